@@ -8,7 +8,10 @@ to populate the DataFrame with data from a benchmark report file. The columns
 in the DataFrame are described in the COLUMNS dictionary.
 
 To assist with loading benchmark report files, get_benchmark_report_files() can
-be used to find all benchmark report files within a search directory.
+be used to find all benchmark report files within a search directory. For large
+archives, load_benchmark_reports_df() imports many files at once, parsing them
+in a process pool and optionally caching the resulting rows on disk so that
+unchanged files are not parsed again.
 
 Once a DataFrame has been populated, analysis can proceed by selecting a set of
 columns to be held constant during analysis. These columns should describe a
@@ -36,9 +39,11 @@ of metrics, showing, for example, the tradeoff between throughput and latency.
 """
 
 import builtins
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 import os
 from pathlib import Path
+import pickle
 import sys
 from typing import Any
 
@@ -46,6 +51,7 @@ import pandas as pd
 import yaml
 
 from benchmark_report import get_nested, import_benchmark_report
+from benchmark_report.pareto import pareto_mask, slo_mask
 from benchmark_report.schema_v0_1 import (
     BenchmarkReport,
     HostType,
@@ -934,6 +940,18 @@ def add_benchmark_report_to_df(runs_df: pd.DataFrame, br_file: str) -> None:
         runs_df (DataFrame): DataFrame to add a row to for the provided run.
         br_file (str): Benchmark report file to import.
     """
+    runs_df.loc[len(runs_df)] = _benchmark_report_row(br_file)
+
+
+def _benchmark_report_row(br_file: str) -> dict[str, Any]:
+    """Load a results file as a row for the DataFrame of benchmark runs.
+
+    Args:
+        br_file (str): Benchmark report file to import.
+
+    Returns:
+        dict[str, Any]: Row values keyed by column.
+    """
     # Import benchmark report.
     # We will parse through this to populate a row in the DataFrame
     report = import_benchmark_report(br_file)
@@ -1092,8 +1110,7 @@ def add_benchmark_report_to_df(runs_df: pd.DataFrame, br_file: str) -> None:
     if report.scenario.host:
         gpu_model = report.scenario.host.accelerator[0].model
 
-    # Add row to DataFrame
-    runs_df.loc[len(runs_df)] = {
+    return {
         # Details about particular run
         "Directory": os.path.abspath(br_file).rsplit(os.sep, 1)[0],
         "Directory_Base": os.path.abspath(br_file).rsplit(os.sep, 2)[0],
@@ -1233,6 +1250,126 @@ def add_benchmark_report_to_df(runs_df: pd.DataFrame, br_file: str) -> None:
     }
 
 
+# Bump when the row layout changes, so cached rows are parsed again.
+_ROW_CACHE_VERSION = 1
+
+
+def _read_row_cache(cache_file: str) -> dict[str, tuple[int, int, dict[str, Any]]]:
+    """Read cached rows, keyed by absolute path, or {} if unusable.
+
+    Args:
+        cache_file (str): Cache written by _write_row_cache().
+
+    Returns:
+        dict: Absolute report path to (mtime_ns, size, row).
+    """
+    try:
+        with open(cache_file, "rb") as file:
+            cached = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return {}
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != _ROW_CACHE_VERSION
+        or cached.get("columns") != list(COLUMNS)
+    ):
+        return {}
+    return cached["rows"]
+
+
+def _write_row_cache(
+    cache_file: str, rows: dict[str, tuple[int, int, dict[str, Any]]]
+) -> None:
+    """Write cached rows atomically; an unwritable location is not an error.
+
+    Args:
+        cache_file (str): Cache file to write.
+        rows (dict): Absolute report path to (mtime_ns, size, row).
+    """
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "wb") as file:
+            pickle.dump(
+                {"version": _ROW_CACHE_VERSION, "columns": list(COLUMNS), "rows": rows},
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_file, cache_file)
+    except OSError as err:
+        sys.stderr.write(f"Cannot write row cache {cache_file}: {err}\n")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def load_benchmark_reports_df(
+    br_files: list[str],
+    runs_df: pd.DataFrame | None = None,
+    max_workers: int | None = None,
+    cache_file: str | None = None,
+) -> pd.DataFrame:
+    """Load many benchmark report files into a DataFrame of benchmark runs.
+
+    Rows are the same as add_benchmark_report_to_df() would add, but files are
+    parsed in a process pool and the DataFrame is built with a single concat.
+    With a cache file, rows of files whose modification time and size are
+    unchanged since they were cached are reused instead of parsed again.
+
+    Args:
+        br_files (list[str]): Benchmark report files to import.
+        runs_df (DataFrame | None): DataFrame to extend, by default an empty
+            one from make_benchmark_runs_df(). It is not modified.
+        max_workers (int | None): Worker processes for parsing, by default
+            one per CPU. 1 parses in this process.
+        cache_file (str | None): Pickle file caching parsed rows, created if
+            missing. Only open cache files you wrote yourself, as loading a
+            pickle can run arbitrary code.
+
+    Returns:
+        DataFrame: runs_df with one row per file appended, in file order.
+    """
+    if runs_df is None:
+        runs_df = make_benchmark_runs_df()
+
+    cached = _read_row_cache(cache_file) if cache_file else {}
+    paths = [os.path.abspath(br_file) for br_file in br_files]
+    rows: dict[str, dict[str, Any]] = {}
+    todo: dict[str, tuple[int, int]] = {}
+    for path in paths:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = cached.get(path)
+        if entry and entry[:2] == signature:
+            rows[path] = entry[2]
+        else:
+            todo[path] = signature
+
+    if max_workers == 1 or len(todo) < 2:
+        parsed = [_benchmark_report_row(path) for path in todo]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(
+                pool.map(
+                    _benchmark_report_row,
+                    todo,
+                    chunksize=max(1, len(todo) // (workers * 4)),
+                )
+            )
+    for (path, signature), row in zip(todo.items(), parsed):
+        rows[path] = row
+        cached[path] = (*signature, row)
+
+    if cache_file and todo:
+        _write_row_cache(cache_file, cached)
+
+    new_df = pd.DataFrame.from_records(
+        [rows[path] for path in paths], columns=list(COLUMNS)
+    )
+    return pd.concat([runs_df, new_df], ignore_index=True)
+
+
 def get_scenarios(
     runs_df: pd.DataFrame, scenario_columns: list[str], bounded: bool = False
 ) -> list[dict[str, Any]]:
@@ -1600,21 +1737,19 @@ def get_meet_slo_df(runs_df: pd.DataFrame, slos: list[SLO]) -> pd.DataFrame:
     Returns:
         pandas.DataFrame: Rows matching SLOs
     """
-    runs_meet_slo_df = runs_df
     for slo in slos:
-        if COLUMNS[slo.col].pref == Pref.LOW:
-            # Must be less than or equal to SLO value to meet SLO
-            runs_meet_slo_df = runs_meet_slo_df[
-                runs_meet_slo_df[slo.col].__le__(slo.value)
-            ]
-        elif COLUMNS[slo.col].pref == Pref.HIGH:
-            # Must be greater than or equal to SLO value to meet SLO
-            runs_meet_slo_df = runs_meet_slo_df[
-                runs_meet_slo_df[slo.col].__ge__(slo.value)
-            ]
-        else:
+        if COLUMNS[slo.col].pref not in (Pref.LOW, Pref.HIGH):
             raise Exception(f"Invalid SLO: {slo.col}")
-    return runs_meet_slo_df
+    if not slos:
+        return runs_df
+    # Lower preferred: must be less than or equal to SLO value to meet SLO.
+    # Higher preferred: must be greater than or equal to SLO value.
+    meets = slo_mask(
+        runs_df[[slo.col for slo in slos]].to_numpy(dtype=float),
+        [slo.value for slo in slos],
+        [COLUMNS[slo.col].pref == Pref.HIGH for slo in slos],
+    )
+    return runs_df[meets]
 
 
 def get_pareto_front_df(
@@ -1637,25 +1772,13 @@ def get_pareto_front_df(
     if COLUMNS[col_b].pref == Pref.NEUTRAL:
         raise Exception(f"Column does not have a preferred direction: {col_b}")
 
-    def better(a: Any, b: Any, col: str) -> bool:
-        """Return true if column in 'a' is better than 'b'."""
-        if COLUMNS[col].pref == Pref.LOW:
-            return a[col] < b[col]
-        if COLUMNS[col].pref == Pref.HIGH:
-            return a[col] > b[col]
-        raise Exception(f"Invalid preference for column: {col}")
-
-    pareto_set = set(runs_df.index.tolist())
-    for ii, rowa in runs_df.iterrows():
-        is_pareto_front = runs_df.index.isin(pareto_set)
-        for jj, rowb in runs_df[is_pareto_front].iterrows():
-            if ii == jj:
-                continue
-            if better(rowa, rowb, col_a) and better(rowa, rowb, col_b):
-                # Index jj worse in all ways to index ii
-                pareto_set.remove(jj)
+    # A row is dropped only when another row is better in both metrics
+    on_front = pareto_mask(
+        runs_df[[col_a, col_b]].to_numpy(dtype=float),
+        [COLUMNS[col_a].pref == Pref.HIGH, COLUMNS[col_b].pref == Pref.HIGH],
+    )
     if sort:
-        return runs_df[runs_df.index.isin(pareto_set)].sort_values(by=col_a)
+        return runs_df[on_front].sort_values(by=col_a)
     else:
         # Preserve order
-        return runs_df[runs_df.index.isin(pareto_set)]
+        return runs_df[on_front]
@@ -32,7 +32,11 @@ from llmdbenchmark.agent.facts import (
 )
 from llmdbenchmark.agent.recommend import recommend
 from llmdbenchmark.agent.render import render_benchmark_job_manifest, render_run_command
-from llmdbenchmark.agent.score import discover_agent_analysis_input, score_slo_goodput
+from llmdbenchmark.agent.score import (
+    discover_agent_analysis_input,
+    gate_margin,
+    score_slo_goodput,
+)
 from llmdbenchmark.agent.workspace import write_agent_session_workspace
 
 __all__ = [
@@ -56,6 +60,7 @@ __all__ = [
     "WorkloadIntent",
     "WorkspaceVolume",
     "discover_agent_analysis_input",
+    "gate_margin",
     "recommend",
     "render_benchmark_job_manifest",
     "render_run_command",
@@ -55,6 +55,24 @@ def _normalize(value: float, units: str, allowed: dict[str, float]) -> float | N
     return value * factor
 
 
+def gate_margin(result: GateResult) -> float | None:
+    """Observed value over threshold for a scored gate, in common units.
+
+    At or below 1.0 the gate passes; the distance from 1.0 says how close
+    to the SLO the report ran. None when the gate has no observed value or
+    its units cannot be compared (the same cases ``_score_gate`` leaves
+    ``passed`` unset for).
+    """
+    if result.observed is None or result.observed_units is None:
+        return None
+    for allowed in (_SECONDS_PER_UNIT, _SECONDS_PER_TOKEN_PER_UNIT):
+        observed = _normalize(result.observed, result.observed_units, allowed)
+        threshold = _normalize(result.threshold, result.threshold_units, allowed)
+        if observed is not None and threshold is not None:
+            return observed / threshold if threshold > 0 else None
+    return None
+
+
 def _score_gate(
     gate: SloGate,
     aggregate,
@@ -16,11 +16,13 @@ import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from llmdbenchmark.analysis.benchmark_report.run_context import RunContext
     from llmdbenchmark.executor.context import ExecutionContext
 
 logger = logging.getLogger(__name__)
@@ -57,35 +59,23 @@ _WRITER_NAMES: dict[str, str] = {
     "eval-containers": "eval-containers",
 }
 
+# Benchmark report version written by run_analysis -> output file prefix.
+_REPORT_PREFIXES: dict[str, str] = {
+    "0.1": "benchmark_report",
+    "0.2": "benchmark_report_v0.2",
+}
 
-def _reset_harness_meta_cache() -> None:
-    """Drop the memoized run_metadata.yaml; one process analyses many subdirs."""
-    from llmdbenchmark.analysis.benchmark_report.native_to_br0_2 import (
-        _get_harness_meta,
-    )
-
-    if hasattr(_get_harness_meta, "_cache"):
-        del _get_harness_meta._cache
-
-
-def _recorded_for(results_dir: Path, key: str) -> str:
-    """Read one of this directory's own metadata values, ignoring the ambient envar.
 
-    Args:
-        results_dir (Path): directory being converted.
-        key (str): run_metadata.yaml key to read.
+def analysis_workers_from_env() -> int:
+    """Analysis processes for :func:`run_analysis_many`.
 
-    Returns:
-        str: the recorded value, or "" for a run that predates it.
+    Read from ``LLMDBENCH_ANALYSIS_WORKERS``; defaults to 1 (analyse
+    in-process, one directory after another).
     """
-    import yaml
-
     try:
-        with (results_dir / "run_metadata.yaml").open(encoding="utf-8") as meta_file:
-            metadata = yaml.safe_load(meta_file) or {}
-    except (OSError, yaml.YAMLError):
-        return ""
-    return str(metadata.get(key) or "").strip()
+        return max(1, int(os.environ.get("LLMDBENCH_ANALYSIS_WORKERS", "1")))
+    except ValueError:
+        return 1
 
 
 # ---------------------------------------------------------------------------
@@ -128,55 +118,28 @@ def run_analysis(
         _log(context, f"No result files matching '{pattern}' in {results_dir.name}")
         return None  # Nothing to convert -- not an error
 
-    # The converters resolve run identity relative to these envars. The harness
-    # pod sets them, the driver does not, and these reports overwrite the in-pod
-    # ones. Each one outranks the per-directory metadata, so a stale one left in
-    # the driver's environment would stamp every treatment of a sweep with a
-    # single identity -- the bug this scoping exists to prevent. Every envar the
-    # converters consult has to be scoped, not just the identity pair.
-    scoped_env = {
-        "LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR": str(results_dir),
-        "LLMDBENCH_RUN_EXPERIMENT_ID": _recorded_for(results_dir, "experiment_id"),
-        "LLMDBENCH_DESCRIPTION_TEXT": _recorded_for(results_dir, "description_text"),
-        "LLMDBENCH_DESCRIPTION_KEYWORDS": _recorded_for(
-            results_dir, "description_keywords"
-        ),
-    }
-    previous_env = {name: os.environ.get(name) for name in scoped_env}
-    os.environ.update(scoped_env)
-    _reset_harness_meta_cache()
+    # The harness pod exports the run identity as envars, the driver does not,
+    # and these reports overwrite the in-pod ones. The identity therefore comes
+    # from this directory's own run_metadata.yaml, passed explicitly: a stale
+    # envar in the driver's environment would otherwise stamp every treatment
+    # of a sweep with a single identity, and nothing process-global is touched,
+    # so directories can be converted concurrently.
+    from llmdbenchmark.analysis.benchmark_report.run_context import RunContext
+
+    run_context = RunContext.from_results_dir(results_dir)
 
     errors: list[str] = []
-    try:
-        for result_file in result_files:
-            result_path = Path(result_file)
-            fname = result_path.name
-
-            for br_version in ("0.1", "0.2"):
-                prefix = (
-                    "benchmark_report"
-                    if br_version == "0.1"
-                    else "benchmark_report_v0.2"
-                )
-                output_name = f"{prefix},_{fname}.yaml"
-                output_path = results_dir / output_name
-
-                err = _convert_to_benchmark_report(
-                    result_path,
-                    output_path,
-                    writer_name,
-                    br_version,
-                    context,
-                )
-                if err:
-                    errors.append(err)
-    finally:
-        for name, previous in previous_env.items():
-            if previous is None:
-                os.environ.pop(name, None)
-            else:
-                os.environ[name] = previous
-        _reset_harness_meta_cache()
+    for result_file in result_files:
+        result_path = Path(result_file)
+        outputs = {
+            br_version: results_dir / f"{prefix},_{result_path.name}.yaml"
+            for br_version, prefix in _REPORT_PREFIXES.items()
+        }
+        errors.extend(
+            _convert_to_benchmark_report(
+                result_path, outputs, writer_name, context, run_context
+            )
+        )
 
     # --- 2. Extract summary from stdout.log ---
     marker = _SUMMARY_MARKERS.get(harness_name)
@@ -205,6 +168,56 @@ def run_analysis(
     return None
 
 
+def _analyse_in_worker(harness_name: str, results_dir: str) -> str | None:
+    """Process-pool entry point: analyse one directory, errors as strings."""
+    try:
+        return run_analysis(harness_name, Path(results_dir))
+    except Exception as exc:
+        return f"Analysis of {Path(results_dir).name} failed: {exc}"
+
+
+def run_analysis_many(
+    harness_name: str,
+    results_dirs: list[Path],
+    context: ExecutionContext | None = None,
+    workers: int | None = None,
+) -> dict[Path, str | None]:
+    """Run :func:`run_analysis` for many results directories.
+
+    With ``workers > 1`` (default ``LLMDBENCH_ANALYSIS_WORKERS``, else 1) the
+    directories are analysed in a process pool: each one's identity travels
+    in its own :class:`RunContext`, and the plotting stages keep matplotlib's
+    global state to their own process. The files written are the same as
+    a serial run's. Progress is logged here, per directory, as each finishes.
+
+    Returns:
+        dict: each directory mapped to ``None`` on success or an error string,
+        in the order given.
+    """
+    results_dirs = [Path(d) for d in results_dirs]
+    workers = min(workers or analysis_workers_from_env(), len(results_dirs))
+    outcomes: dict[Path, str | None] = {}
+    if workers <= 1:
+        for results_dir in results_dirs:
+            outcomes[results_dir] = run_analysis(harness_name, results_dir, context)
+        return outcomes
+
+    _log(context, f"Analysing {len(results_dirs)} result set(s) in {workers} processes")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_analyse_in_worker, harness_name, str(d)): d
+            for d in results_dirs
+        }
+        for future in as_completed(futures):
+            results_dir = futures[future]
+            try:
+                outcomes[results_dir] = future.result()
+            except Exception as exc:  # worker died (e.g. BrokenProcessPool)
+                outcomes[results_dir] = f"Analysis of {results_dir.name} failed: {exc}"
+            _log(context, f"Analysed {results_dir.name}")
+    return {d: outcomes[d] for d in results_dirs}
+
+
 # ---------------------------------------------------------------------------
 # Benchmark report conversion (replaces bash `benchmark-report` CLI calls)
 # ---------------------------------------------------------------------------
@@ -212,26 +225,49 @@ def run_analysis(
 
 def _convert_to_benchmark_report(
     result_file: Path,
-    output_file: Path,
+    outputs: dict[str, Path],
     writer_name: str,
-    br_version: str,
     context: ExecutionContext | None,
-) -> str | None:
-    """Convert a single result file to benchmark report format.
+    run_context: RunContext | None = None,
+) -> list[str]:
+    """Convert a single result file to every benchmark report version in *outputs*.
 
-    Uses the bundled ``benchmark_report`` library API when available,
-    falling back to the ``benchmark-report`` CLI.
+    The native file is parsed once and every version is built from that one
+    parse with the bundled ``benchmark_report`` library API, falling back to
+    the ``benchmark-report`` CLI per version.
+
+    Returns:
+        list[str]: one error per version that could not be written.
     """
-    _log(context, f"Converting {result_file.name} to Benchmark Report v{br_version}")
+    versions = ", ".join(f"v{br_version}" for br_version in outputs)
+    _log(context, f"Converting {result_file.name} to Benchmark Report {versions}")
+
+    native = None
+    if writer_name != "eval-containers":  # reads several files, not this one
+        from llmdbenchmark.analysis.benchmark_report.core import import_yaml
+
+        try:
+            native = import_yaml(str(result_file))
+        except Exception:
+            native = None  # each converter re-reads and reports the failure
 
-    # Try the Python API first (faster, no subprocess)
-    err = _convert_via_api(result_file, output_file, writer_name, br_version)
-    if err is None:
-        return None  # Success
+    errors: list[str] = []
+    for br_version, output_file in outputs.items():
+        # Try the Python API first (faster, no subprocess)
+        err = _convert_via_api(
+            result_file, output_file, writer_name, br_version, run_context, native
+        )
+        if err is None:
+            continue
 
-    # Fallback to CLI
-    _log(context, f"API conversion failed ({err}), trying CLI fallback...")
-    return _convert_via_cli(result_file, output_file, writer_name, br_version)
+        # Fallback to CLI
+        _log(context, f"API conversion failed ({err}), trying CLI fallback...")
+        err = _convert_via_cli(
+            result_file, output_file, writer_name, br_version, run_context
+        )
+        if err:
+            errors.append(err)
+    return errors
 
 
 def _is_session_lifecycle_file(result_file: Path) -> bool:
@@ -243,8 +279,13 @@ def _convert_via_api(
     output_file: Path,
     writer_name: str,
     br_version: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
 ) -> str | None:
-    """Attempt conversion using the benchmark_report Python API."""
+    """Attempt conversion using the benchmark_report Python API.
+
+    *native* is the already-parsed result file, shared by every version.
+    """
     try:
         if writer_name == "eval-containers":
             # Agentic harness: request/session perf from OTel + reward in
@@ -255,7 +296,9 @@ def _convert_via_api(
                 import_eval_containers,
             )
 
-            import_eval_containers(str(result_file)).export_yaml(str(output_file))
+            import_eval_containers(str(result_file), run_context).export_yaml(
+                str(output_file)
+            )
             return None
 
         if br_version == "0.1":
@@ -290,7 +333,7 @@ def _convert_via_api(
             if not convert_fn:
                 return f"No API converter for writer '{writer_name}'"
 
-        br = convert_fn(str(result_file))
+        br = convert_fn(str(result_file), run_context=run_context, native=native)
         br.export_yaml(str(output_file))
         return None
 
@@ -303,8 +346,13 @@ def _convert_via_cli(
     output_file: Path,
     writer_name: str,
     br_version: str,
+    run_context: RunContext | None = None,
 ) -> str | None:
-    """Fallback: call the ``benchmark-report`` CLI."""
+    """Fallback: call the ``benchmark-report`` CLI.
+
+    The CLI reads the run identity from the environment, so the child gets
+    *run_context* as envars; this process's environment is left alone.
+    """
     try:
         cmd = [
             "benchmark-report",
@@ -317,11 +365,15 @@ def _convert_via_cli(
         if writer_name == "inference-perf" and _is_session_lifecycle_file(result_file):
             cmd.append("-s")
         cmd.append(str(output_file))
+        env = None
+        if run_context is not None:
+            env = {**os.environ, **run_context.as_env()}
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             timeout=120,
+            env=env,
         )
         if result.returncode != 0:
             return f"benchmark-report exited {result.returncode}: {result.stderr[:200]}"
@@ -651,11 +703,7 @@ def _run_session_plots(
         return
 
     try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-        import numpy as np
+        import matplotlib  # noqa: F401
     except ImportError:
         _log(context, "matplotlib not available -- skipping session plots")
         return
@@ -666,6 +714,10 @@ def _run_session_plots(
     if not session_br_files:
         return
 
+    from llmdbenchmark.analysis.benchmark_report.plot_jobs import (
+        PlotJob,
+        run_plot_jobs,
+    )
     from llmdbenchmark.analysis.cross_treatment import (
         SESSION_METRICS_OF_INTEREST,
         deep_get,
@@ -713,7 +765,6 @@ def _run_session_plots(
     ]
 
     bar_color = "#3498db"
-    generated = 0
 
     stage_labels = [
         r["stage_file"]
@@ -722,43 +773,77 @@ def _run_session_plots(
         for r in rows
     ]
 
+    jobs = []
     for col_name, title, unit in plot_specs:
         values = [r.get(col_name) for r in rows]
         if all(v is None for v in values):
             continue
-        values_plot = [float(v) if v is not None else float("nan") for v in values]
+        jobs.append(
+            PlotJob(
+                str(out_dir / f"session_{col_name}.png"),
+                _render_session_bars,
+                {
+                    "stage_labels": stage_labels,
+                    "values": [float(v) if v is not None else None for v in values],
+                    "title": title,
+                    "unit": unit,
+                    "color": bar_color,
+                },
+            )
+        )
 
-        fig, ax = plt.subplots(figsize=(max(6, len(rows) * 1.5), 5))
-        x_pos = range(len(rows))
-        bars = ax.bar(x_pos, values_plot, color=bar_color, alpha=0.85)
+    result = run_plot_jobs(jobs)
+    for path, error in result.failed.items():
+        _log(context, f"Session plot {path} failed: {error}", warning=True)
+    if result.plotted:
+        _log(
+            context,
+            f"Generated {result.plotted} session plot(s) in {out_dir}"
+            f" ({result.skipped} unchanged)",
+        )
 
-        for bar, val in zip(bars, values_plot):
-            if np.isnan(val):
-                continue
-            text = f"{val:.4f}" if val < 10 else f"{val:.1f}"
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height(),
-                text,
-                ha="center",
-                va="bottom",
-                fontsize=8,
-                fontweight="bold",
-            )
 
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(stage_labels, rotation=30, ha="right", fontsize=9)
-        ax.set_ylabel(unit)
-        ax.set_title(title)
-        ax.grid(axis="y", alpha=0.3)
+def _render_session_bars(
+    output: str,
+    stage_labels: list[str],
+    values: list[float | None],
+    title: str,
+    unit: str,
+    color: str,
+) -> None:
+    """Plot job: one bar per stage for a session metric (None bars are blank)."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    values_plot = [v if v is not None else float("nan") for v in values]
+
+    fig, ax = plt.subplots(figsize=(max(6, len(values) * 1.5), 5))
+    x_pos = range(len(values))
+    bars = ax.bar(x_pos, values_plot, color=color, alpha=0.85)
+
+    for bar, val in zip(bars, values_plot):
+        if np.isnan(val):
+            continue
+        text = f"{val:.4f}" if val < 10 else f"{val:.1f}"
+        ax.text(
+            bar.get_x() + bar.get_width() / 2,
+            bar.get_height(),
+            text,
+            ha="center",
+            va="bottom",
+            fontsize=8,
+            fontweight="bold",
+        )
 
-        plt.tight_layout()
-        plt.savefig(str(out_dir / f"session_{col_name}.png"), dpi=150)
-        plt.close()
-        generated += 1
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(stage_labels, rotation=30, ha="right", fontsize=9)
+    ax.set_ylabel(unit)
+    ax.set_title(title)
+    ax.grid(axis="y", alpha=0.3)
 
-    if generated:
-        _log(context, f"Generated {generated} session plot(s) in {out_dir}")
+    plt.tight_layout()
+    plt.savefig(output, dpi=150)
+    plt.close()
 
 
 # ---------------------------------------------------------------------------
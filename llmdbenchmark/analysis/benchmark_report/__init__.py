@@ -8,6 +8,7 @@ from .core import (
     import_benchmark_report,
     import_yaml,
     load_benchmark_report,
+    load_yaml_str,
     make_json_schema,
     update_dict,
     yaml_str_to_benchmark_report,
@@ -25,6 +26,7 @@ __all__ = [
     "import_benchmark_report",
     "import_yaml",
     "load_benchmark_report",
+    "load_yaml_str",
     "make_json_schema",
     "update_dict",
     "yaml_str_to_benchmark_report",
@@ -9,6 +9,9 @@ from typing import Any, ClassVar
 from pydantic import BaseModel, model_validator
 import yaml
 
+# libyaml's C emitter when PyYAML was built with it; same output, far faster.
+YamlDumper = getattr(yaml, "CDumper", yaml.Dumper)
+
 ###############################################################################
 # Supported workload generators
 ###############################################################################
@@ -240,7 +243,7 @@ class BenchmarkReport(BaseModel):
             filename: File to save BenchmarkReport to.
         """
         with open(filename, "w") as file:
-            yaml.dump(self.dump(), file, indent=2)
+            yaml.dump(self.dump(), file, indent=2, Dumper=YamlDumper)
 
     def get_json_str(self) -> str:
         """Make a JSON string for BenchmarkReport.
@@ -256,4 +259,4 @@ class BenchmarkReport(BaseModel):
         Returns:
             str: YAML string.
         """
-        return yaml.dump(self.dump(), indent=2)
+        return yaml.dump(self.dump(), indent=2, Dumper=YamlDumper)
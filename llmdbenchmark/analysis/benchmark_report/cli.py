@@ -89,6 +89,7 @@ def main() -> None:
             import_inference_perf_session,
             import_guidellm,
             import_guidellm_all,
+            iter_guidellm,
         )
     elif args.br_version == "0.2":
         from .native_to_br0_2 import (
@@ -99,6 +100,7 @@ def main() -> None:
             import_inference_perf_session,
             import_guidellm,
             import_guidellm_all,
+            iter_guidellm,
         )
     elif args.br_version == "0.2.1":
         from .native_to_br0_2_1 import (
@@ -108,6 +110,7 @@ def main() -> None:
             import_inference_perf_session,
             import_guidellm,
             import_guidellm_all,
+            iter_guidellm,
         )
     else:
         sys.stderr.write(f"Invalid benchmark report version: {args.br_version}\n")
@@ -148,24 +151,22 @@ def main() -> None:
                     )
                 else:
                     print(import_guidellm(args.results_file, args.index).get_yaml_str())
+            elif args.output_file:
+                # Create a benchmark report file per run, converting each as
+                # it is read so only one benchmark is in memory at a time
+                fname, ext = os.path.splitext(args.output_file)
+                for ii, br in enumerate(iter_guidellm(args.results_file)):
+                    output_file = f"{fname}_{ii}{ext}"
+                    if os.path.exists(output_file) and not args.force:
+                        sys.stderr.write(f"Output file already exists: {output_file}\n")
+                        sys.exit(1)
+                    br.export_yaml(output_file)
             else:
                 br_list = import_guidellm_all(args.results_file)
-                # Generate reports for all runs
+                # Don't create a file, just print to stdout
                 for ii, br in enumerate(br_list):
-                    if args.output_file:
-                        # Create a benchmark report file
-                        fname, ext = os.path.splitext(args.output_file)
-                        output_file = f"{fname}_{ii}{ext}"
-                        if os.path.exists(output_file) and not args.force:
-                            sys.stderr.write(
-                                f"Output file already exists: {output_file}\n"
-                            )
-                            sys.exit(1)
-                        br.export_yaml(output_file)
-                    else:
-                        # Don't create a file, just print to stdout
-                        print(f"# Benchmark {ii + 1} of {len(br_list)}")
-                        print(br.get_yaml_str())
+                    print(f"# Benchmark {ii + 1} of {len(br_list)}")
+                    print(br.get_yaml_str())
         case WorkloadGenerator.INFERENCE_PERF:
             if args.output_file:
                 import_inference_perf(args.results_file).export_yaml(args.output_file)
@@ -3,6 +3,7 @@ Core functions for benchmark reports.
 """
 
 import json
+import mmap
 import os
 import sys
 from typing import Any
@@ -10,11 +11,23 @@ from typing import Any
 import yaml
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import BenchmarkReport
 from .schema_v0_1 import BenchmarkReportV01
 from .schema_v0_2 import BenchmarkReportV02
 from .schema_v0_2_1 import BenchmarkReportV021
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Files at least this large are memory-mapped for JSON parsing rather than
+# read into a separate buffer. Only orjson can parse from the mapping directly.
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
 
 def check_file(file_path: str) -> None:
     """Make sure regular file exists.
@@ -115,18 +128,98 @@ def update_dict(dest: dict[Any, Any], source: dict[Any, Any]) -> None:
             dest[key] = val
 
 
-def import_yaml(file_path: str) -> dict[Any, Any]:
+def _looks_like_json(content: bytes | str) -> bool:
+    """Check whether content starts like a JSON object or array.
+
+    Args:
+        content (bytes | str): File contents, or a prefix of them.
+
+    Returns:
+        bool: True if the first non-whitespace character is ``{`` or ``[``.
+    """
+    head = content[:4096].lstrip()
+    if isinstance(head, str):
+        return head[:1] in ("{", "[")
+    return head[:1] in (b"{", b"[")
+
+
+def _json_loads(content: bytes | str | memoryview) -> Any:
+    """Parse JSON with orjson when it is installed, else the stdlib parser.
+
+    Args:
+        content (bytes | str | memoryview): JSON text.
+
+    Returns:
+        Any: Parsed data.
+
+    Raises:
+        ValueError: Content is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259; fall through for NaN/Infinity, which
+            # Python's json module (and the harnesses writing them) accept.
+            pass
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    return json.loads(content)
+
+
+def load_yaml_str(content: bytes | str) -> Any:
+    """Parse a JSON/YAML document, using the fastest available parser.
+
+    JSON content is parsed with a JSON parser, which is far faster than
+    PyYAML on the large results files the harnesses write. Anything else,
+    or JSON-looking content that is not valid JSON (such as a YAML flow
+    mapping), is parsed as YAML with libyaml when it is available.
+
+    Args:
+        content (bytes | str): JSON/YAML text.
+
+    Returns:
+        Any: Parsed data.
+    """
+    if _looks_like_json(content):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            pass
+    return yaml.load(content, Loader=YamlLoader)
+
+
+def import_yaml(
+    file_path: str, mmap_threshold: int | None = MMAP_THRESHOLD_BYTES
+) -> dict[Any, Any]:
     """Import a JSON/YAML file as a dict.
 
     Args:
         file_path (str): Path to JSON/YAML file.
+        mmap_threshold (int | None): Memory-map JSON files at least this many
+            bytes in size when orjson is available. None disables mapping.
 
     Returns:
         dict: Imported data.
     """
-    with open(file_path, "r", encoding="UTF-8") as file:
-        data = yaml.safe_load(file)
-    return data
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if (
+            orjson is not None
+            and mmap_threshold is not None
+            and size >= max(mmap_threshold, 1)
+        ):
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if _looks_like_json(mapped[:4096]):
+                    view = memoryview(mapped)
+                    try:
+                        return _json_loads(view)
+                    except ValueError:
+                        pass
+                    finally:
+                        view.release()
+        content = file.read()
+    return load_yaml_str(content)
 
 
 def load_benchmark_report(data: dict[str, Any]) -> BenchmarkReport:
@@ -176,7 +269,7 @@ def yaml_str_to_benchmark_report(yaml_str: str) -> BenchmarkReport:
     Returns:
         BenchmarkReport: Instance with values from string.
     """
-    return load_benchmark_report(yaml.safe_load(yaml_str))
+    return load_benchmark_report(load_yaml_str(yaml_str))
 
 
 def make_json_schema(version: str = "0.2") -> str:
@@ -28,12 +28,17 @@ carried ``strategy``/``backend`` since at least v0.6.1.
 
 from __future__ import annotations
 
+import json
 import sys
-from typing import Any
+from typing import Any, Iterator, TextIO
 
 import yaml
 
-from .core import get_nested
+from .core import get_nested, import_yaml
+
+# Characters read per refill of the streaming JSON reader. A value larger than
+# the buffer grows the read size with it, so decoding stays linear.
+_STREAM_CHUNK_CHARS = 1 << 20
 
 
 def report_config(data: dict) -> dict:
@@ -308,3 +313,157 @@ def model(data: dict, results: dict | None = None) -> str | None:
         if isinstance(candidate, str) and candidate:
             return candidate
     return None
+
+
+class _JsonStream:
+    """Decode a JSON document one value at a time from an open text file.
+
+    Only as much of the file as the value being decoded is held in memory,
+    which is what lets :func:`iter_benchmarks` walk a multi-hundred-MB
+    ``benchmarks`` list one entry at a time.
+    """
+
+    def __init__(self, handle: TextIO) -> None:
+        self._handle = handle
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append more of the file to the buffer, dropping consumed text.
+
+        Returns:
+            bool: False once the file is exhausted.
+        """
+        if self._eof:
+            return False
+        pending = len(self._buf) - self._pos
+        chunk = self._handle.read(max(_STREAM_CHUNK_CHARS, pending))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Get the next non-whitespace character without consuming it.
+
+        Returns:
+            str: Next character, or empty string at end of file.
+        """
+        while True:
+            buf = self._buf
+            while self._pos < len(buf) and buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the structural character ``char``.
+
+        Raises:
+            json.JSONDecodeError: The next character is something else.
+        """
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buf, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Most likely the value runs past the buffer; a genuinely
+                # malformed file still raises once nothing is left to read.
+                if self._fill():
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may be cut short.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_benchmarks(results_file: str) -> Iterator[tuple[dict, int, dict]]:
+    """Walk a GuideLLM results file one benchmark at a time.
+
+    JSON reports are streamed: the run-wide keys ahead of ``benchmarks``
+    (``metadata`` and ``config``/``args``, in the order GuideLLM writes them)
+    are decoded once, then each ``benchmarks`` entry is decoded, yielded and
+    released before the next is read. A report whose run-wide configuration
+    comes after ``benchmarks`` has its benchmarks held until the config is
+    read. YAML reports cannot be streamed and are parsed in full.
+
+    Args:
+        results_file (str): GuideLLM results file to read.
+
+    Yields:
+        tuple: ``(data, index, results)``, where ``data`` holds the run-wide
+            keys of the report (everything but ``benchmarks``) and ``results``
+            is benchmark number ``index``.
+    """
+    with open(results_file, "r", encoding="UTF-8") as handle:
+        stream = _JsonStream(handle)
+        if stream.peek() != "{":
+            data = None
+        else:
+            data = {}
+            yield from _stream_benchmarks(stream, data)
+
+    if data is None:
+        data = import_yaml(results_file)
+        benchmarks = data.pop("benchmarks", None) or []
+        for index, results in enumerate(benchmarks):
+            yield data, index, results
+
+
+def _stream_benchmarks(
+    stream: _JsonStream, data: dict
+) -> Iterator[tuple[dict, int, dict]]:
+    """Decode the top-level report object, yielding benchmarks as they come.
+
+    Args:
+        stream (_JsonStream): Stream positioned at the opening brace.
+        data (dict): Filled in with the run-wide keys as they are decoded.
+
+    Yields:
+        tuple: ``(data, index, results)``, as for :func:`iter_benchmarks`.
+    """
+    held: list[dict] = []
+    stream.expect("{")
+    first = True
+    while stream.peek() != "}":
+        if not first:
+            stream.expect(",")
+        first = False
+        key = stream.value()
+        stream.expect(":")
+        if key != "benchmarks" or stream.peek() != "[":
+            data[key] = stream.value()
+            continue
+
+        # Without the run-wide config a benchmark cannot be converted yet.
+        ready = bool(report_config(data))
+        stream.expect("[")
+        index = 0
+        while stream.peek() != "]":
+            if index:
+                stream.expect(",")
+            results = stream.value()
+            if ready:
+                yield data, index, results
+            else:
+                held.append(results)
+            index += 1
+        stream.expect("]")
+    stream.expect("}")
+
+    for index, results in enumerate(held):
+        yield data, index, results
@@ -0,0 +1,296 @@
+"""Server-side latency percentiles from raw Prometheus histogram scrapes.
+
+vLLM exports its request latencies (time to first token, inter-token latency,
+end-to-end latency, queue time, ...) as Prometheus histograms: cumulative
+``<name>_bucket{le="..."}`` counters plus ``<name>_sum`` and ``<name>_count``.
+Without a Prometheus server to run ``histogram_quantile`` over them, the
+collected scrapes only ever contributed their raw counter values.
+
+:func:`histogram_series` groups a metric's bucket samples in a
+:class:`~.scrape_store.ScrapeStore` by pod and by every label except ``le``,
+into one scrapes x buckets counter matrix per series. Consecutive scrapes are
+differenced into per-interval observation counts (tolerating counter resets),
+and :func:`histogram_quantiles` interpolates percentiles inside buckets the way
+``histogram_quantile`` does. Everything past the grouping is vectorized over
+scrapes, so a multi-hour run costs a handful of array operations per series.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import numpy as np
+
+from .scrape_store import ScrapeStore, _epoch, parse_labels
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+@dataclass
+class HistogramSeries:
+    """One histogram (a pod and label set) across every scrape of a run.
+
+    ``buckets`` holds the cumulative ``_bucket`` counters, one row per scrape in
+    time order and one column per upper bound in ``bounds``, which is ascending
+    and ends in ``+Inf``. ``sums`` is the matching ``_sum`` counter, NaN where a
+    scrape did not carry it. Scrapes missing any bucket are dropped.
+    """
+
+    pod: str
+    name: str
+    labels: dict[str, str]
+    bounds: np.ndarray
+    times: np.ndarray
+    buckets: np.ndarray
+    sums: np.ndarray
+
+    def intervals(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Difference consecutive scrapes into per-interval observations.
+
+        A counter that went down means the server restarted between the two
+        scrapes, so that interval's observations are the new counter values.
+
+        Returns:
+            tuple: ``(ends, counts, sums)``: each interval's end time in epoch
+                seconds, its cumulative per-bucket observation counts (one row
+                per interval) and the sum of its observed values.
+        """
+        deltas = np.diff(self.buckets, axis=0)
+        reset = (deltas < 0).any(axis=1)
+        counts = np.where(reset[:, None], self.buckets[1:], deltas)
+        sums = np.where(reset, self.sums[1:], np.diff(self.sums))
+        return self.times[1:], counts, sums
+
+
+def _bound(value: str | None) -> float:
+    try:
+        return float(value) if value is not None else np.nan
+    except ValueError:
+        return np.nan
+
+
+def _label_keys(
+    store: ScrapeStore, label_ids: np.ndarray, keys: dict[tuple, int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map label-set ids to a group key (labels without ``le``) and ``le`` bound.
+
+    Label parsing runs once per distinct label set, not once per sample.
+    """
+    codes = np.empty(len(label_ids), dtype=np.int64)
+    bounds = np.empty(len(label_ids), dtype=np.float64)
+    for i, label_id in enumerate(label_ids.tolist()):
+        labels = parse_labels(str(store.label_sets[label_id]))
+        bounds[i] = _bound(labels.pop("le", None))
+        codes[i] = keys.setdefault(tuple(sorted(labels.items())), len(keys))
+    return codes, bounds
+
+
+def histogram_series(
+    store: ScrapeStore, name: str, pattern: str = "*.log"
+) -> list[HistogramSeries]:
+    """Group one histogram metric's samples into per-series counter matrices.
+
+    Args:
+        store (ScrapeStore): Parsed raw scrapes.
+        name (str): Histogram base name, e.g. ``vllm:time_to_first_token_seconds``.
+        pattern (str): fnmatch pattern selecting files by base name.
+
+    Returns:
+        list[HistogramSeries]: One series per pod and label set that has a
+            ``+Inf`` bucket and at least one complete scrape, ordered by pod.
+    """
+    bucket_ids = store.metric_ids([f"{name}_bucket"])
+    if not len(bucket_ids):
+        return []
+    usable = store.usable_rows(pattern)
+    rows = np.flatnonzero(usable & (store.row_metric == bucket_ids[0]))
+    if not len(rows):
+        return []
+
+    keys: dict[tuple, int] = {}
+    label_ids, label_inv = np.unique(store.row_labels[rows], return_inverse=True)
+    key_codes, le_bounds = _label_keys(store, label_ids, keys)
+    row_keys = key_codes[label_inv]
+    row_bounds = le_bounds[label_inv]
+    keep = ~np.isnan(row_bounds)
+    rows, row_keys, row_bounds = rows[keep], row_keys[keep], row_bounds[keep]
+
+    pod_names, pod_codes = np.unique(store.file_pod, return_inverse=True)
+    epochs = store.file_epochs()
+    known = len(keys)
+    row_groups = pod_codes[store.row_file[rows]] * known + row_keys
+
+    # _sum samples carry the bucket series' labels minus ``le``.
+    sum_rows = np.zeros(0, dtype=np.int64)
+    sum_groups = np.zeros(0, dtype=np.int64)
+    sum_ids = store.metric_ids([f"{name}_sum"])
+    if len(sum_ids):
+        sum_rows = np.flatnonzero(usable & (store.row_metric == sum_ids[0]))
+        sum_label_ids, sum_inv = np.unique(
+            store.row_labels[sum_rows], return_inverse=True
+        )
+        sum_codes, _ = _label_keys(store, sum_label_ids, keys)
+        # Label sets without a bucket series were given codes past ``known``.
+        sum_keys = sum_codes[sum_inv]
+        sum_rows = sum_rows[sum_keys < known]
+        sum_groups = (
+            pod_codes[store.row_file[sum_rows]] * known + sum_keys[sum_keys < known]
+        )
+
+    key_labels = {code: dict(key) for key, code in keys.items()}
+    series: list[HistogramSeries] = []
+    for group in np.unique(row_groups).tolist():
+        in_group = row_groups == group
+        selected = rows[in_group]
+        bounds, bound_idx = np.unique(row_bounds[in_group], return_inverse=True)
+        if not np.isinf(bounds[-1]):
+            continue
+        files, file_idx = np.unique(store.row_file[selected], return_inverse=True)
+        matrix = np.full((len(files), len(bounds)), np.nan)
+        matrix[file_idx, bound_idx] = store.values[selected]
+
+        sums = np.full(len(files), np.nan)
+        group_sums = sum_rows[sum_groups == group]
+        if len(group_sums):
+            pos = np.searchsorted(files, store.row_file[group_sums])
+            found = (pos < len(files)) & (
+                files[np.minimum(pos, len(files) - 1)] == store.row_file[group_sums]
+            )
+            sums[pos[found]] = store.values[group_sums[found]]
+
+        complete = ~np.isnan(matrix).any(axis=1)
+        files, matrix, sums = files[complete], matrix[complete], sums[complete]
+        if not len(files):
+            continue
+        order = np.argsort(epochs[files], kind="stable")
+        series.append(
+            HistogramSeries(
+                pod=str(pod_names[group // known]),
+                name=name,
+                labels=key_labels[group % known],
+                bounds=bounds,
+                times=epochs[files][order],
+                buckets=matrix[order],
+                sums=sums[order],
+            )
+        )
+    return series
+
+
+def histogram_quantiles(
+    bounds: np.ndarray,
+    counts: np.ndarray,
+    quantiles: Iterable[float] = DEFAULT_QUANTILES,
+) -> np.ndarray:
+    """Estimate quantiles from cumulative bucket counts, like histogram_quantile.
+
+    The rank is located in the first bucket whose cumulative count reaches it
+    and interpolated linearly between that bucket's bounds; the lowest bucket
+    starts at 0. A rank that falls in the ``+Inf`` bucket reports the highest
+    finite bound, and an empty histogram yields NaN.
+
+    Args:
+        bounds (np.ndarray): Ascending bucket upper bounds ending in ``+Inf``.
+        counts (np.ndarray): Cumulative counts, shape ``(len(bounds),)`` or
+            ``(n, len(bounds))``.
+        quantiles (Iterable[float]): Quantiles in [0, 1].
+
+    Returns:
+        np.ndarray: Shape ``(n, len(quantiles))``, or ``(len(quantiles),)``
+            for a single histogram.
+    """
+    bounds = np.asarray(bounds, dtype=np.float64)
+    single = np.ndim(counts) == 1
+    # Buckets scraped a moment apart can be slightly non-monotonic.
+    counts = np.maximum.accumulate(np.atleast_2d(counts).astype(np.float64), axis=1)
+    q = np.asarray(list(quantiles), dtype=np.float64)
+
+    total = counts[:, -1]
+    rank = q[None, :] * total[:, None]
+    idx = (counts[:, None, :] >= rank[:, :, None]).argmax(axis=2)
+    prev = np.maximum(idx - 1, 0)
+    upper = bounds[idx]
+    lower = np.where(idx > 0, bounds[prev], 0.0)
+    below = np.where(idx > 0, np.take_along_axis(counts, prev, axis=1), 0.0)
+    in_bucket = np.take_along_axis(counts, idx, axis=1) - below
+    fraction = np.divide(
+        rank - below, in_bucket, out=np.ones_like(rank), where=in_bucket > 0
+    )
+    with np.errstate(invalid="ignore"):
+        result = lower + (upper - lower) * fraction
+    highest = bounds[-2] if len(bounds) > 1 else np.nan
+    result = np.where(np.isinf(upper), highest, result)
+    result = np.where((idx == 0) & (bounds[0] <= 0), bounds[0], result)
+    result[total <= 0] = np.nan
+    return result[0] if single else result
+
+
+def interval_quantiles(
+    series: HistogramSeries, quantiles: Iterable[float] = DEFAULT_QUANTILES
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-interval quantiles between consecutive scrapes of one series.
+
+    Args:
+        series (HistogramSeries): Histogram to difference.
+        quantiles (Iterable[float]): Quantiles in [0, 1].
+
+    Returns:
+        tuple: ``(ends, values)``: interval end times in epoch seconds and an
+            ``(intervals, len(quantiles))`` array, NaN for idle intervals.
+    """
+    ends, counts, _ = series.intervals()
+    return ends, histogram_quantiles(series.bounds, counts, quantiles)
+
+
+def _window_mask(ends: np.ndarray, window: tuple[Any, Any] | None) -> np.ndarray:
+    """Select intervals ending in the half-open ``[start, end)`` window."""
+    if not window:
+        return np.ones(len(ends), dtype=bool)
+    start, end = (_epoch(t) for t in window)
+    return (ends >= start) & (ends < end)
+
+
+def summarize_histograms(
+    series: list[HistogramSeries],
+    window: tuple[Any, Any] | None = None,
+    quantiles: Iterable[float] = DEFAULT_QUANTILES,
+) -> dict[str, Any] | None:
+    """Pool the observations of one or more series over a time window.
+
+    Interval observation counts are summed before interpolating, so the result
+    is the distribution of every request observed in the window, not an average
+    of per-interval percentiles. Series must share the same buckets.
+
+    Args:
+        series (list[HistogramSeries]): Series with identical ``bounds``.
+        window (tuple | None): ``(start, end)`` datetimes; intervals whose end
+            falls in ``[start, end)`` count. None counts every interval.
+        quantiles (Iterable[float]): Quantiles in [0, 1].
+
+    Returns:
+        dict | None: ``count``, ``mean`` (from ``_sum``, when scraped) and one
+            ``p<NN>`` key per quantile; None when nothing was observed.
+
+    Raises:
+        ValueError: If the series do not share the same buckets.
+    """
+    quantiles = list(quantiles)
+    bounds = series[0].bounds
+    if any(not np.array_equal(s.bounds, bounds) for s in series[1:]):
+        raise ValueError(f"{series[0].name}: series have different buckets")
+    pooled = np.zeros(len(bounds))
+    total_sum = 0.0
+    for s in series:
+        ends, counts, sums = s.intervals()
+        mask = _window_mask(ends, window)
+        pooled += counts[mask].sum(axis=0)
+        total_sum += float(np.nansum(sums[mask]))
+    count = float(pooled[-1])
+    if count <= 0:
+        return None
+
+    stats: dict[str, Any] = {"count": int(round(count))}
+    if total_sum > 0:
+        stats["mean"] = total_sum / count
+    for q, value in zip(quantiles, histogram_quantiles(bounds, pooled, quantiles)):
+        stats[f"p{q * 100:g}".replace(".", "p")] = float(value)
+    return stats
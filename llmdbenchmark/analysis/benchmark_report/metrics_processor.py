@@ -149,6 +149,10 @@ def _embed_time_series_max_points() -> int:
         return _DEFAULT_TS_MAX_POINTS
 
 
+def _server_histograms_enabled() -> bool:
+    return (_env("METRICS_SERVER_HISTOGRAMS", "true") or "true").lower() != "false"
+
+
 def _embed_time_series_specs() -> dict[str, dict[str, Any]]:
     override = _env("METRICS_EMBED_TIME_SERIES_SPEC")
     if override:
@@ -264,6 +268,43 @@ GRAPHED_METRICS: dict[str, tuple[str, str, str]] = {
     ),
 }
 
+# ---------------------------------------------------------------------------
+# vLLM latency histograms whose percentiles are reconstructed from the raw
+# scrapes' bucket counters, giving server-side percentiles without Prometheus.
+# Maps prometheus histogram name -> (report key, units string)
+# ---------------------------------------------------------------------------
+SERVER_LATENCY_HISTOGRAMS: dict[str, tuple[str, str]] = {
+    "vllm:time_to_first_token_seconds": (
+        "vllm_time_to_first_token_seconds",
+        "seconds",
+    ),
+    "vllm:inter_token_latency_seconds": (
+        "vllm_inter_token_latency_seconds",
+        "seconds",
+    ),
+    # Pre-v1 name of the inter-token latency histogram
+    "vllm:time_per_output_token_seconds": (
+        "vllm_time_per_output_token_seconds",
+        "seconds",
+    ),
+    "vllm:e2e_request_latency_seconds": (
+        "vllm_e2e_request_latency_seconds",
+        "seconds",
+    ),
+    "vllm:request_queue_time_seconds": (
+        "vllm_request_queue_time_seconds",
+        "seconds",
+    ),
+    "vllm:request_prefill_time_seconds": (
+        "vllm_request_prefill_time_seconds",
+        "seconds",
+    ),
+    "vllm:request_decode_time_seconds": (
+        "vllm_request_decode_time_seconds",
+        "seconds",
+    ),
+}
+
 # EPP log-derived metrics: summary_key -> (report_key, default_units, graph_file, per_component)
 _EPP_METRICS: dict[str, tuple[str, str, str, bool]] = {
     "dispatch_latency": (
@@ -387,11 +428,16 @@ def _build_embedded_time_series(
         series_points,
     )
 
-    pod_data = collect_time_series_data(metrics_dir)
+    specs = _embed_time_series_specs()
+    wanted = {
+        name
+        for spec in specs.values()
+        for name in (spec.get("ratio") or [spec.get("metric", "")])
+    }
+    pod_data = collect_time_series_data(metrics_dir, wanted)
     if not pod_data:
         return set(), {"datapoints": 0, "datapoints_available": 0}
 
-    specs = _embed_time_series_specs()
     components = obs.setdefault("components", [])
     by_replica = {c.get("replica_id"): c for c in components}
     embedded: set[str] = set()
@@ -508,6 +554,60 @@ def _build_aggregated_entries(
         entry["aggregated"] = _make_stats_dict(aggregated[prom_name], units)
 
 
+def _build_server_latency_entries(
+    metrics_dir: str,
+    window: tuple[Any, Any] | None = None,
+) -> dict[str, Any]:
+    """Build server-side latency percentile entries from raw histogram scrapes.
+
+    Each pod's bucket counters are differenced between consecutive scrapes and
+    the observations pooled over ``window`` (the whole run when None), so the
+    percentiles cover the same interval as the embedded time series. Pods with
+    identical buckets are also pooled into an ``aggregated`` entry.
+    """
+    from .histograms import histogram_series, summarize_histograms
+    from .scrape_store import load_scrape_store
+
+    store = load_scrape_store(metrics_dir)
+    if not len(store):
+        return {}
+
+    entries: dict[str, Any] = {}
+    for prom_name, (report_key, units) in SERVER_LATENCY_HISTOGRAMS.items():
+        series = histogram_series(store, prom_name)
+        components = []
+        for hist in series:
+            stats = summarize_histograms([hist], window)
+            if stats is None:
+                continue
+            role = _detect_role(hist.pod)
+            component_entry: dict[str, Any] = {
+                "component_id": _component_id(role),
+                "pod": hist.pod,
+                "role": role,
+                "statistics": {**stats, "units": units},
+            }
+            if hist.labels:
+                component_entry["labels"] = hist.labels
+            components.append(component_entry)
+        if not components:
+            continue
+
+        entry: dict[str, Any] = {
+            "source": "prometheus_histogram",
+            "scope": "stage" if window else "run",
+            "components": components,
+        }
+        try:
+            aggregated = summarize_histograms(series, window)
+        except ValueError:
+            aggregated = None
+        if aggregated:
+            entry["aggregated"] = {**aggregated, "units": units}
+        entries[report_key] = entry
+    return entries
+
+
 def _build_epp_entries(
     epp_summary: dict[str, Any],
 ) -> dict[str, Any]:
@@ -575,7 +675,9 @@ def add_metrics_to_benchmark_report(
     """Add metrics to an existing benchmark report dictionary.
 
     Populates per-metric entries (e.g. results.observability.vllm_kv_cache_usage_perc)
-    with per-component statistics, role, graph paths, and EPP metrics.
+    with per-component statistics, role, graph paths, and EPP metrics, plus
+    server-side latency percentiles (e.g. vllm_time_to_first_token_seconds)
+    reconstructed from the raw histogram scrapes.
 
     ``time_series_window`` restricts the embedded series to one stage's interval.
     It applies to the series only -- the scalar statistics come from a whole-run
@@ -619,6 +721,10 @@ def add_metrics_to_benchmark_report(
     else:
         interval["scope"] = "unavailable"
 
+    # Server-side latency percentiles from vLLM histogram counters
+    if _server_histograms_enabled():
+        obs.update(_build_server_latency_entries(metrics_dir, time_series_window))
+
     # EPP log-derived metrics
     epp_summary = _load_json(os.path.join(metrics_dir, "epp_metrics_summary.json"))
     if epp_summary:
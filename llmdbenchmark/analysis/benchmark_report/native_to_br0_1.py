@@ -7,7 +7,7 @@ import datetime
 import os
 import re
 import sys
-from typing import Any
+from typing import Any, Iterator
 import yaml
 
 import numpy as np
@@ -21,12 +21,17 @@ from .core import (
     load_benchmark_report,
     update_dict,
 )
+from .run_context import RunContext
 from .schema_v0_1 import BenchmarkReportV01, HostType, WorkloadGenerator
 
 
-def _get_llmd_benchmark_envars() -> dict:
+def _get_llmd_benchmark_envars(run_context: RunContext | None = None) -> dict:
     """Get information from environment variables for the benchmark report.
 
+    Args:
+        run_context (RunContext | None): Explicit run identity; supplies the
+            experiment ID instead of ``LLMDBENCH_RUN_EXPERIMENT_ID``.
+
     Returns:
         dict: Imported data about scenario following schema of BenchmarkReportV01.
     """
@@ -36,6 +41,11 @@ def _get_llmd_benchmark_envars() -> dict:
         # We are not in a harness pod
         return {}
 
+    if run_context is not None:
+        experiment_id = run_context.experiment_id
+    else:
+        experiment_id = os.environ.get("LLMDBENCH_RUN_EXPERIMENT_ID", "")
+
     if "LLMDBENCH_DEPLOY_METHODS" not in os.environ:
         sys.stderr.write(
             "Warning: LLMDBENCH_DEPLOY_METHODS undefined, cannot determine deployment method."
@@ -121,7 +131,7 @@ def _get_llmd_benchmark_envars() -> dict:
                 },
             },
             "metadata": {
-                "eid": os.environ.get("LLMDBENCH_RUN_EXPERIMENT_ID", ""),
+                "eid": experiment_id,
             },
         }
 
@@ -312,7 +322,7 @@ def _get_llmd_benchmark_envars() -> dict:
                 },
             },
             "metadata": {
-                "eid": os.environ.get("LLMDBENCH_RUN_EXPERIMENT_ID", ""),
+                "eid": experiment_id,
             },
         }
 
@@ -350,11 +360,19 @@ def _vllm_timestamp_to_epoch(date_str: str) -> int:
     return datetime.datetime(year, month, day, hour, minute, second).timestamp()
 
 
-def import_vllm_benchmark(results_file: str) -> BenchmarkReportV01:
+def import_vllm_benchmark(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV01:
     """Import data from a vLLM benchmark run as a BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV01: Imported data.
@@ -362,11 +380,11 @@ def import_vllm_benchmark(results_file: str) -> BenchmarkReportV01:
     check_file(results_file)
 
     # Import results file from vLLM benchmark
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV01
-    br_dict = _get_llmd_benchmark_envars()
+    br_dict = _get_llmd_benchmark_envars(run_context)
     # Append to that dict the data from vLLM benchmark.
     update_dict(
         br_dict,
@@ -480,25 +498,51 @@ def import_vllm_benchmark(results_file: str) -> BenchmarkReportV01:
     return load_benchmark_report(br_dict)
 
 
-def import_guidellm(results_file: str, index: int = 0) -> BenchmarkReportV01:
+def import_guidellm(
+    results_file: str,
+    index: int = 0,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV01:
     """Import data from a GuideLLM run as a BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import.
         index (int): Benchmark index to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV01: Imported data.
     """
     check_file(results_file)
 
-    data = import_yaml(results_file)
+    data = import_yaml(results_file) if native is None else native
+
+    return _guidellm_report(data, data["benchmarks"][index], index, run_context)
+
+
+def _guidellm_report(
+    data: dict, results: dict, index: int, run_context: RunContext | None = None
+) -> BenchmarkReportV01:
+    """Convert a single benchmark of a GuideLLM run to a BenchmarkReportV01.
 
-    results: dict[str:Any] = data["benchmarks"][index]
+    Args:
+        data (dict): Parsed GuideLLM results file. Only the run-wide keys are
+            read, so ``benchmarks`` need not be present.
+        results (dict): One entry of the report's ``benchmarks`` list.
+        index (int): Index of ``results`` within ``benchmarks``.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
 
+    Returns:
+        BenchmarkReportV01: Imported data.
+    """
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV01
-    br_dict = _get_llmd_benchmark_envars()
+    br_dict = _get_llmd_benchmark_envars(run_context)
     # Append to that dict the data from GuideLLM
     update_dict(
         br_dict,
@@ -1386,18 +1430,26 @@ def import_guidellm(results_file: str, index: int = 0) -> BenchmarkReportV01:
     return load_benchmark_report(br_dict)
 
 
-def import_inference_perf_session(results_file: str) -> BenchmarkReportV01:
+def import_inference_perf_session(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV01:
     """Import data from an Inference Perf session lifecycle file as a BenchmarkReportV01.
 
     Args:
         results_file (str): Session lifecycle results file to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV01: Imported data.
     """
     check_file(results_file)
 
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get stage number from metrics filename
     try:
@@ -1407,7 +1459,7 @@ def import_inference_perf_session(results_file: str) -> BenchmarkReportV01:
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV01
-    br_dict = _get_llmd_benchmark_envars()
+    br_dict = _get_llmd_benchmark_envars(run_context)
     if br_dict:
         model_name = get_nested(br_dict, ["scenario", "model", "name"])
     else:
@@ -1499,41 +1551,56 @@ def import_inference_perf_session(results_file: str) -> BenchmarkReportV01:
     return load_benchmark_report(br_dict)
 
 
-def _get_num_guidellm_runs(results_file: str) -> int:
-    """Get the number of benchmark runs in a GuideLLM results JSON file.
+def iter_guidellm(
+    results_file: str, run_context: RunContext | None = None
+) -> Iterator[BenchmarkReportV01]:
+    """Import each benchmark of a GuideLLM run as a BenchmarkReportV01.
+
+    The results file is read once; see ``guidellm_native.iter_benchmarks``.
 
     Args:
-        results_file (str): Results file to get number of runs from.
+        results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
 
-    Returns:
-        int: Number of runs.
+    Yields:
+        BenchmarkReportV01: Imported data, in benchmark order.
     """
     check_file(results_file)
 
-    results = import_yaml(results_file)
-    return len(results["benchmarks"])
+    for data, index, results in guidellm_native.iter_benchmarks(results_file):
+        yield _guidellm_report(data, results, index, run_context)
 
 
-def import_guidellm_all(results_file: str) -> list[BenchmarkReportV01]:
+def import_guidellm_all(
+    results_file: str, run_context: RunContext | None = None
+) -> list[BenchmarkReportV01]:
     """Import all data from a GuideLLM results JSON as BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
 
     Returns:
         list[BenchmarkReportV01]: Imported data.
     """
-    reports = []
-    for index in range(_get_num_guidellm_runs(results_file)):
-        reports.append(import_guidellm(results_file, index))
-    return reports
+    return list(iter_guidellm(results_file, run_context))
 
 
-def import_inference_perf(results_file: str) -> BenchmarkReportV01:
+def import_inference_perf(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV01:
     """Import data from a Inference Perf run as a BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV01: Imported data.
@@ -1541,7 +1608,7 @@ def import_inference_perf(results_file: str) -> BenchmarkReportV01:
     check_file(results_file)
 
     # Import results from Inference Perf
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get stage number from metrics filename
     try:
@@ -1558,7 +1625,7 @@ def import_inference_perf(results_file: str) -> BenchmarkReportV01:
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV01
-    br_dict = _get_llmd_benchmark_envars()
+    br_dict = _get_llmd_benchmark_envars(run_context)
     if br_dict:
         model_name = get_nested(br_dict, ["scenario", "model", "name"])
     else:
@@ -2051,20 +2118,28 @@ def _aiperf_percentiles(data: dict, ms_to_s: bool = False) -> dict:
     }
 
 
-def import_aiperf(results_file: str) -> BenchmarkReportV01:
+def import_aiperf(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV01:
     """Import data from an aiperf run as a BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import (profile_export_aiperf.json).
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV01: Imported data.
     """
     check_file(results_file)
 
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
-    br_dict = _get_llmd_benchmark_envars()
+    br_dict = _get_llmd_benchmark_envars(run_context)
     if br_dict:
         model_name = get_nested(br_dict, ["scenario", "model", "name"])
     else:
@@ -2137,11 +2212,19 @@ def import_aiperf(results_file: str) -> BenchmarkReportV01:
     return load_benchmark_report(br_dict)
 
 
-def import_inference_max(results_file: str) -> BenchmarkReportV01:
+def import_inference_max(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV01:
     """Import data from an InferenceMAX benchmark run as a BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV01: Imported data.
@@ -2149,11 +2232,11 @@ def import_inference_max(results_file: str) -> BenchmarkReportV01:
     check_file(results_file)
 
     # Import results file from InferenceMAX benchmark
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV01
-    br_dict = _get_llmd_benchmark_envars()
+    br_dict = _get_llmd_benchmark_envars(run_context)
     # Append to that dict the data from InferenceMAX benchmark.
     update_dict(
         br_dict,
@@ -2261,18 +2344,26 @@ def import_inference_max(results_file: str) -> BenchmarkReportV01:
     return load_benchmark_report(br_dict)
 
 
-def import_nop(results_file: str) -> BenchmarkReportV01:
+def import_nop(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV01:
     """Import data from a nop run as a BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity; read from the
+            environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV01: Imported data.
     """
     check_file(results_file)
 
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     def _import_categories(cat_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
         new_cat_list = []
@@ -2296,7 +2387,7 @@ def import_nop(results_file: str) -> BenchmarkReportV01:
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV01
-    br_dict = _get_llmd_benchmark_envars()
+    br_dict = _get_llmd_benchmark_envars(run_context)
 
     engines = []
     for engine in results["scenario"]["platform"]["engines"]:
@@ -13,7 +13,7 @@ import hashlib
 import json
 import binascii
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from datetime import datetime, timezone
 
 import numpy as np
@@ -28,6 +28,7 @@ from .core import (
     load_benchmark_report,
     update_dict,
 )
+from .run_context import RunContext, read_run_metadata
 from .schema_v0_2 import BenchmarkReportV02, Component, Distribution, LoadSource
 from .schema_v0_2_components import HostType
 
@@ -56,7 +57,7 @@ def _normalize_concurrency(value: Any, zero_fallback: Any = None) -> Any:
     return value
 
 
-def _load_run_metadata() -> dict:
+def _load_run_metadata(run_context: RunContext | None = None) -> dict:
     """Load run metadata from the YAML file written by the harness script.
 
     The harness script writes run_metadata.yaml to the results directory
@@ -64,32 +65,40 @@ def _load_run_metadata() -> dict:
     when the subshell exits. This function reads that file as a fallback
     when os.environ doesn't have the harness timing/version data.
 
+    Args:
+        run_context: explicit run; its metadata is returned as-is.
+
     Returns:
         dict: metadata keys (harness_start, harness_stop, harness_delta,
               harness_args, harness_version, etc.) or empty dict if not found.
     """
-    results_dir = os.environ.get("LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR", "")
-    if not results_dir:
-        return {}
-    metadata_file = os.path.join(results_dir, "run_metadata.yaml")
-    try:
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    except (FileNotFoundError, yaml.YAMLError):
-        return {}
+    if run_context is not None:
+        return run_context.metadata
+    return read_run_metadata(os.environ.get("LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR", ""))
 
 
-def _get_harness_meta(key: str, env_name: str, default: str = "") -> str:
+def _get_harness_meta(
+    key: str,
+    env_name: str,
+    default: str = "",
+    run_context: RunContext | None = None,
+) -> str:
     """Get a harness metadata value from env var first, then run_metadata.yaml.
 
+    With an explicit *run_context* its metadata wins and the env var is only
+    a fallback; nothing is memoized.
+
     Args:
         key: key name in run_metadata.yaml (e.g., 'harness_start')
         env_name: environment variable name (e.g., 'LLMDBENCH_HARNESS_START')
         default: fallback value if neither source has it
+        run_context: explicit run to read instead of the environment
 
     Returns:
         str: the resolved value
     """
+    if run_context is not None:
+        return run_context.get(key, env_name, default)
     val = os.environ.get(env_name, "")
     if val:
         return val
@@ -104,15 +113,15 @@ def _get_harness_meta(key: str, env_name: str, default: str = "") -> str:
 _EXPERIMENT_ID_TAIL = re.compile(r"-\d{10,}-[a-z0-9]+$")
 
 
-def _resolve_experiment_id() -> str:
+def _resolve_experiment_id(run_context: RunContext | None = None) -> str:
     """Return the experiment ID, or "" when no source provides one."""
     # An unset envar arrives as "", so strip: whitespace would still be truthy.
     experiment_id = _get_harness_meta(
-        "experiment_id", "LLMDBENCH_RUN_EXPERIMENT_ID"
+        "experiment_id", "LLMDBENCH_RUN_EXPERIMENT_ID", run_context=run_context
     ).strip()
     if experiment_id:
         return experiment_id
-    results_dir = os.environ.get("LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR", "")
+    results_dir = _results_dir(run_context)
     if not results_dir:
         return ""
     experiment_id = re.sub(
@@ -125,25 +134,38 @@ def _resolve_experiment_id() -> str:
     return experiment_id
 
 
-def _user_description() -> str:
+def _results_dir(run_context: RunContext | None = None) -> str:
+    """The results directory being converted, or "" when unknown."""
+    if run_context is not None:
+        return run_context.results_dir
+    return os.environ.get("LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR", "")
+
+
+def _user_description(run_context: RunContext | None = None) -> str:
     """Return the submitter-supplied description, or "" when none was given."""
-    return _get_harness_meta("description_text", "LLMDBENCH_DESCRIPTION_TEXT").strip()
+    return _get_harness_meta(
+        "description_text", "LLMDBENCH_DESCRIPTION_TEXT", run_context=run_context
+    ).strip()
 
 
-def _user_keywords() -> list[str]:
+def _user_keywords(run_context: RunContext | None = None) -> list[str]:
     """Return the submitter-supplied keywords, or [] when none were given."""
-    raw = _get_harness_meta("description_keywords", "LLMDBENCH_DESCRIPTION_KEYWORDS")
+    raw = _get_harness_meta(
+        "description_keywords",
+        "LLMDBENCH_DESCRIPTION_KEYWORDS",
+        run_context=run_context,
+    )
     return [keyword.strip() for keyword in raw.split(",") if keyword.strip()]
 
 
-def _run_description(experiment_id: str) -> str:
+def _run_description(experiment_id: str, run_context: RunContext | None = None) -> str:
     """A submitter-supplied description wins over the experiment ID.
 
     The ID is not prefixed with the model: it already encodes the treatment and
     is unique across a sweep, and the model is reported under scenario.stack, so
     prefixing it made consumers that show both render the model twice.
     """
-    user_description = _user_description()
+    user_description = _user_description(run_context)
     if user_description:
         return user_description
 
@@ -343,7 +365,7 @@ def _resolve_accelerator_model(ev_dict: dict) -> str:
     return accelerator or _detect_accelerator_model(ev_dict)
 
 
-def _populate_run_identity() -> dict:
+def _populate_run_identity(run_context: RunContext | None = None) -> dict:
     """Create the run identity fields derived from the experiment ID.
 
     Needs no kubernetes context, so it also applies when analysis runs on the
@@ -353,14 +375,14 @@ def _populate_run_identity() -> dict:
     run = {}
     # Submitter-supplied values stand on their own: neither needs an experiment
     # ID to be correct, and keywords have no other source at all.
-    user_description = _user_description()
+    user_description = _user_description(run_context)
     if user_description:
         run["description"] = user_description
-    keywords = _user_keywords()
+    keywords = _user_keywords(run_context)
     if keywords:
         run["keywords"] = keywords
 
-    experiment_id = _resolve_experiment_id()
+    experiment_id = _resolve_experiment_id(run_context)
     if not experiment_id:
         # Otherwise this surfaces only as an empty dashboard column, long after
         # the cluster is gone.
@@ -372,15 +394,16 @@ def _populate_run_identity() -> dict:
         return {"run": run} if run else {}
 
     run["eid"] = str(uuid.uuid5(uuid.NAMESPACE_URL, experiment_id))
-    run.setdefault("description", _run_description(experiment_id))
+    run.setdefault("description", _run_description(experiment_id, run_context))
     return {"run": run}
 
 
-def _populate_run(ev_dict: dict) -> dict:
+def _populate_run(ev_dict: dict, run_context: RunContext | None = None) -> dict:
     """Create a benchmark report with run details from environment variables.
 
     Args:
         ev_dict (dict): Environment variable values.
+        run_context (RunContext | None): Explicit run identity and metadata.
 
     Returns:
         dict: dict with run section of BenchmarkReport.
@@ -422,27 +445,36 @@ def _populate_run(ev_dict: dict) -> dict:
             "pid": pid,
             "user": "namespace=" + namespace,
             "time": {
-                "start": _get_harness_meta("harness_start", "LLMDBENCH_HARNESS_START"),
-                "end": _get_harness_meta("harness_stop", "LLMDBENCH_HARNESS_STOP"),
+                "start": _get_harness_meta(
+                    "harness_start", "LLMDBENCH_HARNESS_START", run_context=run_context
+                ),
+                "end": _get_harness_meta(
+                    "harness_stop", "LLMDBENCH_HARNESS_STOP", run_context=run_context
+                ),
                 "duration": _get_harness_meta(
-                    "harness_delta", "LLMDBENCH_HARNESS_DELTA"
+                    "harness_delta", "LLMDBENCH_HARNESS_DELTA", run_context=run_context
                 ),
             },
         },
     }
-    update_dict(br_dict, _populate_run_identity())
+    update_dict(br_dict, _populate_run_identity(run_context))
 
     return br_dict
 
 
-def _populate_load() -> dict:
+def _populate_load(run_context: RunContext | None = None) -> dict:
     """Create a benchmark report with scenario.load from environment variables.
 
+    Args:
+        run_context (RunContext | None): Explicit run identity and metadata.
+
     Returns:
         dict: dict with scenario.load part of of BenchmarkReport.
     """
     # Get arguments to harness command (env var first, then run_metadata.yaml)
-    args_str = _get_harness_meta("harness_args", "LLMDBENCH_HARNESS_ARGS")
+    args_str = _get_harness_meta(
+        "harness_args", "LLMDBENCH_HARNESS_ARGS", run_context=run_context
+    )
     kv_pairs = [kv.strip() for kv in args_str.split("--") if kv.strip()]
     args = {}
     for kv in kv_pairs:
@@ -469,8 +501,8 @@ def _populate_load() -> dict:
         os.environ.get("LLMDBENCH_RUN_EXPERIMENT_HARNESS_WORKLOAD_NAME", ""),
         args.get("config_file", ""),
     ]
-    run_metadata = _load_run_metadata()
-    results_dir = os.environ.get("LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR", "")
+    run_metadata = _load_run_metadata(run_context)
+    results_dir = _results_dir(run_context)
     harness_workload = run_metadata.get("harness_workload", "")
     if results_dir and harness_workload:
         config_candidates.append(os.path.join(results_dir, harness_workload))
@@ -490,7 +522,9 @@ def _populate_load() -> dict:
             "load": {
                 "standardized": {
                     "tool_version": _get_harness_meta(
-                        "harness_version", "LLMDBENCH_HARNESS_VERSION"
+                        "harness_version",
+                        "LLMDBENCH_HARNESS_VERSION",
+                        run_context=run_context,
                     ),
                     "parallelism": os.environ.get(
                         "LLMDBENCH_HARNESS_LOAD_PARALLELISM", 1
@@ -914,9 +948,15 @@ def _ev_dict_from_params(data: dict) -> dict:
     return ev
 
 
-def _populate_benchmark_report_from_envars() -> dict:
+def _populate_benchmark_report_from_envars(
+    run_context: RunContext | None = None,
+) -> dict:
     """Create a benchmark report with details from environment variables.
 
+    Args:
+        run_context (RunContext | None): Explicit run identity and metadata;
+            when None they are read from the environment.
+
     Returns:
         dict: run and scenario following schema of BenchmarkReport.
     """
@@ -934,7 +974,7 @@ def _populate_benchmark_report_from_envars() -> dict:
     if "LLMDBENCH_MAGIC_ENVAR" not in os.environ:
         # No kubernetes context here, but the run identity comes from the
         # results directory, which the driver does have.
-        update_dict(br_dict, _populate_run_identity())
+        update_dict(br_dict, _populate_run_identity(run_context))
         return br_dict
 
     # Get Kubernetes context
@@ -961,7 +1001,7 @@ def _populate_benchmark_report_from_envars() -> dict:
     # In run-only mode (--endpoint-url without standup), the ConfigMap and
     # ev.yaml won't exist. Fall back to run_metadata.yaml for basic stack info.
     if not ev_dict:
-        run_meta = _load_run_metadata()
+        run_meta = _load_run_metadata(run_context)
         if run_meta:
             ev_dict = {
                 "deploy_current_model": run_meta.get("model", ""),
@@ -971,9 +1011,9 @@ def _populate_benchmark_report_from_envars() -> dict:
             }
 
     # Fill in more run details
-    update_dict(br_dict, _populate_run(ev_dict))
+    update_dict(br_dict, _populate_run(ev_dict, run_context))
     # Populate part of scenario.load
-    update_dict(br_dict, _populate_load())
+    update_dict(br_dict, _populate_load(run_context))
     # Populate part of scenario.stack
     update_dict(br_dict, _populate_stack(ev_dict))
 
@@ -1010,11 +1050,19 @@ def _vllm_timestamp_to_iso(date_str: str) -> str:
     )
 
 
-def import_vllm_benchmark(results_file: str) -> BenchmarkReportV02:
+def import_vllm_benchmark(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV02:
     """Import data from a vLLM benchmark run as a BenchmarkReport.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV02: Imported data.
@@ -1022,11 +1070,11 @@ def import_vllm_benchmark(results_file: str) -> BenchmarkReportV02:
     check_file(results_file)
 
     # Import results file from vLLM benchmark
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV02
-    br_dict = _populate_benchmark_report_from_envars()
+    br_dict = _populate_benchmark_report_from_envars(run_context)
 
     cfg_id = config_hash(get_nested(br_dict, ["scenario", "load", "native"]))
 
@@ -1227,20 +1275,28 @@ def _aiperf_percentiles(data: dict, ms_to_s: bool = False) -> dict:
     }
 
 
-def import_aiperf(results_file: str) -> BenchmarkReportV02:
+def import_aiperf(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV02:
     """Import data from an aiperf run as a BenchmarkReportV02.
 
     Args:
         results_file (str): Results file to import (profile_export_aiperf.json).
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV02: Imported data.
     """
     check_file(results_file)
 
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
-    br_dict = _populate_benchmark_report_from_envars()
+    br_dict = _populate_benchmark_report_from_envars(run_context)
 
     model_name = get_nested(  # noqa: F841
         br_dict,
@@ -1360,11 +1416,19 @@ def import_aiperf(results_file: str) -> BenchmarkReportV02:
     return load_benchmark_report(br_dict)
 
 
-def import_inference_max(results_file: str) -> BenchmarkReportV02:
+def import_inference_max(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV02:
     """Import data from an InferenceMAX benchmark run as a BenchmarkReportV01.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV02: Imported data.
@@ -1372,11 +1436,11 @@ def import_inference_max(results_file: str) -> BenchmarkReportV02:
     check_file(results_file)
 
     # Import results file from vLLM benchmark
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV02
-    br_dict = _populate_benchmark_report_from_envars()
+    br_dict = _populate_benchmark_report_from_envars(run_context)
 
     cfg_id = config_hash(get_nested(br_dict, ["scenario", "load", "native"]))
 
@@ -1605,7 +1669,9 @@ def agentic_stat(xs: list[float], units: Units) -> dict | None:
     }
 
 
-def import_eval_containers(results_file: str) -> BenchmarkReportV02:
+def import_eval_containers(
+    results_file: str, run_context: RunContext | None = None
+) -> BenchmarkReportV02:
     """Convert eval-containers agentic output into a v0.2 Benchmark Report.
 
     eval-containers runs a real agent, not a synthetic load generator, so its
@@ -1703,7 +1769,7 @@ def import_eval_containers(results_file: str) -> BenchmarkReportV02:
         (t_last - t_first) / 1e9 if (t_first and t_last and t_last > t_first) else None
     )
 
-    br_dict = _populate_benchmark_report_from_envars()
+    br_dict = _populate_benchmark_report_from_envars(run_context)
     # The harness-pod skeleton fills scenario.load.* from the run env; provide
     # agentic-appropriate defaults so the report is valid outside a pod too.
     load = br_dict.setdefault("scenario", {}).setdefault("load", {})
@@ -1756,11 +1822,19 @@ def import_eval_containers(results_file: str) -> BenchmarkReportV02:
     return load_benchmark_report(br_dict)
 
 
-def import_inference_perf(results_file: str) -> BenchmarkReportV02:
+def import_inference_perf(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV02:
     """Import data from a Inference Perf run as a BenchmarkReportV02.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV02: Imported data.
@@ -1768,7 +1842,7 @@ def import_inference_perf(results_file: str) -> BenchmarkReportV02:
     check_file(results_file)
 
     # Import results from Inference Perf
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get stage number from metrics filename
     try:
@@ -1778,7 +1852,7 @@ def import_inference_perf(results_file: str) -> BenchmarkReportV02:
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV02
-    br_dict = _populate_benchmark_report_from_envars()
+    br_dict = _populate_benchmark_report_from_envars(run_context)
 
     config = get_nested(br_dict, ["scenario", "load", "native", "config"], {})
     cfg_id = config_hash(config)
@@ -2599,18 +2673,26 @@ def import_inference_perf(results_file: str) -> BenchmarkReportV02:
     return load_benchmark_report(br_dict)
 
 
-def import_inference_perf_session(results_file: str) -> BenchmarkReportV02:
+def import_inference_perf_session(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV02:
     """Import data from an Inference Perf session lifecycle file as a BenchmarkReportV02.
 
     Args:
         results_file (str): Session lifecycle results file to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV02: Imported data.
     """
     check_file(results_file)
 
-    results = import_yaml(results_file)
+    results = import_yaml(results_file) if native is None else native
 
     # Get stage number from metrics filename
     try:
@@ -2620,7 +2702,7 @@ def import_inference_perf_session(results_file: str) -> BenchmarkReportV02:
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV02
-    br_dict = _populate_benchmark_report_from_envars()
+    br_dict = _populate_benchmark_report_from_envars(run_context)
 
     config = get_nested(br_dict, ["scenario", "load", "native", "config"], {})
     cfg_id = config_hash(config)
@@ -2714,22 +2796,48 @@ def import_inference_perf_session(results_file: str) -> BenchmarkReportV02:
     return load_benchmark_report(br_dict)
 
 
-def import_guidellm(results_file: str, index: int = 0) -> BenchmarkReportV02:
+def import_guidellm(
+    results_file: str,
+    index: int = 0,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+) -> BenchmarkReportV02:
     """Import data from a GuideLLM run as a BenchmarkReportV02.
 
     Args:
         results_file (str): Results file to import.
         index (int): Benchmark index to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
 
     Returns:
         BenchmarkReportV02: Imported data.
     """
     check_file(results_file)
 
-    data = import_yaml(results_file)
+    data = import_yaml(results_file) if native is None else native
+
+    return _guidellm_report(data, data["benchmarks"][index], index, run_context)
+
+
+def _guidellm_report(
+    data: dict, results: dict, index: int, run_context: RunContext | None = None
+) -> BenchmarkReportV02:
+    """Convert a single benchmark of a GuideLLM run to a BenchmarkReportV02.
 
-    results = data["benchmarks"][index]
+    Args:
+        data (dict): Parsed GuideLLM results file. Only the run-wide keys are
+            read, so ``benchmarks`` need not be present.
+        results (dict): One entry of the report's ``benchmarks`` list.
+        index (int): Index of ``results`` within ``benchmarks``.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
 
+    Returns:
+        BenchmarkReportV02: Imported data.
+    """
     # Convert Unix epoch floats to ISO-8601 timestamps
     t_start = (
         datetime.fromtimestamp(results["start_time"], tz=timezone.utc)
@@ -2744,7 +2852,7 @@ def import_guidellm(results_file: str, index: int = 0) -> BenchmarkReportV02:
 
     # Get environment variables from llm-d-benchmark run as a dict following the
     # schema of BenchmarkReportV02
-    br_dict = _populate_benchmark_report_from_envars()
+    br_dict = _populate_benchmark_report_from_envars(run_context)
 
     native = get_nested(br_dict, ["scenario", "load", "native"])
     # If config file was loaded, use that, otherwise extract config from results file
@@ -4267,31 +4375,40 @@ def import_guidellm(results_file: str, index: int = 0) -> BenchmarkReportV02:
     return load_benchmark_report(br_dict)
 
 
-def _get_num_guidellm_runs(results_file: str) -> int:
-    """Get the number of benchmark runs in a GuideLLM results JSON file.
+def iter_guidellm(
+    results_file: str, run_context: RunContext | None = None
+) -> Iterator[BenchmarkReportV02]:
+    """Import each benchmark of a GuideLLM run as a BenchmarkReportV02.
+
+    The results file is read once, and a JSON file is decoded one benchmark
+    at a time, so conversion is linear in the number of benchmarks and only
+    one of them is held in memory.
 
     Args:
-        results_file (str): Results file to get number of runs from.
+        results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
 
-    Returns:
-        int: Number of runs.
+    Yields:
+        BenchmarkReportV02: Imported data, in benchmark order.
     """
     check_file(results_file)
 
-    results = import_yaml(results_file)
-    return len(results["benchmarks"])
+    for data, index, results in guidellm_native.iter_benchmarks(results_file):
+        yield _guidellm_report(data, results, index, run_context)
 
 
-def import_guidellm_all(results_file: str) -> list[BenchmarkReportV02]:
+def import_guidellm_all(
+    results_file: str, run_context: RunContext | None = None
+) -> list[BenchmarkReportV02]:
     """Import all data from a GuideLLM results JSON as BenchmarkReport.
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
 
     Returns:
         list[BenchmarkReportV02]: Imported data.
     """
-    reports = []
-    for index in range(_get_num_guidellm_runs(results_file)):
-        reports.append(import_guidellm(results_file, index))
-    return reports
+    return list(iter_guidellm(results_file, run_context))
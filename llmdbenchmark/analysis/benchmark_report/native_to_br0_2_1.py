@@ -13,7 +13,9 @@ construction, a valid v0.2.1 report.
 """
 
 from .base import Units
-from .core import import_yaml, load_benchmark_report, update_dict
+from .core import check_file, import_yaml, load_benchmark_report, update_dict
+from .run_context import RunContext
+from .schema_v0_2 import BenchmarkReportV02
 from .schema_v0_2_1 import BenchmarkReportV021
 
 # Re-export the v0.2 converters that v0.2.1 does not change, so the CLI can
@@ -24,6 +26,7 @@ from .native_to_br0_2 import (  # noqa: F401
     import_inference_perf_session,
     import_guidellm,
     import_guidellm_all,
+    iter_guidellm,
 )
 from .native_to_br0_2 import import_inference_perf as _import_inference_perf_v0_2
 
@@ -118,7 +121,12 @@ def _build_multimodal(successes: dict) -> dict:
     return multimodal
 
 
-def import_inference_perf(results_file: str) -> BenchmarkReportV021:
+def import_inference_perf(
+    results_file: str,
+    run_context: RunContext | None = None,
+    native: dict | None = None,
+    report_v0_2: BenchmarkReportV02 | None = None,
+) -> BenchmarkReportV021:
     """Import data from an Inference Perf run as a BenchmarkReportV021.
 
     Delegates the v0.2 portion of the report to the v0.2 converter, then folds
@@ -127,15 +135,24 @@ def import_inference_perf(results_file: str) -> BenchmarkReportV021:
 
     Args:
         results_file (str): Results file to import.
+        run_context (RunContext | None): Run identity and metadata; read from
+            the environment when None.
+        native (dict | None): Already-parsed contents of ``results_file``;
+            the file is read when None.
+        report_v0_2 (BenchmarkReportV02 | None): The v0.2 report of the same
+            file, when the caller has already built it.
 
     Returns:
         BenchmarkReportV021: Imported data.
     """
+    check_file(results_file)
+    results = import_yaml(results_file) if native is None else native
+
     # Reuse all the v0.2 logic (scenario, latency, token throughput, ...).
-    br_dict = _import_inference_perf_v0_2(results_file).dump()
+    if report_v0_2 is None:
+        report_v0_2 = _import_inference_perf_v0_2(results_file, run_context, results)
+    br_dict = report_v0_2.dump()
     br_dict["version"] = "0.2.1"
-
-    results = import_yaml(results_file)
     successes = results.get("successes")
 
     # Multimodal stats live under successes; when every request failed the v0.2
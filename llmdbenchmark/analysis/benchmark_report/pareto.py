@@ -0,0 +1,152 @@
+"""Vectorized Pareto-front and SLO filtering over benchmark result tables.
+
+A row is on the Pareto front when no other row is strictly better in every
+objective -- the definition the analysis explorer has always used, so rows
+tied in one objective all stay on the front. A row with a missing (NaN)
+objective can neither dominate nor be dominated, exactly as with the
+element-wise comparisons these functions replace, so it is kept.
+
+Both functions take a plain ``(rows, objectives)`` array plus the direction of
+each objective, so they serve a pandas DataFrame (``df[cols].to_numpy(float)``)
+as well as lists of report rows.
+
+For two objectives the front is a sort and a running minimum, O(n log n). More
+objectives are swept in blocks against the front found so far, which costs
+O(n * front size) comparisons but runs them as NumPy array operations.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+# Cap on elements of a block-vs-front comparison in the N-objective sweep.
+_SWEEP_BLOCK_ELEMENTS = 1 << 22
+
+
+def _costs(values: np.ndarray, maximize: Sequence[bool] | None) -> np.ndarray:
+    """Get values as a 2-D float array where lower is better in every column."""
+    costs = np.array(values, dtype=np.float64)
+    if costs.ndim == 1:
+        costs = costs[:, None]
+    if maximize is not None:
+        flip = np.asarray(maximize, dtype=bool)
+        if flip.shape != (costs.shape[1],):
+            raise ValueError(
+                f"maximize has {flip.size} entries for {costs.shape[1]} objectives"
+            )
+        costs[:, flip] = -costs[:, flip]
+    return costs
+
+
+def _dominated_2d(costs: np.ndarray) -> np.ndarray:
+    """Flag rows some other row beats strictly in both columns."""
+    first, second = costs[:, 0], costs[:, 1]
+    order = np.argsort(first, kind="stable")
+    best_second = np.minimum.accumulate(second[order])
+    # Rows with a strictly smaller first objective sort before this index.
+    before = np.searchsorted(first[order], first, side="left")
+    return (before > 0) & (best_second[np.maximum(before - 1, 0)] < second)
+
+
+def _dominates_any(dominators: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Flag each of ``rows`` that some dominator beats in every column."""
+    if not len(dominators):
+        return np.zeros(len(rows), dtype=bool)
+    better = dominators[None, :, :] < rows[:, None, :]
+    return better.all(axis=2).any(axis=1)
+
+
+def _dominated_nd(costs: np.ndarray) -> np.ndarray:
+    """Flag strictly dominated rows for any number of columns.
+
+    Sorted by the first column, a row can only be dominated by rows before it,
+    and checking it against the non-dominated ones among those is enough, since
+    whatever dominates a dominated row dominates everything that row does.
+    """
+    order = np.lexsort(costs.T[::-1])
+    ordered = costs[order]
+    n, k = ordered.shape
+    dominated = np.zeros(n, dtype=bool)
+    front = ordered[:0]
+    start = 0
+    while start < n:
+        size = _SWEEP_BLOCK_ELEMENTS // (k * (len(front) + 1024))
+        size = max(1, min(1024, size))
+        block = ordered[start : start + size]
+        flags = _dominates_any(front, block)
+        # Survivors of the front need checking only against each other: a
+        # block row dominated by the front cannot dominate anything it misses.
+        survivors = np.flatnonzero(~flags)
+        flags[survivors] = _dominates_any(block[survivors], block[survivors])
+        dominated[start : start + size] = flags
+        front = np.concatenate((front, block[~flags]))
+        start += size
+    result = np.empty(n, dtype=bool)
+    result[order] = dominated
+    return result
+
+
+def pareto_mask(
+    values: np.ndarray, maximize: Sequence[bool] | None = None
+) -> np.ndarray:
+    """Flag the rows on the Pareto front.
+
+    Args:
+        values (np.ndarray): ``(rows, objectives)`` array, or one objective as a
+            1-D array.
+        maximize (Sequence[bool] | None): Per objective, True when higher is
+            better. None minimizes every objective.
+
+    Returns:
+        np.ndarray: Boolean mask, True for rows no other row beats strictly in
+            every objective, and for rows with a NaN objective.
+
+    Raises:
+        ValueError: If ``maximize`` does not have one entry per objective.
+    """
+    costs = _costs(values, maximize)
+    mask = np.ones(len(costs), dtype=bool)
+    rows = np.flatnonzero(~np.isnan(costs).any(axis=1))
+    if len(rows) < 2 or not costs.shape[1]:
+        return mask
+
+    ranked = costs[rows]
+    if ranked.shape[1] == 1:
+        dominated = ranked[:, 0] > ranked[:, 0].min()
+    elif ranked.shape[1] == 2:
+        dominated = _dominated_2d(ranked)
+    else:
+        dominated = _dominated_nd(ranked)
+    mask[rows[dominated]] = False
+    return mask
+
+
+def slo_mask(
+    values: np.ndarray,
+    thresholds: Sequence[float],
+    maximize: Sequence[bool] | None = None,
+) -> np.ndarray:
+    """Flag the rows meeting every service level objective.
+
+    Args:
+        values (np.ndarray): ``(rows, objectives)`` array, or one objective as a
+            1-D array.
+        thresholds (Sequence[float]): Limit per objective, inclusive: a row must
+            be no higher where lower is better, no lower where higher is better.
+        maximize (Sequence[bool] | None): Per objective, True when higher is
+            better. None minimizes every objective.
+
+    Returns:
+        np.ndarray: Boolean mask; a NaN value never meets its objective.
+
+    Raises:
+        ValueError: If ``thresholds`` or ``maximize`` does not have one entry
+            per objective.
+    """
+    costs = _costs(values, maximize)
+    limits = _costs(np.asarray(thresholds, dtype=np.float64)[None, :], maximize)
+    if limits.shape[1] != costs.shape[1]:
+        raise ValueError(
+            f"{limits.shape[1]} thresholds for {costs.shape[1]} objectives"
+        )
+    return (costs <= limits).all(axis=1)
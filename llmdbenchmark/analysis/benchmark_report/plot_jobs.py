@@ -0,0 +1,237 @@
+"""Incremental, parallel rendering of analysis PNGs.
+
+The analysis passes -- per-request distributions, metric time series, session
+bar charts and the cross-treatment comparisons -- used to draw dozens of
+matplotlib figures one after another, all of them again on every re-run. Each
+plot is now a :class:`PlotJob`: a module-level render function plus the
+pre-extracted data it draws, so it pickles into a worker process (the Agg
+backend keeps no state across processes).
+
+:func:`run_plot_jobs` records a digest of every job's inputs in a
+``.plot-digests.json`` manifest next to its PNG and skips jobs whose PNG exists
+with an unchanged digest, so re-running analysis after adding one treatment
+redraws only the figures that treatment changes. The digest covers the data,
+the source of the module defining the render function and the matplotlib
+version, so editing a plot's code also redraws it. Only that one module's
+source is hashed: editing a helper the render function imports from another
+module does not invalidate existing PNGs (delete the manifest to force a
+redraw).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+MANIFEST_NAME = ".plot-digests.json"
+
+logger = logging.getLogger(__name__)
+
+
+def plot_workers_from_env() -> int:
+    """Render processes for :func:`run_plot_jobs`.
+
+    Read from ``LLMDBENCH_PLOT_WORKERS``; defaults to 1 (render in-process,
+    one figure after another).
+    """
+    try:
+        return max(1, int(os.environ.get("LLMDBENCH_PLOT_WORKERS", "1")))
+    except ValueError:
+        return 1
+
+
+@dataclass(frozen=True)
+class PlotJob:
+    """One PNG, drawn by ``render(output, **data)``.
+
+    Attributes:
+        output (str): Path of the PNG to write.
+        render (Callable): Module-level function, so the job pickles into a
+            worker. It must draw from *data* alone and save to *output*.
+        data (dict): Pre-extracted inputs: numbers, strings, datetimes and
+            (nested) lists, tuples or dicts of them, or NumPy arrays.
+    """
+
+    output: str
+    render: Callable[..., None]
+    data: dict = field(default_factory=dict)
+
+    def digest(self) -> str:
+        """Hash of the PNG's inputs: data, render module source, matplotlib.
+
+        Only the source file of ``render.__module__`` is hashed, not the
+        modules it imports, so changes to shared plotting helpers elsewhere
+        do not change the digest.
+        """
+        h = hashlib.sha256()
+        h.update(f"{self.render.__module__}.{self.render.__qualname__}".encode())
+        h.update(_source_digest(self.render.__module__).encode())
+        h.update(_matplotlib_version().encode())
+        h.update(
+            json.dumps(
+                self.data, sort_keys=True, separators=(",", ":"), default=_jsonable
+            ).encode()
+        )
+        return h.hexdigest()
+
+
+@dataclass
+class PlotRunResult:
+    """Outcome of :func:`run_plot_jobs`.
+
+    Attributes:
+        drawn (int): PNGs rendered by this run.
+        skipped (int): PNGs left as they were because their inputs are unchanged.
+        failed (dict[str, str]): Output path -> error for jobs that raised.
+    """
+
+    drawn: int = 0
+    skipped: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def plotted(self) -> int:
+        """PNGs that are current after the run (drawn or unchanged)."""
+        return self.drawn + self.skipped
+
+
+def _jsonable(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+        return obj.tolist()
+    if isinstance(obj, os.PathLike):
+        return os.fspath(obj)
+    raise TypeError(f"cannot hash plot input of type {type(obj).__name__}")
+
+
+@lru_cache(maxsize=None)
+def _source_digest(module_name: str) -> str:
+    """SHA-256 of *module_name*'s own source file ("" when it has none)."""
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return ""
+
+
+@lru_cache(maxsize=1)
+def _matplotlib_version() -> str:
+    try:
+        import matplotlib
+    except ImportError:
+        return ""
+    return matplotlib.__version__
+
+
+def _load_manifest(directory: str) -> dict[str, str]:
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_manifest(directory: str, manifest: dict[str, str]) -> None:
+    path = os.path.join(directory, MANIFEST_NAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _draw(job: PlotJob) -> None:
+    try:
+        import matplotlib
+    except ImportError:
+        pass  # the render function reports it when it imports pyplot
+    else:
+        matplotlib.use("Agg")
+    job.render(job.output, **job.data)
+
+
+def run_plot_jobs(
+    jobs: Iterable[PlotJob],
+    workers: int | None = None,
+    manifest: bool = True,
+) -> PlotRunResult:
+    """Draw every job whose PNG is missing or whose inputs changed.
+
+    Args:
+        jobs: Plots to bring up to date; outputs must be distinct.
+        workers: Render processes (default: :func:`plot_workers_from_env`).
+            With 1, or a single stale job, jobs render in this process.
+        manifest: Read and update ``.plot-digests.json``. When False every
+            job is drawn and no manifest is written or consulted.
+
+    Returns:
+        Counts of drawn and skipped PNGs, and the errors of failed jobs
+        (which are dropped from the manifest so the next run retries them).
+    """
+    jobs = list(jobs)
+    if workers is None:
+        workers = plot_workers_from_env()
+
+    result = PlotRunResult()
+    manifests: dict[str, dict[str, str]] = {}
+    pending: list[tuple[PlotJob, str]] = []
+    if not manifest:
+        pending = [(job, "") for job in jobs]
+        jobs = []
+    for job in jobs:
+        directory, name = os.path.split(os.path.abspath(job.output))
+        recorded = manifests.get(directory)
+        if recorded is None:
+            recorded = manifests[directory] = _load_manifest(directory)
+        digest = job.digest()
+        if recorded.get(name) == digest and os.path.exists(job.output):
+            result.skipped += 1
+            continue
+        recorded.pop(name, None)
+        pending.append((job, digest))
+
+    def _record(job: PlotJob, digest: str, error: BaseException | None) -> None:
+        directory, name = os.path.split(os.path.abspath(job.output))
+        if error is None:
+            if manifest:
+                manifests[directory][name] = digest
+            result.drawn += 1
+        else:
+            result.failed[job.output] = str(error)
+
+    if workers <= 1 or len(pending) <= 1:
+        for job, digest in pending:
+            try:
+                _draw(job)
+            except Exception as exc:
+                _record(job, digest, exc)
+            else:
+                _record(job, digest, None)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {
+                pool.submit(_draw, job): (job, digest) for job, digest in pending
+            }
+            for future in as_completed(futures):
+                job, digest = futures[future]
+                _record(job, digest, future.exception())
+
+    if pending:
+        for directory, recorded in manifests.items():
+            try:
+                _save_manifest(directory, recorded)
+            except OSError as exc:
+                logger.warning(
+                    "Could not record plot digests in %s: %s", directory, exc
+                )
+    return result
@@ -0,0 +1,104 @@
+"""
+Explicit run identity and metadata for the native-to-report converters.
+
+The converters used to read the results directory, experiment ID, submitter
+description and harness timing from process-global environment variables
+(and memoize run_metadata.yaml on a function attribute), so converting two
+treatments at once in one process mixed their identities. A :class:`RunContext`
+carries those values for one results directory; every ``import_*`` function
+accepts one, and falls back to the environment only when none is given.
+"""
+
+import os
+from dataclasses import dataclass, field
+
+import yaml
+
+# run_metadata.yaml key -> environment variable the harness pod exports for it.
+META_ENVARS: dict[str, str] = {
+    "experiment_id": "LLMDBENCH_RUN_EXPERIMENT_ID",
+    "description_text": "LLMDBENCH_DESCRIPTION_TEXT",
+    "description_keywords": "LLMDBENCH_DESCRIPTION_KEYWORDS",
+    "harness_start": "LLMDBENCH_HARNESS_START",
+    "harness_stop": "LLMDBENCH_HARNESS_STOP",
+    "harness_delta": "LLMDBENCH_HARNESS_DELTA",
+    "harness_args": "LLMDBENCH_HARNESS_ARGS",
+    "harness_version": "LLMDBENCH_HARNESS_VERSION",
+}
+
+# Identity keys never fall back to the environment: a stale value left in the
+# driver's shell would stamp every treatment of a sweep with one identity.
+IDENTITY_KEYS = ("experiment_id", "description_text", "description_keywords")
+
+
+def read_run_metadata(results_dir: str) -> dict:
+    """Load ``run_metadata.yaml`` from *results_dir*, or {} if absent/invalid."""
+    if not results_dir:
+        return {}
+    metadata_file = os.path.join(results_dir, "run_metadata.yaml")
+    try:
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except (FileNotFoundError, yaml.YAMLError):
+        return {}
+
+
+@dataclass(frozen=True)
+class RunContext:
+    """Identity and harness metadata of one results directory.
+
+    Attributes:
+        results_dir (str): Directory holding the results and run_metadata.yaml.
+        metadata (dict): run_metadata.yaml contents; these win over the
+            environment, which is consulted only for keys missing here.
+    """
+
+    results_dir: str = ""
+    metadata: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_results_dir(cls, results_dir) -> "RunContext":
+        """Context for converting *results_dir* off the harness pod.
+
+        Identity comes only from the directory's own run_metadata.yaml (and
+        its name), never from the ambient environment.
+        """
+        results_dir = str(results_dir)
+        metadata = read_run_metadata(results_dir)
+        for key in IDENTITY_KEYS:
+            metadata[key] = str(metadata.get(key) or "").strip()
+        return cls(results_dir=results_dir, metadata=metadata)
+
+    @classmethod
+    def from_env(cls) -> "RunContext":
+        """Context equivalent to the environment of a harness pod.
+
+        Non-empty environment variables win over run_metadata.yaml, which is
+        the order the converters always used in-pod.
+        """
+        results_dir = os.environ.get("LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR", "")
+        metadata = read_run_metadata(results_dir)
+        for key, env_name in META_ENVARS.items():
+            if os.environ.get(env_name, ""):
+                metadata[key] = os.environ[env_name]
+        return cls(results_dir=results_dir, metadata=metadata)
+
+    def get(self, key: str, env_name: str = "", default: str = "") -> str:
+        """Metadata value for *key*, else ``$env_name``, else *default*."""
+        if key in self.metadata:
+            # A valueless YAML key parses to None; str() would make it "None".
+            value = self.metadata[key]
+            return default if value is None else str(value)
+        env_name = env_name or META_ENVARS.get(key, "")
+        return (os.environ.get(env_name, "") if env_name else "") or default
+
+    @property
+    def experiment_id(self) -> str:
+        return self.get("experiment_id").strip()
+
+    def as_env(self) -> dict[str, str]:
+        """The environment a separate converter process needs for this run."""
+        env = {"LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR": self.results_dir}
+        for key in IDENTITY_KEYS:
+            env[META_ENVARS[key]] = self.get(key)
+        return env
@@ -0,0 +1,478 @@
+"""Columnar cache of a run's raw Prometheus scrapes.
+
+The metrics collector writes one ``metrics/raw/*.log`` file per pod per scrape:
+a few ``# Key: value`` header lines (``Timestamp``, ``Pod``, ``Namespace``)
+followed by Prometheus exposition samples. Several analysis passes read the same
+files -- process_metrics.py, visualize_metrics.py, the time series embedded in
+benchmark reports and the cross-treatment cache plots -- so a long run with tens
+of thousands of scrapes used to be re-parsed line by line by each of them.
+
+:func:`load_scrape_store` parses the files once into flat NumPy columns and
+persists them as ``metrics/scrape_store.npz``, next to ``metrics/raw``. Each
+later load checks every file's size and mtime against the cache and re-parses
+only files that were added or rewritten since.
+"""
+
+import fnmatch
+import os
+import re
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import numpy as np
+
+CACHE_FILE_NAME = "scrape_store.npz"
+
+# Bump when the parsed columns change meaning, so old caches are rebuilt.
+_CACHE_VERSION = 2
+
+_METRIC_NAME_RE = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"')
+_LABEL_ESCAPE_RE = re.compile(r"\\(.)")
+
+_HEADERS = {
+    "# Timestamp:": "timestamp",
+    "# Pod:": "pod",
+    "# Namespace:": "namespace",
+}
+
+# Per-file columns, then per-sample columns, then string tables.
+_FILE_COLUMNS = (
+    "files",
+    "file_mtime_ns",
+    "file_size",
+    "file_timestamp",
+    "file_pod",
+    "file_namespace",
+)
+_ROW_COLUMNS = ("row_file", "row_metric", "row_labels", "values")
+_TABLES = ("metric_names", "label_sets")
+
+
+def parse_scrape_file(file_path: str) -> tuple[dict[str, str], list[tuple]]:
+    """Parse one raw scrape file.
+
+    A sample line is ``name[{labels}] value [timestamp]``. Lines that do not
+    parse, and samples whose value is not finite (``NaN``, ``+Inf``), are
+    skipped, matching what the per-consumer regexes this replaces accepted.
+
+    Args:
+        file_path (str): Raw scrape file.
+
+    Returns:
+        tuple: ``(headers, samples)``, where ``headers`` maps ``timestamp``,
+            ``pod`` and ``namespace`` to their header values when present and
+            ``samples`` is a list of ``(metric_name, labels, value)`` with
+            ``labels`` the text between the braces (empty when unlabelled).
+    """
+    headers: dict[str, str] = {}
+    samples: list[tuple] = []
+    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                for prefix, key in _HEADERS.items():
+                    if line.startswith(prefix):
+                        headers[key] = line[len(prefix) :].strip()
+                        break
+                continue
+            sample = _parse_sample(line)
+            if sample is not None:
+                samples.append(sample)
+    return headers, samples
+
+
+def _parse_sample(line: str) -> tuple[str, str, float] | None:
+    """Parse a single exposition sample line, or return None."""
+    space = line.find(" ")
+    brace = line.find("{")
+    if brace != -1 and (space == -1 or brace < space):
+        # Label values may contain braces; the value and timestamp after the
+        # closing one never do.
+        close = line.rfind("}")
+        if close == -1:
+            return None
+        name = line[:brace]
+        labels = line[brace + 1 : close]
+        rest = line[close + 1 :]
+    elif space != -1:
+        name = line[:space]
+        labels = ""
+        rest = line[space:]
+    else:
+        return None
+    if not rest.startswith(" ") or not _METRIC_NAME_RE.match(name):
+        return None
+    fields = rest.split()
+    if not fields:
+        return None
+    try:
+        value = float(fields[0])
+    except ValueError:
+        return None
+    if not np.isfinite(value):
+        return None
+    return name, labels, value
+
+
+def parse_labels(text: str) -> dict[str, str]:
+    """Parse the text between a sample's braces into a label dict.
+
+    Args:
+        text (str): Label text, e.g. ``model_name="m",le="0.5"``.
+
+    Returns:
+        dict: Label names to unescaped values, in the order they appear.
+    """
+    labels: dict[str, str] = {}
+    for match in _LABEL_RE.finditer(text):
+        value = match.group(2)
+        if "\\" in value:
+            value = _LABEL_ESCAPE_RE.sub(
+                lambda m: "\n" if m.group(1) == "n" else m.group(1), value
+            )
+        labels[match.group(1)] = value
+    return labels
+
+
+def parse_timestamp(value: str) -> datetime | None:
+    """Parse a ``# Timestamp:`` header value, or return None.
+
+    Args:
+        value (str): ISO-8601 timestamp, optionally ending in ``Z``.
+
+    Returns:
+        datetime: Parsed timestamp, keeping the offset it was written with.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@dataclass
+class ScrapeStore:
+    """Every sample of a directory of raw scrapes, as flat columns.
+
+    Per-file columns are indexed by file number, with files in name order.
+    Per-sample columns give each sample's file number and its indices into
+    the ``metric_names`` and ``label_sets`` string tables; a file's samples are
+    contiguous and in the order they appear in the file.
+    """
+
+    files: np.ndarray
+    file_mtime_ns: np.ndarray
+    file_size: np.ndarray
+    file_timestamp: np.ndarray
+    file_pod: np.ndarray
+    file_namespace: np.ndarray
+    row_file: np.ndarray
+    row_metric: np.ndarray
+    row_labels: np.ndarray
+    values: np.ndarray
+    metric_names: np.ndarray
+    label_sets: np.ndarray
+    _datetimes: list | None = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def file_indices(self, pattern: str = "*.log") -> np.ndarray:
+        """Get the numbers of files whose name matches a glob pattern.
+
+        Args:
+            pattern (str): fnmatch pattern applied to the file base name.
+
+        Returns:
+            np.ndarray: Matching file numbers, in name order.
+        """
+        return np.array(
+            [i for i, name in enumerate(self.files) if fnmatch.fnmatch(name, pattern)],
+            dtype=np.int64,
+        )
+
+    def file_rows(self, index: int) -> slice:
+        """Get the slice of per-sample columns holding one file's samples."""
+        start = int(np.searchsorted(self.row_file, index, side="left"))
+        stop = int(np.searchsorted(self.row_file, index, side="right"))
+        return slice(start, stop)
+
+    def metric_ids(self, metrics: Iterable[str]) -> np.ndarray:
+        """Map metric names to ``metric_names`` indices, dropping unknowns."""
+        lookup = {name: i for i, name in enumerate(self.metric_names)}
+        return np.array(
+            sorted({lookup[m] for m in metrics if m in lookup}), dtype=np.int32
+        )
+
+    def file_datetimes(self) -> list[datetime | None]:
+        """Get each file's parsed ``# Timestamp:`` header, None if absent."""
+        if self._datetimes is None:
+            self._datetimes = [parse_timestamp(ts) for ts in self.file_timestamp]
+        return self._datetimes
+
+    def file_epochs(self) -> np.ndarray:
+        """Get each file's timestamp in epoch seconds, NaN if absent."""
+        return np.array(
+            [_epoch(ts) if ts is not None else np.nan for ts in self.file_datetimes()],
+            dtype=np.float64,
+        )
+
+    def usable_rows(self, pattern: str = "*.log") -> np.ndarray:
+        """Get a per-sample mask of rows from timestamped, pod-attributed files.
+
+        Args:
+            pattern (str): fnmatch pattern selecting files by base name.
+
+        Returns:
+            np.ndarray: Boolean mask over the per-sample columns.
+        """
+        stamps = self.file_datetimes()
+        usable = np.zeros(len(self.files), dtype=bool)
+        for i in self.file_indices(pattern):
+            usable[i] = stamps[i] is not None and bool(self.file_pod[i])
+        return usable[self.row_file] if len(self) else np.zeros(0, dtype=bool)
+
+    def time_series(
+        self, metrics: Iterable[str] | None = None, pattern: str = "*.log"
+    ) -> dict[str, dict[str, list]]:
+        """Build per-pod metric time series.
+
+        Only files that carry both a timestamp and a pod name contribute.
+        Every sample of a metric counts, whatever its labels.
+
+        Args:
+            metrics (Iterable[str] | None): Metric names to include; None
+                includes every metric.
+            pattern (str): fnmatch pattern selecting files by base name.
+
+        Returns:
+            dict: ``{pod_name: {metric_name: [(datetime, value), ...]}}``,
+                each series sorted by time.
+        """
+        stamps = self.file_datetimes()
+        mask = self.usable_rows(pattern)
+        if metrics is not None:
+            mask &= np.isin(self.row_metric, self.metric_ids(metrics))
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return {}
+
+        epochs = self.file_epochs()
+        pod_names, pod_codes = np.unique(self.file_pod, return_inverse=True)
+        row_files = self.row_file[rows]
+        row_pods = pod_codes[row_files]
+        row_metrics = self.row_metric[rows]
+        # Stable by time within (pod, metric), keeping file order on ties.
+        order = np.lexsort((rows, epochs[row_files], row_metrics, row_pods))
+        rows, row_files = rows[order], row_files[order]
+        row_pods, row_metrics = row_pods[order], row_metrics[order]
+
+        bounds = (
+            np.flatnonzero((np.diff(row_pods) != 0) | (np.diff(row_metrics) != 0)) + 1
+        )
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [len(rows)]))
+        values = self.values[rows].tolist()
+        file_list = row_files.tolist()
+
+        result: dict[str, dict[str, list]] = {}
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            pod = str(pod_names[row_pods[start]])
+            metric = str(self.metric_names[row_metrics[start]])
+            result.setdefault(pod, {})[metric] = [
+                (stamps[f], v)
+                for f, v in zip(file_list[start:stop], values[start:stop])
+            ]
+        return result
+
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """Get the store's columns by name, as persisted in the cache."""
+        return {
+            name: getattr(self, name) for name in _FILE_COLUMNS + _ROW_COLUMNS + _TABLES
+        }
+
+
+def _epoch(ts: datetime) -> float:
+    """Seconds since the epoch, reading a naive timestamp as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def _empty_store() -> ScrapeStore:
+    return ScrapeStore(
+        files=np.array([], dtype=str),
+        file_mtime_ns=np.array([], dtype=np.int64),
+        file_size=np.array([], dtype=np.int64),
+        file_timestamp=np.array([], dtype=str),
+        file_pod=np.array([], dtype=str),
+        file_namespace=np.array([], dtype=str),
+        row_file=np.array([], dtype=np.int32),
+        row_metric=np.array([], dtype=np.int32),
+        row_labels=np.array([], dtype=np.int32),
+        values=np.array([], dtype=np.float64),
+        metric_names=np.array([], dtype=str),
+        label_sets=np.array([], dtype=str),
+    )
+
+
+def _read_cache(cache_path: str) -> ScrapeStore | None:
+    """Load a persisted store, or None if it is missing or unusable."""
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if int(data["version"]) != _CACHE_VERSION:
+                return None
+            return ScrapeStore(
+                **{name: data[name] for name in _FILE_COLUMNS + _ROW_COLUMNS + _TABLES}
+            )
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def _write_cache(cache_path: str, store: ScrapeStore) -> None:
+    """Persist a store atomically; an unwritable directory is not an error."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f, version=np.array(_CACHE_VERSION), **store.to_columns()
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _list_raw_files(raw_dir: str) -> list[tuple[str, int, int]]:
+    """List ``*.log`` files in a raw directory as (name, mtime_ns, size)."""
+    entries = []
+    try:
+        with os.scandir(raw_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".log"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if not entry.is_file():
+                    continue
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return []
+    return sorted(entries)
+
+
+def load_scrape_store(metrics_dir: str, use_cache: bool = True) -> ScrapeStore:
+    """Load every raw scrape under ``<metrics_dir>/raw`` as a ScrapeStore.
+
+    Files whose name, size and mtime match the persisted cache are taken from
+    it; new or changed files are parsed, and the cache is rewritten when
+    anything differed. Files that cannot be read are skipped.
+
+    Args:
+        metrics_dir (str): Metrics directory containing ``raw/``.
+        use_cache (bool): Read and update ``scrape_store.npz``. When False,
+            every file is parsed and nothing is written.
+
+    Returns:
+        ScrapeStore: Samples of every readable ``raw/*.log`` file.
+    """
+    raw_dir = os.path.join(metrics_dir, "raw")
+    cache_path = os.path.join(metrics_dir, CACHE_FILE_NAME)
+    listing = _list_raw_files(raw_dir)
+
+    cached = _read_cache(cache_path) if use_cache else None
+    if cached is None:
+        cached = _empty_store()
+    cached_files = {
+        (str(name), int(mtime), int(size)): i
+        for i, (name, mtime, size) in enumerate(
+            zip(cached.files, cached.file_mtime_ns, cached.file_size)
+        )
+    }
+    if len(cached_files) == len(listing) and all(
+        entry in cached_files for entry in listing
+    ):
+        return cached
+
+    # String tables only grow, so indices in reused rows stay valid.
+    metric_names: list[str] = [str(m) for m in cached.metric_names]
+    label_sets: list[str] = [str(label) for label in cached.label_sets]
+    metric_ids = {name: i for i, name in enumerate(metric_names)}
+    label_ids = {label: i for i, label in enumerate(label_sets)}
+
+    file_cols: dict[str, list[Any]] = {name: [] for name in _FILE_COLUMNS}
+    row_chunks: dict[str, list[np.ndarray]] = {name: [] for name in _ROW_COLUMNS}
+
+    for name, mtime_ns, size in listing:
+        cached_index = cached_files.get((name, mtime_ns, size))
+        if cached_index is not None:
+            rows = cached.file_rows(cached_index)
+            header = (
+                cached.file_timestamp[cached_index],
+                cached.file_pod[cached_index],
+                cached.file_namespace[cached_index],
+            )
+            metric_col = cached.row_metric[rows]
+            labels_col = cached.row_labels[rows]
+            values_col = cached.values[rows]
+        else:
+            try:
+                headers, samples = parse_scrape_file(os.path.join(raw_dir, name))
+            except OSError:
+                continue
+            header = (
+                headers.get("timestamp", ""),
+                headers.get("pod", ""),
+                headers.get("namespace", ""),
+            )
+            metric_col = np.array(
+                [metric_ids.setdefault(s[0], len(metric_ids)) for s in samples],
+                dtype=np.int32,
+            )
+            labels_col = np.array(
+                [label_ids.setdefault(s[1], len(label_ids)) for s in samples],
+                dtype=np.int32,
+            )
+            values_col = np.array([s[2] for s in samples], dtype=np.float64)
+
+        index = len(file_cols["files"])
+        for col, value in zip(_FILE_COLUMNS, (name, mtime_ns, size, *header)):
+            file_cols[col].append(value)
+        row_chunks["row_file"].append(np.full(len(values_col), index, dtype=np.int32))
+        row_chunks["row_metric"].append(metric_col)
+        row_chunks["row_labels"].append(labels_col)
+        row_chunks["values"].append(values_col)
+
+    if len(metric_ids) > len(metric_names):
+        metric_names = sorted(metric_ids, key=metric_ids.get)
+    if len(label_ids) > len(label_sets):
+        label_sets = sorted(label_ids, key=label_ids.get)
+
+    empty = _empty_store()
+    store = ScrapeStore(
+        files=np.array(file_cols["files"], dtype=str),
+        file_mtime_ns=np.array(file_cols["file_mtime_ns"], dtype=np.int64),
+        file_size=np.array(file_cols["file_size"], dtype=np.int64),
+        file_timestamp=np.array(file_cols["file_timestamp"], dtype=str),
+        file_pod=np.array(file_cols["file_pod"], dtype=str),
+        file_namespace=np.array(file_cols["file_namespace"], dtype=str),
+        **{
+            col: (np.concatenate(chunks) if chunks else getattr(empty, col))
+            for col, chunks in row_chunks.items()
+        },
+        metric_names=np.array(metric_names, dtype=str),
+        label_sets=np.array(label_sets, dtype=str),
+    )
+    if use_cache and listing:
+        _write_cache(cache_path, store)
+    return store
@@ -1,62 +1,23 @@
 """Reconstruct per-pod metric time series from raw Prometheus scrapes.
 
-Duplicates the parsing in visualize_metrics.py rather than importing it: the image
-copies that module to /usr/local/bin, outside this package.
+Reads the scrapes through the shared columnar cache in scrape_store.py, so the
+raw files are parsed once per run rather than once per analysis pass.
 """
 
-import glob
-import os
-import re
 from datetime import datetime, timezone
-from typing import Any
-
-_METRIC_RE = re.compile(r"([a-zA-Z_:][a-zA-Z0-9_:]*(?:\{[^}]*\})?) ([\d.eE+-]+)")
-
-
-def _parse_scrape(file_path: str) -> tuple[str | None, dict[str, list]]:
-    """Parse one raw scrape file into (pod_name, {metric: [(datetime, value), ...]})."""
-    metrics: dict[str, list] = {}
-    timestamp_dt = None
-    pod_name = None
-    with open(file_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("# Timestamp:"):
-                ts = line.split(":", 1)[1].strip()
-                try:
-                    timestamp_dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                except ValueError:
-                    pass
-                continue
-            if line.startswith("# Pod:"):
-                pod_name = line.split(":", 1)[1].strip()
-                continue
-            if line.startswith("#") or not line:
-                continue
-            match = _METRIC_RE.match(line)
-            if match and timestamp_dt:
-                base_name = match.group(1).split("{")[0]
-                metrics.setdefault(base_name, []).append(
-                    (timestamp_dt, float(match.group(2)))
-                )
-    return pod_name, metrics
-
-
-def collect_time_series_data(metrics_dir: str) -> dict[str, dict[str, list]]:
-    """Return {pod_name: {metric_name: [(datetime, value), ...]}} sorted by time."""
-    raw_dir = os.path.join(metrics_dir, "raw")
-    pod_data: dict[str, dict[str, list]] = {}
-    for file_path in glob.glob(os.path.join(raw_dir, "*.log")):
-        pod_name, metrics = _parse_scrape(file_path)
-        if not pod_name:
-            continue
-        pod = pod_data.setdefault(pod_name, {})
-        for metric_name, points in metrics.items():
-            pod.setdefault(metric_name, []).extend(points)
-    for pod in pod_data.values():
-        for metric_name in pod:
-            pod[metric_name].sort(key=lambda x: x[0])
-    return pod_data
+from typing import Any, Iterable
+
+from .scrape_store import load_scrape_store
+
+
+def collect_time_series_data(
+    metrics_dir: str, metrics: Iterable[str] | None = None
+) -> dict[str, dict[str, list]]:
+    """Return {pod_name: {metric_name: [(datetime, value), ...]}} sorted by time.
+
+    Only the named metrics are materialized when ``metrics`` is given.
+    """
+    return load_scrape_store(metrics_dir).time_series(metrics)
 
 
 def compute_ratio_series(
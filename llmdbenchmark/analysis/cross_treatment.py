@@ -13,11 +13,13 @@ per-treatment analysis completes).
 from __future__ import annotations
 
 import csv
-import glob
+import math
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .benchmark_report.plot_jobs import PlotJob, run_plot_jobs
+
 try:
     import yaml
 except ImportError:
@@ -112,6 +114,13 @@ SESSION_METRICS_OF_INTEREST = [
     ("results.session_performance.sessions.failed", "failed_sessions"),
 ]
 
+# Throughput/latency trade-offs flagged per row in the CSV: the column is True
+# for rows on the Pareto front of (column, higher is better) objectives.
+PARETO_FRONTS = [
+    ("pareto_output_tps_vs_ttft_p99", (("output_tps", True), ("ttft_p99_s", False))),
+    ("pareto_output_tps_vs_tpot_p99", (("output_tps", True), ("tpot_p99_s", False))),
+]
+
 
 def deep_get(d: dict, dotted_key: str, default=None):
     """Traverse nested dict by dotted key path."""
@@ -256,6 +265,8 @@ def generate_cross_treatment_summary(
         _log(context, "No benchmark report v0.2 files found for comparison")
         return 0
 
+    _mark_pareto_fronts(rows)
+
     # Write CSV summary
     csv_path = output_dir / "treatment_comparison.csv"
     fieldnames = (
@@ -263,6 +274,7 @@ def generate_cross_treatment_summary(
         + [m[1] for m in METRICS_OF_INTEREST]
         + [m[1] for m in SESSION_METRICS_OF_INTEREST]
         + ["input_len_mean", "output_len_mean", "tool", "rate_qps"]
+        + [front[0] for front in PARETO_FRONTS]
     )
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
@@ -271,43 +283,108 @@ def generate_cross_treatment_summary(
 
     _log(context, f"Cross-treatment CSV: {csv_path} ({len(rows)} entries)")
 
-    # Generate comparison plots (aggregate)
-    plot_count = _generate_comparison_plots(rows, output_dir, context)
-
-    # Generate session comparison plots
-    plot_count += _generate_session_comparison_plots(rows, output_dir, context)
-
-    # Generate overlaid per-request CDF plots across treatments
-    plot_count += _generate_overlaid_cdf_plots(results_dir, output_dir, context)
-
-    # Generate overlaid vLLM cache-vs-time plots across treatments
-    plot_count += _generate_overlaid_cache_plots(results_dir, output_dir, context)
+    _generate_comparison_plots(rows, results_dir, output_dir, context)
 
     return len(rows)
 
 
 def _generate_comparison_plots(
     rows: list[dict],
+    results_dir: Path,
     output_dir: Path,
     context: "ExecutionContext | None" = None,
 ) -> int:
-    """Generate bar charts comparing key metrics across treatments.
+    """Render every cross-treatment plot as one batch of plot jobs.
 
-    Aggregates multiple stages per treatment into mean with min/max
-    error bars, so each treatment gets one bar instead of one per stage.
+    Plots whose inputs are unchanged since the last run in *output_dir* are
+    not redrawn, so adding a treatment redraws only the comparisons it enters.
     """
     try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+        import matplotlib  # noqa: F401
     except ImportError:
         _log(context, "matplotlib not available -- skipping comparison plots")
         return 0
 
+    # Comparison plots (aggregate)
+    jobs = _comparison_plot_jobs(rows, output_dir, context)
+
+    # Session comparison plots
+    jobs += _session_comparison_plot_jobs(rows, output_dir, context)
+
+    # Overlaid per-request CDF plots across treatments
+    jobs += _overlaid_cdf_plot_jobs(results_dir, output_dir)
+
+    # Overlaid vLLM cache-vs-time plots across treatments
+    jobs += _overlaid_cache_plot_jobs(results_dir, output_dir)
+
+    result = run_plot_jobs(jobs)
+    for path, error in result.failed.items():
+        _log(context, f"Comparison plot {path} failed: {error}", warning=True)
+    if result.plotted:
+        _log(
+            context,
+            f"Generated {result.plotted} comparison plot(s) in {output_dir}"
+            f" ({result.skipped} unchanged)",
+        )
+    return result.plotted
+
+
+def _mark_pareto_fronts(rows: list[dict]) -> None:
+    """Flag each row on the Pareto front of every ``PARETO_FRONTS`` pair.
+
+    Rows missing either metric are left blank rather than marked off the front.
+    """
+    from llmdbenchmark.analysis.benchmark_report.pareto import pareto_mask
+
+    for column, objectives in PARETO_FRONTS:
+        candidates = []
+        for row in rows:
+            row[column] = ""
+            try:
+                point = [float(row[col]) for col, _ in objectives]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not any(math.isnan(value) for value in point):
+                candidates.append((row, point))
+        if not candidates:
+            continue
+        mask = pareto_mask(
+            [point for _, point in candidates],
+            [higher for _, higher in objectives],
+        )
+        for (row, _), on_front in zip(candidates, mask.tolist()):
+            row[column] = on_front
+
+
+# Palette for per-treatment bars and lines (index = treatment position).
+_TREATMENT_COLORS = [
+    "#e74c3c",
+    "#3498db",
+    "#2ecc71",
+    "#9b59b6",
+    "#f39c12",
+    "#1abc9c",
+    "#e67e22",
+    "#34495e",
+    "#16a085",
+    "#c0392b",
+]
+_TREATMENT_MARKERS = ["o", "s", "^", "D", "v", "P", "*", "X", "h", "p"]
+
+
+def _comparison_plot_jobs(
+    rows: list[dict],
+    output_dir: Path,
+    context: "ExecutionContext | None" = None,
+) -> list[PlotJob]:
+    """Bar charts comparing key metrics across treatments.
+
+    Aggregates multiple stages per treatment into mean with min/max
+    error bars, so each treatment gets one bar instead of one per stage.
+    """
     if len(rows) < 2:
         _log(context, "Only 1 treatment -- skipping comparison plots")
-        return 0
+        return []
 
     # Metrics to plot (column_name, title, unit, higher_is_better)
     plot_specs = [
@@ -332,23 +409,9 @@ def _generate_comparison_plots(
 
     treatment_labels = sorted(treatment_values.keys())
     if len(treatment_labels) < 2:
-        return 0
-
-    # Color palette
-    bar_colors = [
-        "#e74c3c",
-        "#3498db",
-        "#2ecc71",
-        "#9b59b6",
-        "#f39c12",
-        "#1abc9c",
-        "#e67e22",
-        "#34495e",
-        "#16a085",
-        "#c0392b",
-    ]
+        return []
 
-    generated = 0
+    jobs = []
 
     for col_name, title, unit, higher_is_better in plot_specs:
         means = []
@@ -376,8 +439,10 @@ def _generate_comparison_plots(
         if not has_data:
             continue
 
-        fig, ax = plt.subplots(figsize=(max(8, len(treatment_labels) * 1.5), 5))
-        colors = [bar_colors[i % len(bar_colors)] for i in range(len(treatment_labels))]
+        colors = [
+            _TREATMENT_COLORS[i % len(_TREATMENT_COLORS)]
+            for i in range(len(treatment_labels))
+        ]
 
         # Highlight best treatment
         non_zero_means = [m for m in means if m > 0]
@@ -388,80 +453,37 @@ def _generate_comparison_plots(
                 best_idx = means.index(min(non_zero_means))
             colors[best_idx] = "#2ecc71"  # green for best
 
-        x_pos = range(len(treatment_labels))
-        bars = ax.bar(
-            x_pos,
-            means,
-            color=colors,
-            alpha=0.85,
-            yerr=[mins, maxs],
-            capsize=4,
-            error_kw={"linewidth": 1.5},
-        )
-
-        # Add value labels on bars
-        for bar, val in zip(bars, means):
-            text = f"{val:.4f}" if val < 10 else f"{val:.1f}"
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + max(maxs) * 0.02,
-                text,
-                ha="center",
-                va="bottom",
-                fontsize=8,
-                fontweight="bold",
-            )
-
-        # Add stage count annotation
-        for i, label in enumerate(treatment_labels):
-            n_stages = len(treatment_values[label])
-            ax.text(
-                i,
-                0,
-                f"n={n_stages}",
-                ha="center",
-                va="bottom",
-                fontsize=7,
-                color="gray",
+        jobs.append(
+            PlotJob(
+                str(output_dir / f"compare_{col_name}.png"),
+                _render_treatment_bars,
+                {
+                    "labels": treatment_labels,
+                    "means": means,
+                    "errors": [mins, maxs],
+                    "colors": colors,
+                    "stage_counts": [
+                        len(treatment_values[label]) for label in treatment_labels
+                    ],
+                    "title": title,
+                    "unit": unit,
+                    "label_offset": max(maxs) * 0.02,
+                },
             )
-
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(treatment_labels, rotation=30, ha="right", fontsize=9)
-        ax.set_ylabel(unit)
-        ax.set_title(f"{title}\n(mean across stages, error bars = min/max)")
-        ax.grid(axis="y", alpha=0.3)
-
-        plt.tight_layout()
-        plot_path = output_dir / f"compare_{col_name}.png"
-        plt.savefig(str(plot_path), dpi=150)
-        plt.close()
-
-        generated += 1
+        )
 
     # --- Scatter / line plots: latency vs throughput curves ---
-    generated += _generate_scatter_plots(rows, output_dir, context)
-
-    if generated:
-        _log(context, f"Generated {generated} comparison plot(s) in {output_dir}")
+    jobs += _scatter_plot_jobs(rows, output_dir)
 
-    return generated
+    return jobs
 
 
-def _generate_session_comparison_plots(
+def _session_comparison_plot_jobs(
     rows: list[dict],
     output_dir: Path,
     context: "ExecutionContext | None" = None,
-) -> int:
-    """Generate bar charts for session lifecycle metrics across treatments."""
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        _log(context, "matplotlib not available -- skipping session comparison plots")
-        return 0
-
+) -> list[PlotJob]:
+    """Bar charts for session lifecycle metrics across treatments."""
     # Only process rows that have at least one session metric populated
     session_rows = [
         r
@@ -469,14 +491,14 @@ def _generate_session_comparison_plots(
         if any(r.get(col) is not None for _, col in SESSION_METRICS_OF_INTEREST)
     ]
     if not session_rows:
-        return 0
+        return []
 
     if len({_shorten_treatment_label(r["treatment"]) for r in session_rows}) < 2:
         _log(
             context,
             "Only 1 treatment with session data -- skipping session comparison plots",
         )
-        return 0
+        return []
 
     # (column_name, title, unit, higher_is_better)
     plot_specs = [
@@ -499,19 +521,6 @@ def _generate_session_comparison_plots(
         ("failed_sessions", "Failed Sessions", "count", False),
     ]
 
-    bar_colors = [
-        "#e74c3c",
-        "#3498db",
-        "#2ecc71",
-        "#9b59b6",
-        "#f39c12",
-        "#1abc9c",
-        "#e67e22",
-        "#34495e",
-        "#16a085",
-        "#c0392b",
-    ]
-
     from collections import defaultdict
 
     treatment_values: dict[str, list[dict]] = defaultdict(list)
@@ -521,7 +530,7 @@ def _generate_session_comparison_plots(
 
     treatment_labels = sorted(treatment_values.keys())
 
-    generated = 0
+    jobs = []
 
     for col_name, title, unit, higher_is_better in plot_specs:
         means = []
@@ -549,8 +558,10 @@ def _generate_session_comparison_plots(
         if not has_data:
             continue
 
-        fig, ax = plt.subplots(figsize=(max(8, len(treatment_labels) * 1.5), 5))
-        colors = [bar_colors[i % len(bar_colors)] for i in range(len(treatment_labels))]
+        colors = [
+            _TREATMENT_COLORS[i % len(_TREATMENT_COLORS)]
+            for i in range(len(treatment_labels))
+        ]
 
         non_zero_means = [m for m in means if m > 0]
         if non_zero_means:
@@ -559,90 +570,34 @@ def _generate_session_comparison_plots(
             )
             colors[best_idx] = "#2ecc71"
 
-        x_pos = range(len(treatment_labels))
-        bars = ax.bar(
-            x_pos,
-            means,
-            color=colors,
-            alpha=0.85,
-            yerr=[mins, maxs],
-            capsize=4,
-            error_kw={"linewidth": 1.5},
-        )
-
         offset = max(maxs) * 0.02 if max(maxs) > 0 else max(means, default=0) * 0.02
-        for bar, val in zip(bars, means):
-            text = f"{val:.4f}" if val < 10 else f"{val:.1f}"
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + offset,
-                text,
-                ha="center",
-                va="bottom",
-                fontsize=8,
-                fontweight="bold",
-            )
-
-        for i, label in enumerate(treatment_labels):
-            n_stages = len(treatment_values[label])
-            ax.text(
-                i,
-                0,
-                f"n={n_stages}",
-                ha="center",
-                va="bottom",
-                fontsize=7,
-                color="gray",
+        jobs.append(
+            PlotJob(
+                str(output_dir / f"session_compare_{col_name}.png"),
+                _render_treatment_bars,
+                {
+                    "labels": treatment_labels,
+                    "means": means,
+                    "errors": [mins, maxs],
+                    "colors": colors,
+                    "stage_counts": [
+                        len(treatment_values[label]) for label in treatment_labels
+                    ],
+                    "title": title,
+                    "unit": unit,
+                    "label_offset": offset,
+                },
             )
-
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(treatment_labels, rotation=30, ha="right", fontsize=9)
-        ax.set_ylabel(unit)
-        ax.set_title(f"{title}\n(mean across stages, error bars = min/max)")
-        ax.grid(axis="y", alpha=0.3)
-
-        plt.tight_layout()
-        plot_path = output_dir / f"session_compare_{col_name}.png"
-        plt.savefig(str(plot_path), dpi=150)
-        plt.close()
-        generated += 1
-
-    # Session rate vs session duration scatter
-    generated += _generate_session_scatter_plots(session_rows, output_dir, context)
-
-    if generated:
-        _log(
-            context, f"Generated {generated} session comparison plot(s) in {output_dir}"
         )
 
-    return generated
-
-
-def _generate_session_scatter_plots(
-    rows: list[dict],
-    output_dir: Path,
-    context: "ExecutionContext | None" = None,
-) -> int:
-    """Generate scatter plots for session metric relationships across treatments."""
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return 0
-
-    if len(rows) < 2:
-        return 0
-
-    import re
+    # Session rate vs session duration scatter
+    jobs += _session_scatter_plot_jobs(session_rows, output_dir)
 
-    def _sort_key(row):
-        nums = re.findall(r"\d+", row.get("treatment", ""))
-        return int(nums[-1]) if nums else 0
+    return jobs
 
-    sorted_rows = sorted(rows, key=_sort_key)
 
+def _session_scatter_plot_jobs(rows: list[dict], output_dir: Path) -> list[PlotJob]:
+    """Scatter plots for session metric relationships across treatments."""
     # (x_col, y_col, title, x_label, y_label)
     scatter_specs = [
         (
@@ -667,98 +622,16 @@ def _generate_session_scatter_plots(
             "Output Tokens per Session (mean)",
         ),
     ]
+    return _treatment_line_jobs(rows, scatter_specs, output_dir, "session_scatter")
 
-    colors = [
-        "#e74c3c",
-        "#3498db",
-        "#2ecc71",
-        "#9b59b6",
-        "#f39c12",
-        "#1abc9c",
-        "#e67e22",
-        "#34495e",
-        "#16a085",
-        "#c0392b",
-    ]
-    markers = ["o", "s", "^", "D", "v", "P", "*", "X", "h", "p"]
-
-    generated = 0
-
-    for x_col, y_col, title, x_label, y_label in scatter_specs:
-        treatment_points: dict[str, list[tuple[float, float]]] = {}
-        for r in sorted_rows:
-            x = r.get(x_col)
-            y = r.get(y_col)
-            if x is None or y is None:
-                continue
-            label = _shorten_treatment_label(r["treatment"])
-            treatment_points.setdefault(label, []).append((float(x), float(y)))
-
-        total_points = sum(len(pts) for pts in treatment_points.values())
-        if total_points < 2:
-            continue
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-        for i, (label, points) in enumerate(sorted(treatment_points.items())):
-            xs, ys = zip(*points)
-            ax.plot(
-                xs,
-                ys,
-                f"{markers[i % len(markers)]}-",
-                color=colors[i % len(colors)],
-                markersize=8,
-                linewidth=2,
-                alpha=0.8,
-                label=label,
-            )
-
-        ax.set_xlabel(x_label)
-        ax.set_ylabel(y_label)
-        ax.set_title(title)
-        ax.legend(fontsize=8, loc="best")
-        ax.grid(True, alpha=0.3)
-
-        plt.tight_layout()
-        plot_path = output_dir / f"session_scatter_{x_col}_vs_{y_col}.png"
-        plt.savefig(str(plot_path), dpi=150)
-        plt.close()
-        generated += 1
-
-    return generated
 
-
-def _generate_scatter_plots(
-    rows: list[dict],
-    output_dir: Path,
-    context: "ExecutionContext | None" = None,
-) -> int:
-    """Generate scatter/line plots showing metric relationships across treatments.
+def _scatter_plot_jobs(rows: list[dict], output_dir: Path) -> list[PlotJob]:
+    """Scatter/line plots showing metric relationships across treatments.
 
     Produces latency-vs-throughput curves that show how performance
     degrades under load -- useful when treatments sweep concurrency
     or request rate.
     """
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return 0
-
-    if len(rows) < 2:
-        return 0
-
-    # Try to extract a numeric sort key from treatment names
-    # (e.g., "conc1", "conc8", "conc32" to sorted by number)
-    import re
-
-    def _sort_key(row):
-        nums = re.findall(r"\d+", row.get("treatment", ""))
-        return int(nums[-1]) if nums else 0
-
-    sorted_rows = sorted(rows, key=_sort_key)
-
     # Scatter plot specs: (x_col, y_col, title, x_label, y_label)
     scatter_specs = [
         (
@@ -818,23 +691,28 @@ def _generate_scatter_plots(
             "TPOT P99 (s)",
         ),
     ]
+    return _treatment_line_jobs(rows, scatter_specs, output_dir, "scatter")
 
-    # Color palette
-    colors = [
-        "#e74c3c",
-        "#3498db",
-        "#2ecc71",
-        "#9b59b6",
-        "#f39c12",
-        "#1abc9c",
-        "#e67e22",
-        "#34495e",
-        "#16a085",
-        "#c0392b",
-    ]
-    markers = ["o", "s", "^", "D", "v", "P", "*", "X", "h", "p"]
 
-    generated = 0
+def _treatment_line_jobs(
+    rows: list[dict],
+    scatter_specs: list[tuple[str, str, str, str, str]],
+    output_dir: Path,
+    prefix: str,
+) -> list[PlotJob]:
+    """One ``{prefix}_{x}_vs_{y}.png`` per spec, one line per treatment."""
+    if len(rows) < 2:
+        return []
+
+    # Try to extract a numeric sort key from treatment names
+    # (e.g., "conc1", "conc8", "conc32" to sorted by number)
+    def _sort_key(row):
+        nums = re.findall(r"\d+", row.get("treatment", ""))
+        return int(nums[-1]) if nums else 0
+
+    sorted_rows = sorted(rows, key=_sort_key)
+
+    jobs = []
 
     for x_col, y_col, title, x_label, y_label in scatter_specs:
         # Build per-treatment data points
@@ -845,48 +723,132 @@ def _generate_scatter_plots(
             if x is None or y is None:
                 continue
             label = _shorten_treatment_label(r["treatment"])
-            if label not in treatment_points:
-                treatment_points[label] = []
-            treatment_points[label].append((float(x), float(y)))
+            treatment_points.setdefault(label, []).append((float(x), float(y)))
 
-        if len(treatment_points) < 1:
-            continue
         # Need at least 2 total data points across all treatments
         total_points = sum(len(pts) for pts in treatment_points.values())
         if total_points < 2:
             continue
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        for i, (label, points) in enumerate(sorted(treatment_points.items())):
+        lines = []
+        for label, points in sorted(treatment_points.items()):
             xs, ys = zip(*points)
-            color = colors[i % len(colors)]
-            marker = markers[i % len(markers)]
-            ax.plot(
-                xs,
-                ys,
-                f"{marker}-",
-                color=color,
-                markersize=8,
-                linewidth=2,
-                alpha=0.8,
-                label=label,
+            lines.append((label, xs, ys))
+
+        jobs.append(
+            PlotJob(
+                str(output_dir / f"{prefix}_{x_col}_vs_{y_col}.png"),
+                _render_treatment_lines,
+                {
+                    "lines": lines,
+                    "title": title,
+                    "x_label": x_label,
+                    "y_label": y_label,
+                },
             )
+        )
 
-        ax.set_xlabel(x_label)
-        ax.set_ylabel(y_label)
-        ax.set_title(title)
-        ax.legend(fontsize=8, loc="best")
-        ax.grid(True, alpha=0.3)
+    return jobs
 
-        plt.tight_layout()
-        plot_path = output_dir / f"scatter_{x_col}_vs_{y_col}.png"
-        plt.savefig(str(plot_path), dpi=150)
-        plt.close()
 
-        generated += 1
+def _render_treatment_bars(
+    output: str,
+    labels: list[str],
+    means: list[float],
+    errors: list[list[float]],
+    colors: list[str],
+    stage_counts: list[int],
+    title: str,
+    unit: str,
+    label_offset: float,
+) -> None:
+    """Plot job: one bar per treatment with min/max error bars."""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(max(8, len(labels) * 1.5), 5))
+
+    x_pos = range(len(labels))
+    bars = ax.bar(
+        x_pos,
+        means,
+        color=colors,
+        alpha=0.85,
+        yerr=errors,
+        capsize=4,
+        error_kw={"linewidth": 1.5},
+    )
+
+    # Add value labels on bars
+    for bar, val in zip(bars, means):
+        text = f"{val:.4f}" if val < 10 else f"{val:.1f}"
+        ax.text(
+            bar.get_x() + bar.get_width() / 2,
+            bar.get_height() + label_offset,
+            text,
+            ha="center",
+            va="bottom",
+            fontsize=8,
+            fontweight="bold",
+        )
+
+    # Add stage count annotation
+    for i, n_stages in enumerate(stage_counts):
+        ax.text(
+            i,
+            0,
+            f"n={n_stages}",
+            ha="center",
+            va="bottom",
+            fontsize=7,
+            color="gray",
+        )
+
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(labels, rotation=30, ha="right", fontsize=9)
+    ax.set_ylabel(unit)
+    ax.set_title(f"{title}\n(mean across stages, error bars = min/max)")
+    ax.grid(axis="y", alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=150)
+    plt.close()
+
+
+def _render_treatment_lines(
+    output: str,
+    lines: list[tuple[str, list[float], list[float]]],
+    title: str,
+    x_label: str,
+    y_label: str,
+) -> None:
+    """Plot job: one marker line per treatment."""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    for i, (label, xs, ys) in enumerate(lines):
+        color = _TREATMENT_COLORS[i % len(_TREATMENT_COLORS)]
+        marker = _TREATMENT_MARKERS[i % len(_TREATMENT_MARKERS)]
+        ax.plot(
+            xs,
+            ys,
+            f"{marker}-",
+            color=color,
+            markersize=8,
+            linewidth=2,
+            alpha=0.8,
+            label=label,
+        )
+
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_title(title)
+    ax.legend(fontsize=8, loc="best")
+    ax.grid(True, alpha=0.3)
 
-    return generated
+    plt.tight_layout()
+    plt.savefig(output, dpi=150)
+    plt.close()
 
 
 def _extract_per_request_metrics(pr_file: Path) -> dict[str, list[float]]:
@@ -926,51 +888,49 @@ def _extract_per_request_metrics(pr_file: Path) -> dict[str, list[float]]:
 # vLLM cache-vs-time overlay across treatments, keyed by treatment name (the
 # raw swept value is not recoverable from result dir names).
 
-_CACHE_RAW_GLOB = "metrics/raw/*_metrics.log"
+_CACHE_RAW_PATTERN = "*_metrics.log"
 _CACHE_KV = "vllm:kv_cache_usage_perc"
 _CACHE_QUERIES = "vllm:prefix_cache_queries_total"
 _CACHE_HITS = "vllm:prefix_cache_hits_total"
 _CACHE_EPS = 1e-9
 _CACHE_TRIM_PAD_SEC = 1.0
-_CACHE_METRIC_RE = re.compile(
-    r"([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{[^}]*\})? ([\d.eE+-]+)(?:\s+\d+)?$"
-)
 
 
-def _cache_epoch_from_name(path: Path) -> float | None:
-    m = re.search(r"_(\d+)_metrics\.log$", path.name)
+def _cache_epoch_from_name(name: str) -> float | None:
+    m = re.search(r"_(\d+)_metrics\.log$", name)
     return float(m.group(1)) if m else None
 
 
-def _cache_parse_snapshot(path: Path) -> dict[str, float]:
-    """Parse one raw snapshot: {KV: mean, QUERIES: sum, HITS: sum} if present."""
-    buckets: dict[str, list[float]] = {
-        _CACHE_KV: [],
-        _CACHE_QUERIES: [],
-        _CACHE_HITS: [],
-    }
-    try:
-        with open(path, encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                m = _CACHE_METRIC_RE.match(line)
-                if not m:
-                    continue
-                name = m.group(1)
-                if name in buckets:
-                    buckets[name].append(float(m.group(2)))
-    except OSError:
-        return {}
-    out: dict[str, float] = {}
-    if buckets[_CACHE_KV]:
-        out[_CACHE_KV] = sum(buckets[_CACHE_KV]) / len(buckets[_CACHE_KV])
-    if buckets[_CACHE_QUERIES]:
-        out[_CACHE_QUERIES] = sum(buckets[_CACHE_QUERIES])
-    if buckets[_CACHE_HITS]:
-        out[_CACHE_HITS] = sum(buckets[_CACHE_HITS])
-    return out
+def _cache_snapshots(metrics_dir: Path) -> list[tuple[float, dict[str, float]]]:
+    """Per raw snapshot: (epoch, {KV: mean, QUERIES: sum, HITS: sum} if present)."""
+    import numpy as np
+
+    from .benchmark_report.scrape_store import load_scrape_store
+
+    store = load_scrape_store(str(metrics_dir))
+    n_files = len(store.files)
+    per_metric: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    for name in (_CACHE_KV, _CACHE_QUERIES, _CACHE_HITS):
+        mask = np.isin(store.row_metric, store.metric_ids([name]))
+        files = store.row_file[mask]
+        per_metric[name] = (
+            np.bincount(files, weights=store.values[mask], minlength=n_files),
+            np.bincount(files, minlength=n_files),
+        )
+
+    samples: list[tuple[float, dict[str, float]]] = []
+    for i in store.file_indices(_CACHE_RAW_PATTERN):
+        epoch = _cache_epoch_from_name(str(store.files[i]))
+        if epoch is None:
+            continue
+        values: dict[str, float] = {}
+        for name, (totals, counts) in per_metric.items():
+            if counts[i]:
+                total = float(totals[i])
+                values[name] = total / int(counts[i]) if name == _CACHE_KV else total
+        if values:
+            samples.append((epoch, values))
+    return samples
 
 
 def _cache_trim_to_active(
@@ -1006,16 +966,7 @@ def _cache_trim_to_active(
 
 def _cache_load_series(results_dir: Path) -> list[tuple[float, dict[str, float]]]:
     """Return [(elapsed_sec, {metric: value}), ...] for one treatment, trimmed to its active window and re-based to t=0."""
-    files = sorted(glob.glob(str(results_dir / _CACHE_RAW_GLOB)))
-    samples: list[tuple[float, dict[str, float]]] = []
-    for f in files:
-        p = Path(f)
-        epoch = _cache_epoch_from_name(p)
-        if epoch is None:
-            continue
-        values = _cache_parse_snapshot(p)
-        if values:
-            samples.append((epoch, values))
+    samples = _cache_snapshots(results_dir / "metrics")
     if not samples:
         return []
     samples.sort(key=lambda s: s[0])
@@ -1028,24 +979,12 @@ def _cache_load_series(results_dir: Path) -> list[tuple[float, dict[str, float]]
     return series
 
 
-def _generate_overlaid_cache_plots(
-    results_dir: Path,
-    output_dir: Path,
-    context: "ExecutionContext | None" = None,
-) -> int:
+def _overlaid_cache_plot_jobs(results_dir: Path, output_dir: Path) -> list[PlotJob]:
     """Overlay each treatment's vLLM cache time series on shared axes.
 
     Emits three PNGs (KV usage, prefix-cache totals, prefix-cache hit rate),
     one line per treatment. No-op with fewer than 2 treatments having snapshots.
     """
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return 0
-
     colors = [
         "#1f77b4",
         "#ff7f0e",
@@ -1067,150 +1006,159 @@ def _generate_overlaid_cache_plots(
             points.append((_shorten_treatment_label(subdir.name), series))
 
     if len(points) < 2:
-        return 0
-
-    generated = 0
+        return []
 
     def _color(idx: int) -> str:
         return colors[idx % len(colors)]
 
-    # 1) KV-cache usage over time
-    fig, ax = plt.subplots(figsize=(14, 5))
-    drew = False
+    # Lines per figure: (label, color, xs, ys); totals also carry a linestyle
+    kv_lines = []
+    total_lines = []
+    rate_lines = []
     for idx, (label, series) in enumerate(points):
+        # 1) KV-cache usage over time
         xs = [t for t, v in series if _CACHE_KV in v]
         ys = [v[_CACHE_KV] for _, v in series if _CACHE_KV in v]
-        if not xs:
-            continue
+        if xs:
+            kv_lines.append((label, _color(idx), xs, ys))
+
+        # 2) Prefix-cache cumulative queries (solid) / hits (dashed) over time
+        q_xs = [t for t, v in series if _CACHE_QUERIES in v]
+        q_ys = [v[_CACHE_QUERIES] for _, v in series if _CACHE_QUERIES in v]
+        h_xs = [t for t, v in series if _CACHE_HITS in v]
+        h_ys = [v[_CACHE_HITS] for _, v in series if _CACHE_HITS in v]
+        if q_xs:
+            total_lines.append((f"{label} queries", _color(idx), "-", q_xs, q_ys))
+        if h_xs:
+            total_lines.append((f"{label} hits", _color(idx), "--", h_xs, h_ys))
+
+        # 3) Derived per-interval prefix-cache hit rate over time
+        pts = [
+            (t, v[_CACHE_QUERIES], v[_CACHE_HITS])
+            for t, v in series
+            if _CACHE_QUERIES in v and _CACHE_HITS in v
+        ]
+        xs = []
+        ys = []
+        for (_, q0, h0), (t1, q1, h1) in zip(pts, pts[1:]):
+            dq = q1 - q0
+            dh = h1 - h0
+            if dq <= 0 or dh < 0:
+                continue
+            xs.append(t1)
+            ys.append(100.0 * dh / dq)
+        if xs:
+            rate_lines.append((label, _color(idx), xs, ys))
+
+    jobs = []
+    if kv_lines:
+        jobs.append(
+            PlotJob(
+                str(output_dir / "cache_overlay_kv_cache_usage.png"),
+                _render_cache_kv_usage,
+                {"lines": kv_lines},
+            )
+        )
+    if total_lines:
+        jobs.append(
+            PlotJob(
+                str(output_dir / "cache_overlay_prefix_cache_totals.png"),
+                _render_cache_prefix_totals,
+                {"lines": total_lines},
+            )
+        )
+    if rate_lines:
+        jobs.append(
+            PlotJob(
+                str(output_dir / "cache_overlay_prefix_cache_hit_rate.png"),
+                _render_cache_hit_rate,
+                {"lines": rate_lines},
+            )
+        )
+    return jobs
+
+
+def _render_cache_kv_usage(output: str, lines: list) -> None:
+    """Plot job: KV-cache usage over time, one line per treatment."""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(14, 5))
+    for label, color, xs, ys in lines:
         ax.plot(
             xs,
             ys,
             marker="o",
             markersize=1.5,
             linewidth=1.6,
-            color=_color(idx),
+            color=color,
             label=label,
         )
-        drew = True
     ax.set_xlabel("time since run start (sec)")
     ax.set_ylabel("KV cache usage (fraction)")
     ax.set_title("KV cache usage over time (per treatment)")
     ax.grid(True, alpha=0.3)
-    if drew:
-        ax.legend(loc="best")
-        fig.tight_layout()
-        fig.savefig(str(output_dir / "cache_overlay_kv_cache_usage.png"), dpi=150)
-        generated += 1
+    ax.legend(loc="best")
+    fig.tight_layout()
+    fig.savefig(output, dpi=150)
     plt.close(fig)
 
-    # 2) Prefix-cache cumulative queries (solid) / hits (dashed) over time
+
+def _render_cache_prefix_totals(output: str, lines: list) -> None:
+    """Plot job: cumulative prefix-cache queries (solid) and hits (dashed)."""
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(14, 5))
-    drew = False
-    for idx, (label, series) in enumerate(points):
-        color = _color(idx)
-        q_xs = [t for t, v in series if _CACHE_QUERIES in v]
-        q_ys = [v[_CACHE_QUERIES] for _, v in series if _CACHE_QUERIES in v]
-        h_xs = [t for t, v in series if _CACHE_HITS in v]
-        h_ys = [v[_CACHE_HITS] for _, v in series if _CACHE_HITS in v]
-        if q_xs:
-            ax.plot(
-                q_xs,
-                q_ys,
-                linestyle="-",
-                linewidth=1.6,
-                color=color,
-                label=f"{label} queries",
-            )
-            drew = True
-        if h_xs:
-            ax.plot(
-                h_xs,
-                h_ys,
-                linestyle="--",
-                linewidth=1.6,
-                color=color,
-                label=f"{label} hits",
-            )
-            drew = True
+    for label, color, linestyle, xs, ys in lines:
+        ax.plot(
+            xs,
+            ys,
+            linestyle=linestyle,
+            linewidth=1.6,
+            color=color,
+            label=label,
+        )
     ax.set_xlabel("time since run start (sec)")
     ax.set_ylabel("cumulative tokens")
     ax.set_title("Prefix cache queries/hits (cumulative) over time (per treatment)")
     ax.grid(True, alpha=0.3)
-    if drew:
-        ax.legend(loc="best", fontsize=8)
-        fig.tight_layout()
-        fig.savefig(str(output_dir / "cache_overlay_prefix_cache_totals.png"), dpi=150)
-        generated += 1
+    ax.legend(loc="best", fontsize=8)
+    fig.tight_layout()
+    fig.savefig(output, dpi=150)
     plt.close(fig)
 
-    # 3) Derived per-interval prefix-cache hit rate over time
+
+def _render_cache_hit_rate(output: str, lines: list) -> None:
+    """Plot job: per-interval prefix-cache hit rate, one line per treatment."""
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(14, 5))
-    drew = False
-    for idx, (label, series) in enumerate(points):
-        pts = [
-            (t, v[_CACHE_QUERIES], v[_CACHE_HITS])
-            for t, v in series
-            if _CACHE_QUERIES in v and _CACHE_HITS in v
-        ]
-        xs: list[float] = []
-        ys: list[float] = []
-        for (_, q0, h0), (t1, q1, h1) in zip(pts, pts[1:]):
-            dq = q1 - q0
-            dh = h1 - h0
-            if dq <= 0 or dh < 0:
-                continue
-            xs.append(t1)
-            ys.append(100.0 * dh / dq)
-        if not xs:
-            continue
+    for label, color, xs, ys in lines:
         ax.plot(
             xs,
             ys,
             marker="o",
             markersize=3,
             linewidth=1.6,
-            color=_color(idx),
+            color=color,
             label=label,
         )
-        drew = True
     ax.set_xlabel("time since run start (sec)")
     ax.set_ylabel("prefix cache hit rate (%)")
     ax.set_title("Prefix cache hit rate (per-interval) over time (per treatment)")
     ax.set_ylim(0, 100)
     ax.grid(True, alpha=0.3)
-    if drew:
-        ax.legend(loc="best")
-        fig.tight_layout()
-        fig.savefig(
-            str(output_dir / "cache_overlay_prefix_cache_hit_rate.png"), dpi=150
-        )
-        generated += 1
+    ax.legend(loc="best")
+    fig.tight_layout()
+    fig.savefig(output, dpi=150)
     plt.close(fig)
 
-    if generated:
-        _log(context, f"Generated {generated} overlaid cache plot(s)")
-
-    return generated
-
 
-def _generate_overlaid_cdf_plots(
-    results_dir: Path,
-    output_dir: Path,
-    context: "ExecutionContext | None" = None,
-) -> int:
-    """Generate overlaid CDF plots comparing per-request distributions across treatments.
+def _overlaid_cdf_plot_jobs(results_dir: Path, output_dir: Path) -> list[PlotJob]:
+    """Overlaid CDF plots comparing per-request distributions across treatments.
 
     Each treatment gets its own curve on the same axes, making it easy
     to see how the full distribution shifts between configurations.
     """
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return 0
-
     # Collect per-request data from each treatment directory
     treatment_data: dict[str, dict[str, list[float]]] = {}
 
@@ -1232,21 +1180,7 @@ def _generate_overlaid_cdf_plots(
             continue
 
     if len(treatment_data) < 2:
-        return 0
-
-    # Color palette for distinguishing treatments
-    colors = [
-        "#e74c3c",
-        "#3498db",
-        "#2ecc71",
-        "#9b59b6",
-        "#f39c12",
-        "#1abc9c",
-        "#e67e22",
-        "#34495e",
-        "#16a085",
-        "#c0392b",
-    ]
+        return []
 
     metric_specs = [
         ("ttft", "TTFT CDF Comparison", "Time to First Token (s)"),
@@ -1255,7 +1189,7 @@ def _generate_overlaid_cdf_plots(
         ("itl", "ITL CDF Comparison", "Inter-Token Latency (s)"),
     ]
 
-    generated = 0
+    jobs = []
     treatments = list(treatment_data.keys())
 
     for metric_key, title, xlabel in metric_specs:
@@ -1266,61 +1200,71 @@ def _generate_overlaid_cdf_plots(
         if len(treatments_with_data) < 2:
             continue
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        curves = [
+            (_shorten_treatment_label(t), sorted(treatment_data[t][metric_key]))
+            for t in treatments_with_data
+        ]
+        jobs.append(
+            PlotJob(
+                str(output_dir / f"cdf_overlay_{metric_key}.png"),
+                _render_cdf_overlay,
+                {"curves": curves, "title": title, "xlabel": xlabel},
+            )
+        )
 
-        for i, treatment in enumerate(treatments_with_data):
-            values = sorted(treatment_data[treatment][metric_key])
-            n = len(values)
-            cdf = [j / n for j in range(n)]
+    return jobs
 
-            label = _shorten_treatment_label(treatment)
-            color = colors[i % len(colors)]
 
-            ax.plot(
-                values,
-                cdf,
-                linewidth=2,
-                label=f"{label} (n={n})",
-                color=color,
-                alpha=0.8,
-            )
+def _render_cdf_overlay(
+    output: str, curves: list[tuple[str, list[float]]], title: str, xlabel: str
+) -> None:
+    """Plot job: one CDF curve per treatment from its sorted values."""
+    import matplotlib.pyplot as plt
 
-        ax.axhline(0.5, color="gray", linestyle=":", alpha=0.4, linewidth=1)
-        ax.axhline(0.99, color="gray", linestyle=":", alpha=0.4, linewidth=1)
-        ax.text(
-            ax.get_xlim()[1] * 0.98,
-            0.5,
-            "P50",
-            ha="right",
-            va="bottom",
-            fontsize=8,
-            color="gray",
-        )
-        ax.text(
-            ax.get_xlim()[1] * 0.98,
-            0.99,
-            "P99",
-            ha="right",
-            va="bottom",
-            fontsize=8,
-            color="gray",
-        )
+    fig, ax = plt.subplots(figsize=(10, 6))
 
-        ax.set_xlabel(xlabel)
-        ax.set_ylabel("Cumulative Probability")
-        ax.set_title(title)
-        ax.legend(fontsize=8, loc="lower right")
-        ax.grid(True, alpha=0.3)
+    for i, (label, values) in enumerate(curves):
+        n = len(values)
+        cdf = [j / n for j in range(n)]
+        ax.plot(
+            values,
+            cdf,
+            linewidth=2,
+            label=f"{label} (n={n})",
+            color=_TREATMENT_COLORS[i % len(_TREATMENT_COLORS)],
+            alpha=0.8,
+        )
 
-        plt.tight_layout()
-        plt.savefig(str(output_dir / f"cdf_overlay_{metric_key}.png"), dpi=150)
-        plt.close()
-        generated += 1
+    ax.axhline(0.5, color="gray", linestyle=":", alpha=0.4, linewidth=1)
+    ax.axhline(0.99, color="gray", linestyle=":", alpha=0.4, linewidth=1)
+    ax.text(
+        ax.get_xlim()[1] * 0.98,
+        0.5,
+        "P50",
+        ha="right",
+        va="bottom",
+        fontsize=8,
+        color="gray",
+    )
+    ax.text(
+        ax.get_xlim()[1] * 0.98,
+        0.99,
+        "P99",
+        ha="right",
+        va="bottom",
+        fontsize=8,
+        color="gray",
+    )
 
-    if generated:
-        _log(context, f"Generated {generated} overlaid CDF plot(s)")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Cumulative Probability")
+    ax.set_title(title)
+    ax.legend(fontsize=8, loc="lower right")
+    ax.grid(True, alpha=0.3)
 
-    return generated
+    plt.tight_layout()
+    plt.savefig(output, dpi=150)
+    plt.close()
 
 
 def _log(
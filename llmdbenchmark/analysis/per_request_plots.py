@@ -15,6 +15,8 @@ import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from llmdbenchmark.analysis.benchmark_report.plot_jobs import PlotJob, run_plot_jobs
+
 if TYPE_CHECKING:
     from llmdbenchmark.executor.context import ExecutionContext
 
@@ -26,6 +28,9 @@ def generate_per_request_plots(
 ) -> int:
     """Generate per-request distribution plots.
 
+    Plots whose inputs are unchanged since the last run are not redrawn
+    (see ``benchmark_report.plot_jobs``).
+
     Args:
         results_dir: Directory containing per_request_lifecycle_metrics.json.
         output_dir: Where to write PNGs (default: results_dir/analysis/distributions).
@@ -35,10 +40,7 @@ def generate_per_request_plots(
         Number of plots generated.
     """
     try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+        import matplotlib  # noqa: F401
     except ImportError:
         _log(context, "matplotlib not available -- skipping per-request plots")
         return 0
@@ -105,7 +107,7 @@ def generate_per_request_plots(
     if not requests:
         return 0
 
-    generated = 0
+    jobs = []
 
     # --- Histograms ---
     hist_specs = [
@@ -119,141 +121,206 @@ def generate_per_request_plots(
         values = [r[key] for r in requests if r[key] is not None]
         if len(values) < 2:
             continue
+        jobs.append(
+            PlotJob(
+                str(output_dir / f"dist_{key}.png"),
+                _render_distribution,
+                {"values": values, "title": title, "xlabel": xlabel, "unit": unit},
+            )
+        )
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    # --- Scatter: TTFT vs input length, E2E vs output length ---
+    # (x_key, y_key, file name, color, x_label, y_label, title)
+    scatter_specs = [
+        (
+            "input_tokens",
+            "ttft",
+            "scatter_ttft_vs_input.png",
+            "#3498db",
+            "Input Tokens",
+            "TTFT (s)",
+            "TTFT vs Input Length (per request)",
+        ),
+        (
+            "output_tokens",
+            "e2e",
+            "scatter_e2e_vs_output.png",
+            "#e74c3c",
+            "Output Tokens",
+            "E2E Latency (s)",
+            "E2E Latency vs Output Length (per request)",
+        ),
+    ]
 
-        # Histogram
-        ax1.hist(
-            values,
-            bins=min(30, len(values)),
-            color="#3498db",
-            alpha=0.7,
-            edgecolor="black",
-            linewidth=0.5,
-        )
-        ax1.axvline(
-            sum(values) / len(values),
-            color="#e74c3c",
-            linestyle="--",
-            label=f"Mean: {sum(values) / len(values):.4f}{unit}",
-        )
-        sorted_v = sorted(values)
-        p50 = sorted_v[len(sorted_v) // 2]
-        p99_idx = min(int(len(sorted_v) * 0.99), len(sorted_v) - 1)
-        ax1.axvline(p50, color="#2ecc71", linestyle="--", label=f"P50: {p50:.4f}{unit}")
-        ax1.axvline(
-            sorted_v[p99_idx],
-            color="#e67e22",
-            linestyle="--",
-            label=f"P99: {sorted_v[p99_idx]:.4f}{unit}",
-        )
-        ax1.set_xlabel(xlabel)
-        ax1.set_ylabel("Count")
-        ax1.set_title(f"{title} (n={len(values)})")
-        ax1.legend(fontsize=8)
-        ax1.grid(alpha=0.3)
-
-        # CDF
-        ax2.plot(
-            sorted_v,
-            [i / len(sorted_v) for i in range(len(sorted_v))],
-            color="#3498db",
-            linewidth=2,
+    for x_key, y_key, name, color, xlabel, ylabel, title in scatter_specs:
+        points = [
+            (r[x_key], r[y_key]) for r in requests if r[y_key] is not None and r[x_key]
+        ]
+        if len(points) < 2:
+            continue
+        xs, ys = zip(*points)
+        jobs.append(
+            PlotJob(
+                str(output_dir / name),
+                _render_scatter,
+                {
+                    "xs": xs,
+                    "ys": ys,
+                    "color": color,
+                    "xlabel": xlabel,
+                    "ylabel": ylabel,
+                    "title": title,
+                },
+            )
         )
-        ax2.axhline(0.5, color="#2ecc71", linestyle=":", alpha=0.5, label="P50")
-        ax2.axhline(0.99, color="#e67e22", linestyle=":", alpha=0.5, label="P99")
-        ax2.set_xlabel(xlabel)
-        ax2.set_ylabel("Cumulative Probability")
-        ax2.set_title(f"{title} CDF")
-        ax2.legend(fontsize=8)
-        ax2.grid(alpha=0.3)
-
-        plt.tight_layout()
-        plt.savefig(str(output_dir / f"dist_{key}.png"), dpi=150)
-        plt.close()
-        generated += 1
-
-    # --- Scatter: TTFT vs input length ---
-    ttft_vals = [
-        (r["input_tokens"], r["ttft"])
-        for r in requests
-        if r["ttft"] is not None and r["input_tokens"]
-    ]
-    if len(ttft_vals) >= 2:
-        xs, ys = zip(*ttft_vals)
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.scatter(xs, ys, alpha=0.6, s=30, color="#3498db")
-        ax.set_xlabel("Input Tokens")
-        ax.set_ylabel("TTFT (s)")
-        ax.set_title("TTFT vs Input Length (per request)")
-        ax.grid(alpha=0.3)
-        plt.tight_layout()
-        plt.savefig(str(output_dir / "scatter_ttft_vs_input.png"), dpi=150)
-        plt.close()
-        generated += 1
-
-    # --- Scatter: E2E vs output length ---
-    e2e_vals = [
-        (r["output_tokens"], r["e2e"])
-        for r in requests
-        if r["e2e"] is not None and r["output_tokens"]
-    ]
-    if len(e2e_vals) >= 2:
-        xs, ys = zip(*e2e_vals)
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.scatter(xs, ys, alpha=0.6, s=30, color="#e74c3c")
-        ax.set_xlabel("Output Tokens")
-        ax.set_ylabel("E2E Latency (s)")
-        ax.set_title("E2E Latency vs Output Length (per request)")
-        ax.grid(alpha=0.3)
-        plt.tight_layout()
-        plt.savefig(str(output_dir / "scatter_e2e_vs_output.png"), dpi=150)
-        plt.close()
-        generated += 1
 
     # --- ITL timeline (all tokens across all requests) ---
     all_itls = []
     for r in requests:
         all_itls.extend(r.get("itls", []))
     if len(all_itls) >= 10:
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-        # Histogram
-        ax1.hist(
-            all_itls,
-            bins=50,
-            color="#9b59b6",
-            alpha=0.7,
-            edgecolor="black",
-            linewidth=0.5,
-        )
-        ax1.set_xlabel("Inter-Token Latency (s)")
-        ax1.set_ylabel("Count")
-        ax1.set_title(f"ITL Distribution (all tokens, n={len(all_itls)})")
-        ax1.grid(alpha=0.3)
-
-        # CDF
-        sorted_itls = sorted(all_itls)
-        ax2.plot(
-            sorted_itls,
-            [i / len(sorted_itls) for i in range(len(sorted_itls))],
-            color="#9b59b6",
-            linewidth=2,
+        jobs.append(
+            PlotJob(
+                str(output_dir / "dist_itl_all_tokens.png"),
+                _render_all_token_itls,
+                {"itls": all_itls},
+            )
         )
-        ax2.set_xlabel("Inter-Token Latency (s)")
-        ax2.set_ylabel("Cumulative Probability")
-        ax2.set_title("ITL CDF (all tokens)")
-        ax2.grid(alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(str(output_dir / "dist_itl_all_tokens.png"), dpi=150)
-        plt.close()
-        generated += 1
+    result = run_plot_jobs(jobs)
+    for path, error in result.failed.items():
+        _log(context, f"Per-request plot {path} failed: {error}", warning=True)
 
-    if generated:
-        _log(context, f"Generated {generated} per-request distribution plot(s)")
+    if result.plotted:
+        _log(
+            context,
+            f"Generated {result.plotted} per-request distribution plot(s)"
+            f" ({result.skipped} unchanged)",
+        )
 
-    return generated
+    return result.plotted
+
+
+# ---------------------------------------------------------------------------
+# Render functions (plot jobs: draw from their arguments alone)
+# ---------------------------------------------------------------------------
+
+
+def _render_distribution(
+    output: str, values: list[float], title: str, xlabel: str, unit: str
+) -> None:
+    import matplotlib.pyplot as plt
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Histogram
+    ax1.hist(
+        values,
+        bins=min(30, len(values)),
+        color="#3498db",
+        alpha=0.7,
+        edgecolor="black",
+        linewidth=0.5,
+    )
+    ax1.axvline(
+        sum(values) / len(values),
+        color="#e74c3c",
+        linestyle="--",
+        label=f"Mean: {sum(values) / len(values):.4f}{unit}",
+    )
+    sorted_v = sorted(values)
+    p50 = sorted_v[len(sorted_v) // 2]
+    p99_idx = min(int(len(sorted_v) * 0.99), len(sorted_v) - 1)
+    ax1.axvline(p50, color="#2ecc71", linestyle="--", label=f"P50: {p50:.4f}{unit}")
+    ax1.axvline(
+        sorted_v[p99_idx],
+        color="#e67e22",
+        linestyle="--",
+        label=f"P99: {sorted_v[p99_idx]:.4f}{unit}",
+    )
+    ax1.set_xlabel(xlabel)
+    ax1.set_ylabel("Count")
+    ax1.set_title(f"{title} (n={len(values)})")
+    ax1.legend(fontsize=8)
+    ax1.grid(alpha=0.3)
+
+    # CDF
+    ax2.plot(
+        sorted_v,
+        [i / len(sorted_v) for i in range(len(sorted_v))],
+        color="#3498db",
+        linewidth=2,
+    )
+    ax2.axhline(0.5, color="#2ecc71", linestyle=":", alpha=0.5, label="P50")
+    ax2.axhline(0.99, color="#e67e22", linestyle=":", alpha=0.5, label="P99")
+    ax2.set_xlabel(xlabel)
+    ax2.set_ylabel("Cumulative Probability")
+    ax2.set_title(f"{title} CDF")
+    ax2.legend(fontsize=8)
+    ax2.grid(alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=150)
+    plt.close()
+
+
+def _render_scatter(
+    output: str,
+    xs: list[float],
+    ys: list[float],
+    color: str,
+    xlabel: str,
+    ylabel: str,
+    title: str,
+) -> None:
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.scatter(xs, ys, alpha=0.6, s=30, color=color)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(output, dpi=150)
+    plt.close()
+
+
+def _render_all_token_itls(output: str, itls: list[float]) -> None:
+    import matplotlib.pyplot as plt
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Histogram
+    ax1.hist(
+        itls,
+        bins=50,
+        color="#9b59b6",
+        alpha=0.7,
+        edgecolor="black",
+        linewidth=0.5,
+    )
+    ax1.set_xlabel("Inter-Token Latency (s)")
+    ax1.set_ylabel("Count")
+    ax1.set_title(f"ITL Distribution (all tokens, n={len(itls)})")
+    ax1.grid(alpha=0.3)
+
+    # CDF
+    sorted_itls = sorted(itls)
+    ax2.plot(
+        sorted_itls,
+        [i / len(sorted_itls) for i in range(len(sorted_itls))],
+        color="#9b59b6",
+        linewidth=2,
+    )
+    ax2.set_xlabel("Inter-Token Latency (s)")
+    ax2.set_ylabel("Cumulative Probability")
+    ax2.set_title("ITL CDF (all tokens)")
+    ax2.grid(alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=150)
+    plt.close()
 
 
 def _log(context, message, warning=False):
@@ -25,6 +25,27 @@ except ImportError:
     MATPLOTLIB_AVAILABLE = False
     print("Warning: matplotlib not available. Install with: pip install matplotlib")
 
+# The shared scrape cache lives in the benchmark_report package, installed as a
+# top-level package in the harness image (where this script runs standalone
+# from /usr/local/bin) and nested under llmdbenchmark elsewhere. Without it,
+# fall back to parsing the raw files here.
+try:
+    from benchmark_report.scrape_store import load_scrape_store
+except ImportError:
+    try:
+        from llmdbenchmark.analysis.benchmark_report.scrape_store import (
+            load_scrape_store,
+        )
+    except ImportError:
+        load_scrape_store = None
+
+# Plots are rendered as jobs that are skipped when their inputs are unchanged
+# (and may run in parallel); the module ships next to the scrape cache.
+try:
+    from benchmark_report.plot_jobs import PlotJob, run_plot_jobs
+except ImportError:
+    from llmdbenchmark.analysis.benchmark_report.plot_jobs import PlotJob, run_plot_jobs
+
 
 # Metrics that should include an aggregated mean line across pods
 AGGREGATE_METRICS = {
@@ -178,6 +199,9 @@ def collect_time_series_data(metrics_dir):
         Dictionary mapping pod names to their time series data:
         {pod_name: {metric_name: [(datetime, value), ...]}}
     """
+    if load_scrape_store is not None:
+        return load_scrape_store(metrics_dir).time_series()
+
     raw_dir = os.path.join(metrics_dir, "raw")
     pod_data = {}
 
@@ -221,13 +245,33 @@ def _parse_ts(ts_str):
         return None
 
 
+def _submit(job, jobs):
+    """Queue *job* on *jobs*, or draw it now when no queue is given.
+
+    A plot drawn now is always redrawn and leaves no ``.plot-digests.json``
+    behind; a render error is raised as RuntimeError.
+    """
+    if jobs is not None:
+        jobs.append(job)
+        return
+    result = run_plot_jobs([job], workers=1, manifest=False)
+    if result.failed:
+        raise RuntimeError(f"plot {job.output} failed: {result.failed[job.output]}")
+
+
 # ---------------------------------------------------------------------------
 # Plot functions
 # ---------------------------------------------------------------------------
 
 
 def plot_metric_time_series(
-    pod_data, metric_name, output_path, title=None, ylabel=None, show_aggregate=False
+    pod_data,
+    metric_name,
+    output_path,
+    title=None,
+    ylabel=None,
+    show_aggregate=False,
+    jobs=None,
 ):
     """Plot time series for a specific metric across all pods.
 
@@ -238,48 +282,42 @@ def plot_metric_time_series(
         title: Plot title (optional)
         ylabel: Y-axis label (optional)
         show_aggregate: If True, add a dashed mean line across all pods
+        jobs: If given, append the plot job here instead of drawing it now
     """
     if not MATPLOTLIB_AVAILABLE:
         return
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ts_values = {} if show_aggregate else None
-
+    series = []
+    ts_values = {}
     for pod_name, metrics in pod_data.items():
         if metric_name not in metrics:
             continue
         timestamps, values = zip(*metrics[metric_name])
-        alpha = 0.5 if show_aggregate else 1.0
-        ax.plot(
-            timestamps, values, label=pod_name, marker="o", markersize=3, alpha=alpha
-        )
+        series.append((pod_name, timestamps, values))
         if show_aggregate:
             for ts, val in metrics[metric_name]:
                 ts_values.setdefault(ts, []).append(val)
 
-    if show_aggregate and ts_values:
+    aggregate = None
+    if show_aggregate:
         sorted_ts = sorted(ts_values.keys())
         agg_means = [sum(ts_values[ts]) / len(ts_values[ts]) for ts in sorted_ts]
-        ax.plot(
-            sorted_ts,
-            agg_means,
-            label="Aggregated (mean)",
-            color="black",
-            linewidth=2,
-            linestyle="--",
-            marker="s",
-            markersize=4,
-        )
-
-    ax.set_xlabel("Time")
-    ax.set_ylabel(ylabel or metric_name)
-    ax.set_title(title or f"{metric_name} Over Time")
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    _save_plot(fig, output_path)
+        aggregate = (sorted_ts, agg_means)
+
+    job = PlotJob(
+        output_path,
+        _render_metric_time_series,
+        {
+            "series": series,
+            "title": title or f"{metric_name} Over Time",
+            "ylabel": ylabel or metric_name,
+            "aggregate": aggregate,
+        },
+    )
+    _submit(job, jobs)
 
 
-def plot_pod_startup_times(metrics_dir, output_path):
+def plot_pod_startup_times(metrics_dir, output_path, jobs=None):
     """Scatter plot of pod startup times.
 
     X-axis: ready_timestamp (when the pod became ready)
@@ -310,46 +348,21 @@ def plot_pod_startup_times(metrics_dir, output_path):
         return
 
     timestamps, startup_secs = zip(*points)
-
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.scatter(
-        timestamps,
-        startup_secs,
-        s=80,
-        c="steelblue",
-        edgecolors="black",
-        linewidths=0.5,
-        zorder=5,
-    )
-
     agg = data.get("aggregate", {})
-    if agg.get("mean"):
-        ax.axhline(
-            y=agg["mean"],
-            color="orange",
-            linestyle="--",
-            linewidth=1.5,
-            label=f"Mean: {agg['mean']:.1f}s",
-        )
-    if agg.get("p99"):
-        ax.axhline(
-            y=agg["p99"],
-            color="red",
-            linestyle="--",
-            linewidth=1,
-            label=f"P99: {agg['p99']:.1f}s",
-        )
-    if agg.get("mean") or agg.get("p99"):
-        ax.legend()
-
-    ax.set_xlabel("Time (pod became Ready)")
-    ax.set_ylabel("Startup Time (seconds)")
-    ax.set_title("Pod Startup Times")
-    ax.grid(True, alpha=0.3)
-    _save_plot(fig, output_path)
+    job = PlotJob(
+        output_path,
+        _render_pod_startup_times,
+        {
+            "timestamps": timestamps,
+            "startup_secs": startup_secs,
+            "mean": agg.get("mean"),
+            "p99": agg.get("p99"),
+        },
+    )
+    _submit(job, jobs)
 
 
-def plot_replica_status(metrics_dir, output_path):
+def plot_replica_status(metrics_dir, output_path, jobs=None):
     """Line plot of replica counts over time, one line per role."""
     if not MATPLOTLIB_AVAILABLE:
         return
@@ -381,10 +394,90 @@ def plot_replica_status(metrics_dir, output_path):
     if not role_series:
         return
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    roles = []
     for role, points in sorted(role_series.items()):
         points.sort(key=lambda x: x[0])
         timestamps, counts = zip(*points)
+        roles.append((role, timestamps, counts))
+
+    _submit(PlotJob(output_path, _render_replica_status, {"roles": roles}), jobs)
+
+
+# ---------------------------------------------------------------------------
+# Render functions (plot jobs: draw from their arguments alone)
+# ---------------------------------------------------------------------------
+
+
+def _render_metric_time_series(output, series, title, ylabel, aggregate):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    alpha = 0.5 if aggregate is not None else 1.0
+    for pod_name, timestamps, values in series:
+        ax.plot(
+            timestamps, values, label=pod_name, marker="o", markersize=3, alpha=alpha
+        )
+
+    if aggregate is not None and aggregate[0]:
+        sorted_ts, agg_means = aggregate
+        ax.plot(
+            sorted_ts,
+            agg_means,
+            label="Aggregated (mean)",
+            color="black",
+            linewidth=2,
+            linestyle="--",
+            marker="s",
+            markersize=4,
+        )
+
+    ax.set_xlabel("Time")
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    _save_plot(fig, output)
+
+
+def _render_pod_startup_times(output, timestamps, startup_secs, mean, p99):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.scatter(
+        timestamps,
+        startup_secs,
+        s=80,
+        c="steelblue",
+        edgecolors="black",
+        linewidths=0.5,
+        zorder=5,
+    )
+
+    if mean:
+        ax.axhline(
+            y=mean,
+            color="orange",
+            linestyle="--",
+            linewidth=1.5,
+            label=f"Mean: {mean:.1f}s",
+        )
+    if p99:
+        ax.axhline(
+            y=p99,
+            color="red",
+            linestyle="--",
+            linewidth=1,
+            label=f"P99: {p99:.1f}s",
+        )
+    if mean or p99:
+        ax.legend()
+
+    ax.set_xlabel("Time (pod became Ready)")
+    ax.set_ylabel("Startup Time (seconds)")
+    ax.set_title("Pod Startup Times")
+    ax.grid(True, alpha=0.3)
+    _save_plot(fig, output)
+
+
+def _render_replica_status(output, roles):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    for role, timestamps, counts in roles:
         ax.plot(timestamps, counts, label=role, marker="o", markersize=3)
 
     ax.set_xlabel("Time")
@@ -393,7 +486,7 @@ def plot_replica_status(metrics_dir, output_path):
     ax.legend()
     ax.grid(True, alpha=0.3)
     ax.yaxis.get_major_locator().set_params(integer=True)
-    _save_plot(fig, output_path)
+    _save_plot(fig, output)
 
 
 # ---------------------------------------------------------------------------
@@ -405,7 +498,9 @@ def generate_all_visualizations(metrics_dir, output_dir=None, context=None):
     """Generate visualizations for all collected metrics.
 
     Returns the number of plots generated (0 when matplotlib is missing or
-    no data is found).
+    no data is found). Plots whose data is unchanged since the last run in
+    *output_dir* are not redrawn; ``LLMDBENCH_PLOT_WORKERS`` renders the rest
+    in parallel.
     """
     if not MATPLOTLIB_AVAILABLE:
         print("Error: matplotlib is required for visualization")
@@ -423,6 +518,7 @@ def generate_all_visualizations(metrics_dir, output_dir=None, context=None):
         return 0
 
     plot_count = 0
+    jobs = []
     configured_metrics = _load_time_series_metrics(metrics_dir)
     configured_metric_set = set(configured_metrics)
 
@@ -442,6 +538,7 @@ def generate_all_visualizations(metrics_dir, output_dir=None, context=None):
                 os.path.join(output_dir, f"{output_name}.png"),
                 title,
                 ylabel,
+                jobs=jobs,
             )
             plot_count += 1
 
@@ -463,17 +560,26 @@ def generate_all_visualizations(metrics_dir, output_dir=None, context=None):
                 title,
                 ylabel,
                 show_aggregate=(metric_name in AGGREGATE_METRICS),
+                jobs=jobs,
             )
             plot_count += 1
 
     # Infrastructure plots
     plot_pod_startup_times(
-        metrics_dir, os.path.join(output_dir, "pod_startup_times.png")
+        metrics_dir, os.path.join(output_dir, "pod_startup_times.png"), jobs
     )
     plot_count += 1
-    plot_replica_status(metrics_dir, os.path.join(output_dir, "replica_status.png"))
+    plot_replica_status(
+        metrics_dir, os.path.join(output_dir, "replica_status.png"), jobs
+    )
     plot_count += 1
 
+    result = run_plot_jobs(jobs)
+    for path, error in result.failed.items():
+        print(f"Warning: plot {path} failed: {error}")
+    if result.skipped:
+        print(f"{result.skipped} plot(s) unchanged since the last run")
+
     print(f"\nAll visualizations saved to: {output_dir}")
     return plot_count
 
@@ -479,8 +479,12 @@ def _resolve_deploy_methods(args, plan_info, logger, phase="standup"):
     return ["modelservice"]
 
 
-def _do_standup(args, logger, render_plan_errors):
-    """Core standup logic. Returns (context, result). Raises PhaseError on failure."""
+def _do_standup(args, logger, render_plan_errors, step_spec=None):
+    """Core standup logic. Returns (context, result). Raises PhaseError on failure.
+
+    ``step_spec`` limits the steps run (the incremental experiment mode passes
+    the steps a treatment's plan changes need); ``--step`` takes precedence.
+    """
     rendered_paths = getattr(render_plan_errors, "rendered_paths", [])
     all_stacks_info = _load_all_stacks_info(rendered_paths)
     plan_info = all_stacks_info[0] if all_stacks_info else {}
@@ -546,7 +550,7 @@ def _do_standup(args, logger, render_plan_errors):
         max_parallel_stacks=getattr(args, "parallel", 4),
     )
 
-    step_spec = getattr(args, "step", None)
+    step_spec = getattr(args, "step", None) or step_spec
     result = executor.execute(step_spec=step_spec)
 
     # Reported before the failure check so a standup that died *after*
@@ -652,20 +656,22 @@ def _do_smoketest(args, logger, render_plan_errors):
         stack_filter=_parse_stack_filter(getattr(args, "stack", None)),
     )
 
-    # Smoketest runs per-stack checks sequentially (max_parallel_stacks=1):
-    # parallel runs would interleave /health + /v1/models probe logs across
-    # stacks, hammer the shared gateway with concurrent curls, and make
-    # multi-stack failures harder to debug. Standup/run stay at the
-    # user-configured default via --parallel; smoketest overrides.
+    # Stacks are smoketested in parallel (--parallel); each stack's log
+    # output is buffered and written out in one block when it finishes, so
+    # /health and /v1/models probe logs of different stacks never interleave.
     executor = StepExecutor(
         steps=get_smoketest_steps(),
         context=context,
         logger=logger,
-        max_parallel_stacks=1,
+        max_parallel_stacks=getattr(args, "parallel", 4) or 4,
     )
 
     step_spec = getattr(args, "step", None)
-    result = executor.execute(step_spec=step_spec)
+    try:
+        result = executor.execute(step_spec=step_spec)
+    finally:
+        # Every HTTP check of the phase ran in these pods; remove them now.
+        context.probe_agents.close_all()
 
     if result.has_errors:
         raise PhaseError(f"Smoketest failed:\n{result.summary()}")
@@ -855,6 +861,8 @@ def _do_teardown(args, logger, render_plan_errors):
         model_name=plan_info.get("model_name"),
         logger=logger,
         fma_teardown_timeout=int(getattr(args, "fma_teardown_timeout", 120) or 120),
+        teardown_parallelism=int(getattr(args, "teardown_parallelism", 4) or 4),
+        teardown_wait_timeout=int(getattr(args, "teardown_wait_timeout", 300) or 300),
         llmd_repo_path=getattr(args, "llmd_repo_path", None),
         stack_filter=_parse_stack_filter(getattr(args, "stack", None)),
     )
@@ -998,6 +1006,10 @@ def _do_run(args, logger, render_plan_errors, experiment_file_override=None):
         harness_debug=getattr(args, "debug", False),
         harness_skip_run=getattr(args, "skip", False),
         harness_fast_collect=getattr(args, "fast_collect", False),
+        harness_collect_streams=int(getattr(args, "collect_streams", None) or 4),
+        harness_collect_zstd=getattr(args, "collect_zstd", False),
+        harness_pipeline=getattr(args, "pipeline_treatments", False),
+        harness_pipeline_depth=int(getattr(args, "pipeline_depth", None) or 1),
         reset_caches=reset_caches,
         treatment_max_attempts=treatment_max_attempts,
         treatment_stop_on_error=treatment_stop_on_error,
@@ -1413,10 +1425,157 @@ def _render_plans_for_experiment(args, logger, setup_overrides=None):
     return render_plan_errors
 
 
+def _prerender_setup_treatments(args, logger, setup_treatments, base_workspace):
+    """Render every setup treatment up front and plan the incremental standups.
+
+    Returns ``(rendered, decisions)`` keyed by 1-based treatment index:
+    ``rendered`` holds each treatment's render result (or the exception its
+    render raised) and ``decisions`` how it is stood up over the previous one.
+    The reuse plan is logged and written to ``incremental-plan.yaml``.
+    """
+    from llmdbenchmark.experiment.incremental import (
+        log_incremental_report,
+        plan_incremental_standups,
+        write_incremental_report,
+    )
+
+    rendered = {}
+    sequence = []
+    for i, setup_treatment in enumerate(setup_treatments, 1):
+        treatment_dir = Path(base_workspace) / f"setup-treatment-{setup_treatment.name}"
+        treatment_plan_dir = treatment_dir / "plan"
+        treatment_plan_dir.mkdir(parents=True, exist_ok=True)
+        config.workspace = treatment_dir
+        config.plan_dir = treatment_plan_dir
+        try:
+            rendered[i] = _render_plans_for_experiment(
+                args, logger, setup_overrides=setup_treatment.overrides
+            )
+            sequence.append((setup_treatment.name, treatment_plan_dir))
+        except Exception as e:  # reported when the treatment's turn comes
+            rendered[i] = e
+            sequence.append((setup_treatment.name, None))
+
+    decisions = dict(enumerate(plan_incremental_standups(sequence), 1))
+    report_path = Path(base_workspace) / "incremental-plan.yaml"
+    write_incremental_report(list(decisions.values()), report_path)
+    logger.log_info("Incremental standup plan:", emoji="♻️")
+    log_incremental_report(list(decisions.values()), logger)
+    logger.log_info(f"Incremental standup plan written to {report_path}")
+    logger.line_break()
+    return rendered, decisions
+
+
+def _run_saturation_search(args, logger, render_plan_errors, experiment_plan, search):
+    """Run one load level at a time until *search* brackets the SLO knee.
+
+    Each level gets its own single-treatment experiment file under
+    ``<workspace>/search/`` and is judged from the benchmark-report v0.2
+    files it adds to ``<workspace>/results``. Raises PhaseError when no
+    level could be judged at all.
+    """
+    from llmdbenchmark.agent import discover_agent_analysis_input
+    from llmdbenchmark.experiment.search import (
+        SearchPoint,
+        score_point,
+        write_point_experiment,
+    )
+
+    spec = search.spec
+    results_dir = Path(config.workspace) / "results"
+    seen = set(discover_agent_analysis_input(results_dir))
+    while (level := search.next_level()) is not None:
+        name = search.treatment_name(level)
+        point_file = write_point_experiment(
+            experiment_plan.experiment_file,
+            spec,
+            level,
+            name,
+            Path(config.workspace) / "search" / f"{name}.yaml",
+        )
+        logger.log_info(
+            f"Adaptive search point {len(search.points) + 1}: "
+            f"{spec.knob}={level:g} ({name})",
+            emoji="🎯",
+        )
+        point_start = time.time()
+        try:
+            _do_run(
+                args,
+                logger,
+                render_plan_errors,
+                experiment_file_override=str(point_file),
+            )
+        except PhaseError as e:
+            point = SearchPoint(level=level, name=name, verdict="error", error=str(e))
+        else:
+            reports = [
+                p for p in discover_agent_analysis_input(results_dir) if p not in seen
+            ]
+            seen.update(reports)
+            point = score_point(spec, level, name, reports)
+        point.duration_seconds = time.time() - point_start
+        search.record(point)
+
+        margin = f", SLO margin {point.margin:.2f}" if point.margin is not None else ""
+        logger.log_info(f"  {name}: {point.verdict}{margin}")
+        if config.dry_run:
+            search.finish("dry run")
+
+    best = search.best
+    outcome = (
+        f"max level meeting SLO is {best.level:g} ({best.name})"
+        if best
+        else "no level met the SLO"
+    )
+    logger.log_info(
+        f"Adaptive search on {spec.knob} stopped ({search.reason}) after "
+        f"{len(search.points)} point(s): {outcome}",
+        emoji="📈",
+    )
+    if not config.dry_run and not any(
+        p.verdict in ("pass", "fail") for p in search.points
+    ):
+        raise PhaseError(
+            f"Adaptive search on {spec.knob} could not judge any load level "
+            f"({search.reason})"
+        )
+
+
+def _order_setup_treatments(experiment_plan, logger):
+    """Reorder the plan's setup treatments by estimated reconfiguration cost."""
+    from llmdbenchmark.experiment.ordering import order_setup_treatments
+
+    # Two treatments cost the same in either order.
+    if len(experiment_plan.setup_treatments) < 3:
+        return
+    result = order_setup_treatments(experiment_plan.setup_treatments)
+    if not result.reordered:
+        logger.log_info(
+            f"Setup treatment order kept: file order is already cheapest "
+            f"(estimated reconfiguration cost {result.cost:g})."
+        )
+        return
+    experiment_plan.setup_treatments = result.treatments
+    logger.log_info(
+        f"Setup treatments reordered: estimated reconfiguration cost "
+        f"{result.original_cost:g} -> {result.cost:g} "
+        f"({result.savings_pct:.0f}% saved)",
+        emoji="🔀",
+    )
+    for i, treatment in enumerate(result.treatments, 1):
+        logger.log_info(f"  {i:>3}. {treatment.name}")
+
+
 def _execute_experiment(args, logger):
     """Orchestrate a full DoE experiment: setup x run treatment matrix."""
     from llmdbenchmark.experiment.parser import parse_experiment, SetupTreatment
+    from llmdbenchmark.experiment.search import SaturationSearch
     from llmdbenchmark.experiment.summary import ExperimentSummary
+    from llmdbenchmark.utilities.treatment_pipeline import (
+        TREATMENT_STATUS_FILE,
+        read_treatment_statuses,
+    )
 
     experiment_file = Path(args.experiments)
     experiment_plan = parse_experiment(experiment_file)
@@ -1431,6 +1590,9 @@ def _execute_experiment(args, logger):
             f"running a single cycle with spec defaults."
         )
 
+    if getattr(args, "order_treatments", False):
+        _order_setup_treatments(experiment_plan, logger)
+
     # Wire experiment-level harness/profile/dataset as fallbacks for CLI args
     if experiment_plan.harness and not getattr(args, "harness", None):
         args.harness = experiment_plan.harness
@@ -1440,9 +1602,15 @@ def _execute_experiment(args, logger):
         args.dataset = experiment_plan.dataset_url
 
     total_setup = len(experiment_plan.setup_treatments)
-    total_run = experiment_plan.run_treatments_count
+    # An adaptive search runs at most max_points run treatments.
+    total_run = (
+        experiment_plan.search.max_points
+        if experiment_plan.search
+        else experiment_plan.run_treatments_count
+    )
     stop_on_error = getattr(args, "stop_on_error", False)
     skip_teardown = getattr(args, "skip_teardown", False)
+    incremental = getattr(args, "incremental", False)
 
     summary = ExperimentSummary(
         experiment_name=experiment_plan.name,
@@ -1456,7 +1624,14 @@ def _execute_experiment(args, logger):
     logger.log_info("=" * W)
     logger.log_info(f"  Name:             {experiment_plan.name}")
     logger.log_info(f"  Setup treatments: {total_setup}")
-    logger.log_info(f"  Run treatments:   {total_run}")
+    if experiment_plan.search:
+        spec = experiment_plan.search
+        logger.log_info(
+            f"  Run treatments:   adaptive search on {spec.knob} in "
+            f"[{spec.low:g}, {spec.high:g}], up to {spec.max_points}"
+        )
+    else:
+        logger.log_info(f"  Run treatments:   {total_run}")
     logger.log_info(f"  Total matrix:     {experiment_plan.total_matrix}")
     if experiment_plan.harness:
         logger.log_info(f"  Harness:          {experiment_plan.harness}")
@@ -1464,12 +1639,21 @@ def _execute_experiment(args, logger):
         logger.log_info(f"  Profile:          {experiment_plan.profile}")
     logger.log_info(f"  Continue on error: {not stop_on_error}")
     logger.log_info(f"  Skip teardown:    {skip_teardown}")
+    logger.log_info(f"  Incremental:      {incremental}")
     logger.log_info("=" * W)
     logger.line_break()
 
     base_workspace = config.workspace
     base_plan_dir = config.plan_dir
 
+    rendered, decisions = {}, {}
+    if incremental:
+        rendered, decisions = _prerender_setup_treatments(
+            args, logger, experiment_plan.setup_treatments, base_workspace
+        )
+    # Name of the treatment whose stack was left up for the next one to reuse.
+    deployed = None
+
     for i, setup_treatment in enumerate(experiment_plan.setup_treatments, 1):
         treatment_start = time.time()
         treatment_name = setup_treatment.name
@@ -1488,9 +1672,14 @@ def _execute_experiment(args, logger):
         config.plan_dir = treatment_plan_dir
 
         try:
-            render_plan_errors = _render_plans_for_experiment(
-                args, logger, setup_overrides=setup_treatment.overrides
-            )
+            if incremental:
+                render_plan_errors = rendered[i]
+                if isinstance(render_plan_errors, Exception):
+                    raise render_plan_errors
+            else:
+                render_plan_errors = _render_plans_for_experiment(
+                    args, logger, setup_overrides=setup_treatment.overrides
+                )
             override_note = " with setup overrides" if setup_treatment.overrides else ""
             logger.log_info(
                 f"Plans rendered{override_note} for {treatment_name}",
@@ -1512,9 +1701,22 @@ def _execute_experiment(args, logger):
                 break
             continue
 
+        # Incremental only over the stack the plan was diffed against: if that
+        # treatment failed and was cleaned up, this one starts from scratch.
+        decision = decisions.get(i)
+        standup_steps = None
+        if decision and decision.incremental and deployed == decision.previous:
+            standup_steps = decision.step_spec
+            logger.log_info(
+                f"Incremental standup over {deployed} ({decision.reason}): "
+                f"steps {standup_steps}",
+                emoji="♻️",
+            )
+        deployed = None
+
         try:
             standup_context, standup_result = _do_standup(
-                args, logger, render_plan_errors
+                args, logger, render_plan_errors, step_spec=standup_steps
             )
             logger.log_info(f"Standup complete for {treatment_name}", emoji="✅")
         except PhaseError as e:
@@ -1573,13 +1775,21 @@ def _execute_experiment(args, logger):
 
         run_succeeded = False
         run_error_msg = None
+        search = (
+            SaturationSearch(experiment_plan.search) if experiment_plan.search else None
+        )
         try:
-            run_context, run_result = _do_run(
-                args,
-                logger,
-                render_plan_errors,
-                experiment_file_override=str(experiment_plan.experiment_file),
-            )
+            if search is not None:
+                _run_saturation_search(
+                    args, logger, render_plan_errors, experiment_plan, search
+                )
+            else:
+                _do_run(
+                    args,
+                    logger,
+                    render_plan_errors,
+                    experiment_file_override=str(experiment_plan.experiment_file),
+                )
             run_succeeded = True
             logger.log_info(f"Run complete for {treatment_name}", emoji="✅")
         except PhaseError as e:
@@ -1587,8 +1797,23 @@ def _execute_experiment(args, logger):
             logger.log_error(f"Run failed for {treatment_name}: {run_error_msg}")
 
         # --- Phase 4: Teardown (always attempted unless --skip-teardown) ---
+        # In incremental mode the stack stays up when the next treatment can
+        # be applied over it (and the experiment is going on to it).
+        next_decision = decisions.get(i + 1)
+        keep_up = (
+            next_decision is not None
+            and next_decision.incremental
+            and (run_succeeded or not stop_on_error)
+        )
         teardown_error = None
-        if not skip_teardown:
+        if keep_up:
+            deployed = treatment_name
+            logger.log_info(
+                f"Teardown deferred for {treatment_name}: "
+                f"{next_decision.treatment} reuses the stack",
+                emoji="♻️",
+            )
+        elif not skip_teardown:
             try:
                 _do_teardown(args, logger, render_plan_errors)
                 logger.log_info(f"Teardown complete for {treatment_name}", emoji="✅")
@@ -1598,6 +1823,7 @@ def _execute_experiment(args, logger):
                     f"Teardown failed for {treatment_name}: {teardown_error}"
                 )
         else:
+            deployed = treatment_name
             logger.log_info(
                 f"Teardown skipped for {treatment_name} (--skip-teardown)",
                 emoji="⏭️",
@@ -1605,33 +1831,51 @@ def _execute_experiment(args, logger):
 
         # --- Record result ---
         duration = time.time() - treatment_start
+        run_completed = len(search.points) if search else total_run
+        search_summary = search.to_dict() if search else None
+        # Ordered per-run-treatment outcomes written by run step 07 (the
+        # search records its own points instead).
+        run_statuses = (
+            None
+            if search
+            else read_treatment_statuses(treatment_dir / "run" / TREATMENT_STATUS_FILE)
+            or None
+        )
+        if run_statuses:
+            run_completed = sum(r.get("status") == "succeeded" for r in run_statuses)
         if run_succeeded and not teardown_error:
             summary.record_success(
                 treatment_name,
-                run_completed=total_run,
+                run_completed=run_completed,
                 run_total=total_run,
                 workspace_dir=str(treatment_dir),
                 duration=duration,
+                search=search_summary,
+                run_statuses=run_statuses,
             )
         elif run_succeeded and teardown_error:
             summary.record_failure(
                 treatment_name,
                 "teardown",
                 teardown_error,
-                run_completed=total_run,
+                run_completed=run_completed,
                 run_total=total_run,
                 workspace_dir=str(treatment_dir),
                 duration=duration,
+                search=search_summary,
+                run_statuses=run_statuses,
             )
         else:
             summary.record_failure(
                 treatment_name,
                 "run",
                 run_error_msg,
-                run_completed=0,
+                run_completed=run_completed if search or run_statuses else 0,
                 run_total=total_run,
                 workspace_dir=str(treatment_dir),
                 duration=duration,
+                search=search_summary,
+                run_statuses=run_statuses,
             )
 
         if not run_succeeded and stop_on_error:
@@ -1704,6 +1948,13 @@ def _log_env_overrides(logger, args):
         "LLMDBENCH_SKIP": ("skip", "--skip"),
         "LLMDBENCH_DEBUG": ("debug", "--debug"),
         "LLMDBENCH_FAST_COLLECT": ("fast_collect", "--fast-collect"),
+        "LLMDBENCH_COLLECT_STREAMS": ("collect_streams", "--collect-streams"),
+        "LLMDBENCH_COLLECT_ZSTD": ("collect_zstd", "--collect-zstd"),
+        "LLMDBENCH_PIPELINE_TREATMENTS": (
+            "pipeline_treatments",
+            "--pipeline-treatments",
+        ),
+        "LLMDBENCH_PIPELINE_DEPTH": ("pipeline_depth", "--pipeline-depth"),
         "LLMDBENCH_AFFINITY": ("affinity", "--affinity"),
         "LLMDBENCH_ANNOTATIONS": ("annotations", "--annotations"),
         "LLMDBENCH_WVA": ("wva", "--wva"),
@@ -1730,6 +1981,14 @@ def _log_env_overrides(logger, args):
             "fma_teardown_timeout",
             "--fma-teardown-timeout",
         ),
+        "LLMDBENCH_TEARDOWN_PARALLELISM": (
+            "teardown_parallelism",
+            "--teardown-parallelism",
+        ),
+        "LLMDBENCH_TEARDOWN_WAIT_TIMEOUT": (
+            "teardown_wait_timeout",
+            "--teardown-wait-timeout",
+        ),
         "LLMDBENCH_LLMD_REPO_PATH": ("llmd_repo_path", "--llmd-repo-path"),
         "LLMDBENCH_KUSTOMIZE_DEPLOY_TIMEOUT": (
             "kustomize_deploy_timeout",
@@ -1817,6 +2076,10 @@ def _all_flag_forms(flag: str) -> list[str]:
         "--skip": ["--skip", "-z"],
         "--debug": ["--debug", "-d"],
         "--fast-collect": ["--fast-collect"],
+        "--collect-streams": ["--collect-streams"],
+        "--collect-zstd": ["--collect-zstd"],
+        "--pipeline-treatments": ["--pipeline-treatments"],
+        "--pipeline-depth": ["--pipeline-depth"],
         "--affinity": ["--affinity"],
         "--annotations": ["--annotations"],
         "--wva": ["--wva"],
@@ -267,12 +267,18 @@ class CommandExecutor:
         parts.extend(args)
         return self.execute(" ".join(parts), check=check, force=force)
 
-    def helm(self, *args: str, check: bool = True) -> CommandResult:
-        """Execute a helm command with auto-injected kubeconfig flags."""
+    def helm(
+        self, *args: str, check: bool = True, force: bool = False
+    ) -> CommandResult:
+        """Execute a helm command with auto-injected kubeconfig flags.
+
+        When *force* is True the command runs even in dry-run mode; use it
+        only for reads such as ``helm list``.
+        """
         parts = ["helm"]
         parts.extend(self._kubeconfig_args())
         parts.extend(args)
-        return self.execute(" ".join(parts), check=check)
+        return self.execute(" ".join(parts), check=check, force=force)
 
     def helmfile(self, *args: str, use_kubeconfig: bool = True) -> CommandResult:
         """Execute a helmfile command.
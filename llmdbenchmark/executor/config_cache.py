@@ -0,0 +1,98 @@
+"""Per-context cache of parsed ``config.yaml`` files.
+
+Every step reads its stack's rendered ``config.yaml`` -- often several times
+per step, from dozens of steps -- and each read used to re-parse a
+multi-thousand-line file.  :class:`ConfigCache` parses each file once (with
+libyaml's loader when available) and serves later reads from memory for as
+long as the file's mtime and size are unchanged, so a step that rewrites a
+config (e.g. FMA's ``fma.requester.replicas``) is picked up on the next read.
+
+Reads return a private copy of the parsed tree by default, so a caller that
+mutates its config cannot affect anyone else's.  Read-only callers can pass
+``copy=False`` to get the shared tree itself.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml's loader when available: these files are large.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Parse one YAML file with the fastest available safe loader."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def copy_tree(obj: Any) -> Any:
+    """Copy the dicts and lists of a parsed YAML tree; scalars are shared."""
+    if isinstance(obj, dict):
+        return {k: copy_tree(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [copy_tree(v) for v in obj]
+    return obj
+
+
+@dataclass
+class ConfigCacheStats:
+    """Parse and hit counts, and time spent parsing."""
+
+    parses: int = 0
+    hits: int = 0
+    parse_seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.parses} parse(s) in {self.parse_seconds * 1000:.0f}ms, "
+            f"{self.hits} cache hit(s)"
+        )
+
+
+class ConfigCache:
+    """Parsed YAML files keyed by path, invalidated by mtime and size."""
+
+    def __init__(self) -> None:
+        self.stats = ConfigCacheStats()
+        self._entries: dict[Path, tuple[tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Path, copy: bool = True) -> Any:
+        """Return the parsed contents of *path*.
+
+        Raises ``OSError`` when the file cannot be read, like ``open()``.
+        """
+        path = Path(path).absolute()
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                self.stats.hits += 1
+                data = entry[1]
+            else:
+                entry = None
+        if entry is None:
+            start = time.perf_counter()
+            data = load_yaml_file(path)
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._entries[path] = (key, data)
+                self.stats.parses += 1
+                self.stats.parse_seconds += elapsed
+        return copy_tree(data) if copy else data
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop *path* (or everything) from the cache."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path).absolute(), None)
@@ -83,6 +83,13 @@ class ExecutionContext:  # pylint: disable=too-many-instance-attributes
     # Experiment IDs generated in this run (step_06 writes, step_08 reads)
     experiment_ids: list[str] = field(default_factory=list)
 
+    # Per-treatment outcomes, in run order (step_07 writes; also saved to
+    # run/treatment-status.yaml for the experiment summary)
+    treatment_statuses: list = field(default_factory=list)
+
+    # Result dirs already analyzed by the step_07 pipeline (step_12 skips them)
+    analyzed_result_dirs: set[str] = field(default_factory=set)
+
     # Run-phase configuration (set by _execute_run)
     harness_name: str | None = None
     harness_profile: str | None = None
@@ -105,6 +112,18 @@ class ExecutionContext:  # pylint: disable=too-many-instance-attributes
     # differs -- but is much faster for large result trees. Relies on the
     # fragile apiserver exec stream (retried). Off by default. See step_07.
     harness_fast_collect: bool = False
+    # Result transfers per treatment that may run at once (``oc cp`` per dir,
+    # or fast-collect tar streams), and whether fast-collect streams use zstd
+    # (needs the zstandard package and zstd in the data-access pod).
+    harness_collect_streams: int = 4
+    harness_collect_zstd: bool = False
+    # When True, step_07 hands each finished treatment's collection, local
+    # analysis and upload to a background worker and deploys the next
+    # treatment's harness meanwhile. ``harness_pipeline_depth`` bounds how
+    # many finished treatments may queue behind the one being collected.
+    # Only used with treatment_max_attempts == 1. See treatment_pipeline.py.
+    harness_pipeline: bool = False
+    harness_pipeline_depth: int = 1
     # When True, reset the vLLM prefix, multimodal, and encoder caches
     # (POST /reset_prefix_cache, /reset_mm_cache, /reset_encoder_cache) on
     # every serving pod before each treatment's run, so every treatment
@@ -167,6 +186,10 @@ class ExecutionContext:  # pylint: disable=too-many-instance-attributes
 
     # Teardown timeouts
     fma_teardown_timeout: int = 120
+    # Bulk teardown: namespaces / helm releases / delete batches in flight,
+    # and how long step 03 waits for deleted objects' finalizers.
+    teardown_parallelism: int = 4
+    teardown_wait_timeout: int = 300
 
     # Run-only mode (existing-stack)
     endpoint_url: str | None = None
@@ -179,6 +202,10 @@ class ExecutionContext:  # pylint: disable=too-many-instance-attributes
     # Built once on first use and shared by every CommandExecutor rebuild, so
     # the count survives the executor being recreated mid-phase.
     _restart_budget: Any = field(default=None, repr=False)
+    # Parsed config.yaml files, shared by every step of the phase.
+    _config_cache: Any = field(default=None, repr=False)
+    # Smoketest probe pods, one per namespace; deleted at phase end.
+    _probe_agents: Any = field(default=None, repr=False)
 
     # Call rebuild_cmd() after changing kubeconfig or is_openshift.
     cmd: CommandExecutor | None = field(default=None, repr=False)
@@ -200,6 +227,24 @@ class ExecutionContext:  # pylint: disable=too-many-instance-attributes
             self._restart_budget = RestartBudget(self.pod_restart_budget)
         return self._restart_budget
 
+    @property
+    def config_cache(self):
+        """The phase's config.yaml cache, created on first access."""
+        if self._config_cache is None:
+            from llmdbenchmark.executor.config_cache import ConfigCache
+
+            self._config_cache = ConfigCache()
+        return self._config_cache
+
+    @property
+    def probe_agents(self):
+        """The phase's smoketest probe pods, created on first access."""
+        if self._probe_agents is None:
+            from llmdbenchmark.smoketests.probe_agent import ProbeAgentPool
+
+            self._probe_agents = ProbeAgentPool()
+        return self._probe_agents
+
     def rebuild_cmd(self) -> CommandExecutor:
         """Create or recreate the shared CommandExecutor from current context fields."""
         from llmdbenchmark.executor.command import CommandExecutor as _CE
@@ -7,8 +7,7 @@ from pathlib import Path
 from typing import Any
 import re
 
-import yaml
-
+from llmdbenchmark.executor.config_cache import ConfigCache, load_yaml_file
 from llmdbenchmark.executor.context import ExecutionContext
 
 
@@ -55,6 +54,8 @@ class StackExecutionResult:
     stack_name: str
     stack_path: Path
     step_results: list[StepResult] = field(default_factory=list)
+    # Seconds spent running this stack's steps.
+    duration: float = 0.0
 
     @property
     def has_errors(self) -> bool:
@@ -129,6 +130,9 @@ class Step(ABC):
     description: str
     phase: Phase
     per_stack: bool
+    # Bound to the context's cache by StepExecutor; unbound steps parse
+    # config.yaml on every read.
+    config_cache: ConfigCache | None = None
 
     def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
@@ -207,21 +211,29 @@ class Step(ABC):
             current = current[key]
         return current
 
+    def _read_config(self, config_file: Path, copy: bool = True) -> Any:
+        """Parse *config_file*, through the bound config cache when there is one.
+
+        ``copy=False`` returns the cache's shared tree: only for callers that
+        never modify it.
+        """
+        if self.config_cache is not None:
+            return self.config_cache.load(config_file, copy=copy)
+        return load_yaml_file(config_file)
+
     def _load_plan_config(self, context: ExecutionContext) -> dict | None:
         """Load the merged config.yaml from the first rendered stack."""
         for stack_path in context.rendered_stacks:
             config_file = stack_path / "config.yaml"
             if config_file.exists():
-                with open(config_file, encoding="utf-8") as f:
-                    return yaml.safe_load(f)
+                return self._read_config(config_file)
         return None
 
-    def _load_stack_config(self, stack_path: Path) -> dict:
+    def _load_stack_config(self, stack_path: Path, copy: bool = True) -> dict:
         """Load config.yaml from a specific stack directory."""
         config_file = stack_path / "config.yaml"
         if config_file.exists():
-            with open(config_file, encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+            return self._read_config(config_file, copy=copy) or {}
         return {}
 
     def _all_target_namespaces(self, context: ExecutionContext) -> list[str]:
@@ -233,7 +245,7 @@ class Step(ABC):
                 seen.append(ns)
 
         for stack_path in context.rendered_stacks:
-            cfg = self._load_stack_config(stack_path)
+            cfg = self._load_stack_config(stack_path, copy=False)
             if cfg:
                 _add(cfg.get("namespace", {}).get("name"))
                 _add(cfg.get("harness", {}).get("namespace"))
@@ -1,6 +1,8 @@
 """Phase-agnostic step orchestrator with sequential and parallel execution."""
 
+import contextlib
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -11,6 +13,7 @@ from llmdbenchmark.executor.step import (
     ExecutionResult,
 )
 from llmdbenchmark.executor.context import ExecutionContext
+from llmdbenchmark.utilities.podstate import release_watchers
 
 
 class StepExecutor:
@@ -25,6 +28,8 @@ class StepExecutor:
     ):
         self.steps = sorted(steps, key=lambda s: s.number)
         self.context = context
+        for step in self.steps:
+            step.config_cache = context.config_cache
         self.logger = logger
         self.max_parallel_stacks = max_parallel_stacks
 
@@ -62,17 +67,30 @@ class StepExecutor:
             allowed_numbers
         )
 
-        abort = self._execute_global_steps(pre_global, result)
-        if abort:
-            return result
+        try:
+            abort = self._execute_global_steps(pre_global, result)
+            if abort:
+                return result
 
-        self._execute_per_stack_steps(per_stack_steps, result)
+            self._execute_per_stack_steps(per_stack_steps, result)
 
-        if post_global:
-            self._execute_global_steps(post_global, result)
+            if post_global:
+                self._execute_global_steps(post_global, result)
+        finally:
+            # Pod watchers shared by this phase's steps hold API clients.
+            if getattr(self.context, "cmd", None) is not None:
+                release_watchers(self.context.cmd)
 
+        self._report_config_cache()
         return result
 
+    def _report_config_cache(self) -> None:
+        """In verbose mode, log how much config parsing the phase did."""
+        if self.context.verbose:
+            self.logger.log_info(
+                f"Config cache: {self.context.config_cache.stats.summary()}"
+            )
+
     def _partition_steps(
         self, allowed_numbers: set[int] | None
     ) -> tuple[list[Step], list[Step], list[Step]]:
@@ -210,13 +228,19 @@ class StepExecutor:
     def _execute_stacks_parallel(
         self, stacks: list[Path], steps: list[Step], result: ExecutionResult
     ) -> None:
-        """Execute per-stack steps across multiple stacks in parallel."""
-        with ThreadPoolExecutor(
-            max_workers=min(self.max_parallel_stacks, len(stacks))
-        ) as pool:
+        """Execute per-stack steps across multiple stacks in parallel.
+
+        With more than one worker, each stack's console output is buffered
+        and written out in one block when that stack finishes, so concurrent
+        stacks never interleave their lines on the terminal; log files are
+        written as records happen.
+        """
+        workers = min(self.max_parallel_stacks, len(stacks))
+        run = self._execute_stack_buffered if workers > 1 else self._execute_stack
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
             futures = {
-                pool.submit(self._execute_stack, stack_path, steps): stack_path
-                for stack_path in stacks
+                pool.submit(run, stack_path, steps): stack_path for stack_path in stacks
             }
             for future in as_completed(futures):
                 stack_path = futures[future]
@@ -241,6 +265,21 @@ class StepExecutor:
                     )
                 result.stack_results.append(stack_result)
 
+        wall = time.monotonic() - started
+        total = sum(r.duration for r in result.stack_results)
+        self.logger.log_info(
+            f"⏱️  {len(stacks)} stack(s) finished in {wall:.1f}s wall time "
+            f"({total:.1f}s summed across stacks, max parallel: {workers})"
+        )
+
+    def _execute_stack_buffered(
+        self, stack_path: Path, steps: list[Step]
+    ) -> StackExecutionResult:
+        """:meth:`_execute_stack` with this thread's console output held until done."""
+        buffered = getattr(self.logger, "buffered", None)
+        with buffered() if buffered else contextlib.nullcontext():
+            return self._execute_stack(stack_path, steps)
+
     def _execute_stack(
         self,
         stack_path: Path,
@@ -251,6 +290,7 @@ class StepExecutor:
         stack_result = StackExecutionResult(
             stack_name=stack_name, stack_path=stack_path
         )
+        started = time.monotonic()
 
         self.logger.log_info(
             f"Stack '{stack_name}': starting {len(steps)} step(s)...",
@@ -292,6 +332,10 @@ class StepExecutor:
                 f"✅ [{step.number:02d}] Stack '{stack_name}': Completed: {step.name}",
             )
 
+        stack_result.duration = time.monotonic() - started
+        self.logger.log_info(
+            f"Stack '{stack_name}': finished in {stack_result.duration:.1f}s"
+        )
         return stack_result
 
     def _safe_execute_step(self, step: Step, stack_path: Path | None) -> StepResult:
@@ -0,0 +1,371 @@
+"""Incremental standup between consecutive setup treatments.
+
+A setup treatment usually changes one or two knobs (a vLLM flag, a replica
+count, the EPP plugins file), so most of its rendered plan is byte-identical
+to the previous treatment's. This module diffs the two plan directories and
+maps every changed file to the standup steps that apply it, so the
+orchestrator can leave the previous stack up and re-run only those steps:
+namespaces, model PVCs and their downloaded weights, the gateway and anything
+else untouched stays warm.
+
+A treatment falls back to a full teardown/standup cycle when the diff cannot
+be applied in place: the namespace, release or deploy method changed, a
+resource disappeared (an incremental apply cannot delete it), a file is not
+mapped to a step, only ``config.yaml`` changed (steps read it directly, so the
+change is not tied to any one of them), or the method is one whose standup is
+not file-driven (kustomize, nok8s).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+#: Standup steps re-run on every incremental treatment: the preflight and
+#: the post-deploy checks, which are cheap and verify the updated stack.
+ALWAYS_RUN_STEPS = (0, 10, 11)
+
+#: Rendered-plan file prefix -> standup steps that apply it. Kept in step
+#: with the ``_find_yaml``/``_find_rendered_yaml`` lookups of each step.
+PLAN_FILE_STEPS: dict[str, tuple[int, ...]] = {
+    "01_pvc_workload-pvc": (5,),
+    "02_pvc_model-pvc": (4,),
+    "02a_pv_model-hostpath": (4,),
+    "03_cluster-monitoring-config": (3,),
+    "03_download_daemonset": (4,),
+    "04_download_job": (4,),
+    "05_namespace_sa_rbac_secret": (2, 4),
+    "05a_agentgateway_scc": (2,),
+    "06_pod_access_to_harness_data": (5,),
+    "07_service_access_to_harness_data": (5,),
+    "08_httproute": (6, 9),
+    "09_helmfile-gateway-provider": (2, 7),
+    "10_helmfile-main": (7, 8, 9),
+    "11_infra": (7,),
+    "12_router-values": (8,),
+    "13_ms-values": (9,),
+    "13a_modelservice-direct-service": (9,),
+    "14_standalone-deployment": (6,),
+    "15_standalone-service": (6,),
+    "16_pvc_extra-pvc": (4,),
+    "17_standalone-podmonitor": (6,),
+    "18_podmonitor": (9,),
+    "19_wva-kustomize": (3,),
+    "20_harness_pod": (),  # rendered again by the run phase
+    "21_keda-triggerauthentication": (3,),
+    "22_prometheus-rbac": (3,),
+    "23_wva-namespace": (3,),
+    "24_fma-deployment": (6,),
+    "25_fma-clusterrole": (6,),
+    "25a_fma-launcher-rbac": (6,),
+    "26_helmfile-fma-controllers": (6,),
+    "27_keda-scaledobjects": (3, 9),
+    "27a_keda-triggerauthentication": (3, 9),
+    "28_wva-scaledobject": (6, 9),
+    "29_epp-keda-saturation-epp-monitoring": (3,),
+    "30_keda-scaledobject": (9,),
+    "31_nok8s-epp-config": (6,),
+    "32_nok8s-epp-endpoints": (6,),
+    "33_nok8s-envoy": (6,),
+    "34_nok8s-containers": (6,),
+}
+
+#: Steps 08 and 09 deploy from the helm working directory step 07 prepares.
+STEP_PREREQUISITES: dict[int, tuple[int, ...]] = {8: (7,), 9: (7,)}
+
+#: ``config.yaml`` keys whose change means a different stack, not an update.
+FULL_CYCLE_CONFIG_KEYS = (
+    "namespace",
+    "release",
+    "standalone.enabled",
+    "modelservice.enabled",
+    "fma.enabled",
+    "kustomize.enabled",
+    "nok8s.enabled",
+)
+
+#: Deploy methods whose standup is driven by the plan files above.
+INCREMENTAL_METHODS = {"modelservice", "standalone", "fma"}
+
+PLAN_CONFIG = "config.yaml"
+
+
+@dataclass
+class PlanDiff:
+    """File-level difference between one stack of two rendered plans."""
+
+    stack: str
+    changed: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    config_keys: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the incremental report."""
+        d: dict[str, Any] = {"stack": self.stack, "reused": len(self.unchanged)}
+        for key in ("changed", "added", "removed", "config_keys"):
+            if getattr(self, key):
+                d[key] = list(getattr(self, key))
+        return d
+
+
+@dataclass
+class IncrementalDecision:
+    """How one setup treatment is stood up relative to the previous one."""
+
+    treatment: str
+    previous: str | None
+    mode: str
+    reason: str
+    steps: list[int] = field(default_factory=list)
+    diffs: list[PlanDiff] = field(default_factory=list)
+
+    @property
+    def incremental(self) -> bool:
+        return self.mode == "incremental"
+
+    @property
+    def step_spec(self) -> str:
+        """``StepExecutor`` step filter for the steps to re-run."""
+        return ",".join(str(step) for step in self.steps)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the incremental report."""
+        d: dict[str, Any] = {
+            "treatment": self.treatment,
+            "mode": self.mode,
+            "reason": self.reason,
+        }
+        if self.previous:
+            d["previous"] = self.previous
+        if self.incremental:
+            d["standup_steps"] = list(self.steps)
+        if self.diffs:
+            d["stacks"] = [diff.to_dict() for diff in self.diffs]
+        return d
+
+
+def _file_key(name: str) -> str:
+    """Rendered-file prefix, e.g. ``13_ms-values`` for ``13_ms-values.yaml``."""
+    for prefix in PLAN_FILE_STEPS:
+        if name.startswith(prefix) and name[len(prefix) :][:1] in ("", ".", "_"):
+            return prefix
+    return name
+
+
+def _digest(path: Path) -> str:
+    """Content hash of a rendered file, or "" when it renders empty."""
+    content = path.read_bytes()
+    if not content.strip():
+        return ""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _stack_files(stack_dir: Path) -> dict[str, str]:
+    return {
+        path.name: _digest(path)
+        for path in sorted(stack_dir.iterdir())
+        if path.is_file() and path.name != PLAN_CONFIG
+    }
+
+
+def _load_config(stack_dir: Path) -> dict[str, Any]:
+    path = stack_dir / PLAN_CONFIG
+    if not path.is_file():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def _lookup(cfg: dict[str, Any], dotted: str) -> Any:
+    value: Any = cfg
+    for part in dotted.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _stack_dirs(plan_dir: Path) -> dict[str, Path]:
+    return {
+        path.name: path
+        for path in sorted(Path(plan_dir).iterdir())
+        if path.is_dir() and (path / PLAN_CONFIG).is_file()
+    }
+
+
+def diff_stack(stack: str, previous: Path, current: Path) -> PlanDiff:
+    """Diff one stack directory of two rendered plans.
+
+    A file that rendered with content before and renders empty now counts as
+    removed: its resources would have to be deleted.
+    """
+    diff = PlanDiff(stack=stack)
+    before = _stack_files(previous)
+    after = _stack_files(current)
+    for name in sorted(set(before) | set(after)):
+        old, new = before.get(name), after.get(name)
+        if old == new:
+            diff.unchanged.append(name)
+        elif new is None or (old and not new):
+            diff.removed.append(name)
+        elif old is None or not old:
+            diff.added.append(name)
+        else:
+            diff.changed.append(name)
+
+    old_cfg, new_cfg = _load_config(previous), _load_config(current)
+    diff.config_keys = sorted(
+        key
+        for key in set(old_cfg) | set(new_cfg)
+        if old_cfg.get(key) != new_cfg.get(key)
+    )
+    return diff
+
+
+def _methods(cfg: dict[str, Any]) -> set[str]:
+    return {
+        method
+        for method in ("standalone", "modelservice", "fma", "kustomize", "nok8s")
+        if _lookup(cfg, f"{method}.enabled")
+    }
+
+
+def decide_standup(
+    treatment: str,
+    current_plan: Path,
+    previous: str | None = None,
+    previous_plan: Path | None = None,
+) -> IncrementalDecision:
+    """Work out whether ``current_plan`` can be applied over ``previous_plan``.
+
+    Args:
+        treatment: Name of the treatment being stood up.
+        current_plan: Its rendered plan directory.
+        previous: Name of the treatment whose stack is still deployed.
+        previous_plan: That treatment's plan directory, or ``None`` when
+            nothing is deployed (the first treatment, or after a teardown).
+
+    Returns:
+        IncrementalDecision: ``mode`` is ``"incremental"`` with the standup
+        steps to re-run, or ``"full"`` with the reason an in-place update is
+        not possible.
+    """
+    if previous_plan is None:
+        return IncrementalDecision(treatment, previous, "full", "nothing deployed")
+
+    before, after = _stack_dirs(previous_plan), _stack_dirs(current_plan)
+    if set(before) != set(after):
+        return IncrementalDecision(
+            treatment, previous, "full", "the set of stacks changed"
+        )
+
+    diffs: list[PlanDiff] = []
+    steps: set[int] = set()
+    reasons: list[str] = []
+    for stack, current_dir in after.items():
+        diff = diff_stack(stack, before[stack], current_dir)
+        diffs.append(diff)
+        old_cfg, new_cfg = _load_config(before[stack]), _load_config(current_dir)
+        for key in FULL_CYCLE_CONFIG_KEYS:
+            if _lookup(old_cfg, key) != _lookup(new_cfg, key):
+                reasons.append(f"{stack}: {key} changed")
+        unsupported = _methods(new_cfg) - INCREMENTAL_METHODS
+        if unsupported:
+            reasons.append(
+                f"{stack}: {', '.join(sorted(unsupported))} standup is not incremental"
+            )
+        if diff.removed:
+            reasons.append(f"{stack}: resources removed ({', '.join(diff.removed)})")
+        for name in diff.changed + diff.added:
+            key = _file_key(name)
+            if key not in PLAN_FILE_STEPS:
+                reasons.append(f"{stack}: no standup step known for {name}")
+            steps.update(PLAN_FILE_STEPS.get(key, ()))
+
+    changed = sum(len(d.changed) + len(d.added) for d in diffs)
+    config_keys = sorted({key for d in diffs for key in d.config_keys})
+    if config_keys and not changed:
+        reasons.append(
+            f"only {PLAN_CONFIG} changed ({', '.join(config_keys)}); "
+            "no standup step known for it"
+        )
+
+    if reasons:
+        return IncrementalDecision(
+            treatment, previous, "full", "; ".join(reasons), diffs=diffs
+        )
+
+    for step in sorted(steps):
+        steps.update(STEP_PREREQUISITES.get(step, ()))
+    steps.update(ALWAYS_RUN_STEPS)
+    reused = sum(len(d.unchanged) for d in diffs)
+    if changed:
+        reason = f"{changed} changed file(s), {reused} reused"
+    else:
+        reason = f"plan unchanged, {reused} file(s) reused"
+    return IncrementalDecision(
+        treatment, previous, "incremental", reason, sorted(steps), diffs
+    )
+
+
+def plan_incremental_standups(
+    treatments: list[tuple[str, Path | None]],
+) -> list[IncrementalDecision]:
+    """Decisions for a sequence of treatments, assuming each standup succeeds.
+
+    ``treatments`` holds ``(name, plan_dir)`` in execution order; a ``None``
+    plan directory (render failed) forces the treatment after it to stand up
+    from scratch, as the orchestrator tears the stack down in that case.
+    """
+    decisions: list[IncrementalDecision] = []
+    previous: tuple[str, Path] | None = None
+    for name, plan_dir in treatments:
+        if plan_dir is None:
+            decisions.append(IncrementalDecision(name, None, "full", "render failed"))
+            previous = None
+            continue
+        decisions.append(
+            decide_standup(
+                name,
+                plan_dir,
+                previous[0] if previous else None,
+                previous[1] if previous else None,
+            )
+        )
+        previous = (name, plan_dir)
+    return decisions
+
+
+def write_incremental_report(decisions: list[IncrementalDecision], path: Path) -> None:
+    """Write the per-treatment reuse plan as YAML."""
+    incremental = sum(1 for d in decisions if d.incremental)
+    document = {
+        "treatments": len(decisions),
+        "incremental": incremental,
+        "full": len(decisions) - incremental,
+        "decisions": [d.to_dict() for d in decisions],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(document, f, default_flow_style=False, sort_keys=False)
+
+
+def log_incremental_report(decisions: list[IncrementalDecision], logger) -> None:
+    """Log one line per treatment (plus its changed files) of the reuse plan."""
+    for decision in decisions:
+        if decision.incremental:
+            logger.log_info(
+                f"  {decision.treatment}: incremental over {decision.previous} "
+                f"({decision.reason}); standup steps {decision.step_spec}"
+            )
+        else:
+            logger.log_info(f"  {decision.treatment}: full standup ({decision.reason})")
+        for diff in decision.diffs:
+            touched = diff.changed + diff.added + diff.removed
+            if touched:
+                logger.log_info(f"      {diff.stack}: {', '.join(touched)}")
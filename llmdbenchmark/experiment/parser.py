@@ -8,6 +8,8 @@ runtime sections:
   standup to run to teardown cycle.
 - ``treatments`` -- workload treatments (consumed by step_04 render_profiles).
   Multiple run treatments execute against a single stood-up stack.
+- ``search`` -- instead of ``treatments``, an adaptive saturation search
+  over one load knob (see :mod:`llmdbenchmark.experiment.search`).
 
 The ``setup`` section is optional.  When absent, the experiment file
 behaves identically to the existing ``--experiments`` run-only flow.
@@ -18,10 +20,13 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
+if TYPE_CHECKING:
+    from llmdbenchmark.experiment.search import SearchSpec
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +50,7 @@ class ExperimentPlan:
     run_treatments_count: int
     experiment_file: Path
     has_setup_phase: bool
+    search: SearchSpec | None = None
 
     @property
     def total_matrix(self) -> int:
@@ -253,6 +259,18 @@ def parse_experiment(path: Path) -> ExperimentPlan:
 
     run_count = _count_run_treatments(data)
 
+    search = None
+    if data.get("search") is not None:
+        if run_count:
+            raise ValueError(
+                "An experiment file takes either a 'search' section or a "
+                "'treatments' list, not both"
+            )
+        # Imported here: the search spec pulls in the agent scoring models.
+        from llmdbenchmark.experiment.search import SearchSpec
+
+        search = SearchSpec.from_dict(data["search"])
+
     return ExperimentPlan(
         name=name,
         harness=harness,
@@ -262,4 +280,5 @@ def parse_experiment(path: Path) -> ExperimentPlan:
         run_treatments_count=run_count,
         experiment_file=path,
         has_setup_phase=has_setup,
+        search=search,
     )
@@ -0,0 +1,350 @@
+"""Adaptive saturation search over a run-treatment load knob.
+
+A fixed rate or concurrency grid spends most of its points far below or far
+above the knee of the latency curve.  An experiment file with a ``search``
+section instead of a ``treatments`` list runs one load level at a time and
+picks the next level from the results so far, until it has bracketed the
+highest load that still meets the SLO to within a tolerance::
+
+    search:
+      knob: max-concurrency        # run-treatment override path
+      range: [4, 256]
+      name: conc                   # treatment names: conc4, conc256, ...
+      integer: true
+      tolerance: 0.05              # stop when the bracket is within 5%
+      max_points: 8
+      strategy: fit                # or "bisect"
+      slo:
+        percentile: p95
+        max_failure_ratio: 0.01
+        gates:
+          - {metric: time_to_first_token, threshold: 500, units: ms}
+
+Each point is judged with the SLO gate logic in ``llmdbenchmark.agent.score``
+against the benchmark-report v0.2 files it produced.  The search is only a
+planner: the experiment orchestrator runs each level and feeds the verdicts
+back through :meth:`SaturationSearch.record`.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Sequence
+
+import yaml
+from pydantic import ValidationError
+
+from llmdbenchmark.agent import (
+    GatePercentile,
+    SloGate,
+    gate_margin,
+    score_slo_goodput,
+)
+
+SEARCH_STRATEGIES = ("bisect", "fit")
+
+#: Experiment keys that describe the experiment's own treatments and are not
+#: carried into the single-treatment file written for each point.
+_NON_RUN_KEYS = ("experiment", "setup", "search", "treatments", "run")
+
+#: An interpolated point is kept at least this fraction of the bracket away
+#: from either end, so a lopsided fit still shrinks the bracket every step.
+_FIT_GUARD = 0.1
+
+
+@dataclass
+class SearchSpec:
+    """The ``search`` section of an experiment file."""
+
+    knob: str
+    low: float
+    high: float
+    gates: list[SloGate]
+    percentile: GatePercentile = GatePercentile.P95
+    max_failure_ratio: float | None = None
+    name: str = "load"
+    integer: bool = True
+    tolerance: float = 0.05
+    max_points: int = 8
+    strategy: str = "fit"
+
+    @classmethod
+    def from_dict(cls, data: Any) -> SearchSpec:
+        """Build a spec from parsed YAML; raises ``ValueError`` when invalid."""
+        if not isinstance(data, dict):
+            raise ValueError("search must be a mapping")
+        knob = data.get("knob")
+        if not knob or not isinstance(knob, str):
+            raise ValueError("search.knob must name a run-treatment override path")
+
+        bounds = data.get("range")
+        if (
+            not isinstance(bounds, list)
+            or len(bounds) != 2
+            or not all(isinstance(b, (int, float)) for b in bounds)
+            or not 0 <= bounds[0] < bounds[1]
+        ):
+            raise ValueError("search.range must be [low, high] with 0 <= low < high")
+
+        slo = data.get("slo") or {}
+        raw_gates = slo.get("gates") if isinstance(slo, dict) else None
+        if not isinstance(raw_gates, list) or not raw_gates:
+            raise ValueError("search.slo.gates must list at least one SLO gate")
+        try:
+            gates = [SloGate.model_validate(g) for g in raw_gates]
+            percentile = GatePercentile(slo.get("percentile", "p95"))
+        except (ValidationError, ValueError) as exc:
+            raise ValueError(f"search.slo: {exc}") from exc
+
+        strategy = str(data.get("strategy", "fit"))
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"search.strategy must be one of {SEARCH_STRATEGIES}")
+        tolerance = float(data.get("tolerance", 0.05))
+        if tolerance <= 0:
+            raise ValueError("search.tolerance must be positive")
+        max_points = int(data.get("max_points", 8))
+        if max_points < 2:
+            raise ValueError("search.max_points must be at least 2")
+        max_failure_ratio = slo.get("max_failure_ratio")
+
+        return cls(
+            knob=knob,
+            low=bounds[0],
+            high=bounds[1],
+            gates=gates,
+            percentile=percentile,
+            max_failure_ratio=(
+                float(max_failure_ratio) if max_failure_ratio is not None else None
+            ),
+            name=str(data.get("name", "load")),
+            integer=bool(data.get("integer", True)),
+            tolerance=tolerance,
+            max_points=max_points,
+            strategy=strategy,
+        )
+
+
+@dataclass
+class SearchPoint:
+    """One explored load level and how it was judged.
+
+    ``verdict`` is ``pass``/``fail``/``indeterminate`` as scored, or
+    ``error`` when the run itself failed.  ``margin`` is the worst gate's
+    observed/threshold ratio (<= 1.0 meets the SLO).
+    """
+
+    level: float
+    name: str
+    verdict: str
+    margin: float | None = None
+    output_token_rate: float | None = None
+    reports: list[str] = field(default_factory=list)
+    error: str | None = None
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        d: dict[str, Any] = {
+            "name": self.name,
+            "level": self.level,
+            "verdict": self.verdict,
+            "duration_seconds": round(self.duration_seconds, 1),
+        }
+        if self.margin is not None:
+            d["slo_margin"] = round(self.margin, 4)
+        if self.output_token_rate is not None:
+            d["output_token_rate"] = round(self.output_token_rate, 3)
+        if self.reports:
+            d["reports"] = list(self.reports)
+        if self.error:
+            d["error"] = self.error
+        return d
+
+
+class SaturationSearch:
+    """Bracket the highest load level that meets the SLO.
+
+    The first two points are the ends of the range.  After that the bracket
+    is ``[highest passing level, lowest failing level above it]`` and the
+    next level is its midpoint (``bisect``), or where a straight line through
+    the two ends' log SLO margins crosses 1.0 (``fit``, falling back to the
+    midpoint when a margin is missing).  A run that errors counts as a
+    failure; a point that cannot be judged stops the search.
+    """
+
+    def __init__(self, spec: SearchSpec):
+        self.spec = spec
+        self.points: list[SearchPoint] = []
+        self.reason: str | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.reason is not None
+
+    @property
+    def best(self) -> SearchPoint | None:
+        """The highest passing point so far."""
+        lo, _ = self._bracket()
+        return lo
+
+    def treatment_name(self, level: float) -> str:
+        """Run-treatment name for *level*, e.g. ``conc24`` or ``rate0p08``."""
+        return f"{self.spec.name}{format(level, 'g').replace('.', 'p')}"
+
+    def finish(self, reason: str) -> None:
+        if self.reason is None:
+            self.reason = reason
+
+    def record(self, point: SearchPoint) -> None:
+        self.points.append(point)
+        if point.verdict == "indeterminate":
+            self.finish(f"could not judge {point.name} against the SLO")
+
+    def next_level(self) -> float | None:
+        """The next load level to run, or None once the search is over."""
+        if self.done:
+            return None
+        if len(self.points) >= self.spec.max_points:
+            self.finish("point budget exhausted")
+            return None
+
+        spec = self.spec
+        tested = {p.level for p in self.points}
+        lo, hi = self._bracket()
+        if lo is None:
+            if spec.low in tested:
+                self.finish("SLO missed at the lowest load")
+                return None
+            return self._level(spec.low)
+        if hi is None:
+            if spec.high in tested:
+                self.finish("SLO met at the highest load")
+                return None
+            return self._level(spec.high)
+
+        width = hi.level - lo.level
+        if width <= max(spec.tolerance * hi.level, 1 if spec.integer else 0):
+            self.finish("converged")
+            return None
+
+        midpoint = self._level(lo.level + width / 2)
+        candidate = midpoint
+        if (
+            spec.strategy == "fit"
+            and lo.margin
+            and hi.margin
+            and hi.margin > lo.margin > 0
+        ):
+            # Latency climbs roughly exponentially into saturation, so the
+            # line is fitted through log(margin), which crosses 0 at the SLO.
+            lo_log, hi_log = math.log(lo.margin), math.log(hi.margin)
+            crossing = lo.level + width * -lo_log / (hi_log - lo_log)
+            guard = width * _FIT_GUARD
+            candidate = self._level(
+                min(max(crossing, lo.level + guard), hi.level - guard)
+            )
+        for level in (candidate, midpoint):
+            if lo.level < level < hi.level and level not in tested:
+                return level
+        self.finish("converged")
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        best = self.best
+        return {
+            "knob": self.spec.knob,
+            "range": [self.spec.low, self.spec.high],
+            "strategy": self.spec.strategy,
+            "max_passing_level": best.level if best else None,
+            "max_passing_treatment": best.name if best else None,
+            "stop_reason": self.reason,
+            "points": [p.to_dict() for p in self.points],
+        }
+
+    def _level(self, value: float) -> float:
+        if self.spec.integer:
+            return int(math.floor(value + 0.5))
+        return round(value, 6)
+
+    def _bracket(self) -> tuple[SearchPoint | None, SearchPoint | None]:
+        # The highest pass wins even above an earlier (noisy) failure; the
+        # upper end is then the lowest failure above it, if any.
+        judged = [p for p in self.points if p.verdict in ("pass", "fail", "error")]
+        passing = [p for p in judged if p.verdict == "pass"]
+        lo = max(passing, key=lambda p: p.level, default=None)
+        failing = [
+            p
+            for p in judged
+            if p.verdict != "pass" and (lo is None or p.level > lo.level)
+        ]
+        hi = min(failing, key=lambda p: p.level, default=None)
+        return lo, hi
+
+
+def score_point(
+    spec: SearchSpec, level: float, name: str, reports: Sequence[Path]
+) -> SearchPoint:
+    """Judge one load level from the benchmark-report v0.2 files it produced.
+
+    Every report must pass for the point to pass; the margin and throughput
+    are the worst gate margin and the best output token rate across them.
+    """
+    if not reports:
+        return SearchPoint(
+            level=level,
+            name=name,
+            verdict="indeterminate",
+            error="no benchmark_report_v0.2 files were produced",
+        )
+    goodput = score_slo_goodput(
+        reports,
+        spec.gates,
+        slo_gate_percentile=spec.percentile,
+        max_failure_ratio=spec.max_failure_ratio,
+    )
+    verdicts = {r.verdict for r in goodput.reports}
+    if "fail" in verdicts:
+        verdict = "fail"
+    elif "indeterminate" in verdicts:
+        verdict = "indeterminate"
+    else:
+        verdict = "pass"
+    margins = [
+        margin
+        for r in goodput.reports
+        for gate in r.gate_results
+        if (margin := gate_margin(gate)) is not None
+    ]
+    rates = [
+        r.output_token_rate_mean
+        for r in goodput.reports
+        if r.output_token_rate_mean is not None
+    ]
+    return SearchPoint(
+        level=level,
+        name=name,
+        verdict=verdict,
+        margin=max(margins, default=None),
+        output_token_rate=max(rates, default=None),
+        reports=[str(p) for p in reports],
+    )
+
+
+def write_point_experiment(
+    experiment_file: Path, spec: SearchSpec, level: float, name: str, path: Path
+) -> Path:
+    """Write a single-treatment experiment file running the knob at *level*.
+
+    Top-level keys other than the experiment's own treatments (``constants``,
+    ``reset_caches``, run controls, ...) are carried over unchanged.
+    """
+    with open(experiment_file, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    point = {k: v for k, v in data.items() if k not in _NON_RUN_KEYS}
+    point["treatments"] = [{"name": name, spec.knob: level}]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(point, f, default_flow_style=False, sort_keys=False)
+    return path
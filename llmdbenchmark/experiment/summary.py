@@ -26,6 +26,8 @@ class TreatmentResult:
     error_message: str | None = None
     workspace_dir: str | None = None
     duration_seconds: float = 0.0
+    search: dict[str, Any] | None = None
+    run_statuses: list[dict[str, Any]] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a dict for YAML output."""
@@ -39,6 +41,10 @@ class TreatmentResult:
             d["workspace_dir"] = self.workspace_dir
         if self.error_message:
             d["error"] = self.error_message
+        if self.search:
+            d["search"] = self.search
+        if self.run_statuses:
+            d["run_treatment_status"] = self.run_statuses
         return d
 
 
@@ -74,6 +80,8 @@ class ExperimentSummary:
         run_total: int,
         workspace_dir: str | None = None,
         duration: float = 0.0,
+        search: dict[str, Any] | None = None,
+        run_statuses: list[dict[str, Any]] | None = None,
     ) -> None:
         """Record a successful setup treatment cycle."""
         self.results.append(
@@ -84,6 +92,8 @@ class ExperimentSummary:
                 run_treatments_total=run_total,
                 workspace_dir=workspace_dir,
                 duration_seconds=duration,
+                search=search,
+                run_statuses=run_statuses,
             )
         )
 
@@ -96,6 +106,8 @@ class ExperimentSummary:
         run_total: int = 0,
         workspace_dir: str | None = None,
         duration: float = 0.0,
+        search: dict[str, Any] | None = None,
+        run_statuses: list[dict[str, Any]] | None = None,
     ) -> None:
         """Record a failed setup treatment cycle (phase: standup/run/teardown)."""
         self.results.append(
@@ -107,6 +119,8 @@ class ExperimentSummary:
                 error_message=error,
                 workspace_dir=workspace_dir,
                 duration_seconds=duration,
+                search=search,
+                run_statuses=run_statuses,
             )
         )
 
@@ -160,6 +174,19 @@ class ExperimentSummary:
             )
             if result.error_message:
                 logger.log_info(f"     Error: {result.error_message}")
+            for run in result.run_statuses or []:
+                if run.get("status") != "succeeded":
+                    logger.log_info(
+                        f"     Run treatment {run.get('treatment')}: "
+                        f"{run.get('status')}"
+                    )
+            if result.search:
+                best = result.search.get("max_passing_treatment") or "none"
+                logger.log_info(
+                    f"     Max {result.search['knob']} meeting SLO: {best} "
+                    f"({len(result.search['points'])} point(s), "
+                    f"{result.search['stop_reason']})"
+                )
 
         logger.log_info("=" * W)
         logger.log_info(
@@ -141,6 +141,38 @@ def add_subcommands(
         "'oc cp'. Copies the same files, just much faster for large result "
         "trees (env: LLMDBENCH_FAST_COLLECT). Default: off.",
     )
+    exp_parser.add_argument(
+        "--collect-streams",
+        type=int,
+        default=env_int("LLMDBENCH_COLLECT_STREAMS", 4),
+        help="Result transfers per treatment to run at once "
+        "(env: LLMDBENCH_COLLECT_STREAMS). Default: 4.",
+    )
+    exp_parser.add_argument(
+        "--collect-zstd",
+        action="store_true",
+        default=env_bool("LLMDBENCH_COLLECT_ZSTD"),
+        help="Compress --fast-collect streams with zstd instead of gzip; falls "
+        "back to gzip when the pod has no zstd or the zstandard package is "
+        "missing (env: LLMDBENCH_COLLECT_ZSTD). Default: off.",
+    )
+    exp_parser.add_argument(
+        "--pipeline-treatments",
+        action="store_true",
+        default=env_bool("LLMDBENCH_PIPELINE_TREATMENTS"),
+        help="Collect, analyze and upload each finished treatment in the "
+        "background while the next treatment's harness runs. Fails closed if "
+        "collection falls behind (env: LLMDBENCH_PIPELINE_TREATMENTS). "
+        "Ignored when treatments are retried. Default: off.",
+    )
+    exp_parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=env_int("LLMDBENCH_PIPELINE_DEPTH", 1),
+        help="Finished treatments allowed to queue behind the one being "
+        "collected with --pipeline-treatments "
+        "(env: LLMDBENCH_PIPELINE_DEPTH). Default: 1.",
+    )
 
     exp_parser.add_argument(
         "--stop-on-error",
@@ -155,3 +187,24 @@ def add_subcommands(
         default=False,
         help="Skip teardown phase (leave stacks running for debugging).",
     )
+    exp_parser.add_argument(
+        "--order-treatments",
+        action="store_true",
+        default=env_bool("LLMDBENCH_ORDER_TREATMENTS"),
+        help="Reorder setup treatments to minimise redeploy cost between "
+        "consecutive treatments (model > accelerator/TP > replicas > vLLM "
+        "flags) and print the estimated savings. File order is kept unless "
+        "the new order is cheaper (env: LLMDBENCH_ORDER_TREATMENTS). "
+        "Default: off.",
+    )
+    exp_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=env_bool("LLMDBENCH_INCREMENTAL_STANDUP"),
+        help="Keep the stack up between setup treatments and re-run only the "
+        "standup steps whose rendered plan files changed; fall back to a full "
+        "teardown/standup when a treatment cannot be applied in place. All "
+        "treatments are rendered first and the reuse plan is written to "
+        "incremental-plan.yaml (use with --dry-run to review it without a "
+        "cluster) (env: LLMDBENCH_INCREMENTAL_STANDUP). Default: off.",
+    )
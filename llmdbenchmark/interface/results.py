@@ -68,6 +68,18 @@ def add_subcommands(
     ls_parser.add_argument("remote", help="Name of the remote (e.g. prod, staging)")
     ls_parser.add_argument("-m", "--model", help="Filter by model")
     ls_parser.add_argument("-w", "--hardware", help="Filter by hardware")
+    ls_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="List the remote's runs instead of using the local catalog, and "
+        "rewrite the remote's run index if it has one",
+    )
+    ls_parser.add_argument(
+        "--write-index",
+        action="store_true",
+        help="Write the remote's run index from a listing, creating it if "
+        "missing (implies --refresh)",
+    )
 
     # `push` subcommand
     push_parser = subparsers.add_parser("push", help="Push a staged run to a remote.")
@@ -100,6 +112,12 @@ def add_subcommands(
     pull_parser.add_argument(
         "--run-uid", required=True, help="Specific run UUID to pull"
     )
+    pull_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="List the remote's runs instead of using the local catalog, and "
+        "rewrite the remote's run index if it has one",
+    )
 
 
 def execute(args, logger):
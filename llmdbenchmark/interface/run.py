@@ -270,6 +270,38 @@ def add_subcommands(
         "'oc cp'. Copies the same files, just much faster for large result "
         "trees (env: LLMDBENCH_FAST_COLLECT). Default: off.",
     )
+    run_parser.add_argument(
+        "--collect-streams",
+        type=int,
+        default=env_int("LLMDBENCH_COLLECT_STREAMS", 4),
+        help="Result transfers per treatment to run at once "
+        "(env: LLMDBENCH_COLLECT_STREAMS). Default: 4.",
+    )
+    run_parser.add_argument(
+        "--collect-zstd",
+        action="store_true",
+        default=env_bool("LLMDBENCH_COLLECT_ZSTD"),
+        help="Compress --fast-collect streams with zstd instead of gzip; falls "
+        "back to gzip when the pod has no zstd or the zstandard package is "
+        "missing (env: LLMDBENCH_COLLECT_ZSTD). Default: off.",
+    )
+    run_parser.add_argument(
+        "--pipeline-treatments",
+        action="store_true",
+        default=env_bool("LLMDBENCH_PIPELINE_TREATMENTS"),
+        help="Collect, analyze and upload each finished treatment in the "
+        "background while the next treatment's harness runs. Fails closed if "
+        "collection falls behind (env: LLMDBENCH_PIPELINE_TREATMENTS). "
+        "Ignored when treatments are retried. Default: off.",
+    )
+    run_parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=env_int("LLMDBENCH_PIPELINE_DEPTH", 1),
+        help="Finished treatments allowed to queue behind the one being "
+        "collected with --pipeline-treatments "
+        "(env: LLMDBENCH_PIPELINE_DEPTH). Default: 1.",
+    )
 
     # Run-only / existing-stack mode
     run_parser.add_argument(
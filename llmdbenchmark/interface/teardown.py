@@ -102,6 +102,20 @@ def add_subcommands(
         help="Seconds to wait for FMA launcher and requester pods to terminate "
         "before the Helm chart uninstall removes the controller. Default: 120.",
     )
+    teardown_parser.add_argument(
+        "--teardown-parallelism",
+        type=int,
+        default=env_int("LLMDBENCH_TEARDOWN_PARALLELISM"),
+        help="Namespaces, Helm releases and delete batches processed "
+        "concurrently during teardown. Default: 4.",
+    )
+    teardown_parser.add_argument(
+        "--teardown-wait-timeout",
+        type=int,
+        default=env_int("LLMDBENCH_TEARDOWN_WAIT_TIMEOUT"),
+        help="Seconds to wait for deleted resources (and their finalizers) to "
+        "disappear before reporting the stragglers. Default: 300.",
+    )
     teardown_parser.add_argument(
         "--llmd-repo-path",
         default=env("LLMDBENCH_LLMD_REPO_PATH"),
@@ -2,8 +2,10 @@
 
 import logging
 import sys
+import threading
 import uuid
 
+from contextlib import contextmanager
 from logging import StreamHandler, FileHandler
 from pathlib import Path
 from datetime import datetime
@@ -61,11 +63,17 @@ class LLMDBenchmarkLogger:
     _shared_stdout_handler: FileHandler | None = None
     _shared_stderr_handler: FileHandler | None = None
     _shared_log_dir: Path | None = None
+    # Held while writing one record, or one flushed buffer, to the handlers,
+    # so a buffered block is never interleaved with other output.
+    _output_lock = threading.RLock()
 
     INDENT_PREFIX = "    | "
 
     def __init__(self, log_dir: Path, log_name: str, verbose: bool = False):
-        self._indent_level = 0
+        # Indent level and log buffer are per thread: concurrent stacks
+        # must not shift each other's indentation or capture each other's
+        # output.
+        self._local = threading.local()
         short_uuid = uuid.uuid4().hex[:4]
         log_name_with_uuid = f"{log_name}-{short_uuid}"
         self.logger = logging.getLogger(f"{__package_name__}-{log_name_with_uuid}")
@@ -148,9 +156,13 @@ class LLMDBenchmarkLogger:
                 context={"log_dir": str(log_dir), "error": str(e)},
             ) from e
 
+    @property
+    def _indent_level(self) -> int:
+        return getattr(self._local, "indent", 0)
+
     def set_indent(self, level: int) -> None:
-        """Set the indentation level for subsequent log messages."""
-        self._indent_level = max(0, level)
+        """Set the calling thread's indentation level for subsequent messages."""
+        self._local.indent = max(0, level)
 
     def _apply_indent(self, msg: str) -> str:
         """Prepend indent prefix if indent level is set."""
@@ -158,41 +170,116 @@ class LLMDBenchmarkLogger:
             return self.INDENT_PREFIX * self._indent_level + msg
         return msg
 
+    @contextmanager
+    def buffered(self):
+        """Hold the calling thread's console output until the block exits.
+
+        Log files still receive every record as it happens, so nothing is
+        lost if the process dies mid-block.  Console records keep their
+        original timestamps and are written out in one uninterrupted piece
+        at exit, so work running in parallel threads (e.g. one stack per
+        thread) shows contiguous per-thread blocks on the terminal instead
+        of interleaved lines.  Nested calls join the outer buffer.
+        """
+        if getattr(self._local, "buffer", None) is not None:
+            yield
+            return
+        self._local.buffer = []
+        try:
+            yield
+        finally:
+            entries, self._local.buffer = self._local.buffer, None
+            with self._output_lock:
+                for entry in entries:
+                    self._emit(entry, self._handlers(files=False))
+
+    def _handlers(self, files: bool) -> list[logging.Handler]:
+        """The logger's file handlers, or its console handlers."""
+        return [h for h in self.logger.handlers if isinstance(h, FileHandler) == files]
+
+    @staticmethod
+    def _emit(entry, handlers: list[logging.Handler]) -> None:
+        """Write a record, or raw text, to *handlers*."""
+        for handler in handlers:
+            if isinstance(entry, str):
+                handler.stream.write(entry)
+                handler.flush()
+            elif entry.levelno >= handler.level:
+                handler.handle(entry)
+
+    def _log(self, level: int, msg, extra: dict, exc_info=False) -> None:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            with self._output_lock:
+                self.logger.log(level, msg, extra=extra, exc_info=exc_info)
+            return
+        if not self.logger.isEnabledFor(level):
+            return
+        if exc_info and not isinstance(exc_info, tuple):
+            exc_info = sys.exc_info()
+        record = self.logger.makeRecord(
+            self.logger.name,
+            level,
+            "(buffered)",
+            0,
+            msg,
+            (),
+            exc_info or None,
+            extra=extra,
+        )
+        with self._output_lock:
+            self._emit(record, self._handlers(files=True))
+        buffer.append(record)
+
+    def _write_raw(self, text: str) -> None:
+        self._emit(text, self.logger.handlers)
+
+    def _raw(self, text: str) -> None:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            with self._output_lock:
+                self._emit(text, self._handlers(files=True))
+            buffer.append(text)
+            return
+        with self._output_lock:
+            self._write_raw(text)
+
     def log_debug(self, msg, emoji=None):
         """Log a debug-level message with an optional emoji override."""
-        self.logger.debug(
-            self._apply_indent(msg), extra={"emoji": emoji} if emoji else {}
+        self._log(
+            logging.DEBUG, self._apply_indent(msg), {"emoji": emoji} if emoji else {}
         )
 
     def log_info(self, msg, emoji=None):
         """Log an info-level message with an optional emoji override."""
-        self.logger.info(
-            self._apply_indent(msg), extra={"emoji": emoji} if emoji else {}
+        self._log(
+            logging.INFO, self._apply_indent(msg), {"emoji": emoji} if emoji else {}
         )
 
     def log_plain_console(self, msg, emoji=None):
         """Log a plain message to console (no metadata) but full message to file."""
-        self.logger.info(self._apply_indent(msg), extra={"plain": True, "emoji": emoji})
+        self._log(
+            logging.INFO, self._apply_indent(msg), {"plain": True, "emoji": emoji}
+        )
 
     def log_warning(self, msg, emoji=None):
         """Log a warning-level message with an optional emoji override."""
-        self.logger.warning(
-            self._apply_indent(msg), extra={"emoji": emoji} if emoji else {}
+        self._log(
+            logging.WARNING, self._apply_indent(msg), {"emoji": emoji} if emoji else {}
         )
 
     def log_error(self, msg, emoji=None, exc_info=False):
         """Log an error-level message with an optional emoji override."""
-        self.logger.error(
+        self._log(
+            logging.ERROR,
             self._apply_indent(msg),
-            extra={"emoji": emoji} if emoji else {},
+            {"emoji": emoji} if emoji else {},
             exc_info=exc_info,
         )
 
     def line_break(self) -> None:
         """Insert a completely blank line in the log (no timestamp or level)."""
-        for handler in self.logger.handlers:
-            handler.stream.write("\n")
-            handler.flush()
+        self._raw("\n")
 
     def log_plain(self, msg: str) -> None:
         """Write *msg* verbatim to every handler - no timestamp or level prefix.
@@ -203,9 +290,7 @@ class LLMDBenchmarkLogger:
         the terminal and any attached FileHandler(s) - unlike print(),
         which only reaches stdout.
         """
-        for handler in self.logger.handlers:
-            handler.stream.write(str(msg) + "\n")
-            handler.flush()
+        self._raw(str(msg) + "\n")
 
 
 def get_logger(
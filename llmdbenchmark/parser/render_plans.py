@@ -2,6 +2,12 @@
 
 Loads templates, merges defaults with scenario overrides, resolves
 versions and cluster resources, and writes validated YAML to the output dir.
+
+Templates are compiled once per :class:`RenderPlans` (or once per worker
+process) and reused for every stack; the shared ``_macros.j2`` is imported
+into each template by :class:`PlanTemplateLoader` rather than pasted in.
+Independent stacks can be rendered in a process pool with
+``render_workers`` / ``LLMDBENCH_RENDER_WORKERS``.
 """
 
 import base64
@@ -9,12 +15,20 @@ import hashlib
 import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Any
 import yaml
 
-from jinja2 import Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import (
+    Environment,
+    FileSystemLoader,
+    TemplateSyntaxError,
+    UndefinedError,
+    nodes,
+)
 
 from llmdbenchmark.config import config
 from llmdbenchmark.logging.logger import get_logger
@@ -32,6 +46,158 @@ from llmdbenchmark.parser.config_schema import validate_config
 from llmdbenchmark.parser.render_result import StackErrors, RenderResult
 
 
+# libyaml's loader when available: plan validation parses every file.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared macros file, imported into every non-partial template.
+MACROS_TEMPLATE = "_macros.j2"
+
+
+class PlanTemplateLoader(FileSystemLoader):
+    """Loads plan templates with the shared macros imported into each one.
+
+    Every template that is not a partial gets a one-line
+    ``{% from "_macros.j2" import ... with context %}`` header naming the
+    macros (and top-level ``set`` variables) the macros file defines. The
+    header carries no newline, so template line numbers in errors match the
+    file on disk, and the macros file is compiled once rather than once per
+    template.
+    """
+
+    def __init__(self, searchpath, partial_prefix: str = "_"):
+        super().__init__(searchpath)
+        self.partial_prefix = partial_prefix
+        self._header: Optional[str] = None
+
+    def _macro_header(self, environment: Environment) -> str:
+        if self._header is not None:
+            return self._header
+        self._header = ""
+        try:
+            source, _, _ = super().get_source(environment, MACROS_TEMPLATE)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return self._header
+        names = []
+        for node in environment.parse(source).body:
+            if isinstance(node, nodes.Macro):
+                names.append(node.name)
+            elif isinstance(node, nodes.Assign) and isinstance(node.target, nodes.Name):
+                names.append(node.target.name)
+        if names:
+            self._header = (
+                f'{{% from "{MACROS_TEMPLATE}" import '
+                f"{', '.join(dict.fromkeys(names))} with context %}}"
+            )
+        return self._header
+
+    def get_source(self, environment: Environment, template: str):
+        source, filename, uptodate = super().get_source(environment, template)
+        if Path(template).name.startswith(self.partial_prefix):
+            return source, filename, uptodate
+        return self._macro_header(environment) + source, filename, uptodate
+
+
+@dataclass
+class StackRender:
+    """Outcome of rendering one stack's templates (picklable for workers).
+
+    ``outcomes`` holds ``(filename, error, is_template_error)`` per template,
+    with ``error`` None on success.
+    """
+
+    outcomes: list[tuple[str, Optional[str], bool]] = field(default_factory=list)
+    config_error: Optional[str] = None
+    yaml_errors: list[str] = field(default_factory=list)
+
+
+# Per-process environments for render workers, keyed by template dir.
+_WORKER_ENVS: dict[str, Environment] = {}
+
+
+def render_stack_files(
+    env: Environment,
+    templates: list[dict],
+    values: dict,
+    stack_output_dir: Path,
+) -> StackRender:
+    """Render every template for one stack and write its plan directory.
+
+    Writes each rendered template, the resolved ``config.yaml``, and then
+    checks every YAML file in ``stack_output_dir`` parses.
+    """
+    render = StackRender()
+    stack_output_dir.mkdir(parents=True, exist_ok=True)
+
+    for template_info in templates:
+        filename = template_info["filename"]
+        try:
+            template = env.get_template(template_info["template"])
+            rendered = template.render(**values).strip()
+            with open(stack_output_dir / filename, "w", encoding="utf-8") as f:
+                f.write(rendered)
+                f.write("\n")
+            render.outcomes.append((filename, None, False))
+        except (TemplateSyntaxError, UndefinedError) as e:
+            render.outcomes.append((filename, str(e), True))
+        except Exception as e:
+            render.outcomes.append((filename, str(e), False))
+
+    # Write resolved config (JSON round-trip strips YAML anchors)
+    try:
+        resolved = json.loads(json.dumps(values, default=str))
+        with open(stack_output_dir / "config.yaml", "w", encoding="utf-8") as f:
+            yaml.dump(resolved, f, default_flow_style=False, allow_unicode=True)
+    except Exception as e:
+        render.config_error = str(e)
+
+    render.yaml_errors = validate_yaml_files(stack_output_dir)
+    return render
+
+
+def validate_yaml_files(directory: Path) -> list[str]:
+    """Validate all YAML files in a directory, returning any error messages."""
+    errors = []
+    for yaml_file in directory.glob("*.yaml"):
+        try:
+            with open(yaml_file, "r", encoding="utf-8") as f:
+                list(yaml.load_all(f, Loader=_YAML_LOADER))
+        except yaml.YAMLError as e:
+            errors.append(f"{yaml_file.name}: {str(e)[:100]}")
+    return errors
+
+
+def _render_stack_in_worker(
+    template_dir: str, templates: list[dict], values: dict, stack_output_dir: Path
+) -> StackRender:
+    """Process-pool entry point: render one stack with a per-process env."""
+    env = _WORKER_ENVS.get(template_dir)
+    if env is None:
+        env = RenderPlans.build_environment(Path(template_dir))
+        _WORKER_ENVS[template_dir] = env
+    return render_stack_files(env, templates, values, stack_output_dir)
+
+
+def render_workers_from_env() -> int:
+    """Worker processes for stack rendering from ``LLMDBENCH_RENDER_WORKERS``.
+
+    Defaults to 1 (render in-process, one stack after another).
+    """
+    try:
+        return max(1, int(os.environ.get("LLMDBENCH_RENDER_WORKERS", "1")))
+    except ValueError:
+        return 1
+
+
+@dataclass
+class _StackJob:
+    """A stack whose values are resolved and is ready to render."""
+
+    stack_name: str
+    values: dict
+    output_dir: Path
+    errors: StackErrors
+
+
 class RenderPlans:
     """Render and validate llmdbenchmark stack plans from Jinja2 templates.
 
@@ -65,6 +231,7 @@ class RenderPlans:
         setup_overrides_by_stack: dict[str, dict] | None = None,
         cli_stack_filter: list[str] | None = None,
         cli_non_admin: bool = False,
+        render_workers: int | None = None,
     ):
         self.template_dir = Path(template_dir)
         self.defaults_file = Path(defaults_file)
@@ -122,39 +289,62 @@ class RenderPlans:
         # Cache for parsed templates (avoid re-parsing on multiple evals)
         self._template_cache: Optional[list[dict]] = None
 
-        # Jinja2 environment (reusable)
+        # Jinja2 environment (reusable). Its loader keeps every compiled
+        # template, so each is compiled once however many stacks render.
         self._jinja_env: Optional[Environment] = None
 
-    def _get_jinja_env(self) -> Environment:
-        """Get or create the Jinja2 environment with custom filters."""
-        if self._jinja_env is not None:
-            return self._jinja_env
+        # Worker processes for rendering independent stacks; 1 renders
+        # in-process. Values are resolved serially either way.
+        self.render_workers: int = (
+            render_workers if render_workers is not None else render_workers_from_env()
+        )
 
+    @classmethod
+    def build_environment(cls, template_dir: Optional[Path] = None) -> Environment:
+        """Create a Jinja2 environment with the plan filters and globals.
+
+        With a ``template_dir``, templates load through
+        :class:`PlanTemplateLoader` and stay compiled in the environment.
+        """
         env = Environment(
+            loader=(
+                PlanTemplateLoader(template_dir, cls.PARTIAL_PREFIX)
+                if template_dir is not None
+                else None
+            ),
             autoescape=False,
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=False,
+            # Templates do not change during a render; skip the per-lookup
+            # mtime check.
+            auto_reload=False,
         )
 
         # Register custom filters
-        env.filters["indent"] = self._indent_filter
-        env.filters["toyaml"] = self._toyaml_filter
-        env.filters["tojson"] = self._tojson_filter
-        env.filters["is_empty"] = self._is_empty_filter
-        env.filters["default_if_empty"] = self._default_if_empty_filter
-        env.filters["b64pad"] = self._b64pad_filter
-        env.filters["b64encode"] = self._b64encode_filter
-        env.filters["model_id_label"] = self._model_id_label_filter
+        env.filters["indent"] = cls._indent_filter
+        env.filters["toyaml"] = cls._toyaml_filter
+        env.filters["tojson"] = cls._tojson_filter
+        env.filters["is_empty"] = cls._is_empty_filter
+        env.filters["default_if_empty"] = cls._default_if_empty_filter
+        env.filters["b64pad"] = cls._b64pad_filter
+        env.filters["b64encode"] = cls._b64encode_filter
+        env.filters["model_id_label"] = cls._model_id_label_filter
 
         # `raise` global lets templates abort rendering with a clear
         # error when an input is invalid for the current code path
         # (e.g. an option that only applies to some gateway classes).
-        env.globals["raise"] = self._raise_helper
-
-        self._jinja_env = env
+        env.globals["raise"] = cls._raise_helper
         return env
 
+    def _get_jinja_env(self) -> Environment:
+        """Get or create the Jinja2 environment with custom filters."""
+        if self._jinja_env is None:
+            self._jinja_env = self.build_environment(
+                getattr(self, "template_dir", None)
+            )
+        return self._jinja_env
+
     @staticmethod
     def _raise_helper(message: str) -> str:
         """Abort template rendering with the given error message."""
@@ -1755,7 +1945,11 @@ class RenderPlans:
         return result
 
     def _load_templates(self) -> list[dict]:
-        """Load .j2 files from the template dir, prepending shared macros."""
+        """List the .j2 templates to render and their output filenames.
+
+        Sources are read and compiled by the environment's loader on first
+        use; shared macros are imported by :class:`PlanTemplateLoader`.
+        """
         if self._template_cache is not None:
             return self._template_cache
 
@@ -1769,20 +1963,12 @@ class RenderPlans:
                 f"Template path is not a directory: {self.template_dir}"
             )
 
-        # Load shared macros if they exist
-        macros_file = self.template_dir / "_macros.j2"
-        macros = ""
-        if macros_file.exists():
-            macros = macros_file.read_text(encoding="utf-8") + "\n"
-
-        # Load all template files (exclude partials starting with _)
+        # All template files (exclude partials starting with _)
         templates = []
         for template_file in sorted(self.template_dir.glob("*.j2")):
             if template_file.name.startswith(self.PARTIAL_PREFIX):
                 continue
 
-            content = template_file.read_text(encoding="utf-8")
-
             # Output filename: remove .j2 extension
             # e.g., "01_pvc_workload-pvc.yaml.j2" -> "01_pvc_workload-pvc.yaml"
             output_filename = template_file.stem
@@ -1792,7 +1978,7 @@ class RenderPlans:
             templates.append(
                 {
                     "filename": output_filename,
-                    "content": macros + content,
+                    "template": template_file.name,
                 }
             )
 
@@ -1803,22 +1989,15 @@ class RenderPlans:
         return templates
 
     def _render_template(self, template_content: str, values: dict) -> str:
-        """Render a Jinja2 template string with the given values dict."""
+        """Render a Jinja2 template string with the given values dict.
+
+        Compiles ``template_content`` on every call; plan templates go
+        through the environment's loader instead (see ``render_stack_files``).
+        """
         env = self._get_jinja_env()
         template = env.from_string(template_content)
         return template.render(**values)
 
-    def _validate_yaml_files(self, directory: Path) -> list[str]:
-        """Validate all YAML files in a directory, returning any error messages."""
-        errors = []
-        for yaml_file in directory.glob("*.yaml"):
-            try:
-                with open(yaml_file, "r", encoding="utf-8") as f:
-                    list(yaml.safe_load_all(f))
-            except yaml.YAMLError as e:
-                errors.append(f"{yaml_file.name}: {str(e)[:100]}")
-        return errors
-
     @staticmethod
     def _validate_kustomize_patches(values: dict, stack_name: str) -> list[str]:
         """Validate inline kustomize patches during plan rendering."""
@@ -2041,8 +2220,15 @@ class RenderPlans:
         sibling_stacks: list[dict] | None = None,
         shared: dict | None = None,
         shared_infra_stack_index: int = 1,
-    ) -> None:
-        """Merge values, resolve overrides, render templates, and validate output for one stack."""
+        render: bool = True,
+    ) -> Optional[_StackJob]:
+        """Merge values, resolve overrides, render templates, and validate output for one stack.
+
+        With ``render=False`` the stack's values are resolved and validated
+        but not rendered; the returned job is rendered later (possibly in a
+        worker process). Returns None when the stack was rendered here or
+        was skipped because of errors.
+        """
         if "name" not in stack:
             msg = f"Stack {stack_index} missing 'name' field, skipping"
             self.logger.log_warning(msg)
@@ -2206,62 +2392,98 @@ class RenderPlans:
                 f"for stack {stack_name}"
             )
 
-        stack_output_dir = base_path / stack_name
-        stack_output_dir.mkdir(parents=True, exist_ok=True)
+        job = _StackJob(
+            stack_name=stack_name,
+            values=merged_values,
+            output_dir=base_path / stack_name,
+            errors=stack_errors,
+        )
+        if not render:
+            return job
+        self._finish_stack(
+            job,
+            render_stack_files(
+                self._get_jinja_env(), templates, merged_values, job.output_dir
+            ),
+            result,
+        )
+        return None
 
+    def _finish_stack(
+        self, job: _StackJob, render: StackRender, result: RenderResult
+    ) -> None:
+        """Log a stack's render outcome and record its errors and output."""
+        stack_errors = job.errors
         success_count = 0
         error_count = 0
 
-        for template_info in templates:
-            filename = template_info["filename"]
-            content = template_info["content"]
-
-            try:
-                rendered = self._render_template(content, merged_values).strip()
-
-                output_file = stack_output_dir / filename
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(rendered)
-                    f.write("\n")
-
+        for filename, error, is_template_error in render.outcomes:
+            if error is None:
                 self.logger.log_info(f"Rendered: {filename}", emoji="✅")
                 success_count += 1
+                continue
+            if is_template_error:
+                self.logger.log_error(f"Template error in {filename}: {error}")
+            else:
+                self.logger.log_error(f"Error rendering {filename}: {error}")
+            stack_errors.render_errors.append(f"{filename}: {error}")
+            error_count += 1
 
-            except (TemplateSyntaxError, UndefinedError) as e:
-                msg = f"{filename}: {e}"
-                self.logger.log_error(f"Template error in {filename}: {e}")
-                stack_errors.render_errors.append(msg)
-                error_count += 1
-
-            except Exception as e:
-                msg = f"{filename}: {e}"
-                self.logger.log_error(f"Error rendering {filename}: {e}")
-                stack_errors.render_errors.append(msg)
-                error_count += 1
-
-        # Write resolved config (JSON round-trip strips YAML anchors)
-        config_output = stack_output_dir / "config.yaml"
-        try:
-            resolved = json.loads(json.dumps(merged_values, default=str))
-            with open(config_output, "w", encoding="utf-8") as f:
-                yaml.dump(resolved, f, default_flow_style=False, allow_unicode=True)
-        except Exception as e:
-            self.logger.log_warning(f"Failed to write config.yaml: {e}")
+        if render.config_error:
+            self.logger.log_warning(
+                f"Failed to write config.yaml: {render.config_error}"
+            )
 
-        yaml_errors = self._validate_yaml_files(stack_output_dir)
-        if yaml_errors:
+        if render.yaml_errors:
             self.logger.log_error("YAML validation issues:")
-            for err in yaml_errors:
+            for err in render.yaml_errors:
                 self.logger.log_error(f"  {err}")
                 stack_errors.yaml_errors.append(err)
 
         if not stack_errors.has_errors:
-            result.rendered_paths.append(stack_output_dir)
+            result.rendered_paths.append(job.output_dir)
 
-        self.logger.log_info(f"Output: {stack_output_dir}")
+        self.logger.log_info(f"Output: {job.output_dir}")
         self.logger.log_info(f"Success: {success_count}, Errors: {error_count}")
         self.logger.line_break()
 
+    def _render_parallel(
+        self, jobs: list[_StackJob], templates: list[dict], result: RenderResult
+    ) -> None:
+        """Render prepared stacks in a process pool, finishing them in order.
+
+        A stack whose values cannot be sent to a worker (or whose worker
+        dies) is rendered in-process instead.
+        """
+        workers = min(self.render_workers, len(jobs))
+        self.logger.log_info(
+            f"Rendering {len(jobs)} stack(s) in {workers} worker process(es)..."
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _render_stack_in_worker,
+                    str(self.template_dir),
+                    templates,
+                    job.values,
+                    job.output_dir,
+                )
+                for job in jobs
+            ]
+            for job, future in zip(jobs, futures):
+                try:
+                    render = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.logger.log_warning(
+                        f"Render worker failed for stack {job.stack_name} ({e}); "
+                        f"rendering in-process"
+                    )
+                    render = render_stack_files(
+                        self._get_jinja_env(), templates, job.values, job.output_dir
+                    )
+                self.logger.log_info(f"Stack: {job.stack_name}")
+                self._finish_stack(job, render, result)
+
     def eval(self) -> RenderResult:
         """Run the full rendering pipeline and return a RenderResult."""
         result = RenderResult()
@@ -2396,8 +2618,12 @@ class RenderPlans:
 
         self._nok8s_port_claims = {}
         self._nok8s_name_claims = {}
+        # Value resolution stays serial (it logs, calls the resolvers, and
+        # checks cross-stack claims); only rendering fans out to workers.
+        parallel = self.render_workers > 1 and len(stacks) > 1
+        jobs: list[_StackJob] = []
         for i, stack in enumerate(stacks, 1):
-            self._process_stack(
+            job = self._process_stack(
                 stack=stack,
                 stack_index=i,
                 total_stacks=len(stacks),
@@ -2408,7 +2634,13 @@ class RenderPlans:
                 sibling_stacks=sibling_stacks,
                 shared=shared,
                 shared_infra_stack_index=shared_infra_stack_index,
+                render=not parallel,
             )
+            if job is not None:
+                jobs.append(job)
+
+        if jobs:
+            self._render_parallel(jobs, templates, result)
 
         self.logger.log_info(
             f"Scenario rendering complete! Output in: {self.output_dir}"
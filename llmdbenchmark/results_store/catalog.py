@@ -0,0 +1,484 @@
+"""SQLite catalog of local and remote benchmark runs.
+
+The catalog lives in ``.result_store/catalog.db`` and answers ``ls``,
+``status`` and ``pull`` lookups without re-reading reports or re-listing a
+bucket:
+
+* ``local_runs`` caches the parsed identity of each workspace run, keyed by
+  its path and invalidated when the files it was parsed from change.
+* ``remote_runs`` records the runs known in each remote, with timestamps and
+  headline metrics when they were pushed from here or read from a remote
+  index. It is refreshed from the remote once older than
+  ``LLMDBENCH_RESULTS_CATALOG_TTL`` seconds (default 600).
+
+A remote may also keep ``catalog_index.json`` at its root, holding each run's
+timestamps and headline metrics so ``ls`` need not read every report. ``push``
+adds each run to it; ``ls --write-index`` (re)builds it. Which runs exist is
+always taken from a listing of the remote's report objects, so an index entry
+lost to two concurrent pushes hides only that run's metrics, and the index is
+rewritten whenever it disagrees with the listing.
+"""
+
+import fnmatch
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from llmdbenchmark.results_store.store import StoreManager
+from llmdbenchmark.results_store.utils import parse_report_path
+
+SCHEMA_VERSION = 1
+DEFAULT_TTL_SECONDS = 600
+INDEX_OBJECT = "catalog_index.json"
+REPORT_SUFFIX = "report_v0.2.yaml"
+
+# Report fields kept per run, as (dotted path, catalog key).
+HEADLINE_METRICS = [
+    (
+        "results.request_performance.aggregate.throughput.output_token_rate.mean",
+        "output_tps",
+    ),
+    (
+        "results.request_performance.aggregate.throughput.request_rate.mean",
+        "request_qps",
+    ),
+    (
+        "results.request_performance.aggregate.latency.time_to_first_token.p99",
+        "ttft_p99_s",
+    ),
+    (
+        "results.request_performance.aggregate.latency.time_per_output_token.p99",
+        "tpot_p99_s",
+    ),
+    ("results.request_performance.aggregate.latency.request_latency.p99", "e2e_p99_s"),
+    ("results.request_performance.aggregate.requests.total", "total_requests"),
+    ("results.request_performance.aggregate.requests.failures", "failures"),
+]
+
+_REPORT_PATTERNS = ("benchmark_report_v0.2*.yaml", "report_v0.2*.yaml")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS local_runs (
+    path TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    info TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS remote_runs (
+    remote TEXT NOT NULL,
+    relative_name TEXT NOT NULL,
+    run_uid TEXT NOT NULL,
+    group_name TEXT,
+    scenario TEXT,
+    model TEXT,
+    hardware TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    pushed_at TEXT,
+    metrics TEXT,
+    PRIMARY KEY (remote, relative_name)
+);
+CREATE INDEX IF NOT EXISTS remote_runs_uid ON remote_runs (remote, run_uid);
+CREATE TABLE IF NOT EXISTS remote_syncs (
+    remote TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    source TEXT NOT NULL
+);
+"""
+
+_RUN_COLUMNS = (
+    "relative_name",
+    "run_uid",
+    "group_name",
+    "scenario",
+    "model",
+    "hardware",
+    "start_time",
+    "end_time",
+    "pushed_at",
+    "metrics",
+)
+
+
+def catalog_ttl() -> float:
+    """Seconds a remote's catalog rows stay fresh, from the environment."""
+    value = os.environ.get("LLMDBENCH_RESULTS_CATALOG_TTL", "")
+    try:
+        return float(value) if value else DEFAULT_TTL_SECONDS
+    except ValueError:
+        return DEFAULT_TTL_SECONDS
+
+
+def _deep_get(data: dict, dotted_key: str):
+    for key in dotted_key.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def report_summary(report: dict) -> dict:
+    """Extracts run timestamps and headline metrics from a v0.2 report."""
+    run_time = _deep_get(report, "run.time") or {}
+    metrics = {}
+    for dotted_key, name in HEADLINE_METRICS:
+        value = _deep_get(report, dotted_key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[name] = value
+    return {
+        "start": str(run_time["start"]) if run_time.get("start") else None,
+        "end": str(run_time["end"]) if run_time.get("end") else None,
+        "metrics": metrics,
+    }
+
+
+def report_signature(path: Path) -> str:
+    """Fingerprints the files a workspace run's identity is parsed from.
+
+    Covers run_metadata.yaml, the v0.2 reports in the run directory and the
+    workspace's plan subdirectories, by name, size and modification time.
+    """
+    entries = []
+    try:
+        with os.scandir(path) as scan:
+            for entry in scan:
+                if entry.name == "run_metadata.yaml" or any(
+                    fnmatch.fnmatchcase(entry.name, p) for p in _REPORT_PATTERNS
+                ):
+                    stat = entry.stat()
+                    entries.append([entry.name, stat.st_size, stat.st_mtime_ns])
+    except OSError:
+        pass
+    plan_dir = Path(path).parent.parent / "plan"
+    try:
+        plans = [d.name for d in plan_dir.iterdir() if d.is_dir()]
+    except OSError:
+        plans = []
+    return json.dumps([sorted(entries), plans])
+
+
+def runs_from_listing(names: list[str], uri: str) -> tuple[list[dict], list[str]]:
+    """Turns object names from ``client.ls(uri)`` into catalog runs.
+
+    Args:
+        names (list[str]): Object names; for gs:// URIs they include the
+            bucket prefix, which is stripped.
+        uri (str): Remote root the names were listed under.
+
+    Returns:
+        tuple[list[dict], list[str]]: Runs with a ``relative_name`` key, and
+            the report names that do not follow the expected layout.
+    """
+    base_prefix = ""
+    if uri.startswith("gs://"):
+        parts = uri[5:].split("/", 1)
+        base_prefix = parts[1] if len(parts) > 1 else ""
+    prefix_check = base_prefix.rstrip("/") + "/" if base_prefix else ""
+    runs, ignored = [], []
+    for name in names:
+        if not name.endswith(REPORT_SUFFIX):
+            continue
+        relative_name = name
+        if prefix_check and relative_name.startswith(prefix_check):
+            relative_name = relative_name[len(prefix_check) :]
+        run_info = parse_report_path(relative_name)
+        if not run_info:
+            ignored.append(name)
+            continue
+        run_info["relative_name"] = relative_name
+        runs.append(run_info)
+    return runs, ignored
+
+
+def run_uri(uri: str, run: dict) -> str:
+    """URI of the directory holding a catalog run under remote ``uri``."""
+    return f"{uri.rstrip('/')}/{run['relative_name'].rsplit('/', 1)[0]}"
+
+
+def index_uri(uri: str) -> str:
+    """URI of a remote's catalog index object."""
+    return f"{uri.rstrip('/')}/{INDEX_OBJECT}"
+
+
+def load_remote_index(client, uri: str) -> list[dict] | None:
+    """Reads a remote's catalog index; None when absent or unreadable."""
+    try:
+        data = json.loads(client.read_object(index_uri(uri)))
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get("version") != SCHEMA_VERSION:
+        return None
+    return [run for run in data.get("runs", []) if run.get("relative_name")]
+
+
+def write_remote_index(client, uri: str, runs: list[dict]) -> None:
+    """Writes a remote's catalog index, replacing any previous one."""
+    payload = {
+        "version": SCHEMA_VERSION,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "runs": sorted(runs, key=lambda run: run["relative_name"]),
+    }
+    client.write_object(index_uri(uri), json.dumps(payload).encode("utf-8"))
+
+
+def add_to_remote_index(client, uri: str, run: dict) -> bool:
+    """Adds or replaces one run in an existing remote index.
+
+    A remote without an index is left alone. The read-modify-write is not
+    atomic: when two pushes race, one entry may be lost, and the next sync
+    restores the run (without its metrics) from the remote's listing.
+
+    Returns:
+        bool: True if the index was updated.
+    """
+    runs = load_remote_index(client, uri)
+    if runs is None:
+        return False
+    runs = [r for r in runs if r["relative_name"] != run["relative_name"]]
+    write_remote_index(client, uri, runs + [run])
+    return True
+
+
+class Catalog:
+    """SQLite-backed index of workspace and remote runs.
+
+    Args:
+        db_path (str | Path): Database file, or ``":memory:"`` for a catalog
+            that lives only as long as the object.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = str(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None or int(row["value"]) != SCHEMA_VERSION:
+                self.conn.executescript(
+                    "DELETE FROM local_runs; DELETE FROM remote_runs;"
+                    "DELETE FROM remote_syncs;"
+                )
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+
+    @classmethod
+    def for_store(cls, store_root: Path | None = None) -> "Catalog":
+        """Opens the store's catalog, or an in-memory one outside a store."""
+        if store_root is None:
+            store_root = StoreManager.find_store_root(silent=True)
+        if store_root is not None:
+            store_dir = os.path.join(str(store_root), StoreManager.STORE_DIR_NAME)
+            if os.path.isdir(store_dir):
+                try:
+                    return cls(os.path.join(store_dir, "catalog.db"))
+                except sqlite3.Error:
+                    pass
+        return cls(":memory:")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # -- workspace runs -------------------------------------------------------
+
+    def cached_report(self, path: Path, parse: Callable[[Path], dict]) -> dict:
+        """Returns ``parse(path)``, reusing the stored result while unchanged."""
+        key = str(path)
+        signature = report_signature(path)
+        row = self.conn.execute(
+            "SELECT signature, info FROM local_runs WHERE path = ?", (key,)
+        ).fetchone()
+        if row is not None and row["signature"] == signature:
+            return json.loads(row["info"])
+        info = parse(path)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO local_runs VALUES (?, ?, ?)",
+                (key, signature, json.dumps(info, default=str)),
+            )
+        return info
+
+    # -- remote runs ----------------------------------------------------------
+
+    def synced_at(self, uri: str) -> float | None:
+        row = self.conn.execute(
+            "SELECT synced_at FROM remote_syncs WHERE remote = ?", (uri,)
+        ).fetchone()
+        return row["synced_at"] if row else None
+
+    def is_fresh(self, uri: str, ttl: float | None = None) -> bool:
+        synced = self.synced_at(uri)
+        ttl = catalog_ttl() if ttl is None else ttl
+        return synced is not None and time.time() - synced < ttl
+
+    @staticmethod
+    def _row_values(uri: str, run: dict) -> tuple:
+        metrics = run.get("metrics")
+        return (
+            uri,
+            run["relative_name"],
+            run.get("run_uid", "missing"),
+            run.get("group", "default"),
+            run.get("scenario", "missing"),
+            run.get("model", "missing"),
+            run.get("hardware", "missing"),
+            run.get("start"),
+            run.get("end"),
+            run.get("pushed_at"),
+            json.dumps(metrics) if metrics else None,
+        )
+
+    def replace_remote(self, uri: str, runs: list[dict], source: str) -> None:
+        """Replaces every run recorded for a remote and marks it synced."""
+        placeholders = ", ".join("?" * (len(_RUN_COLUMNS) + 1))
+        with self.conn:
+            self.conn.execute("DELETE FROM remote_runs WHERE remote = ?", (uri,))
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO remote_runs VALUES ({placeholders})",
+                [self._row_values(uri, run) for run in runs],
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO remote_syncs VALUES (?, ?, ?)",
+                (uri, time.time(), source),
+            )
+
+    def upsert_remote_run(self, uri: str, run: dict) -> None:
+        """Records one run in a remote, e.g. right after pushing it."""
+        placeholders = ", ".join("?" * (len(_RUN_COLUMNS) + 1))
+        with self.conn:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO remote_runs VALUES ({placeholders})",
+                self._row_values(uri, run),
+            )
+
+    def find_remote_runs(
+        self,
+        uri: str,
+        run_uid: str | None = None,
+        model: str | None = None,
+        hardware: str | None = None,
+    ) -> list[dict]:
+        """Queries a remote's runs.
+
+        ``model`` and ``hardware`` match exactly, or as a glob when they hold
+        ``*`` or ``?``. ``run_uid`` matches as a glob, else exactly or as a
+        prefix, as ``pull`` resolves it.
+        """
+        clauses, params = ["remote = ?"], [uri]
+        for column, value in (("model", model), ("hardware", hardware)):
+            if value:
+                glob = "*" in value or "?" in value
+                clauses.append(f"{column} {'GLOB' if glob else '='} ?")
+                params.append(value)
+        if run_uid:
+            if "*" in run_uid or "?" in run_uid:
+                clauses.append("run_uid GLOB ?")
+                params.append(run_uid)
+            else:
+                clauses.append("substr(run_uid, 1, ?) = ?")
+                params += [len(run_uid), run_uid]
+        rows = self.conn.execute(
+            f"SELECT * FROM remote_runs WHERE {' AND '.join(clauses)} "
+            "ORDER BY group_name, relative_name",
+            params,
+        ).fetchall()
+        runs = []
+        for row in rows:
+            runs.append(
+                {
+                    "relative_name": row["relative_name"],
+                    "run_uid": row["run_uid"],
+                    "group": row["group_name"],
+                    "scenario": row["scenario"],
+                    "model": row["model"],
+                    "hardware": row["hardware"],
+                    "start": row["start_time"],
+                    "end": row["end_time"],
+                    "pushed_at": row["pushed_at"],
+                    "metrics": json.loads(row["metrics"]) if row["metrics"] else {},
+                }
+            )
+        return runs
+
+
+def _merge_index(runs: list[dict], indexed: list[dict]) -> tuple[list[dict], bool]:
+    """Adds index entries' timestamps and metrics to listed runs.
+
+    Returns:
+        tuple[list[dict], bool]: The merged runs, and whether the index holds
+            exactly the listed runs.
+    """
+    by_name = {run["relative_name"]: run for run in indexed}
+    merged = [{**run, **by_name.get(run["relative_name"], {})} for run in runs]
+    return merged, set(by_name) == {run["relative_name"] for run in runs}
+
+
+def sync_remote(
+    catalog: Catalog,
+    client,
+    uri: str,
+    refresh: bool = False,
+    logger=None,
+    write_index: bool = False,
+) -> tuple[object, str]:
+    """Brings a remote's catalog rows up to date when they are stale.
+
+    Fresh rows are used as they are unless ``refresh`` is set. Otherwise the
+    remote's report objects are listed (with the fallback client when direct
+    access fails) and the runs found are recorded, with the timestamps and
+    metrics of the remote's index when it has one. An index that misses
+    listed runs or holds deleted ones is rewritten, as is any index on
+    ``refresh``; ``write_index`` writes one even where there was none.
+
+    Returns:
+        tuple[object, str]: The client that answered (possibly the fallback)
+            and where the rows came from: "catalog", "index" or "listing".
+    """
+    if not refresh and not write_index and catalog.is_fresh(uri):
+        return client, "catalog"
+
+    from llmdbenchmark.results_store.client import get_fallback_client
+
+    try:
+        names = client.ls(uri, REPORT_SUFFIX)
+    except Exception as exception:
+        fallback_client = get_fallback_client(client)
+        if not fallback_client:
+            raise exception
+        if logger:
+            logger.log_warning(f"Direct access failed, trying fallback: {exception}")
+        client = fallback_client
+        names = client.ls(uri, REPORT_SUFFIX)
+
+    runs, ignored = runs_from_listing(names or [], uri)
+    if logger:
+        for name in ignored:
+            logger.log_warning(
+                f"Ignoring remote object with unexpected path structure: {name}"
+            )
+    indexed = load_remote_index(client, uri)
+    source, in_sync = "listing", False
+    if indexed is not None:
+        runs, in_sync = _merge_index(runs, indexed)
+        source = "index"
+    catalog.replace_remote(uri, runs, source)
+
+    if write_index or (indexed is not None and (refresh or not in_sync)):
+        try:
+            write_remote_index(client, uri, runs)
+        except Exception as exception:
+            if write_index:
+                raise
+            if logger:
+                logger.log_warning(
+                    f"Could not update the remote run index: {exception}"
+                )
+    return client, source
@@ -3,12 +3,15 @@
 from llmdbenchmark.results_store.client.base import StorageClient
 from llmdbenchmark.results_store.client.gcs import GCSClient
 from llmdbenchmark.results_store.client.gcs_proxy import GCSProxyClient
+from llmdbenchmark.results_store.client.local import FileClient
 
 
 def get_storage_client(uri: str) -> StorageClient:
     """Factory to return appropriate StorageClient based on URI scheme."""
     if uri.startswith("gs://"):
         return GCSClient()
+    if uri.startswith("file://"):
+        return FileClient()
     raise ValueError(f"Unsupported storage URI scheme: {uri}")
 
 
@@ -9,9 +9,14 @@ class StorageClient(ABC):
     Operates purely on URIs and local paths, without knowledge of application logic.
     """
 
+    # Optional callable receiving TransferStats while push/pull run.
+    progress = None
+    # TransferStats of the latest push or pull, for clients that record them.
+    last_transfer = None
+
     @abstractmethod
-    def ls(self, uri: str) -> list[str]:
-        """Lists object names under the given URI."""
+    def ls(self, uri: str, suffix: str = "") -> list[str]:
+        """Lists object names under the given URI, only those ending with suffix."""
         pass
 
     @abstractmethod
@@ -28,3 +33,15 @@ class StorageClient(ABC):
     def pull(self, uri: str, dest_dir: str) -> int:
         """Pulls objects from URI to dest_dir. Returns count of downloaded files."""
         pass
+
+    def read_object(self, uri: str) -> bytes | None:
+        """Reads a single object. Returns None if it does not exist."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support reading single objects."
+        )
+
+    def write_object(self, uri: str, data: bytes) -> None:
+        """Writes a single object, replacing any existing one."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support writing single objects."
+        )
@@ -2,8 +2,18 @@
 
 import os
 from pathlib import Path
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 from llmdbenchmark.results_store.client.base import StorageClient
+from llmdbenchmark.results_store.client.transfer import (
+    RemoteObject,
+    TransferEngine,
+    TransferItem,
+    TransferManifest,
+    default_manifest_path,
+    join_remote,
+    local_files,
+)
 
 
 def parse_gcs_uri(uri: str) -> tuple[str, str]:
@@ -16,21 +26,49 @@ def parse_gcs_uri(uri: str) -> tuple[str, str]:
     return bucket, prefix
 
 
+def download_path(file_dest: Path) -> Path:
+    """Temporary name a download is written to before it replaces file_dest."""
+    return file_dest.with_name(f"{file_dest.name}.part")
+
+
 class GCSClient(StorageClient):
     """Handles pure GCS operations using standard credentials."""
 
     def __init__(self):
         self.client = storage.Client()
 
-    def ls(self, uri: str) -> list[str]:
-        """Lists object names under the given URI."""
+    def _remote_objects(self, bucket, prefix: str) -> dict[str, RemoteObject]:
+        """Maps object names under prefix to their size and checksums."""
+        return {
+            blob.name: RemoteObject(
+                name=blob.name,
+                size=blob.size,
+                crc32c=blob.crc32c,
+                md5=blob.md5_hash,
+            )
+            for blob in bucket.list_blobs(prefix=prefix)
+        }
+
+    def ls(self, uri: str, suffix: str = "") -> list[str]:
+        """Lists object names under the given URI that end with suffix.
+
+        A suffix is matched by the bucket, so only matching objects are
+        returned.
+        """
         bucket_name, prefix = parse_gcs_uri(uri)
         bucket = self.client.bucket(bucket_name)
-        blobs = bucket.list_blobs(prefix=prefix)
+        if suffix:
+            blobs = bucket.list_blobs(prefix=prefix, match_glob=f"{prefix}**{suffix}")
+        else:
+            blobs = bucket.list_blobs(prefix=prefix)
         return [blob.name for blob in blobs]
 
     def push(self, uri: str, local_dir: str) -> int:
-        """Pushes all files in a local directory to the remote URI."""
+        """Pushes all files in a local directory to the remote URI.
+
+        Files already present remotely with the same size and checksum are
+        skipped, and an interrupted push resumes from its manifest.
+        """
         bucket_name, dest_prefix = parse_gcs_uri(uri)
         bucket = self.client.bucket(bucket_name)
         local_path = Path(local_dir)
@@ -40,20 +78,23 @@ class GCSClient(StorageClient):
                 f"Local directory '{local_dir}' does not exist or is not a directory."
             )
 
-        uploaded_count = 0
-        for root, _, files in os.walk(local_path):
-            for file in files:
-                file_path = Path(root) / file
-                relative_path = file_path.relative_to(local_path)
-                blob_path = f"{dest_prefix}/{relative_path}".replace("//", "/")
-                if blob_path.startswith("/"):
-                    blob_path = blob_path[1:]
+        remote = self._remote_objects(bucket, join_remote(dest_prefix, ""))
+        items = []
+        for key, file_path in local_files(local_path):
+            blob_path = join_remote(dest_prefix, key)
+            items.append(TransferItem(key, file_path, blob_path, remote.get(blob_path)))
 
-                blob = bucket.blob(blob_path)
-                blob.upload_from_filename(str(file_path))
-                uploaded_count += 1
+        def upload(item: TransferItem) -> None:
+            blob = bucket.blob(item.remote_name)
+            blob.upload_from_filename(str(item.local_path))
 
-        return uploaded_count
+        manifest = TransferManifest(
+            default_manifest_path("push", uri, local_dir), "push", uri, local_dir
+        )
+        self.last_transfer = TransferEngine(progress=self.progress).run(
+            items, upload, manifest
+        )
+        return self.last_transfer.transferred
 
     def exists(self, uri: str) -> bool:
         """Checks if any object exists with the given URI prefix."""
@@ -62,22 +103,50 @@ class GCSClient(StorageClient):
         blobs = list(bucket.list_blobs(prefix=prefix, max_results=1))
         return len(blobs) > 0
 
+    def read_object(self, uri: str) -> bytes | None:
+        """Reads a single object. Returns None if it does not exist."""
+        bucket_name, name = parse_gcs_uri(uri)
+        try:
+            return self.client.bucket(bucket_name).blob(name).download_as_bytes()
+        except NotFound:
+            return None
+
+    def write_object(self, uri: str, data: bytes) -> None:
+        """Writes a single object, replacing any existing one."""
+        bucket_name, name = parse_gcs_uri(uri)
+        blob = self.client.bucket(bucket_name).blob(name)
+        blob.upload_from_string(data, content_type="application/json")
+
     def pull(self, uri: str, dest_dir: str) -> int:
-        """Pulls all objects from URI to dest_dir."""
+        """Pulls all objects from URI to dest_dir.
+
+        Local files matching the remote object's size and checksum are kept,
+        and an interrupted pull resumes from its manifest.
+        """
         bucket_name, prefix = parse_gcs_uri(uri)
         bucket = self.client.bucket(bucket_name)
         dest_path = Path(dest_dir)
         dest_path.mkdir(parents=True, exist_ok=True)
 
-        downloaded_count = 0
-        blobs = bucket.list_blobs(prefix=prefix)
-        for blob in blobs:
-            relative_name = blob.name[len(prefix) :].lstrip("/")
+        items = []
+        for name, remote in self._remote_objects(bucket, prefix).items():
+            relative_name = name[len(prefix) :].lstrip("/")
             if not relative_name:
                 continue
-            file_dest = dest_path / relative_name
-            file_dest.parent.mkdir(parents=True, exist_ok=True)
-            blob.download_to_filename(str(file_dest))
-            downloaded_count += 1
+            items.append(
+                TransferItem(relative_name, dest_path / relative_name, name, remote)
+            )
 
-        return downloaded_count
+        def download(item: TransferItem) -> None:
+            item.local_path.parent.mkdir(parents=True, exist_ok=True)
+            part_path = download_path(item.local_path)
+            bucket.blob(item.remote_name).download_to_filename(str(part_path))
+            os.replace(part_path, item.local_path)
+
+        manifest = TransferManifest(
+            default_manifest_path("pull", uri, dest_dir), "pull", uri, dest_dir
+        )
+        self.last_transfer = TransferEngine(progress=self.progress).run(
+            items, download, manifest
+        )
+        return self.last_transfer.transferred
@@ -3,9 +3,18 @@
 import os
 import urllib.parse
 import requests
+from requests.adapters import HTTPAdapter
 from llmdbenchmark.exceptions.exceptions import ConfigurationError
 from llmdbenchmark.results_store.client.base import StorageClient
-from llmdbenchmark.results_store.client.gcs import parse_gcs_uri
+from llmdbenchmark.results_store.client.gcs import download_path, parse_gcs_uri
+from llmdbenchmark.results_store.client.transfer import (
+    RemoteObject,
+    TransferEngine,
+    TransferItem,
+    TransferManifest,
+    default_manifest_path,
+    transfer_workers,
+)
 from pathlib import Path
 
 
@@ -22,27 +31,42 @@ class GCSProxyClient(StorageClient):
                 step="result_store",
             )
         self.session = requests.Session()
+        # Downloads share the session across the transfer engine's threads.
+        adapter = HTTPAdapter(pool_maxsize=transfer_workers())
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _get_bucket_uri(self, bucket: str) -> str:
         return f"{self.prism_url}/api/gcs/storage/v1/b/{bucket}"
 
-    def ls(self, uri: str) -> list[str]:
-        """Lists object names under the given URI."""
-        bucket_name, prefix = parse_gcs_uri(uri)
+    def _list_items(
+        self, bucket_name: str, prefix: str, match_glob: str | None = None
+    ) -> list[dict]:
+        """Lists object resources under prefix, following page tokens."""
         url = f"{self._get_bucket_uri(bucket_name)}/o"
-        params = {}
-        if prefix:
-            params["prefix"] = prefix
-
-        try:
+        params = {"prefix": prefix} if prefix else {}
+        if match_glob:
+            params["matchGlob"] = match_glob
+        items = []
+        while True:
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
-
-            items = data.get("items", [])
-            return [item["name"] for item in items if "name" in item]
+            items.extend(item for item in data.get("items", []) if "name" in item)
+            token = data.get("nextPageToken")
+            if not token:
+                return items
+            params = {**params, "pageToken": token}
+
+    def ls(self, uri: str, suffix: str = "") -> list[str]:
+        """Lists object names under the given URI that end with suffix."""
+        bucket_name, prefix = parse_gcs_uri(uri)
+        match_glob = f"{prefix}**{suffix}" if suffix else None
+        try:
+            items = self._list_items(bucket_name, prefix, match_glob)
         except Exception as exception:
             raise RuntimeError(f"Proxy GCS ls failed: {exception}")
+        return [item["name"] for item in items]
 
     def push(self, uri: str, local_dir: str) -> int:
         """Push is not supported via proxy."""
@@ -62,42 +86,72 @@ class GCSProxyClient(StorageClient):
         except Exception as exception:
             raise RuntimeError(f"Proxy GCS exists failed: {exception}")
 
+    def read_object(self, uri: str) -> bytes | None:
+        """Reads a single object. Returns None if it does not exist."""
+        bucket_name, name = parse_gcs_uri(uri)
+        encoded_name = urllib.parse.quote(name, safe="")
+        media_url = f"{self._get_bucket_uri(bucket_name)}/o/{encoded_name}"
+        try:
+            response = self.session.get(media_url, params={"alt": "media"}, timeout=30)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.content
+        except Exception as exception:
+            raise RuntimeError(f"Proxy GCS read failed: {exception}")
+
     def pull(self, uri: str, dest_dir: str) -> int:
-        """Pulls all objects from URI to dest_dir."""
+        """Pulls all objects from URI to dest_dir.
+
+        Uses the same transfer engine as GCSClient: concurrent downloads,
+        unchanged local files kept, and resumable after interruption.
+        """
         bucket_name, prefix = parse_gcs_uri(uri)
         dest_path = Path(dest_dir)
         dest_path.mkdir(parents=True, exist_ok=True)
 
-        url = f"{self._get_bucket_uri(bucket_name)}/o"
-        params = {"prefix": prefix}
+        try:
+            listed = self._list_items(bucket_name, prefix)
+        except Exception as exception:
+            raise RuntimeError(f"Proxy GCS pull failed: {exception}")
 
+        items = []
+        for item in listed:
+            name = item["name"]
+            relative_name = name[len(prefix) :].lstrip("/")
+            if not relative_name:
+                continue
+            remote = RemoteObject(
+                name=name,
+                size=int(item.get("size", -1)),
+                crc32c=item.get("crc32c"),
+                md5=item.get("md5Hash"),
+            )
+            items.append(
+                TransferItem(relative_name, dest_path / relative_name, name, remote)
+            )
+
+        def download(item: TransferItem) -> None:
+            item.local_path.parent.mkdir(parents=True, exist_ok=True)
+            encoded_name = urllib.parse.quote(item.remote_name, safe="")
+            media_url = f"{self._get_bucket_uri(bucket_name)}/o/{encoded_name}"
+            part_path = download_path(item.local_path)
+            with self.session.get(
+                media_url, params={"alt": "media"}, timeout=30, stream=True
+            ) as media_response:
+                media_response.raise_for_status()
+                with open(part_path, "wb") as f:
+                    for chunk in media_response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            os.replace(part_path, item.local_path)
+
+        manifest = TransferManifest(
+            default_manifest_path("pull", uri, dest_dir), "pull", uri, dest_dir
+        )
         try:
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            items = data.get("items", [])
-
-            downloaded_count = 0
-            for item in items:
-                name = item.get("name")
-                if name:
-                    relative_name = name[len(prefix) :].lstrip("/")
-                    if not relative_name:
-                        continue
-                    file_dest = dest_path / relative_name
-                    file_dest.parent.mkdir(parents=True, exist_ok=True)
-
-                    encoded_name = urllib.parse.quote(name, safe="")
-                    media_url = f"{self._get_bucket_uri(bucket_name)}/o/{encoded_name}"
-                    media_response = self.session.get(
-                        media_url, params={"alt": "media"}, timeout=30
-                    )
-                    media_response.raise_for_status()
-
-                    with open(file_dest, "wb") as f:
-                        f.write(media_response.content)
-                    downloaded_count += 1
-
-            return downloaded_count
+            self.last_transfer = TransferEngine(progress=self.progress).run(
+                items, download, manifest
+            )
         except Exception as exception:
             raise RuntimeError(f"Proxy GCS pull failed: {exception}")
+        return self.last_transfer.transferred
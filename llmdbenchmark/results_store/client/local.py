@@ -0,0 +1,128 @@
+"""Local filesystem client for file:// remotes.
+
+A file:// remote lays runs out exactly as a bucket would, under a directory,
+which makes it usable for offline work, shared mounts, and tests. Transfers go
+through the same engine as the GCS clients.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from llmdbenchmark.results_store.client.base import StorageClient
+from llmdbenchmark.results_store.client.gcs import download_path
+from llmdbenchmark.results_store.client.transfer import (
+    RemoteObject,
+    TransferEngine,
+    TransferItem,
+    TransferManifest,
+    default_manifest_path,
+    file_checksums,
+    local_files,
+)
+
+
+def parse_file_uri(uri: str) -> Path:
+    """Parses file:///path into a local Path."""
+    if not uri.startswith("file://"):
+        raise ValueError(f"Invalid file URI: {uri}")
+    return Path(uri[7:])
+
+
+def _remote_object(path: Path, counterpart: Path) -> RemoteObject:
+    """Describes a remote file, checksumming it only when sizes agree."""
+    size = path.stat().st_size
+    try:
+        same_size = counterpart.stat().st_size == size
+    except OSError:
+        same_size = False
+    checksums = file_checksums(path) if same_size else {}
+    return RemoteObject(str(path), size, checksums.get("crc32c"), checksums.get("md5"))
+
+
+def _copy(source: Path, target: Path) -> None:
+    """Copies source over target atomically, creating parent directories."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    part_path = download_path(target)
+    shutil.copyfile(source, part_path)
+    os.replace(part_path, target)
+
+
+class FileClient(StorageClient):
+    """Handles results store operations against a local directory.
+
+    Object names returned by ``ls`` are relative to the listed URI.
+    """
+
+    def ls(self, uri: str, suffix: str = "") -> list[str]:
+        """Lists file names under the given URI that end with suffix."""
+        root = parse_file_uri(uri)
+        if not root.is_dir():
+            return []
+        return [key for key, _ in local_files(root) if key.endswith(suffix)]
+
+    def push(self, uri: str, local_dir: str) -> int:
+        """Copies all files in a local directory under the remote URI."""
+        root = parse_file_uri(uri)
+        local_path = Path(local_dir)
+
+        if not local_path.exists() or not local_path.is_dir():
+            raise ValueError(
+                f"Local directory '{local_dir}' does not exist or is not a directory."
+            )
+
+        items = []
+        for key, file_path in local_files(local_path):
+            target = root / key
+            remote = _remote_object(target, file_path) if target.is_file() else None
+            items.append(TransferItem(key, file_path, str(target), remote))
+
+        manifest = TransferManifest(
+            default_manifest_path("push", uri, local_dir), "push", uri, local_dir
+        )
+        self.last_transfer = TransferEngine(progress=self.progress).run(
+            items, lambda item: _copy(item.local_path, Path(item.remote_name)), manifest
+        )
+        return self.last_transfer.transferred
+
+    def exists(self, uri: str) -> bool:
+        """Checks if the URI names a file or a directory containing any file."""
+        path = parse_file_uri(uri)
+        if path.is_file():
+            return True
+        return path.is_dir() and any(files for _, _, files in os.walk(path))
+
+    def read_object(self, uri: str) -> bytes | None:
+        """Reads a single file. Returns None if it does not exist."""
+        try:
+            return parse_file_uri(uri).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write_object(self, uri: str, data: bytes) -> None:
+        """Writes a single file atomically, replacing any existing one."""
+        path = parse_file_uri(uri)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = download_path(path)
+        part_path.write_bytes(data)
+        os.replace(part_path, path)
+
+    def pull(self, uri: str, dest_dir: str) -> int:
+        """Copies all files under the URI to dest_dir."""
+        root = parse_file_uri(uri)
+        dest_path = Path(dest_dir)
+        dest_path.mkdir(parents=True, exist_ok=True)
+
+        items = []
+        if root.is_dir():
+            for key, source in local_files(root):
+                target = dest_path / key
+                remote = _remote_object(source, target)
+                items.append(TransferItem(key, target, str(source), remote))
+
+        manifest = TransferManifest(
+            default_manifest_path("pull", uri, dest_dir), "pull", uri, dest_dir
+        )
+        self.last_transfer = TransferEngine(progress=self.progress).run(
+            items, lambda item: _copy(Path(item.remote_name), item.local_path), manifest
+        )
+        return self.last_transfer.transferred
@@ -0,0 +1,361 @@
+"""Concurrent, resumable file transfers shared by the storage clients.
+
+A client lists what it has to move as :class:`TransferItem` entries and hands
+the engine a function that moves one of them. The engine runs those functions
+in a bounded thread pool and skips files that have not changed: a local file
+whose size and checksum (CRC32C, else MD5) match the remote object's metadata
+is not transferred again. Completed items are recorded in a manifest so an
+interrupted push or pull resumes where it stopped; the manifest is deleted
+once every item has succeeded.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+try:
+    import google_crc32c
+except ImportError:  # pragma: no cover - installed with google-cloud-storage
+    google_crc32c = None
+
+DEFAULT_WORKERS = 8
+MANIFEST_VERSION = 1
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class RemoteObject:
+    """Metadata of one remote object, as the storage listing reports it.
+
+    Checksums use the GCS encoding: base64 of the big-endian CRC32C and of the
+    MD5 digest. Either may be None when the backend does not provide it.
+    """
+
+    name: str
+    size: int
+    crc32c: str | None = None
+    md5: str | None = None
+
+
+@dataclass
+class TransferItem:
+    """One file to move between ``local_path`` and ``remote_name``.
+
+    ``key`` is the file's path relative to the transferred directory and names
+    it in the manifest. ``remote`` holds the remote object's metadata when it
+    exists, which is what the unchanged check compares against.
+    """
+
+    key: str
+    local_path: Path
+    remote_name: str
+    remote: RemoteObject | None = None
+
+
+@dataclass
+class TransferStats:
+    """Counts and throughput of one transfer run."""
+
+    total: int = 0
+    transferred: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def done(self) -> int:
+        return self.transferred + self.skipped + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Transferred bytes per second."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.transferred} transferred, {self.skipped} unchanged, "
+            f"{self.failed} failed of {self.total} files; "
+            f"{self.bytes / 1e6:.1f} MB in {self.seconds:.1f}s "
+            f"({self.throughput / 1e6:.1f} MB/s)"
+        )
+
+
+def transfer_workers() -> int:
+    """Worker threads per transfer, from LLMDBENCH_RESULTS_TRANSFER_WORKERS."""
+    value = os.environ.get("LLMDBENCH_RESULTS_TRANSFER_WORKERS", "")
+    try:
+        return max(1, int(value)) if value else DEFAULT_WORKERS
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def file_checksums(path: Path, crc32c: bool = True, md5: bool = True) -> dict:
+    """Compute a file's checksums in one read, encoded as GCS reports them.
+
+    Args:
+        path (Path): File to read.
+        crc32c (bool): Compute the CRC32C, when google-crc32c is installed.
+        md5 (bool): Compute the MD5 digest.
+
+    Returns:
+        dict: ``crc32c`` and/or ``md5`` keys with base64-encoded values.
+    """
+    crc = google_crc32c.Checksum() if crc32c and google_crc32c else None
+    digest = hashlib.md5(usedforsecurity=False) if md5 else None
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            if crc is not None:
+                crc.update(chunk)
+            if digest is not None:
+                digest.update(chunk)
+    result = {}
+    if crc is not None:
+        result["crc32c"] = base64.b64encode(crc.digest()).decode("ascii")
+    if digest is not None:
+        result["md5"] = base64.b64encode(digest.digest()).decode("ascii")
+    return result
+
+
+def is_unchanged(path: Path, remote: RemoteObject | None) -> bool:
+    """Check whether a local file matches a remote object.
+
+    Sizes must agree, then the CRC32C is compared when both sides can provide
+    it, else the MD5. Without a checksum to compare the file counts as changed.
+    """
+    if remote is None:
+        return False
+    try:
+        if path.stat().st_size != remote.size:
+            return False
+    except OSError:
+        return False
+    use_crc = bool(remote.crc32c) and google_crc32c is not None
+    use_md5 = not use_crc and bool(remote.md5)
+    if not (use_crc or use_md5):
+        return False
+    local = file_checksums(path, crc32c=use_crc, md5=use_md5)
+    if use_crc:
+        return local.get("crc32c") == remote.crc32c
+    return local.get("md5") == remote.md5
+
+
+def local_files(local_dir: Path) -> list[tuple[str, Path]]:
+    """List files under ``local_dir`` as sorted (posix relative key, path)."""
+    files = []
+    for root, _, names in os.walk(local_dir):
+        for name in names:
+            path = Path(root) / name
+            files.append((path.relative_to(local_dir).as_posix(), path))
+    return sorted(files)
+
+
+def join_remote(prefix: str, key: str) -> str:
+    """Join a remote prefix and a relative key without doubled slashes."""
+    prefix = prefix.strip("/")
+    return f"{prefix}/{key}" if prefix else key
+
+
+def default_manifest_path(direction: str, uri: str, local_dir: str) -> Path:
+    """Manifest file for one (direction, remote, local directory) transfer."""
+    root = os.environ.get("LLMDBENCH_RESULTS_TRANSFER_STATE_DIR") or os.path.join(
+        tempfile.gettempdir(), "llmdbench-transfers"
+    )
+    identity = f"{direction}\n{uri}\n{os.path.abspath(local_dir)}"
+    digest = hashlib.sha1(identity.encode("utf-8"), usedforsecurity=False)
+    return Path(root) / f"{direction}-{digest.hexdigest()[:16]}.json"
+
+
+class TransferManifest:
+    """Record of completed items, persisted so a transfer can resume.
+
+    An item counts as done only while its local file keeps the size and
+    modification time recorded when it completed, so edits since then are
+    transferred again.
+    """
+
+    def __init__(self, path: Path, direction: str, uri: str, local_dir: str):
+        self.path = Path(path)
+        self.header = {
+            "version": MANIFEST_VERSION,
+            "direction": direction,
+            "uri": uri,
+            "local_dir": os.path.abspath(local_dir),
+        }
+        self._done: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if all(data.get(k) == v for k, v in self.header.items()):
+            self._done = dict(data.get("done", {}))
+
+    @staticmethod
+    def _signature(path: Path) -> list[int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def is_done(self, item: TransferItem) -> bool:
+        signature = self._signature(item.local_path)
+        with self._lock:
+            return signature is not None and self._done.get(item.key) == signature
+
+    def mark_done(self, item: TransferItem) -> None:
+        signature = self._signature(item.local_path)
+        if signature is not None:
+            with self._lock:
+                self._done[item.key] = signature
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            data = {**self.header, "done": dict(self._done)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def discard(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class TransferEngine:
+    """Runs per-file transfers in a bounded thread pool.
+
+    Args:
+        max_workers (int | None): Concurrent transfers; None reads
+            LLMDBENCH_RESULTS_TRANSFER_WORKERS (default 8).
+        progress (Callable[[TransferStats], None] | None): Called at most
+            every ``progress_interval`` seconds while items complete, and once
+            at the end.
+        progress_interval (float): Minimum seconds between progress calls.
+        save_interval (float): Minimum seconds between manifest writes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        progress: Callable[[TransferStats], None] | None = None,
+        progress_interval: float = 2.0,
+        save_interval: float = 5.0,
+    ):
+        self.max_workers = max_workers or transfer_workers()
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.save_interval = save_interval
+
+    def _run_one(
+        self,
+        item: TransferItem,
+        transfer: Callable[[TransferItem], None],
+        manifest: TransferManifest | None,
+    ) -> int:
+        """Move one item; returns the bytes moved, or -1 when skipped."""
+        if manifest is not None and manifest.is_done(item):
+            return -1
+        if item.remote is not None and is_unchanged(item.local_path, item.remote):
+            if manifest is not None:
+                manifest.mark_done(item)
+            return -1
+        transfer(item)
+        if manifest is not None:
+            manifest.mark_done(item)
+        try:
+            return item.local_path.stat().st_size
+        except OSError:
+            return 0
+
+    def run(
+        self,
+        items: list[TransferItem],
+        transfer: Callable[[TransferItem], None],
+        manifest: TransferManifest | None = None,
+    ) -> TransferStats:
+        """Transfer every item that is not done or unchanged.
+
+        Args:
+            items (list[TransferItem]): Files to move.
+            transfer (Callable[[TransferItem], None]): Moves one file; raises on
+                failure. Called from worker threads.
+            manifest (TransferManifest | None): Resume record; saved
+                periodically, kept when anything fails or the run is
+                interrupted, and deleted after a complete run.
+
+        Returns:
+            TransferStats: Outcome of the run.
+
+        Raises:
+            RuntimeError: If any item failed, after all others were attempted.
+        """
+        stats = TransferStats(total=len(items))
+        start = time.monotonic()
+        last_progress = last_save = start
+        completed = False
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {
+                executor.submit(self._run_one, item, transfer, manifest): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                try:
+                    moved = future.result()
+                except Exception as exception:
+                    stats.failed += 1
+                    stats.errors.append(f"{futures[future].key}: {exception}")
+                else:
+                    if moved < 0:
+                        stats.skipped += 1
+                    else:
+                        stats.transferred += 1
+                        stats.bytes += moved
+                now = time.monotonic()
+                stats.seconds = now - start
+                if manifest is not None and now - last_save >= self.save_interval:
+                    manifest.save()
+                    last_save = now
+                if self.progress and now - last_progress >= self.progress_interval:
+                    self.progress(stats)
+                    last_progress = now
+            completed = True
+        finally:
+            executor.shutdown(wait=completed, cancel_futures=not completed)
+            stats.seconds = time.monotonic() - start
+            if manifest is not None:
+                if completed and not stats.failed:
+                    manifest.discard()
+                elif len(manifest):
+                    manifest.save()
+
+        if self.progress:
+            self.progress(stats)
+        if stats.failed:
+            raise RuntimeError(
+                f"{stats.failed} of {stats.total} transfers failed "
+                f"(first: {stats.errors[0]}); rerun to resume"
+            )
+        return stats
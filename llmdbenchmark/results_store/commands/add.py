@@ -42,7 +42,7 @@ def execute(args, logger):
                         if not exp_dir.is_dir():
                             continue
 
-                        report_info = workspace_manager._parse_report(exp_dir)
+                        report_info = workspace_manager.parse_report(exp_dir)
                         full_uid = report_info.get("run_uid", "-")
 
                         if full_uid != "-":
@@ -70,7 +70,7 @@ def execute(args, logger):
                 target_path = str(matches[0])
                 logger.log_debug(f"Resolved '{input_path}' to {target_path}")
 
-        report_info = workspace_manager._parse_report(Path(target_path))
+        report_info = workspace_manager.parse_report(Path(target_path))
         overrides = {}
 
         missing_fields = []
@@ -1,11 +1,15 @@
 """Command to list benchmark runs in a remote."""
 
 import sys
-import fnmatch
+from llmdbenchmark.results_store.catalog import (
+    Catalog,
+    index_uri,
+    sync_remote,
+)
 from llmdbenchmark.results_store.config import ConfigManager
-from llmdbenchmark.results_store.utils import color_pad, parse_report_path
+from llmdbenchmark.results_store.utils import color_pad
 from llmdbenchmark.results_store.commands import register_command
-from llmdbenchmark.results_store.client import get_storage_client, get_fallback_client
+from llmdbenchmark.results_store.client import get_storage_client
 
 
 @register_command("ls")
@@ -14,67 +18,28 @@ def execute(args, logger):
     try:
         uri = config.get_remote(args.remote)
         client = get_storage_client(uri)
+        catalog = Catalog.for_store()
 
-        try:
-            blob_names = client.ls(uri)
-        except Exception as exception:
-            fallback_client = get_fallback_client(client)
-            if fallback_client:
-                logger.log_warning(
-                    f"Direct access failed, trying fallback: {exception}"
-                )
-                client = fallback_client
-                blob_names = client.ls(uri)
-            else:
-                raise exception
-
-        if not blob_names:
-            logger.log_info(f"No objects found in remote '{args.remote}'.")
-            return
-
-        # Parse URI to get base prefix for relative path calculation
-        if uri.startswith("gs://"):
-            parts = uri[5:].split("/", 1)
-            base_prefix = parts[1] if len(parts) > 1 else ""
-        else:
-            base_prefix = ""
-
-        runs = []
-        for name in blob_names:
-            if name.endswith("report_v0.2.yaml"):
-                relative_name = name
-                if base_prefix:
-                    prefix_check = (
-                        base_prefix if base_prefix.endswith("/") else base_prefix + "/"
-                    )
-                    if relative_name.startswith(prefix_check):
-                        relative_name = relative_name[len(prefix_check) :]
-
-                run_info = parse_report_path(relative_name)
-                if not run_info:
-                    logger.log_warning(
-                        f"Ignoring remote object with unexpected path structure: {name}"
-                    )
-                    continue
-
-                # Apply filters
-                if args.model:
-                    if "*" in args.model or "?" in args.model:
-                        if not fnmatch.fnmatch(run_info["model"], args.model):
-                            continue
-                    elif args.model != run_info["model"]:
-                        continue
+        refresh = getattr(args, "refresh", False)
+        write_index = getattr(args, "write_index", False)
+        client, source = sync_remote(
+            catalog,
+            client,
+            uri,
+            refresh=refresh,
+            logger=logger,
+            write_index=write_index,
+        )
+        logger.log_debug(f"Runs in '{args.remote}' read from the remote {source}.")
 
-                if args.hardware:
-                    if "*" in args.hardware or "?" in args.hardware:
-                        if not fnmatch.fnmatch(run_info["hardware"], args.hardware):
-                            continue
-                    elif args.hardware != run_info["hardware"]:
-                        continue
+        if write_index:
+            logger.log_info(f"Wrote run index to {index_uri(uri)}.")
 
-                run_info["blob_name"] = name
-                runs.append(run_info)
+        if not catalog.find_remote_runs(uri):
+            logger.log_info(f"No benchmark runs found in remote '{args.remote}'.")
+            return
 
+        runs = catalog.find_remote_runs(uri, model=args.model, hardware=args.hardware)
         if not runs:
             logger.log_info(
                 f"No benchmark runs found matching filters in remote '{args.remote}'."
@@ -1,13 +1,14 @@
 """Command to pull benchmark runs from a remote."""
 
 import sys
-import fnmatch
 from pathlib import Path
+from llmdbenchmark.results_store.catalog import Catalog, run_uri, sync_remote
 from llmdbenchmark.results_store.config import ConfigManager
 from llmdbenchmark.results_store.store import StoreManager, StoreNotFound
-from llmdbenchmark.results_store.utils import parse_report_path
+from llmdbenchmark.results_store.utils import log_transfer_summary, transfer_progress
 from llmdbenchmark.results_store.commands import register_command
-from llmdbenchmark.results_store.client import get_storage_client, get_fallback_client
+from llmdbenchmark.results_store.client import get_storage_client
+from llmdbenchmark.results_store.client.transfer import default_manifest_path
 
 
 @register_command("pull")
@@ -20,56 +21,14 @@ def execute(args, logger):
 
         # 1. Find the runs
         logger.log_info(f"Resolving run '{args.run_uid}' in {remote_name}...")
-        try:
-            blob_names = client.ls(uri)
-        except Exception as exception:
-            fallback_client = get_fallback_client(client)
-            if fallback_client:
-                logger.log_warning(
-                    f"Direct access failed, trying fallback: {exception}"
-                )
-                client = fallback_client
-                blob_names = client.ls(uri)
-            else:
-                raise exception
-
-        if not blob_names:
-            logger.log_error(f"No objects found in remote '{remote_name}'.")
-            sys.exit(1)
-
-        # Parse URI to get base prefix
-        if uri.startswith("gs://"):
-            parts = uri[5:].split("/", 1)
-            base_prefix = parts[1] if len(parts) > 1 else ""
-        else:
-            base_prefix = ""
-
-        matching_runs = []
-        for name in blob_names:
-            if name.endswith("report_v0.2.yaml"):
-                relative_name = name
-                if base_prefix:
-                    prefix_check = (
-                        base_prefix if base_prefix.endswith("/") else base_prefix + "/"
-                    )
-                    if relative_name.startswith(prefix_check):
-                        relative_name = relative_name[len(prefix_check) :]
-
-                run_info = parse_report_path(relative_name)
-                if not run_info:
-                    logger.log_warning(
-                        f"Ignoring remote object with unexpected path structure: {name}"
-                    )
-                    continue
-
-                run_uid = run_info["run_uid"]
-                if "*" in args.run_uid or "?" in args.run_uid:
-                    if fnmatch.fnmatch(run_uid, args.run_uid):
-                        run_info["blob_name"] = name
-                        matching_runs.append(run_info)
-                elif run_uid == args.run_uid or run_uid.startswith(args.run_uid):
-                    run_info["blob_name"] = name
-                    matching_runs.append(run_info)
+        catalog = Catalog.for_store()
+        refresh = getattr(args, "refresh", False)
+        client, source = sync_remote(catalog, client, uri, refresh, logger)
+        matching_runs = catalog.find_remote_runs(uri, run_uid=args.run_uid)
+        if not matching_runs and source == "catalog":
+            # The catalog may predate the run; list the remote.
+            client, source = sync_remote(catalog, client, uri, True, logger)
+            matching_runs = catalog.find_remote_runs(uri, run_uid=args.run_uid)
 
         # Deduplicate by run_uid
         unique_runs = {}
@@ -97,16 +56,7 @@ def execute(args, logger):
             scenario = target_run.get("scenario", "missing")
             full_uid = target_run["run_uid"]
             short_uid = full_uid[:8]
-            blob_name = target_run["blob_name"]
-
-            # Construct target prefix from blob_name (remove report_v0.2.yaml)
-            target_prefix = blob_name.rsplit("/", 1)[0]
-
-            if uri.startswith("gs://"):
-                bucket_name = uri[5:].split("/", 1)[0]
-                full_uri = f"gs://{bucket_name}/{target_prefix}"
-            else:
-                full_uri = f"{uri.rstrip('/')}/{target_prefix}"
+            full_uri = run_uri(uri, target_run)
 
             # 2. Construct workspace path
             ws_name = f"{remote_name}_{group}_{short_uid}"
@@ -130,7 +80,12 @@ def execute(args, logger):
 
             # 4. Pull files
             target_dest = results_dir / full_uid
-            if target_dest.exists():
+            resuming = default_manifest_path(
+                "pull", full_uri, str(target_dest)
+            ).exists()
+            if resuming:
+                logger.log_info(f"Resuming interrupted pull of {short_uid}.")
+            elif target_dest.exists():
                 if sys.stdout.isatty():
                     ans = (
                         input(
@@ -149,8 +104,10 @@ def execute(args, logger):
                     continue
 
             try:
+                client.progress = transfer_progress(logger, short_uid)
                 count = client.pull(full_uri, str(target_dest))
                 logger.log_info(f"Successfully pulled {count} files to {target_dest}")
+                log_transfer_summary(client, logger)
             except Exception as exception:
                 logger.log_error(f"Failed to pull {short_uid}: {exception}")
                 continue
@@ -1,20 +1,52 @@
 """Command to push staged runs to a remote."""
 
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
+from llmdbenchmark.results_store.catalog import (
+    REPORT_SUFFIX,
+    Catalog,
+    add_to_remote_index,
+)
 from llmdbenchmark.results_store.config import ConfigManager
 from llmdbenchmark.results_store.workspace import WorkspaceManager
 from llmdbenchmark.results_store.store import StoreNotFound
+from llmdbenchmark.results_store.utils import log_transfer_summary, transfer_progress
 from llmdbenchmark.results_store.commands import register_command
 from llmdbenchmark.results_store.client import get_storage_client, get_fallback_client
 
 
+def _record_push(catalog, client, uri: str, run: dict, relative_dir: str, logger):
+    """Adds a pushed run to the local catalog and the remote's run index."""
+    reports = sorted(p.name for p in Path(run["path"]).glob(f"*{REPORT_SUFFIX}"))
+    if not reports:
+        return
+    entry = {
+        key: run.get(key, "missing")
+        for key in ("run_uid", "scenario", "model", "hardware")
+    }
+    entry.update(
+        relative_name=f"{relative_dir}/{reports[0]}",
+        group=relative_dir.split("/", 1)[0],
+        start=run.get("start"),
+        end=run.get("end"),
+        metrics=run.get("metrics") or {},
+        pushed_at=datetime.now(timezone.utc).isoformat(),
+    )
+    catalog.upsert_remote_run(uri, entry)
+    try:
+        add_to_remote_index(client, uri, entry)
+    except Exception as exception:
+        logger.log_warning(f"Could not update the remote run index: {exception}")
+
+
 @register_command("push")
 def execute(args, logger):
     config = ConfigManager()
     try:
         uri = config.get_remote(args.remote)
         client = get_storage_client(uri)
+        catalog = Catalog.for_store()
         runs_to_push = []
 
         if args.path:
@@ -60,7 +92,8 @@ def execute(args, logger):
                 hardware = run.get("hardware", "missing")
                 run_uid = run.get("run_uid", "missing")
 
-                full_uri = f"{uri.rstrip('/')}/{args.group}/{scenario}/{model}/{hardware}/{run_uid}"
+                relative_dir = f"{args.group}/{scenario}/{model}/{hardware}/{run_uid}"
+                full_uri = f"{uri.rstrip('/')}/{relative_dir}"
 
                 try:
                     remote_exists = client.exists(full_uri)
@@ -95,10 +128,13 @@ def execute(args, logger):
 
                 logger.log_plain(f"Pushing {short_uid}...")
                 try:
+                    client.progress = transfer_progress(logger, short_uid)
                     uploaded_files = client.push(full_uri, path)
                     logger.log_plain(
                         f"Successfully pushed {uploaded_files} files to {full_uri}"
                     )
+                    log_transfer_summary(client, logger)
+                    _record_push(catalog, client, uri, run, relative_dir, logger)
                     if not args.path and "workspace_manager" in locals():
                         workspace_manager.remove_workspace(path)
                     pushed_count += 1
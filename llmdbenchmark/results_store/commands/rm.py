@@ -43,7 +43,7 @@ def execute(args, logger):
                 )
 
         if workspace_manager.remove_workspace(target_path):
-            report_info = workspace_manager._parse_report(Path(target_path))
+            report_info = workspace_manager.parse_report(Path(target_path))
             uid = report_info.get("run_uid", "-")
             short_uid = uid[:8] if len(uid) > 8 else uid
             logger.log_plain(f"Unstaged '{short_uid}'")
@@ -42,7 +42,7 @@ def execute(args, logger):
 
                 path_str = str(exp_dir.resolve())
                 if path_str not in staged_paths:
-                    report_info = workspace_manager._parse_report(exp_dir)
+                    report_info = workspace_manager.parse_report(exp_dir)
                     report_info.update({"path": path_str, "status": "untracked"})
                     if (
                         report_info.get("run_uid") == "missing"
@@ -35,3 +35,24 @@ def parse_report_path(relative_name: str) -> dict:
             "group": group,
         }
     return None
+
+
+def transfer_progress(logger, label: str):
+    """Returns a progress callback logging a transfer's file and byte counts."""
+
+    def report(stats) -> None:
+        logger.log_plain(
+            f"  {label}: {stats.done}/{stats.total} files "
+            f"({stats.skipped} unchanged), {stats.throughput / 1e6:.1f} MB/s"
+        )
+
+    return report
+
+
+def log_transfer_summary(client, logger) -> None:
+    """Logs the counts and throughput of the client's latest transfer."""
+    from llmdbenchmark.results_store.client.transfer import TransferStats
+
+    stats = getattr(client, "last_transfer", None)
+    if isinstance(stats, TransferStats):
+        logger.log_plain(f"  {stats.summary()}")
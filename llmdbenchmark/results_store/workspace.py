@@ -3,21 +3,28 @@
 import json
 from pathlib import Path
 import yaml
+from llmdbenchmark.results_store.catalog import Catalog, report_summary
 from llmdbenchmark.results_store.store import StoreManager
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class WorkspaceManager:
-    """Manages tracking benchmark directories within the local store."""
+    """Manages tracking benchmark directories within the local store.
+
+    When it belongs to a store (no explicit ``staged_path``), parsed run
+    identities are cached in the store's catalog.
+    """
 
-    def __init__(self, staged_path: Path = None):
+    def __init__(self, staged_path: Path = None, catalog: Catalog = None):
+        self.catalog = catalog
         if staged_path:
             self.staged_path = Path(staged_path)
         else:
-            self.staged_path = (
-                StoreManager.find_store_root()
-                / StoreManager.STORE_DIR_NAME
-                / "staged.json"
-            )
+            store_root = StoreManager.find_store_root()
+            self.staged_path = store_root / StoreManager.STORE_DIR_NAME / "staged.json"
+            if self.catalog is None:
+                self.catalog = Catalog.for_store(store_root)
 
     def _load(self) -> dict:
         if not self.staged_path.exists():
@@ -29,6 +36,12 @@ class WorkspaceManager:
         with open(self.staged_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
 
+    def parse_report(self, path: Path) -> dict:
+        """Parse a run's identity, from the catalog while its files are unchanged."""
+        if self.catalog is None:
+            return self._parse_report(path)
+        return self.catalog.cached_report(path, self._parse_report)
+
     def _parse_report(self, path: Path) -> dict:
         """Parse core ID values dynamically from files or directory name."""
         info = {
@@ -49,7 +62,7 @@ class WorkspaceManager:
         if metadata_path.exists():
             try:
                 with open(metadata_path, "r", encoding="utf-8") as f:
-                    m = yaml.safe_load(f) or {}
+                    m = yaml.load(f, Loader=_YAML_LOADER) or {}
                     info["model"] = m.get("model", info["model"])
                     info["scenario"] = m.get("harness_workload", info["scenario"])
             except Exception:
@@ -68,7 +81,8 @@ class WorkspaceManager:
         ):
             try:
                 with open(f, "r", encoding="utf-8") as f_in:
-                    r = yaml.safe_load(f_in) or {}
+                    r = yaml.load(f_in, Loader=_YAML_LOADER) or {}
+                    info.update(report_summary(r))
                     if "run" in r and "uid" in r["run"]:
                         info["run_uid"] = str(r["run"]["uid"])
 
@@ -166,7 +180,7 @@ class WorkspaceManager:
                 "status": "missing report",
             }
             if path.exists():
-                report_info = self._parse_report(path)
+                report_info = self.parse_report(path)
                 if report_info:
                     base_info.update(report_info)
                     base_info["status"] = "staged"
@@ -74,7 +74,9 @@ class FMAWarmupStep(Step):
                 FMAWarmupHotStartStep,
             )
 
-            return FMAWarmupHotStartStep().execute(context, stack_path)
+            hotstart = FMAWarmupHotStartStep()
+            hotstart.config_cache = self.config_cache
+            return hotstart.execute(context, stack_path)
 
         if not self._resolve(plan_config, "fma.enabled", default=False):
             return StepResult(
@@ -5,6 +5,11 @@ parallel pods, wait for completion, collect results, capture logs,
 and clean up before moving to the next treatment.  This matches the
 original bash behavior and ensures treatments do not compete for
 cluster resources.
+
+With ``--pipeline-treatments`` the harness runs stay sequential, but each
+treatment's collection, local analysis and upload are handed to a
+background worker once its pods are deleted, so they overlap the next
+treatment's run (see ``utilities/treatment_pipeline.py``).
 """
 
 import base64
@@ -12,15 +17,17 @@ import json
 import random
 import shutil
 import string
-import subprocess
-import tarfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import yaml
 from jinja2 import Environment
 
+from llmdbenchmark.analysis import run_analysis
 from llmdbenchmark.executor.command import CommandResult
 from llmdbenchmark.executor.step import Step, StepResult, Phase
 from llmdbenchmark.executor.context import ExecutionContext, is_fma_only_mode
@@ -36,6 +43,20 @@ from llmdbenchmark.utilities.kube_helpers import (
 )
 from llmdbenchmark.utilities.cloud_upload import upload_results_dir
 from llmdbenchmark.utilities.endpoint import reset_caches_pods
+from llmdbenchmark.utilities.result_collector import collect_result_dirs
+from llmdbenchmark.utilities.treatment_pipeline import (
+    TREATMENT_STATUS_FILE,
+    TreatmentPipeline,
+    TreatmentStatus,
+    write_treatment_statuses,
+)
+
+# run_analysis's plotting stages use matplotlib's process-global pyplot state,
+# so analyses from pipelines of stacks running in parallel must not interleave
+# threads (run_analysis_many uses processes instead).
+_ANALYSIS_LOCK = threading.Lock()
+# Stacks run step 07 in parallel and share one treatment-status file.
+_STATUS_LOCK = threading.Lock()
 
 
 class DeployHarnessStep(Step):
@@ -191,11 +212,49 @@ class DeployHarnessStep(Step):
         profile_mounts = self._profile_mounts(context, harness_name)
         total_deployed = 0
 
+        statuses = [
+            TreatmentStatus(
+                index=idx,
+                treatment=(
+                    (t.get("name") if isinstance(t, dict) else None) or "default"
+                ),
+                stack=stack_name,
+            )
+            for idx, t in enumerate(treatments, 1)
+        ]
+        pipeline = None
+        if (
+            context.harness_pipeline
+            and not context.dry_run
+            and not context.harness_debug
+        ):
+            if context.treatment_max_attempts > 1:
+                context.logger.log_warning(
+                    "--pipeline-treatments ignored: treatment retries need each "
+                    "attempt's results before the next launch; running "
+                    "treatments sequentially"
+                )
+            else:
+                pipeline = TreatmentPipeline(
+                    depth=context.harness_pipeline_depth,
+                    submit_timeout=timeout or 3600,
+                    on_done=partial(
+                        self._report_post_processed, context, total_treatments
+                    ),
+                    logger=context.logger,
+                )
+                context.logger.log_info(
+                    "Pipelining treatments: collection, analysis and upload run "
+                    f"in the background (queue depth {pipeline.depth})"
+                )
+
         for treatment_idx, treatment in enumerate(treatments, 1):
             treatment_name = ""
             if treatment and isinstance(treatment, dict):
                 treatment_name = treatment.get("name", "")
             treatment_label = treatment_name or "default"
+            status = statuses[treatment_idx - 1]
+            submitted = True
 
             # Per-treatment retry loop: each attempt gets a fresh experiment_id
             # so reset_caches (if enabled) re-fires and the treatment starts
@@ -447,8 +506,15 @@ class DeployHarnessStep(Step):
                     if wait_errors:
                         treatment_errors.extend(wait_errors)
 
-                # Phase 3: collect this treatment's results
-                if not no_pods and not context.dry_run and not context.harness_debug:
+                # Phase 3: collect this treatment's results (pipelined: after
+                # cleanup, on the pipeline worker)
+                if (
+                    not no_pods
+                    and not context.dry_run
+                    and not context.harness_debug
+                    and pipeline is None
+                ):
+                    collect_start = time.time()
                     collect_errors = self._collect_treatment_results_discovery(
                         cmd,
                         experiment_id,
@@ -456,6 +522,7 @@ class DeployHarnessStep(Step):
                         results_dir_prefix,
                         context,
                     )
+                    status.collect_seconds += time.time() - collect_start
                     if collect_errors:
                         treatment_errors.extend(collect_errors)
 
@@ -511,6 +578,7 @@ class DeployHarnessStep(Step):
                     and context.validate_failures
                     and not context.dry_run
                     and not context.harness_debug
+                    and pipeline is None
                 ):
                     validation_errors = self._validate_failures(
                         context, experiment_id, parallelism, profile_name
@@ -519,6 +587,36 @@ class DeployHarnessStep(Step):
                         treatment_errors.extend(validation_errors)
 
                 elapsed = time.time() - treatment_start
+                status.experiment_id = experiment_id
+                status.run_seconds += elapsed
+
+                if pipeline is not None:
+                    # The pods are gone: queue the rest and launch the next one.
+                    if no_pods:
+                        status.fail(*treatment_errors)
+                    else:
+                        submitted = pipeline.submit(
+                            status,
+                            partial(
+                                self._post_process_treatment,
+                                cmd,
+                                context,
+                                experiment_id,
+                                harness_ns,
+                                results_dir_prefix,
+                                parallelism,
+                                profile_name,
+                                harness_name,
+                                treatment_errors,
+                            ),
+                        )
+                        context.logger.log_info(
+                            f"[{treatment_idx}/{total_treatments}] Treatment "
+                            f"'{treatment_label}' ran ({int(elapsed)}s); "
+                            f"collecting in the background",
+                            emoji="\U0001f4e5",
+                        )
+                    break
 
                 if not treatment_errors:
                     # Attempt succeeded: record its ID for upload and stop retrying.
@@ -543,7 +641,28 @@ class DeployHarnessStep(Step):
                 if attempt < max_attempts and not context.dry_run:
                     self._delete_faulty_results(context, experiment_id, parallelism)
 
-            if not treatment_succeeded:
+            if pipeline is not None:
+                # Fail closed: a collector that cannot keep up stops the run.
+                if not submitted:
+                    context.logger.log_error(
+                        f"Treatment '{treatment_label}' failed: "
+                        f"{status.errors[-1]} -- not launching the remaining "
+                        f"treatments"
+                    )
+                    break
+                if context.treatment_stop_on_error and (
+                    status.status == "failed" or pipeline.failed
+                ):
+                    context.logger.log_error(
+                        "A pipelined treatment failed -- aborting run"
+                    )
+                    break
+                continue
+
+            if treatment_succeeded:
+                status.status = "succeeded"
+            else:
+                status.fail(*last_attempt_errors)
                 errors.extend(last_attempt_errors)
                 if context.treatment_stop_on_error:
                     # Abort the loop, leaving remaining treatments un-run;
@@ -554,6 +673,19 @@ class DeployHarnessStep(Step):
                     )
                     break
 
+        if pipeline is not None:
+            context.logger.log_info(
+                "Waiting for background collection to finish...",
+                emoji="\u23f3",
+            )
+            pipeline.close(timeout=timeout or 3600)
+            for status in statuses:
+                errors.extend(status.errors)
+        for status in statuses:
+            if status.status == "pending" and status.experiment_id is None:
+                status.status = "skipped"
+        self._record_statuses(context, statuses)
+
         if errors:
             return StepResult(
                 step_number=self.number,
@@ -575,6 +707,97 @@ class DeployHarnessStep(Step):
             stack_name=stack_name,
         )
 
+    # Pipelined post-processing and per-treatment status
+
+    def _post_process_treatment(
+        self,
+        cmd,
+        context: ExecutionContext,
+        experiment_id: str,
+        harness_ns: str,
+        results_dir_prefix: str,
+        parallelism: int,
+        profile_name: str,
+        harness_name: str,
+        prior_errors: list[str],
+    ) -> list[str]:
+        """Collect, validate, analyze and upload one treatment (pipeline worker).
+
+        *prior_errors* are the treatment's deploy/wait errors; its results are
+        still collected, as in sequential mode.  Analysis problems are left
+        to step 12 to report (the dir is simply not marked analyzed).
+        """
+        errs = list(prior_errors)
+        errs.extend(
+            self._collect_treatment_results_discovery(
+                cmd, experiment_id, harness_ns, results_dir_prefix, context
+            )
+        )
+        if not errs and context.validate_failures:
+            errs.extend(
+                self._validate_failures(
+                    context, experiment_id, parallelism, profile_name
+                )
+            )
+
+        result_dirs = sorted(
+            d
+            for d in context.run_results_dir().glob(f"*{experiment_id}*")
+            if d.is_dir()
+        )
+        if context.analyze_locally:
+            for result_dir in result_dirs:
+                with _ANALYSIS_LOCK:
+                    err = run_analysis(harness_name, result_dir, context)
+                if err:
+                    context.logger.log_warning(f"Analysis issue: {err}")
+                else:
+                    context.analyzed_result_dirs.add(result_dir.name)
+        if context.harness_output != "local":
+            for result_dir in result_dirs:
+                upload_err = upload_results_dir(
+                    cmd, result_dir, context.harness_output, context
+                )
+                if upload_err:
+                    errs.append(upload_err)
+
+        if not errs:
+            context.experiment_ids.append(experiment_id)
+        return errs
+
+    @staticmethod
+    def _report_post_processed(
+        context: ExecutionContext, total: int, status: TreatmentStatus
+    ) -> None:
+        prefix = f"[{status.index}/{total}] Treatment '{status.treatment}'"
+        if status.status == "succeeded":
+            context.logger.log_info(
+                f"{prefix} complete (run {int(status.run_seconds)}s, "
+                f"collect {int(status.collect_seconds)}s)",
+                emoji="\u2705",
+            )
+        else:
+            context.logger.log_error(f"{prefix} failed: {len(status.errors)} error(s)")
+
+    @staticmethod
+    def _record_statuses(
+        context: ExecutionContext, statuses: list[TreatmentStatus]
+    ) -> None:
+        """Add this stack's statuses to the context and rewrite the status file."""
+        with _STATUS_LOCK:
+            context.treatment_statuses.extend(statuses)
+            if context.dry_run:
+                return
+            try:
+                write_treatment_statuses(
+                    context.treatment_statuses,
+                    context.run_dir() / TREATMENT_STATUS_FILE,
+                )
+            except OSError as exc:
+                context.logger.log_warning(
+                    f"Could not write {TREATMENT_STATUS_FILE}: {exc}"
+                )
+
     # Per-treatment retry helpers
 
     @staticmethod
@@ -757,86 +980,75 @@ class DeployHarnessStep(Step):
         # default) results are collected with the original ``oc cp`` path
         # (slow: ~95 min/dir because the ~1.5 GB per_request_lifecycle_metrics.json
         # tunnels through the apiserver exec stream at ~0.3 MB/s). The fast path
-        # copies the exact same files -- it only swaps ``oc cp`` for a gzip'd
-        # ``oc exec | tar`` stream, which crosses the tunnel far faster.
+        # copies the exact same files -- it only swaps ``oc cp`` for gzip'd
+        # ``oc exec | tar`` streams, which cross the tunnel far faster. Either
+        # way up to ``harness_collect_streams`` transfers run at once; the fast
+        # path also shares one listing across all dirs and skips files already
+        # collected (see utilities/result_collector.py).
         FAST_COLLECT = context.harness_fast_collect
+        streams = max(1, context.harness_collect_streams)
+        collect_start = time.monotonic()
 
-        for dir_name in matching_dirs:
-            local_path = local_results_dir / dir_name
-            local_path.mkdir(parents=True, exist_ok=True)
-
-            if FAST_COLLECT:
-                remote_dir = f"{results_dir_prefix}/{dir_name}"
-                # Auto-detected binary + kubeconfig/context/namespace flags.
-                kube_argv = [
-                    cmd._kube_bin,
-                    *cmd._kubeconfig_args(),
-                    "--namespace",
-                    namespace,
-                    "exec",
-                    data_pod,
-                    "--",
-                    "tar",
-                    "cz",
-                    "-C",
-                    remote_dir,
-                    ".",
-                ]
-                # Retry the whole stream: dropped apiserver exec streams
-                # (``tar: Unexpected EOF``) are transient; extractall overwrites
-                # so a partial extraction from a failed attempt is harmless.
-                max_attempts = 5
-                cp_result = CommandResult(command=" ".join(kube_argv), exit_code=1)
-                for cp_attempt in range(1, max_attempts + 1):
-                    cp_result = DeployHarnessStep._fast_collect_stream(
-                        kube_argv, local_path
-                    )
-                    if cp_result.success:
-                        break
-                    context.logger.log_warning(
-                        f"FAST_COLLECT pipeline attempt {cp_attempt}/{max_attempts} "
-                        f"failed for {dir_name} (exit={cp_result.exit_code}): "
-                        f"{(cp_result.stderr or cp_result.stdout)[:300]}"
-                    )
-                    if cp_attempt < max_attempts:
-                        time.sleep(min(5 * cp_attempt, 30))
-                if not cp_result.success:
-                    context.logger.log_error(
-                        f"FAST_COLLECT pipeline failed for {dir_name} after "
-                        f"{max_attempts} attempt(s) "
-                        f"(exit={cp_result.exit_code}): "
-                        f"{(cp_result.stderr or cp_result.stdout)[:500]}"
-                    )
-                else:
-                    context.logger.log_info(
-                        f"FAST Collected {remote_dir} to {local_path}"
-                    )
-            else:
-                remote_path = f"{data_pod}:{results_dir_prefix}/{dir_name}"
-                cp_result = cmd.kube(
+        if FAST_COLLECT:
+            stats = collect_result_dirs(
+                cmd,
+                data_pod,
+                namespace,
+                results_dir_prefix,
+                matching_dirs,
+                local_results_dir,
+                streams=streams,
+                zstd=context.harness_collect_zstd,
+                logger=context.logger,
+            )
+            errors.extend(stats.errors)
+            copied = [d for d in matching_dirs if d not in stats.failed_dirs]
+            context.logger.log_info(
+                f"FAST Collected {experiment_id}: {stats.summary()}"
+            )
+        else:
+
+            def _copy(dir_name: str) -> CommandResult:
+                local_path = local_results_dir / dir_name
+                local_path.mkdir(parents=True, exist_ok=True)
+                return cmd.kube(
                     "cp",
                     "--retries=5",
-                    remote_path,
+                    f"{data_pod}:{results_dir_prefix}/{dir_name}",
                     str(local_path),
                     namespace=namespace,
                     check=False,
                 )
 
-            if cp_result.success:
-                file_count = sum(1 for f in local_path.rglob("*") if f.is_file())
-                context.logger.log_info(
-                    f"Collected {file_count} file(s) for {dir_name}"
-                )
-                # Sync analysis sub-directory
-                if not context.harness_debug and context.harness_wait_timeout != 0:
-                    sync_analysis_dir(
-                        local_path,
-                        local_analysis_dir,
-                        dir_name,
+            with ThreadPoolExecutor(
+                max_workers=min(streams, len(matching_dirs))
+            ) as pool:
+                cp_results = list(pool.map(_copy, matching_dirs))
+            copied = []
+            for dir_name, cp_result in zip(matching_dirs, cp_results):
+                if cp_result.success:
+                    copied.append(dir_name)
+                else:
+                    errors.append(
+                        f"Failed to copy {dir_name}: {cp_result.stderr[:200]}"
                     )
-            else:
-                errors.append(f"Failed to copy {dir_name}: {cp_result.stderr[:200]}")
 
+        for dir_name in copied:
+            local_path = local_results_dir / dir_name
+            file_count = sum(1 for f in local_path.rglob("*") if f.is_file())
+            context.logger.log_info(f"Collected {file_count} file(s) for {dir_name}")
+            # Sync analysis sub-directory
+            if not context.harness_debug and context.harness_wait_timeout != 0:
+                sync_analysis_dir(
+                    local_path,
+                    local_analysis_dir,
+                    dir_name,
+                )
+
+        context.logger.log_info(
+            f"Collected {len(copied)}/{len(matching_dirs)} dir(s) for "
+            f"{experiment_id} in {time.monotonic() - collect_start:.1f}s"
+        )
         return errors
 
     @staticmethod
@@ -923,41 +1135,6 @@ class DeployHarnessStep(Step):
 
         return errors
 
-    @staticmethod
-    def _fast_collect_stream(kube_argv: list[str], local_path: Path) -> CommandResult:
-        """Stream ``<kube> exec ... -- tar cz`` stdout into local ``tarfile``.
-
-        Pure-Python replacement for a ``kube exec ... | tar xz -C`` shell pipe:
-        no shell, no local ``tar`` binary, no quoting. Returns a CommandResult
-        so the caller keeps its uniform success/stderr handling.
-        """
-        cmd_str = " ".join(kube_argv)
-        try:
-            with subprocess.Popen(
-                kube_argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            ) as proc:
-                # ``r|gz`` = streaming read; tarfile consumes bytes as they land
-                # on stdout without seeking, so it works on a live pipe.
-                try:
-                    with tarfile.open(fileobj=proc.stdout, mode="r|gz") as tar:
-                        # ``filter="data"`` rejects absolute paths, ``..`` and
-                        # device entries (default in Py 3.14+, safe elsewhere).
-                        tar.extractall(path=local_path, filter="data")
-                    stderr = proc.stderr.read().decode("utf-8", errors="replace")
-                    exit_code = proc.wait()
-                except Exception as exc:  # pylint: disable=broad-exception-caught
-                    proc.kill()
-                    stderr = proc.stderr.read().decode("utf-8", errors="replace")
-                    proc.wait()
-                    return CommandResult(
-                        command=cmd_str,
-                        exit_code=proc.returncode or 1,
-                        stderr=f"{exc}\n{stderr}",
-                    )
-        except OSError as exc:
-            return CommandResult(command=cmd_str, exit_code=1, stderr=str(exc))
-        return CommandResult(command=cmd_str, exit_code=exit_code, stderr=stderr)
-
     # ------------------------------------------------------------------
     # Template rendering and helpers
     # ------------------------------------------------------------------
@@ -1134,6 +1311,5 @@ class DeployHarnessStep(Step):
         for stack_path in rendered_paths or []:
             config_file = stack_path / "config.yaml"
             if config_file.exists():
-                with open(config_file, encoding="utf-8") as f:
-                    return yaml.safe_load(f)
+                return self._read_config(config_file)
         return None
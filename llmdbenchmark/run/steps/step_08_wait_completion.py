@@ -4,7 +4,7 @@ from pathlib import Path
 
 from llmdbenchmark.executor.step import Step, StepResult, Phase
 from llmdbenchmark.executor.context import ExecutionContext
-from llmdbenchmark.utilities.kube_helpers import wait_for_pod
+from llmdbenchmark.utilities.kube_helpers import wait_for_pods
 
 
 class WaitCompletionStep(Step):
@@ -87,9 +87,10 @@ class WaitCompletionStep(Step):
             f"(timeout={timeout}s)..."
         )
 
-        # Wait for each pod
+        # Wait for all pods at once against one shared listing per tick
+        outcomes = wait_for_pods(cmd, pod_names, harness_ns, timeout, context)
         for pod_name in pod_names:
-            result = wait_for_pod(cmd, pod_name, harness_ns, timeout, context)
+            result = outcomes[pod_name]
             if result == "Succeeded":
                 succeeded += 1
             elif result == "Failed":
@@ -121,5 +122,3 @@ class WaitCompletionStep(Step):
             message=f"All {total} harness pod(s) completed",
             stack_name=stack_name,
         )
-
-    # _wait_for_pod is now provided by kube_helpers.wait_for_pod
@@ -7,7 +7,11 @@ raw harness output into standardised benchmark reports using the bundled
 
 from pathlib import Path
 
-from llmdbenchmark.analysis import run_analysis
+from llmdbenchmark.analysis import (
+    analysis_workers_from_env,
+    run_analysis,
+    run_analysis_many,
+)
 from llmdbenchmark.executor.step import Step, StepResult, Phase
 from llmdbenchmark.executor.context import ExecutionContext
 
@@ -63,13 +67,27 @@ class AnalyzeResultsStep(Step):
         errors: list[str] = []
         analyzed = 0
 
+        pending: list[Path] = []
         for result_subdir in sorted(results_dir.iterdir()):
             if not result_subdir.is_dir():
                 continue
+            if result_subdir.name in context.analyzed_result_dirs:
+                # Already converted by the step 07 treatment pipeline.
+                analyzed += 1
+                continue
+            pending.append(result_subdir)
+
+        if len(pending) > 1 and analysis_workers_from_env() > 1:
+            outcomes = list(run_analysis_many(harness_name, pending, context).values())
+        else:
+            outcomes = []
+            for result_subdir in pending:
+                context.logger.log_info(
+                    f"Analyzing {result_subdir.name}...", emoji="🔍"
+                )
+                outcomes.append(run_analysis(harness_name, result_subdir, context))
 
-            context.logger.log_info(f"Analyzing {result_subdir.name}...", emoji="🔍")
-
-            err = run_analysis(harness_name, result_subdir, context)
+        for err in outcomes:
             if err:
                 errors.append(err)
             else:
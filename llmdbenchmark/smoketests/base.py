@@ -2,30 +2,34 @@
 
 import base64
 import json
+import shlex
 import time
 from pathlib import Path
 
 from llmdbenchmark.executor.command import CommandExecutor
+from llmdbenchmark.executor.config_cache import load_yaml_file
 from llmdbenchmark.executor.context import ExecutionContext
 from llmdbenchmark.smoketests.nok8s import (
     health_check as nok8s_health_check,
     inference_test as nok8s_inference_test,
 )
+from llmdbenchmark.smoketests.probe_agent import ProbeAgent, ProbeRequest
 from llmdbenchmark.smoketests.report import CheckResult, SmoketestReport
 from llmdbenchmark.utilities.endpoint import (
-    _build_overrides,
-    _ephemeral_label_args,
     _normalize_url_prefix,
-    _rand_suffix,
+    build_overrides,
     compute_gateway_path_prefix,
+    ephemeral_label_args,
     find_custom_endpoint,
     find_direct_modelservice_endpoint,
     find_epponly_endpoint,
     find_gateway_endpoint,
     find_kustomize_endpoint,
     find_standalone_endpoint,
+    rand_suffix,
     resolve_direct_service_namespace,
     test_model_serving,
+    validate_model_response,
 )
 
 _RETRYABLE_INDICATORS = ("502", "503", "504", "ServiceUnavailable", "not ready")
@@ -58,8 +62,21 @@ class BaseSmoketest:
 
     Provides health checks, inference testing, pod inspection, and a
     library of assertion helpers that per-scenario validators build on.
+
+    In-cluster HTTP checks run through the phase's shared probe agent
+    (see ``probe_agent.py``) rather than a curl pod per request.
     """
 
+    @staticmethod
+    def _probe_agent(
+        context: ExecutionContext,
+        cmd: CommandExecutor,
+        namespace: str,
+        plan_config: dict | None,
+    ) -> ProbeAgent:
+        """The phase's probe pod for *namespace*, started on first use."""
+        return context.probe_agents.agent(cmd, namespace, plan_config, context.logger)
+
     @staticmethod
     def _gateway_path_prefix_for_stack(
         plan_config: dict,
@@ -184,7 +201,7 @@ class BaseSmoketest:
             return nok8s_health_check(context, stack_path)
         cmd = context.require_cmd()
         namespace = context.require_namespace()
-        plan_config = _load_config(stack_path)
+        plan_config = _load_config(stack_path, context)
 
         model_name = _nested_get(plan_config, "model", "name") or ""
         model_id_label = (
@@ -463,6 +480,7 @@ class BaseSmoketest:
             f'Testing service/gateway "{service_ip}" (port {gateway_port})'
             f"{' [prefix=' + url_path_prefix + ']' if url_path_prefix else ''}..."
         )
+        agent = self._probe_agent(context, cmd, namespace, plan_config)
         test_result = test_model_serving(
             cmd,
             namespace,
@@ -472,6 +490,7 @@ class BaseSmoketest:
             plan_config,
             max_retries=1,
             url_path_prefix=url_path_prefix,
+            agent=agent,
         )
         if test_result:
             report.add(
@@ -540,23 +559,30 @@ class BaseSmoketest:
                 model_name,
                 plan_config,
                 max_retries=1,
+                agent=agent,
             )
         elif (
             pod_ips_result and pod_ips_result.success and pod_ips_result.stdout.strip()
         ):
             pod_ips = pod_ips_result.stdout.strip().split()
-            for i, pod_ip in enumerate(pod_ips, 1):
-                context.logger.log_info(
-                    f"Testing pod {i}/{len(pod_ips)} at {pod_ip}:{inference_port}..."
-                )
-                test_result = test_model_serving(
-                    cmd,
-                    namespace,
-                    pod_ip,
-                    inference_port,
-                    model_name,
-                    plan_config,
-                )
+            context.logger.log_info(
+                f"Testing {len(pod_ips)} pod(s) on port {inference_port}..."
+            )
+            first_pass = self._probe_pod_ips(agent, pod_ips, inference_port, model_name)
+            for pod_ip in pod_ips:
+                test_result = first_pass[pod_ip]
+                if test_result:
+                    # Re-probe with the usual retry budget, which rides out
+                    # pods that are still warming up.
+                    test_result = test_model_serving(
+                        cmd,
+                        namespace,
+                        pod_ip,
+                        inference_port,
+                        model_name,
+                        plan_config,
+                        agent=agent,
+                    )
                 if test_result:
                     if service_test_passed:
                         context.logger.log_warning(
@@ -590,6 +616,30 @@ class BaseSmoketest:
 
         return report
 
+    @staticmethod
+    def _probe_pod_ips(
+        agent: ProbeAgent,
+        pod_ips: list[str],
+        port: str | int,
+        expected_model: str,
+    ) -> dict[str, str | None]:
+        """Query ``/v1/models`` on every pod at once; error (or None) per IP."""
+        protocol = "https" if str(port) == "443" else "http"
+        requests = [
+            ProbeRequest(f"{protocol}://{ip}:{port}/v1/models") for ip in pod_ips
+        ]
+        errors: dict[str, str | None] = {}
+        for pod_ip, probe in zip(pod_ips, agent.run(requests)):
+            if not probe.status:
+                errors[pod_ip] = f"Curl to {pod_ip}:{port} failed: {probe.error[:200]}"
+            elif expected_model and probe.body.strip():
+                errors[pod_ip] = validate_model_response(
+                    probe.body.strip(), expected_model, pod_ip, port
+                )
+            else:
+                errors[pod_ip] = None
+        return errors
+
     def run_inference_test(
         self,
         context: ExecutionContext,
@@ -602,7 +652,7 @@ class BaseSmoketest:
             return nok8s_inference_test(context, stack_path)
         cmd = context.require_cmd()
         namespace = context.require_namespace()
-        plan_config = _load_config(stack_path)
+        plan_config = _load_config(stack_path, context)
 
         model_name = _nested_get(plan_config, "model", "name") or ""
 
@@ -1682,11 +1732,10 @@ class BaseSmoketest:
         protocol = "https" if str(port) == "443" else "http"
         prefix = _normalize_url_prefix(url_path_prefix)
         url = f"{protocol}://{host}:{port}{prefix}/health"
-        curl_image = "quay.io/fedora/fedora"
-        override_args = _build_overrides(plan_config)
+        agent = self._probe_agent(context, cmd, namespace, plan_config)
 
         context.logger.log_info(
-            f"Health check: verifying vLLM is listening at {host}:{port}/health... Using curl image: {curl_image}"
+            f"Health check: verifying vLLM is listening at {host}:{port}/health..."
         )
         start = time.time()
         attempt = 0
@@ -1700,31 +1749,12 @@ class BaseSmoketest:
                 )
 
             attempt += 1
-            pod_name = f"healthcheck-{_rand_suffix()}"
-            curl_cmd = f"'curl -sk --max-time 10 -o /dev/null -w %{{http_code}} {url}'"
-
-            kubectl_args = (
-                [
-                    "run",
-                    pod_name,
-                    "--rm",
-                    "--attach",
-                    "--quiet",
-                    "--restart=Never",
-                    "--namespace",
-                    namespace,
-                    f"--image={curl_image}",
-                ]
-                + _ephemeral_label_args()
-                + override_args
-                + ["--command", "--", "sh", "-c", curl_cmd]
-            )
-            result = cmd.kube(*kubectl_args, check=False)
+            probe = agent.get(url, timeout=10)
 
-            if result.dry_run:
+            if probe.dry_run:
                 return None
 
-            status_code = result.stdout.strip() if result.success else ""
+            status_code = str(probe.status) if probe.status else ""
 
             if status_code == "200":
                 context.logger.log_info(
@@ -1825,6 +1855,7 @@ class BaseSmoketest:
                 plan_config,
                 max_retries=1,
                 url_path_prefix=url_path_prefix,
+                agent=self._probe_agent(context, cmd, namespace, plan_config),
             )
 
             if cmd.dry_run:
@@ -1915,6 +1946,7 @@ class BaseSmoketest:
                 route_port,
                 model_name,
                 plan_config,
+                agent=self._probe_agent(context, cmd, namespace, plan_config),
             )
             if test_result:
                 if service_test_passed:
@@ -1980,6 +2012,7 @@ class BaseSmoketest:
         retry_max_interval: int | None = None,
     ) -> dict:
         url = f"{base_url}/v1/completions"
+        agent = self._probe_agent(context, cmd, namespace, plan_config)
         payload = {
             "model": model_name,
             "prompt": "The capital of the United States is",
@@ -2009,7 +2042,9 @@ class BaseSmoketest:
         )
 
         for attempt in range(1, max_retries + 1):
-            stdout, err = self._curl_post(cmd, namespace, url, payload, plan_config)
+            stdout, err = self._curl_post(
+                cmd, namespace, url, payload, plan_config, agent=agent
+            )
 
             if cmd.dry_run:
                 return {
@@ -2139,6 +2174,7 @@ class BaseSmoketest:
         retry_max_interval: int | None = None,
     ) -> dict:
         url = f"{base_url}/v1/chat/completions"
+        agent = self._probe_agent(context, cmd, namespace, plan_config)
         payload = {
             "model": model_name,
             "messages": [
@@ -2170,7 +2206,9 @@ class BaseSmoketest:
         )
 
         for attempt in range(1, max_retries + 1):
-            stdout, err = self._curl_post(cmd, namespace, url, payload, plan_config)
+            stdout, err = self._curl_post(
+                cmd, namespace, url, payload, plan_config, agent=agent
+            )
 
             if err:
                 if _is_retryable(err) and attempt < max_retries:
@@ -2275,10 +2313,25 @@ class BaseSmoketest:
         payload: dict,
         plan_config: dict | None,
         timeout_seconds: int = 120,
+        agent: ProbeAgent | None = None,
     ) -> tuple[str, str | None]:
-        override_args = _build_overrides(plan_config)
+        if agent is not None:
+            probe = agent.post(url, payload, timeout=timeout_seconds)
+            if probe.dry_run:
+                return "", None
+            if not probe.status:
+                return "", f"Curl to {url} failed: {probe.error[:300]}"
+            body = probe.body.strip()
+            if not probe.ok:
+                body_preview = body[:200] or "(empty body)"
+                return body, (
+                    f"Curl POST {url} returned HTTP {probe.status}: {body_preview}"
+                )
+            return body, None
+
+        override_args = build_overrides(plan_config)
         curl_image = "quay.io/fedora/fedora"
-        pod_name = f"inference-test-{_rand_suffix()}"
+        pod_name = f"inference-test-{rand_suffix()}"
         payload_json = json.dumps(payload)
         payload_b64 = base64.b64encode(payload_json.encode()).decode()
 
@@ -2286,13 +2339,13 @@ class BaseSmoketest:
         # status so an empty body is still diagnosable (empty + 404 vs
         # empty + 502 vs empty + 200 look identical to `-s` alone).
         # We split the status off in Python before returning the body.
-        curl_cmd = (
-            f"'echo {payload_b64} | base64 -d | "
-            f"curl -sk --max-time {timeout_seconds} "
+        curl_cmd = shlex.quote(
+            f"echo {payload_b64} | base64 -d | "
+            f"curl -sk --max-time {int(timeout_seconds)} "
             f'-w "\\n%{{http_code}}" '
-            f"-X POST {url} "
+            f"-X POST {shlex.quote(url)} "
             f'-H "Content-Type: application/json" '
-            f"-d @- 2>&1'"
+            f"-d @- 2>&1"
         )
 
         kubectl_args = (
@@ -2307,7 +2360,7 @@ class BaseSmoketest:
                 namespace,
                 f"--image={curl_image}",
             ]
-            + _ephemeral_label_args()
+            + ephemeral_label_args()
             + override_args
             + ["--command", "--", "sh", "-c", curl_cmd]
         )
@@ -2427,12 +2480,14 @@ def _nested_get(d: dict, *keys: str):
     return d
 
 
-def _load_config(stack_path: Path) -> dict:
-    """Load the rendered config.yaml from a stack directory."""
-    import yaml
+def _load_config(stack_path: Path, context: ExecutionContext | None = None) -> dict:
+    """Load the rendered config.yaml from a stack directory.
 
+    Reads go through *context*'s config cache when one is given.
+    """
     config_file = stack_path / "config.yaml"
-    if config_file.exists():
-        with open(config_file) as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    if not config_file.exists():
+        return {}
+    if context is not None:
+        return context.config_cache.load(config_file) or {}
+    return load_yaml_file(config_file) or {}
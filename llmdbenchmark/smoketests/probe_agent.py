@@ -0,0 +1,378 @@
+"""Long-lived in-cluster probe pod for smoketest HTTP checks.
+
+Every smoketest HTTP check used to launch its own ``kubectl run --rm
+--attach`` curl pod, paying pod scheduling, image-pull checks and attach
+latency (5-20s) per probe.  A :class:`ProbeAgent` starts one idle pod per
+namespace and reuses it for every check of the phase: a batch of
+:class:`ProbeRequest` objects becomes one ``kubectl exec`` that runs the
+curls concurrently inside the pod and prints one JSON line per request
+(status, base64 body, latency, curl error).
+
+Agents are held by a :class:`ProbeAgentPool` on the execution context and
+deleted when the smoketest phase ends.  The pod only sleeps for
+``AGENT_LIFETIME_SECONDS``, so an agent close to that age -- or one whose
+exec produced no output at all (pod gone or exited) -- is replaced by a
+fresh pod before the batch runs again.  If the agent pod cannot be started
+(quota, admission policy, image pull), each batch falls back to a single
+one-shot pod running the same script, so checks still run -- just slower.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import shlex
+import threading
+import time
+from dataclasses import dataclass
+
+from llmdbenchmark.executor.command import CommandExecutor
+from llmdbenchmark.utilities.endpoint import (
+    EPHEMERAL_POD_LABEL,
+    build_overrides,
+    ephemeral_label_args,
+    rand_suffix,
+)
+
+PROBE_IMAGE = "quay.io/fedora/fedora"
+PROBE_AGENT_LABEL = "llm-d-benchmark/probe-agent=true"
+
+#: How long an idle agent pod lives if phase-end cleanup never runs.
+AGENT_LIFETIME_SECONDS = 3600
+#: Agents older than the lifetime minus this margin are replaced before use.
+AGENT_RENEW_MARGIN_SECONDS = 300
+AGENT_READY_TIMEOUT = 120
+#: Curls run at once inside the pod for one batch.
+MAX_CONCURRENT_PROBES = 16
+
+
+@dataclass(frozen=True)
+class ProbeRequest:
+    """One HTTP request to issue from inside the cluster."""
+
+    url: str
+    method: str = "GET"
+    payload: dict | None = None
+    timeout: int = 30
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one :class:`ProbeRequest`.
+
+    ``status`` is 0 when no HTTP response arrived; ``error`` then carries
+    curl's message (e.g. ``Connection refused``).
+    """
+
+    url: str
+    status: int = 0
+    body: str = ""
+    latency_ms: float = 0.0
+    error: str = ""
+    dry_run: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+def build_probe_script(requests: list[ProbeRequest]) -> str:
+    """Shell script that runs *requests* concurrently and prints JSON lines.
+
+    Every value taken from a request is shell-quoted for the pod's shell,
+    and callers quote the whole script again for the local shell that runs
+    ``kubectl``.  Payloads travel base64-encoded so the script stays on one
+    line.  Every entry of ``lines`` carries its own terminator (``;`` or
+    ``&``).
+    """
+    lines = [
+        "d=$(mktemp -d);",
+        "probe() { i=$1; shift; : > $d/b$i; curl -sSk -o $d/b$i "
+        '-w "%{http_code} %{time_total}" "$@" > $d/s$i 2> $d/e$i; };',
+    ]
+    for index, request in enumerate(requests):
+        args = [f"--max-time {int(request.timeout)}"]
+        if request.method != "GET" or request.payload is not None:
+            args.append(f"-X {shlex.quote(request.method)}")
+        if request.payload is not None:
+            encoded = base64.b64encode(json.dumps(request.payload).encode()).decode()
+            lines.append(f"echo {encoded} | base64 -d > $d/p{index};")
+            args += [
+                '-H "Content-Type: application/json"',
+                f"--data-binary @$d/p{index}",
+            ]
+        lines.append(f"probe {index} {' '.join(args)} {shlex.quote(request.url)} &")
+        if (index + 1) % MAX_CONCURRENT_PROBES == 0:
+            lines.append("wait;")
+    lines += [
+        "wait;",
+        f"for i in $(seq 0 {len(requests) - 1}); do",
+        "read code secs < $d/s$i;",
+        'printf "{\\"id\\":%s,\\"status\\":\\"%s\\",\\"seconds\\":\\"%s\\",'
+        '\\"body\\":\\"%s\\",\\"error\\":\\"%s\\"}\\n" $i "${code:-0}" "${secs:-0}" '
+        '"$(base64 -w0 $d/b$i)" "$(base64 -w0 $d/e$i)";',
+        "done;",
+        "rm -rf $d",
+    ]
+    return " ".join(lines)
+
+
+def _b64(text: str) -> str:
+    return base64.b64decode(text or "").decode("utf-8", errors="replace")
+
+
+def parse_probe_output(stdout: str, requests: list[ProbeRequest]) -> list[ProbeResult]:
+    """Turn the script's JSON lines back into one result per request.
+
+    Requests with no line in *stdout* (the exec died part-way) come back
+    with ``status=0`` and an error, so callers always get a full list.
+    """
+    by_id: dict[int, dict] = {}
+    for line in stdout.splitlines():
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            record = json.loads(line)
+            by_id[int(record["id"])] = record
+        except (ValueError, KeyError, TypeError):
+            continue
+
+    results = []
+    for index, request in enumerate(requests):
+        record = by_id.get(index)
+        if record is None:
+            results.append(ProbeResult(request.url, error="no result from probe pod"))
+            continue
+        try:
+            status = int(record.get("status") or 0)
+            seconds = float(record.get("seconds") or 0)
+        except ValueError:
+            status, seconds = 0, 0.0
+        results.append(
+            ProbeResult(
+                url=request.url,
+                status=status,
+                body=_b64(record.get("body", "")),
+                latency_ms=seconds * 1000,
+                error=_b64(record.get("error", "")).strip(),
+            )
+        )
+    return results
+
+
+class ProbeAgent:
+    """An idle curl pod in *namespace* that runs batches of HTTP probes."""
+
+    def __init__(
+        self,
+        cmd: CommandExecutor,
+        namespace: str,
+        plan_config: dict | None = None,
+        logger=None,
+    ):
+        self.cmd = cmd
+        self.namespace = namespace
+        self.logger = logger
+        self.pod_name = f"probe-agent-{rand_suffix()}"
+        self._override_args = build_overrides(plan_config)
+        self._started = False
+        self._available = False
+        self._started_at = 0.0
+        self._lock = threading.Lock()
+
+    def _log(self, msg: str) -> None:
+        if self.logger:
+            self.logger.log_info(msg)
+
+    def start(self) -> bool:
+        """Create the pod and wait for it to be Ready; True when usable."""
+        with self._lock:
+            if self._started:
+                return self._available
+            self._started = True
+            created = self.cmd.kube(
+                "run",
+                self.pod_name,
+                "--restart=Never",
+                "--namespace",
+                self.namespace,
+                f"--image={PROBE_IMAGE}",
+                f"--labels={EPHEMERAL_POD_LABEL},{PROBE_AGENT_LABEL}",
+                *self._override_args,
+                "--command",
+                "--",
+                "sleep",
+                str(AGENT_LIFETIME_SECONDS),
+                check=False,
+            )
+            if created.dry_run:
+                self._available = True
+                self._started_at = time.monotonic()
+                return True
+            ready = (
+                created.success
+                and self.cmd.kube(
+                    "wait",
+                    "--for=condition=Ready",
+                    f"pod/{self.pod_name}",
+                    "--namespace",
+                    self.namespace,
+                    f"--timeout={AGENT_READY_TIMEOUT}s",
+                    check=False,
+                ).success
+            )
+            if not ready:
+                detail = (created.stderr or created.stdout or "not Ready")[:200]
+                if self.logger:
+                    self.logger.log_warning(
+                        f"Probe agent in ns/{self.namespace} unavailable "
+                        f"({detail.strip()}); using one-shot curl pods"
+                    )
+                self._delete()
+                return False
+            self._available = True
+            self._started_at = time.monotonic()
+            self._log(f"Probe agent {self.pod_name} ready in ns/{self.namespace}")
+            return True
+
+    def _expired(self) -> bool:
+        age = time.monotonic() - self._started_at
+        return age > AGENT_LIFETIME_SECONDS - AGENT_RENEW_MARGIN_SECONDS
+
+    def _renew(self, pod_name: str, reason: str) -> None:
+        """Replace the agent pod *pod_name* with a fresh one on next use.
+
+        A no-op when another thread already replaced it.
+        """
+        with self._lock:
+            if self.pod_name != pod_name or not self._started:
+                return
+            self._log(
+                f"Replacing probe agent {pod_name} in ns/{self.namespace} ({reason})"
+            )
+            self._delete()
+            self.pod_name = f"probe-agent-{rand_suffix()}"
+            self._started = self._available = False
+
+    def _exec(self, pod_name: str, script: str):
+        return self.cmd.kube(
+            "exec",
+            pod_name,
+            "--namespace",
+            self.namespace,
+            "--",
+            "sh",
+            "-c",
+            script,
+            check=False,
+        )
+
+    def run(self, requests: list[ProbeRequest]) -> list[ProbeResult]:
+        """Issue *requests* concurrently from inside the cluster."""
+        if not requests:
+            return []
+        script = shlex.quote(build_probe_script(requests))
+        if self.start() and self._expired():
+            self._renew(self.pod_name, "near the end of its lifetime")
+        if self.start():
+            pod_name = self.pod_name
+            result = self._exec(pod_name, script)
+            if not result.dry_run and not result.success and "{" not in result.stdout:
+                # Nothing ran: the pod is gone or its sleep ended.
+                self._renew(pod_name, "exec failed")
+                if self.start():
+                    result = self._exec(self.pod_name, script)
+                else:
+                    result = self._run_once(script)
+        else:
+            result = self._run_once(script)
+        if result.dry_run:
+            return [ProbeResult(r.url, dry_run=True) for r in requests]
+        results = parse_probe_output(result.stdout, requests)
+        if not result.success:
+            detail = (result.stderr or result.stdout)[:300]
+            for probe in results:
+                if not probe.status and not probe.error:
+                    probe.error = detail
+        return results
+
+    def _run_once(self, script: str):
+        """Run *script* in a one-shot pod (the agent is unavailable)."""
+        return self.cmd.kube(
+            "run",
+            f"probe-{rand_suffix()}",
+            "--rm",
+            "--attach",
+            "--quiet",
+            "--restart=Never",
+            "--namespace",
+            self.namespace,
+            f"--image={PROBE_IMAGE}",
+            *ephemeral_label_args(),
+            *self._override_args,
+            "--command",
+            "--",
+            "sh",
+            "-c",
+            script,
+            check=False,
+        )
+
+    def get(self, url: str, timeout: int = 30) -> ProbeResult:
+        return self.run([ProbeRequest(url, timeout=timeout)])[0]
+
+    def post(self, url: str, payload: dict, timeout: int = 120) -> ProbeResult:
+        return self.run([ProbeRequest(url, "POST", payload, timeout)])[0]
+
+    def _delete(self) -> None:
+        self.cmd.kube(
+            "delete",
+            "pod",
+            self.pod_name,
+            "--namespace",
+            self.namespace,
+            "--ignore-not-found=true",
+            "--wait=false",
+            "--grace-period=0",
+            "--force",
+            check=False,
+        )
+
+    def close(self) -> None:
+        """Delete the agent pod, if it was ever created."""
+        with self._lock:
+            if self._started:
+                self._delete()
+            self._started = self._available = False
+
+
+class ProbeAgentPool:
+    """One :class:`ProbeAgent` per namespace (and pod overrides) per phase."""
+
+    def __init__(self) -> None:
+        self._agents: dict[tuple[str, tuple[str, ...]], ProbeAgent] = {}
+        self._lock = threading.Lock()
+
+    def agent(
+        self,
+        cmd: CommandExecutor,
+        namespace: str,
+        plan_config: dict | None = None,
+        logger=None,
+    ) -> ProbeAgent:
+        """Return this namespace's agent; its pod starts on first use."""
+        key = (namespace, tuple(build_overrides(plan_config)))
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = ProbeAgent(cmd, namespace, plan_config, logger)
+                self._agents[key] = agent
+            return agent
+
+    def close_all(self) -> None:
+        """Delete every agent pod started during the phase."""
+        with self._lock:
+            agents, self._agents = list(self._agents.values()), {}
+        for agent in agents:
+            agent.close()
@@ -19,7 +19,7 @@ class CpuValidator(BaseSmoketest):
         report = SmoketestReport()
         cmd = context.require_cmd()
         namespace = context.require_namespace()
-        config = _load_config(stack_path)
+        config = _load_config(stack_path, context)
 
         if context.dry_run:
             report.add(
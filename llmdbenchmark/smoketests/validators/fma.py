@@ -147,7 +147,7 @@ class FmaValidator(BaseSmoketest):
         report = SmoketestReport()
         cmd = context.require_cmd()
         namespace = context.require_namespace()
-        plan_config = _load_config(stack_path)
+        plan_config = _load_config(stack_path, context)
 
         model_name = _nested_get(plan_config, "model", "name") or ""
         port = str(_nested_get(plan_config, "vllmCommon", "inferencePort") or "8000")
@@ -269,7 +269,7 @@ class FmaValidator(BaseSmoketest):
         report = SmoketestReport()
         cmd = context.require_cmd()
         namespace = context.require_namespace()
-        plan_config = _load_config(stack_path)
+        plan_config = _load_config(stack_path, context)
 
         model_name = _nested_get(plan_config, "model", "name") or ""
         port = str(_nested_get(plan_config, "vllmCommon", "inferencePort") or "8000")
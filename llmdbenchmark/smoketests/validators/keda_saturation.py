@@ -51,7 +51,7 @@ class EppKedaSaturationSmoketestMixin:
           4. Generated HPA targets have resolved from <unknown> to real numbers.
           5. End-state snapshot of ScaledObject and HPA.
         """
-        config = _load_config(stack_path)
+        config = _load_config(stack_path, context)
         if not (_nested_get(config, "eppKedaSaturation", "enabled") or False):
             return
 
@@ -91,7 +91,7 @@ class WvaSmoketestMixin:
              resource can be queried) so the smoketest log captures the final
              cluster state without needing a follow-up ``oc describe``.
         """
-        config = _load_config(stack_path)
+        config = _load_config(stack_path, context)
         if not (_nested_get(config, "wva", "enabled") or False):
             return
 
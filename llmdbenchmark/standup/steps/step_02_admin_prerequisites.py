@@ -1015,6 +1015,5 @@ class AdminPrerequisitesStep(Step):
         if plan_dir:
             config_file = plan_dir / "config.yaml"
             if config_file.exists():
-                with open(config_file, encoding="utf-8") as f:
-                    return yaml.safe_load(f)
+                return self._read_config(config_file)
         return {}
@@ -7,9 +7,9 @@ from llmdbenchmark.executor.step import Step, StepResult, Phase
 from llmdbenchmark.executor.context import ExecutionContext
 from llmdbenchmark.executor.command import CommandExecutor
 from llmdbenchmark.utilities.endpoint import (
-    _rand_suffix,
-    _build_overrides,
-    _ephemeral_label_args,
+    rand_suffix,
+    build_overrides,
+    ephemeral_label_args,
     cleanup_ephemeral_pods,
     find_standalone_endpoint,
     find_gateway_endpoint,
@@ -307,7 +307,7 @@ class SmoketestStep(Step):
         protocol = "https" if str(port) == "443" else "http"
         url = f"{protocol}://{host}:{port}/health"
         curl_image = "quay.io/fedora/fedora"
-        override_args = _build_overrides(plan_config)
+        override_args = build_overrides(plan_config)
 
         context.logger.log_info(
             f"Health check: verifying vLLM is listening at {host}:{port}/health..."
@@ -324,7 +324,7 @@ class SmoketestStep(Step):
                 )
 
             attempt += 1
-            pod_name = f"healthcheck-{_rand_suffix()}"
+            pod_name = f"healthcheck-{rand_suffix()}"
             curl_cmd = f"'curl -sk --max-time 10 -o /dev/null -w %{{http_code}} {url}'"
 
             kubectl_args = (
@@ -339,7 +339,7 @@ class SmoketestStep(Step):
                     namespace,
                     f"--image={curl_image}",
                 ]
-                + _ephemeral_label_args()
+                + ephemeral_label_args()
                 + override_args
                 + ["--command", "--", "sh", "-c", curl_cmd]
             )
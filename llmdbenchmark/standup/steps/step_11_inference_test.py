@@ -22,9 +22,9 @@ from llmdbenchmark.executor.step import Step, StepResult, Phase
 from llmdbenchmark.executor.context import ExecutionContext
 from llmdbenchmark.executor.command import CommandExecutor
 from llmdbenchmark.utilities.endpoint import (
-    _rand_suffix,
-    _build_overrides,
-    _ephemeral_label_args,
+    rand_suffix,
+    build_overrides,
+    ephemeral_label_args,
     find_standalone_endpoint,
     find_gateway_endpoint,
     find_direct_modelservice_endpoint,
@@ -456,9 +456,9 @@ class InferenceTestStep(Step):
         The JSON payload is base64-encoded and decoded inside the pod to
         avoid shell quoting issues when passing through kubectl to sh -c.
         """
-        override_args = _build_overrides(plan_config)
+        override_args = build_overrides(plan_config)
         curl_image = "quay.io/fedora/fedora"
-        pod_name = f"inference-test-{_rand_suffix()}"
+        pod_name = f"inference-test-{rand_suffix()}"
         payload_json = json.dumps(payload)
         payload_b64 = base64.b64encode(payload_json.encode()).decode()
 
@@ -484,7 +484,7 @@ class InferenceTestStep(Step):
                 namespace,
                 f"--image={curl_image}",
             ]
-            + _ephemeral_label_args()
+            + ephemeral_label_args()
             + override_args
             + ["--command", "--", "sh", "-c", curl_cmd]
         )
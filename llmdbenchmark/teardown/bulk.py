@@ -0,0 +1,299 @@
+"""Bulk teardown engine: one listing per namespace, batched deletes, one watcher.
+
+Step 03 used to run one ``get`` per namespace and resource kind, then one
+``delete`` per resource, each blocking on that resource's finalizers.  In
+multi-model scenarios that is hundreds of round trips done back to back.
+Here the work is split into three phases:
+
+1. **Plan** -- one multi-kind ``get -o json`` per namespace (namespaces listed
+   concurrently).  Kinds the cluster does not serve are dropped from the
+   request and it is retried, so no per-kind probing is needed.  The caller
+   filters the listed objects into a :class:`DeletionPlan`.
+2. **Delete** -- one ``delete --wait=false`` per namespace and kind with the
+   planned names (chunked at :data:`DELETE_BATCH`), run with bounded
+   parallelism.  Controllers (:data:`CONTROLLER_KINDS`) go first, so they
+   cannot recreate pods deleted alongside them; everything else follows
+   once their deletes have returned.  Pods are force-deleted as before.
+3. **Wait** -- a single watcher polls every namespace that still has pending
+   objects (again one ``get`` per namespace) until they are gone or the
+   timeout passes, and reports what is stuck and on which finalizers.
+
+Listing is a read, so it also runs in dry-run mode, which lets a dry run
+print the exact plan that a real teardown would execute.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence, TypeVar
+
+#: Upper bound on names passed to a single ``kubectl delete``.
+DELETE_BATCH = 100
+
+#: Kinds that (re)create pods, deleted in a phase before all other kinds.
+CONTROLLER_KINDS = frozenset(
+    {"daemonset", "deployment", "job", "leaderworkerset", "replicaset", "statefulset"}
+)
+
+_UNSUPPORTED_TYPE = re.compile(
+    r"(?:doesn't have a resource type|no matches for kind) \"([^\"]+)\"",
+    re.IGNORECASE,
+)
+_BENIGN_DELETE_ERRORS = (
+    "the server doesn't have a resource type",
+    "not found",
+    "no matches for kind",
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_bounded(fn: Callable[[T], R], items: Iterable[T], parallelism: int) -> list[R]:
+    """Apply *fn* to every item with at most *parallelism* in flight.
+
+    Results come back in input order.  ``parallelism <= 1`` runs inline.
+    """
+    items = list(items)
+    if parallelism <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(parallelism, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+@dataclass(frozen=True)
+class ResourceRef:
+    """A namespaced object, identified the way ``kubectl get -o name`` does."""
+
+    namespace: str
+    kind: str
+    group: str
+    name: str
+
+    @property
+    def type_name(self) -> str:
+        """``kind.group`` (``kind`` for the core group), lower-case."""
+        return f"{self.kind}.{self.group}" if self.group else self.kind
+
+    @property
+    def ref(self) -> str:
+        """``type/name``, e.g. ``deployment.apps/llm-d-decode``."""
+        return f"{self.type_name}/{self.name}"
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any], namespace: str) -> ResourceRef:
+        api_version = item.get("apiVersion", "")
+        group = api_version.split("/", 1)[0] if "/" in api_version else ""
+        metadata = item.get("metadata", {}) or {}
+        return cls(
+            namespace=metadata.get("namespace") or namespace,
+            kind=item.get("kind", "").lower(),
+            group=group,
+            name=metadata.get("name", ""),
+        )
+
+
+@dataclass
+class NamespaceListing:
+    """Result of :func:`list_namespace`."""
+
+    namespace: str
+    items: list[dict[str, Any]] = field(default_factory=list)
+    unsupported: list[str] = field(default_factory=list)
+    error: str = ""
+
+
+def list_namespace(
+    cmd, namespace: str, kinds: Sequence[str], unsupported: set[str] | None = None
+) -> NamespaceListing:
+    """List every object of *kinds* in *namespace* with one ``get -o json``.
+
+    A kind the cluster does not serve fails the whole request; it is dropped
+    and the request retried.  Pass the same *unsupported* set to every call
+    so later namespaces skip kinds already known to be missing.
+    """
+    listing = NamespaceListing(namespace=namespace)
+    known_missing = unsupported if unsupported is not None else set()
+    kinds = [k for k in kinds if k and k not in known_missing]
+    while kinds:
+        result = cmd.kube(
+            "get",
+            ",".join(kinds),
+            "--namespace",
+            namespace,
+            "-o",
+            "json",
+            "--ignore-not-found",
+            check=False,
+            force=True,
+        )
+        if result.success:
+            try:
+                payload = json.loads(result.stdout) if result.stdout.strip() else {}
+            except ValueError as exc:
+                listing.error = f"unparseable listing: {exc}"
+                return listing
+            listing.items = [i for i in payload.get("items", []) or [] if i]
+            return listing
+        match = _UNSUPPORTED_TYPE.search(result.stderr or "")
+        if not match or match.group(1) not in kinds:
+            listing.error = (result.stderr or "").strip() or "listing failed"
+            return listing
+        kinds.remove(match.group(1))
+        known_missing.add(match.group(1))
+        listing.unsupported.append(match.group(1))
+    return listing
+
+
+@dataclass
+class DeleteBatch:
+    """One ``kubectl delete`` for up to :data:`DELETE_BATCH` objects of a type."""
+
+    namespace: str
+    type_name: str
+    names: list[str]
+
+    @property
+    def force(self) -> bool:
+        # Force-delete pods to avoid hanging on Terminating pods.
+        return self.type_name == "pod"
+
+    @property
+    def phase(self) -> int:
+        """0 for controllers, 1 for everything they could otherwise recreate."""
+        return 0 if self.type_name.split(".", 1)[0] in CONTROLLER_KINDS else 1
+
+    def args(self) -> list[str]:
+        args = [
+            "delete",
+            "--namespace",
+            self.namespace,
+            "--ignore-not-found=true",
+            "--wait=false",
+        ]
+        if self.force:
+            args += ["--grace-period=0", "--force"]
+        return args + [self.type_name, *self.names]
+
+
+@dataclass
+class DeletionPlan:
+    """Everything a teardown will delete, grouped per namespace and type."""
+
+    resources: list[ResourceRef] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def add(self, ref: ResourceRef) -> None:
+        if ref.name and ref not in self.resources:
+            self.resources.append(ref)
+
+    def grouped(self) -> dict[str, dict[str, list[str]]]:
+        """``{namespace: {type_name: [names]}}`` in insertion order."""
+        groups: dict[str, dict[str, list[str]]] = {}
+        for ref in self.resources:
+            groups.setdefault(ref.namespace, {}).setdefault(ref.type_name, []).append(
+                ref.name
+            )
+        return groups
+
+    def batches(self, batch_size: int = DELETE_BATCH) -> list[DeleteBatch]:
+        out = []
+        for namespace, types in self.grouped().items():
+            for type_name, names in types.items():
+                for i in range(0, len(names), max(1, batch_size)):
+                    out.append(
+                        DeleteBatch(namespace, type_name, names[i : i + batch_size])
+                    )
+        return out
+
+    def describe(self) -> list[str]:
+        """Human-readable plan, one line per namespace and type."""
+        lines = []
+        for namespace, types in self.grouped().items():
+            count = sum(len(n) for n in types.values())
+            lines.append(f'Namespace "{namespace}": {count} resource(s)')
+            for type_name, names in types.items():
+                lines.append(f"  {type_name} ({len(names)}): {', '.join(names)}")
+        return lines
+
+
+def delete_batches(
+    cmd, batches: Sequence[DeleteBatch], parallelism: int, logger: Any = None
+) -> list[str]:
+    """Issue every batch without waiting on finalizers; return the errors.
+
+    Batches run in :attr:`DeleteBatch.phase` order, with up to *parallelism*
+    in flight within a phase.
+    """
+
+    def _delete(batch: DeleteBatch) -> str | None:
+        if logger is not None:
+            logger.log_info(
+                f"  Deleting {len(batch.names)} {batch.type_name} in {batch.namespace}",
+                emoji="🗑️",
+            )
+        result = cmd.kube(*batch.args(), check=False)
+        if result.success:
+            return None
+        stderr = result.stderr or ""
+        if any(s in stderr.lower() for s in _BENIGN_DELETE_ERRORS):
+            return None
+        message = f"Failed to delete {batch.type_name} in {batch.namespace}: {stderr}"
+        if logger is not None:
+            logger.log_error(message)
+        return message
+
+    errors: list[str] = []
+    for phase in sorted({batch.phase for batch in batches}):
+        phase_batches = [batch for batch in batches if batch.phase == phase]
+        errors.extend(e for e in run_bounded(_delete, phase_batches, parallelism) if e)
+    return errors
+
+
+def wait_for_deletion(
+    cmd,
+    resources: Sequence[ResourceRef],
+    timeout: float,
+    interval: float = 5.0,
+    logger: Any = None,
+) -> dict[ResourceRef, list[str]]:
+    """Watch *resources* until they are all gone or *timeout* seconds pass.
+
+    One poll is one ``get`` per namespace that still has pending objects.
+    Returns whatever is still present, mapped to its finalizers.
+    """
+    pending = set(resources)
+    stuck: dict[ResourceRef, list[str]] = {}
+    deadline = time.monotonic() + timeout
+    while pending:
+        stuck = {}
+        by_ns: dict[str, set[str]] = {}
+        for ref in pending:
+            by_ns.setdefault(ref.namespace, set()).add(ref.type_name)
+        for namespace, types in sorted(by_ns.items()):
+            listing = list_namespace(cmd, namespace, sorted(types))
+            if listing.error:
+                # Can't tell; keep what we were waiting for in this namespace.
+                stuck.update({r: [] for r in pending if r.namespace == namespace})
+                continue
+            for item in listing.items:
+                ref = ResourceRef.from_item(item, namespace)
+                if ref in pending:
+                    stuck[ref] = list(
+                        (item.get("metadata", {}) or {}).get("finalizers") or []
+                    )
+        pending = set(stuck)
+        if not pending or time.monotonic() >= deadline:
+            break
+        if logger is not None:
+            logger.log_info(
+                f"  Waiting for {len(pending)} resource(s) to finish deleting..."
+            )
+        time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
+    return stuck
@@ -82,8 +82,7 @@ class TeardownPreflightStep(Step):
             if not config_file.exists():
                 continue
             try:
-                with open(config_file, encoding="utf-8") as f:
-                    cfg = yaml.safe_load(f)
+                cfg = self._read_config(config_file)
                 if cfg:
                     return cfg
             except (OSError, yaml.YAMLError):
@@ -14,6 +14,13 @@ from llmdbenchmark.standup.keda_saturation import (
     unique_epp_keda_saturation_namespaces,
 )
 from llmdbenchmark.standup.wva import _find_yaml, _has_yaml_content
+from llmdbenchmark.teardown.bulk import (
+    DeletionPlan,
+    ResourceRef,
+    delete_batches,
+    list_namespace,
+    run_bounded,
+)
 from llmdbenchmark.utilities.kube_helpers import (
     force_remove_finalizers_by_selector,
     wait_for_pods_deleted,
@@ -67,24 +74,18 @@ class UninstallHelmStep(Step):
             return False
         return not self._any_stack_has_wva(context)
 
-    @staticmethod
-    def _any_stack_has_wva(context: ExecutionContext) -> bool:
+    def _any_stack_has_wva(self, context: ExecutionContext) -> bool:
         """Return True if any rendered stack has wva.enabled: true."""
         for stack_path in context.rendered_stacks or []:
-            cfg_file = stack_path / "config.yaml"
-            if not cfg_file.exists():
-                continue
             try:
-                with open(cfg_file, encoding="utf-8") as fh:
-                    cfg = yaml.safe_load(fh) or {}
+                cfg = self._load_stack_config(stack_path, copy=False)
             except (OSError, yaml.YAMLError):
                 continue
             if (cfg.get("wva", {}) or {}).get("enabled", False):
                 return True
         return False
 
-    @staticmethod
-    def _fma_guide_name(context: ExecutionContext) -> str:
+    def _fma_guide_name(self, context: ExecutionContext) -> str:
         """Return the guide name if any rendered stack is a kustomize FMA guide,
         else "".
 
@@ -95,12 +96,8 @@ class UninstallHelmStep(Step):
         selector in ``_delete_fma_crs`` stays correct per variant.
         """
         for stack_path in context.rendered_stacks or []:
-            cfg_file = stack_path / "config.yaml"
-            if not cfg_file.exists():
-                continue
             try:
-                with open(cfg_file, encoding="utf-8") as fh:
-                    cfg = yaml.safe_load(fh) or {}
+                cfg = self._load_stack_config(stack_path, copy=False)
             except (OSError, yaml.YAMLError):
                 continue
             guide_name = (cfg.get("kustomize", {}) or {}).get("guideName", "")
@@ -124,18 +121,25 @@ class UninstallHelmStep(Step):
         fma_guide_name = self._fma_guide_name(context)
         is_fma_enabled = "fma" in context.deployed_methods or bool(fma_guide_name)
 
+        parallelism = max(1, context.teardown_parallelism)
+
         # Delete FMA CRs before uninstalling the Helm chart so the
         # controller is still running and can remove pod finalizers.
         if is_fma_enabled:
-            for ns in namespaces:
-                self._delete_fma_crs(cmd, context, ns, fma_guide_name)
+            run_bounded(
+                lambda ns: self._delete_fma_crs(cmd, context, ns, fma_guide_name),
+                namespaces,
+                parallelism,
+            )
             # Remove any node label standup applied for launcher node selection
             # (mirrors step_06's fma.launcherNodeSelection). No-op unless that
             # feature was enabled for a stack.
             self._unlabel_launcher_nodes(cmd, context)
 
+        self._uninstall_all(
+            cmd, context, namespaces, release, model_labels, errors, parallelism
+        )
         for ns in namespaces:
-            self._uninstall_releases(cmd, context, ns, release, model_labels, errors)
             if not is_fma_enabled:
                 self._delete_openshift_routes(cmd, context, ns, release)
                 self._delete_download_job(cmd, context, ns)
@@ -192,38 +196,19 @@ class UninstallHelmStep(Step):
             check=False,
         )
 
-        # Delete FMA CRs
+        # Delete FMA CRs: one listing, one delete per kind.
         fma_cr_kinds = [
             "launcherpopulationpolicy",
             "inferenceserverconfig",
             "launcherconfig",
         ]
-        for kind in fma_cr_kinds:
-            result = cmd.kube(
-                "get",
-                kind,
-                "--namespace",
-                namespace,
-                "-o",
-                "name",
-                "--ignore-not-found",
-                check=False,
-            )
-            if not result.success or not result.stdout.strip():
-                continue
-            for cr in result.stdout.strip().splitlines():
-                context.logger.log_info(
-                    f"  Deleting FMA CR {cr} (before Helm uninstall)",
-                    emoji="🗑️",
-                )
-                cmd.kube(
-                    "delete",
-                    "--namespace",
-                    namespace,
-                    "--ignore-not-found=true",
-                    cr,
-                    check=False,
-                )
+        listing = list_namespace(cmd, namespace, fma_cr_kinds)
+        plan = DeletionPlan()
+        for item in listing.items:
+            plan.add(ResourceRef.from_item(item, namespace))
+        for line in plan.describe():
+            context.logger.log_info(f"  FMA CRs (before Helm uninstall): {line}")
+        delete_batches(cmd, plan.batches(), parallelism=1)
 
         # Wait for all FMA pods to terminate while the controller is still running.
         # Then force-remove any remaining finalizers and force-delete: this handles
@@ -294,22 +279,24 @@ class UninstallHelmStep(Step):
                 labels.append(label)
         return labels
 
-    def _uninstall_releases(
+    def _uninstall_all(
         self,
         cmd: CommandExecutor,
         context: ExecutionContext,
-        namespace: str,
+        namespaces: list[str],
         release: str,
         model_labels: list[str],
         errors: list,
-    ):
-        """Find and uninstall Helm releases matching the release name or model labels.
-
-        Enumerates every release status explicitly so releases stuck in a
-        transitional state (``uninstalling`` / ``pending-*`` / ``failed``)
-        are visible -- Helm v3's default ``helm list`` hides them. A release
-        left ``uninstalling`` by a previously interrupted teardown is
-        otherwise never cleaned: it blocks the next standup's
+        parallelism: int = 1,
+    ) -> None:
+        """List every namespace's releases concurrently, then remove all
+        matching releases with at most *parallelism* in flight.
+
+        Listing enumerates every release status explicitly so releases stuck
+        in a transitional state (``uninstalling`` / ``pending-*`` /
+        ``failed``) are visible -- Helm v3's default ``helm list`` hides
+        them. A release left ``uninstalling`` by a previously interrupted
+        teardown is otherwise never cleaned: it blocks the next standup's
         ``helmfile apply`` (which no-ops on an already-present release) so
         the EPP/InferencePool never redeploy. For such wedged releases
         ``helm uninstall`` does not reliably clear the release, so we delete
@@ -320,6 +307,38 @@ class UninstallHelmStep(Step):
         Helm v4, which dropped the ``--all`` flag in favor of listing every
         status by default.
         """
+        found = run_bounded(
+            lambda ns: [
+                (ns, rel)
+                for rel in self._matching_releases(
+                    cmd, context, ns, release, model_labels
+                )
+            ],
+            namespaces,
+            parallelism,
+        )
+        targets = [pair for pairs in found for pair in pairs]
+        if targets:
+            verb = "Would remove" if context.dry_run else "Removing"
+            context.logger.log_info(
+                f"{verb} {len(targets)} Helm release(s): "
+                + ", ".join(f"{ns}/{rel.get('name')}" for ns, rel in targets)
+            )
+        self._remove_releases(cmd, context, targets, errors, parallelism)
+
+    def _matching_releases(
+        self,
+        cmd: CommandExecutor,
+        context: ExecutionContext,
+        namespace: str,
+        release: str,
+        model_labels: list[str],
+    ) -> list[dict]:
+        """Releases in *namespace* (any status) that belong to this deployment.
+
+        ``helm list`` is a read, so it runs in dry-run mode too and the dry
+        run shows the releases a real teardown would remove.
+        """
         result = cmd.helm(
             "list",
             "--namespace",
@@ -332,9 +351,10 @@ class UninstallHelmStep(Step):
             "--superseded",
             "-o",
             "json",
+            force=True,
         )
         if not result.success:
-            return
+            return []
 
         try:
             releases = json.loads(result.stdout) or []
@@ -348,42 +368,70 @@ class UninstallHelmStep(Step):
         # preserved.
         full_teardown = not context.stack_filter
 
-        for rel in releases:
-            release_name = rel.get("name", "")
-            if not release_name or not self._release_matches(
-                release_name, release, model_labels, rel.get("chart", ""), full_teardown
-            ):
-                continue
+        return [
+            rel
+            for rel in releases
+            if rel.get("name")
+            and self._release_matches(
+                rel["name"], release, model_labels, rel.get("chart", ""), full_teardown
+            )
+        ]
 
-            status = rel.get("status", "")
-            if status in self._WEDGED_HELM_STATES:
-                context.logger.log_warning(
-                    f'Helm release "{release_name}" in {namespace} is stuck in '
-                    f'state "{status}" (interrupted teardown); deleting its '
-                    "release secret(s) directly."
-                )
-                cmd.kube(
-                    "delete",
-                    "secret",
-                    "-l",
-                    f"owner=helm,name={release_name}",
-                    "--ignore-not-found=true",
-                    namespace=namespace,
-                    check=False,
-                )
-                continue
+    def _remove_releases(
+        self,
+        cmd: CommandExecutor,
+        context: ExecutionContext,
+        targets: list[tuple[str, dict]],
+        errors: list,
+        parallelism: int = 1,
+    ) -> None:
+        """Remove each ``(namespace, release)`` in *targets*, concurrently."""
+        results = run_bounded(
+            lambda target: self._remove_release(cmd, context, *target),
+            targets,
+            parallelism,
+        )
+        errors.extend(e for e in results if e)
 
-            context.logger.log_info(
-                f'Uninstalling Helm release "{release_name}" from {namespace}'
+    def _remove_release(
+        self,
+        cmd: CommandExecutor,
+        context: ExecutionContext,
+        namespace: str,
+        rel: dict,
+    ) -> str | None:
+        """Uninstall one release (or drop a wedged one's secret); the error."""
+        release_name = rel["name"]
+        status = rel.get("status", "")
+        if status in self._WEDGED_HELM_STATES:
+            context.logger.log_warning(
+                f'Helm release "{release_name}" in {namespace} is stuck in '
+                f'state "{status}" (interrupted teardown); deleting its '
+                "release secret(s) directly."
             )
-            uninstall = cmd.helm(
-                "uninstall",
-                release_name,
-                "--namespace",
-                namespace,
+            cmd.kube(
+                "delete",
+                "secret",
+                "-l",
+                f"owner=helm,name={release_name}",
+                "--ignore-not-found=true",
+                namespace=namespace,
+                check=False,
             )
-            if not uninstall.success:
-                errors.append(f"Failed to uninstall {release_name}: {uninstall.stderr}")
+            return None
+
+        context.logger.log_info(
+            f'Uninstalling Helm release "{release_name}" from {namespace}'
+        )
+        uninstall = cmd.helm(
+            "uninstall",
+            release_name,
+            "--namespace",
+            namespace,
+        )
+        if not uninstall.success:
+            return f"Failed to uninstall {release_name}: {uninstall.stderr}"
+        return None
 
     @staticmethod
     def _release_matches(
@@ -489,12 +537,8 @@ class UninstallHelmStep(Step):
         seen_ns: dict[str, Path] = {}  # wva_ns -> first stack_path with that ns
 
         for stack_path in context.rendered_stacks or []:
-            cfg_file = stack_path / "config.yaml"
-            if not cfg_file.exists():
-                continue
             try:
-                with open(cfg_file, encoding="utf-8") as fh:
-                    cfg = yaml.safe_load(fh) or {}
+                cfg = self._load_stack_config(stack_path, copy=False)
             except (OSError, yaml.YAMLError):
                 continue
             wva_cfg = cfg.get("wva", {}) or {}
@@ -1,11 +1,19 @@
 """Teardown Step 03 -- Delete namespaced resources (normal or deep mode)."""
 
-import json
+import time
 from pathlib import Path
 
 from llmdbenchmark.executor.step import Step, StepResult, Phase
 from llmdbenchmark.executor.context import ExecutionContext
 from llmdbenchmark.executor.command import CommandExecutor
+from llmdbenchmark.teardown.bulk import (
+    DeletionPlan,
+    ResourceRef,
+    delete_batches,
+    list_namespace,
+    run_bounded,
+    wait_for_deletion,
+)
 
 
 NORMAL_RESOURCE_LIST = (
@@ -104,100 +112,61 @@ class DeleteResourcesStep(Step):
         cmd = context.require_cmd()
 
         namespaces = self._all_target_namespaces(context)
+        parallelism = max(1, context.teardown_parallelism)
 
         if context.deep_clean:
-            self._deep_clean(cmd, context, namespaces, errors)
+            kinds = list(DEEP_RESOURCE_KINDS)
+            if context.is_openshift:
+                kinds.extend(OPENSHIFT_RESOURCE_KINDS)
+            select = None
         else:
-            self._normal_clean(cmd, context, namespaces, errors)
-
-        if errors:
-            return StepResult(
-                step_number=self.number,
-                step_name=self.name,
-                success=False,
-                message="Resource deletion had errors",
-                errors=errors,
-            )
-
-        return StepResult(
-            step_number=self.number,
-            step_name=self.name,
-            success=True,
-            message=(
-                f"Namespaced resources deleted "
-                f"({'deep' if context.deep_clean else 'normal'} mode)"
-            ),
+            kinds = NORMAL_RESOURCE_LIST.split(",")
+            if context.is_openshift:
+                kinds.extend(OPENSHIFT_RESOURCE_KINDS)
+            if "fma" in context.deployed_methods:
+                kinds.extend(FMA_RESOURCE_LIST.split(","))
+            select = self._normal_selector(context)
+
+        mode = "deep" if context.deep_clean else "normal"
+        context.logger.log_info(
+            f"Listing {len(kinds)} resource kind(s) in {len(namespaces)} "
+            f"namespace(s) ({mode} mode)..."
         )
+        unsupported: set[str] = set()
+        listings = run_bounded(
+            lambda ns: list_namespace(cmd, ns, kinds, unsupported),
+            namespaces,
+            parallelism,
+        )
+
+        plan = DeletionPlan()
+        for listing in listings:
+            if listing.error:
+                context.logger.log_warning(
+                    f'Could not list resources in "{listing.namespace}": '
+                    f"{listing.error}"
+                )
+                continue
+            for item in listing.items:
+                ref = ResourceRef.from_item(item, listing.namespace)
+                if select is None or select(ref, item):
+                    plan.add(ref)
 
-    def _deep_clean(
-        self,
-        cmd: CommandExecutor,
-        context: ExecutionContext,
-        namespaces: list[str],
-        errors: list,
-    ):
-        """Delete all resources of each kind in both namespaces."""
-        kinds = list(DEEP_RESOURCE_KINDS)
-        if context.is_openshift:
-            kinds.extend(OPENSHIFT_RESOURCE_KINDS)
-
-        for ns in namespaces:
+        if not plan:
+            context.logger.log_info("  No matching resources found")
+        else:
+            verb = "Would delete" if context.dry_run else "Deleting"
             context.logger.log_info(
-                f'Deep cleaning namespace "{ns}" ({len(kinds)} resource kinds)...'
+                f"{verb} {len(plan)} resource(s) in {len(plan.grouped())} namespace(s):"
             )
-            for kind in kinds:
-                list_result = cmd.kube(
-                    "get",
-                    kind,
-                    "--namespace",
-                    ns,
-                    "-o",
-                    "name",
-                    "--no-headers",
-                    "--ignore-not-found",
-                    check=False,
-                )
-                existing = []
-                if list_result.success and list_result.stdout.strip():
-                    existing = list_result.stdout.strip().splitlines()
-
-                if not existing:
-                    continue
-
-                for resource in existing:
-                    context.logger.log_info(f"  Deleting {resource}", emoji="🗑️")
-
-                # check=False suppresses CommandExecutor ERROR logs;
-                # we handle failures ourselves below
-                delete_args = [
-                    "delete",
-                    kind,
-                    "--all",
-                    "--namespace",
-                    ns,
-                    "--ignore-not-found=true",
-                ]
-                # Force-delete pods to avoid hanging on Terminating pods
-                if kind == "pod":
-                    delete_args += ["--grace-period=0", "--force"]
-                result = cmd.kube(*delete_args, check=False)
-                if not result.success:
-                    stderr_lower = result.stderr.lower()
-                    if (
-                        "the server doesn't have a resource type" in stderr_lower
-                        or "not found" in stderr_lower
-                        or "no matches for kind" in stderr_lower
-                    ):
-                        # Resource type doesn't exist on this cluster
-                        continue
-                    context.logger.log_error(
-                        f"Failed to delete {kind} in {ns}: {result.stderr}"
-                    )
-                    errors.append(f"Failed to delete {kind} in {ns}: {result.stderr}")
-                else:
-                    context.logger.log_info(
-                        f"  Deleted {len(existing)} {kind}(s) in {ns}"
-                    )
+            for line in plan.describe():
+                context.logger.log_info(f"  {line}")
+
+            errors.extend(
+                delete_batches(cmd, plan.batches(), parallelism, context.logger)
+            )
+            if not context.dry_run:
+                self._wait_for_finalizers(cmd, context, plan)
 
         # Clean up cluster-scoped hostPath PVs created by the benchmark.
         pv_result = cmd.kube(
@@ -211,24 +180,29 @@ class DeleteResourcesStep(Step):
         if pv_result.success and pv_result.stdout.strip():
             context.logger.log_info("  Deleted hostPath PV(s)")
 
-    def _normal_clean(
-        self,
-        cmd: CommandExecutor,
-        context: ExecutionContext,
-        namespaces: list[str],
-        errors: list,
-    ):
-        """Query for resources, filter by deployment method, delete individually."""
-        resource_list = NORMAL_RESOURCE_LIST
-        if context.is_openshift:
-            resource_list += ",route"
+        if errors:
+            return StepResult(
+                step_number=self.number,
+                step_name=self.name,
+                success=False,
+                message="Resource deletion had errors",
+                errors=errors,
+            )
 
-        fma_active = "fma" in context.deployed_methods
-        if fma_active:
-            resource_list += f",{FMA_RESOURCE_LIST}"
+        return StepResult(
+            step_number=self.number,
+            step_name=self.name,
+            success=True,
+            message=f"Namespaced resources deleted ({mode} mode)",
+        )
 
-        resource_list = self._prune_unsupported(cmd, resource_list, namespaces[0])
+    def _normal_selector(self, context: ExecutionContext):
+        """Build the normal-mode filter: ``select(ref, item) -> bool``.
 
+        Keeps resources matching the deployed methods' name patterns, plus
+        model-serving workload controllers identified by their pod template
+        labels, and never touches system resources.
+        """
         standalone_active = "standalone" in context.deployed_methods
         modelservice_active = "modelservice" in context.deployed_methods
 
@@ -240,161 +214,63 @@ class DeleteResourcesStep(Step):
             )
         hf_secret = self._require_config(plan_config, "huggingface", "secretName")
 
-        for ns in namespaces:
-            context.logger.log_info(f'Cleaning namespace "{ns}" (normal mode)...')
+        if standalone_active and not modelservice_active:
+            patterns = STANDALONE_PATTERNS
+        elif modelservice_active and not standalone_active:
+            patterns = MODELSERVICE_PATTERNS
+        else:
+            patterns = None
 
-            result = cmd.kube(
-                "get",
-                resource_list,
-                "--namespace",
-                ns,
-                "-o",
-                "name",
-            )
-            if not result.success or not result.stdout.strip():
-                all_resources = []
-            else:
-                all_resources = result.stdout.strip().splitlines()
-
-            filtered = [
-                r for r in all_resources if not self._is_system_resource(r, hf_secret)
-            ]
-
-            if standalone_active and not modelservice_active:
-                filtered = [
-                    r for r in filtered if self._matches_any(r, STANDALONE_PATTERNS)
-                ]
-            elif modelservice_active and not standalone_active:
-                filtered = [
-                    r for r in filtered if self._matches_any(r, MODELSERVICE_PATTERNS)
-                ]
-
-            # Also find model-serving workload controllers by pod
-            # template labels. oc get -l only filters by metadata.labels,
-            # but the llm-d.ai/inferenceServing label is on the pod
-            # template, so we query as JSON and filter in Python.
-            workload_result = cmd.kube(
-                "get",
-                "leaderworkerset,deployment,statefulset",
-                "--namespace",
-                ns,
-                "-o",
-                "json",
-                "--ignore-not-found",
-                check=False,
-            )
-            if workload_result.success and workload_result.stdout.strip():
-                try:
-                    items = json.loads(workload_result.stdout).get("items", [])
-                    existing = set(filtered)
-                    for item in items:
-                        spec = item.get("spec", {})
-                        # Deployment/StatefulSet: spec.template.metadata.labels
-                        # LeaderWorkerSet: spec.leaderWorkerTemplate.workerTemplate.metadata.labels
-                        tmpl_labels = (
-                            spec.get("template", {})
-                            .get("metadata", {})
-                            .get("labels", {})
-                        )
-                        if not tmpl_labels.get("llm-d.ai/inferenceServing"):
-                            tmpl_labels = (
-                                spec.get("leaderWorkerTemplate", {})
-                                .get("workerTemplate", {})
-                                .get("metadata", {})
-                                .get("labels", {})
-                            )
-                        if tmpl_labels.get("llm-d.ai/inferenceServing") != "true":
-                            continue
-                        # Use apiVersion/kind to build the resource name
-                        # that oc delete accepts (e.g.,
-                        # "leaderworkerset.leaderworkerset.x-k8s.io/name")
-                        api_version = item.get("apiVersion", "")
-                        kind = item.get("kind", "")
-                        name = item.get("metadata", {}).get("name", "")
-                        # For core/apps resources (Deployment, StatefulSet),
-                        # "deployment/name" works. For CRDs, use the full
-                        # group-qualified form from apiVersion.
-                        if "/" in api_version and not api_version.startswith("apps/"):
-                            group = api_version.split("/")[0]
-                            resource = f"{kind.lower()}.{group}/{name}"
-                        else:
-                            resource = f"{kind.lower()}/{name}"
-                        if resource and resource not in existing:
-                            filtered.append(resource)
-                            existing.add(resource)
-                except (json.JSONDecodeError, KeyError):
-                    pass
-
-            if not filtered:
-                context.logger.log_info(f"  No matching resources found in {ns}")
-                continue
+        def select(ref: ResourceRef, item: dict) -> bool:
+            if self._is_system_resource(ref.ref, hf_secret):
+                return False
+            if patterns is None or self._matches_any(ref.ref, patterns):
+                return True
+            return self._is_inference_serving(item)
 
-            context.logger.log_info(
-                f"  Found {len(filtered)} resource(s) to delete in {ns}"
-            )
-            deleted_count = 0
-            for resource in filtered:
-                context.logger.log_info(f"  Deleting {resource}", emoji="🗑️")
-                delete_args = [
-                    "delete",
-                    "--namespace",
-                    ns,
-                    "--ignore-not-found=true",
-                    resource,
-                ]
-                # Force-delete pods to avoid hanging on Terminating pods
-                if resource.startswith("pod/"):
-                    delete_args += ["--grace-period=0", "--force"]
-                del_result = cmd.kube(*delete_args)
-                if del_result.success:
-                    deleted_count += 1
-                else:
-                    stderr_lower = del_result.stderr.lower()
-                    if "not found" in stderr_lower or "no matches" in stderr_lower:
-                        context.logger.log_info(f"    Already removed: {resource}")
-                    else:
-                        context.logger.log_warning(
-                            f"    Could not delete {resource}: {del_result.stderr}"
-                        )
+        return select
 
-            context.logger.log_info(
-                f"  Deleted {deleted_count}/{len(filtered)} resources in {ns}"
+    @staticmethod
+    def _is_inference_serving(item: dict) -> bool:
+        """True for workload controllers whose pod template is model-serving.
+
+        ``get -l`` only filters on metadata.labels, but the
+        llm-d.ai/inferenceServing label is on the pod template.
+        """
+        spec = item.get("spec", {}) or {}
+        # Deployment/StatefulSet: spec.template.metadata.labels
+        # LeaderWorkerSet: spec.leaderWorkerTemplate.workerTemplate.metadata.labels
+        tmpl_labels = spec.get("template", {}).get("metadata", {}).get("labels", {})
+        if not tmpl_labels.get("llm-d.ai/inferenceServing"):
+            tmpl_labels = (
+                spec.get("leaderWorkerTemplate", {})
+                .get("workerTemplate", {})
+                .get("metadata", {})
+                .get("labels", {})
             )
+        return tmpl_labels.get("llm-d.ai/inferenceServing") == "true"
 
-        # Clean up cluster-scoped hostPath PVs created by the benchmark.
-        pv_result = cmd.kube(
-            "delete",
-            "pv",
-            "-l",
-            "usage=model-cache",
-            "--ignore-not-found",
-            check=False,
+    @staticmethod
+    def _wait_for_finalizers(
+        cmd: CommandExecutor, context: ExecutionContext, plan: DeletionPlan
+    ) -> None:
+        """Wait once for the whole plan to disappear; warn about stragglers."""
+        timeout = context.teardown_wait_timeout
+        start = time.monotonic()
+        stuck = wait_for_deletion(
+            cmd, plan.resources, timeout=timeout, logger=context.logger
         )
-        if pv_result.success and pv_result.stdout.strip():
-            context.logger.log_info("  Deleted hostPath PV(s)")
-
-    def _prune_unsupported(
-        self, cmd: CommandExecutor, resource_list: str, namespace: str
-    ) -> str:
-        """Remove resource types that the cluster does not support."""
-        supported = []
-        for resource_type in resource_list.split(","):
-            resource_type = resource_type.strip()
-            if not resource_type:
-                continue
-            result = cmd.kube(
-                "get",
-                resource_type,
-                "--namespace",
-                namespace,
-                "--no-headers",
-                "-o",
-                "name",
-                check=False,
+        if not stuck:
+            context.logger.log_info(
+                f"  Deleted {len(plan)} resource(s) in {time.monotonic() - start:.0f}s"
             )
-            if result.success or "No resources found" in result.stderr:
-                supported.append(resource_type)
-        return ",".join(supported)
+            return
+        context.logger.log_warning(
+            f"{len(stuck)}/{len(plan)} resource(s) still present after {timeout}s:"
+        )
+        for ref, finalizers in sorted(stuck.items(), key=lambda kv: kv[0].ref):
+            held = f" (finalizers: {', '.join(finalizers)})" if finalizers else ""
+            context.logger.log_warning(f"  {ref.namespace}/{ref.ref}{held}")
 
     @staticmethod
     def _is_system_resource(resource: str, hf_secret: str) -> bool:
@@ -6,13 +6,14 @@ smoketest step and the run phase can reuse the same logic.
 
 import json
 import random
+import shlex
 import string
 import time
 
 from llmdbenchmark.executor.command import CommandExecutor
 
 
-def _rand_suffix(length: int = 8) -> str:
+def rand_suffix(length: int = 8) -> str:
     """Generate a random lowercase alphanumeric suffix for pod names."""
     return "".join(random.choices(string.ascii_lowercase + string.digits, k=length))
 
@@ -75,7 +76,7 @@ def compute_gateway_path_prefix(
     return _normalize_url_prefix(tmpl.replace("{stack.name}", stack_name))
 
 
-def _build_overrides(
+def build_overrides(
     plan_config: dict | None, service_account: str | None = None
 ) -> list[str]:
     """Build --overrides args for ephemeral curl pods (imagePullSecrets, serviceAccount)."""
@@ -94,11 +95,11 @@ def _build_overrides(
         overrides.setdefault("spec", {})["serviceAccountName"] = sa_name
 
     if overrides:
-        return ["--overrides", f"'{json.dumps(overrides)}'"]
+        return ["--overrides", shlex.quote(json.dumps(overrides))]
     return []
 
 
-def _ephemeral_label_args() -> list[str]:
+def ephemeral_label_args() -> list[str]:
     """Return kubectl args to label ephemeral pods for cleanup."""
     return [f"--labels={EPHEMERAL_POD_LABEL}"]
 
@@ -706,6 +707,7 @@ def test_model_serving(
     retry_interval: int = 15,
     service_account: str | None = None,
     url_path_prefix: str = "",
+    agent=None,
 ) -> str | None:
     """Test an endpoint by querying /v1/models via an ephemeral curl pod.
 
@@ -720,6 +722,9 @@ def test_model_serving(
     the response indicates the model is still loading or the decode
     node isn't ready (503 / ServiceUnavailable).
 
+    When *agent* (a smoketest ``ProbeAgent``) is given, the request runs
+    in its long-lived pod instead of a fresh curl pod per attempt.
+
     Returns None on success, or an error string describing the failure.
     """
     protocol = "https" if str(port) == "443" else "http"
@@ -780,48 +785,60 @@ def test_model_serving(
                 check=False,
             )
 
-    override_args = _build_overrides(plan_config, service_account=service_account)
+    override_args = build_overrides(plan_config, service_account=service_account)
     curl_image = "quay.io/fedora/fedora"
     last_error: str | None = None
 
     for attempt in range(1, max_retries + 1):
-        pod_name = f"smoketest-{_rand_suffix()}"
-
-        curl_cmd = (
-            f"'curl -sk --retry 3 --retry-delay 3 "
-            f"--retry-all-errors --max-time 30 {url} 2>&1'"
-        )
+        if agent is not None:
+            probe = agent.get(url, timeout=30)
+            if probe.dry_run:
+                return None
+            # Any HTTP status counts as curl success, as in the pod path.
+            succeeded = probe.status != 0
+            stdout = probe.body
+            detail = probe.error[:200]
+        else:
+            pod_name = f"smoketest-{rand_suffix()}"
+
+            curl_cmd = shlex.quote(
+                f"curl -sk --retry 3 --retry-delay 3 "
+                f"--retry-all-errors --max-time 30 {shlex.quote(url)} 2>&1"
+            )
 
-        kubectl_args = (
-            [
-                "run",
-                pod_name,
-                "--rm",
-                "--attach",
-                "--quiet",
-                "--restart=Never",
-                "--namespace",
-                namespace,
-                f"--image={curl_image}",
-            ]
-            + _ephemeral_label_args()
-            + override_args
-            + [
-                "--command",
-                "--",
-                "sh",
-                "-c",
-                curl_cmd,
-            ]
-        )
+            kubectl_args = (
+                [
+                    "run",
+                    pod_name,
+                    "--rm",
+                    "--attach",
+                    "--quiet",
+                    "--restart=Never",
+                    "--namespace",
+                    namespace,
+                    f"--image={curl_image}",
+                ]
+                + ephemeral_label_args()
+                + override_args
+                + [
+                    "--command",
+                    "--",
+                    "sh",
+                    "-c",
+                    curl_cmd,
+                ]
+            )
 
-        result = cmd.kube(*kubectl_args, check=False)
+            result = cmd.kube(*kubectl_args, check=False)
 
-        if result.dry_run:
-            return None  # Command logged, skip retries
+            if result.dry_run:
+                return None  # Command logged, skip retries
 
-        if not result.success:
+            succeeded = result.success
+            stdout = result.stdout
             detail = result.stderr[:200] or result.stdout[:200]
+
+        if not succeeded:
             last_error = f"Curl to {host}:{port} failed: {detail}"
             if _is_retryable(detail) and attempt < max_retries:
                 cmd.logger.log_info(
@@ -832,7 +849,7 @@ def test_model_serving(
                 continue
             return last_error
 
-        stdout = result.stdout.strip()
+        stdout = stdout.strip()
 
         # Check for retryable error responses (e.g. 503 decode not ready)
         if _is_retryable(stdout) and attempt < max_retries:
@@ -947,23 +964,23 @@ def reset_caches_pods(
     # failure is still diagnosable; per-request failures are surfaced inline
     # by curl's own stderr (folded in via 2>&1). Non-2xx (esp. 404 when dev
     # mode is off) is a warning, not an error.
-    ip_list = " ".join(pod_ips)
-    endpoint_list = " ".join(_CACHE_RESET_ENDPOINTS)
-    reset_url_tmpl = f"http://$ip:{inference_port}$ep"
+    ip_list = " ".join(shlex.quote(ip) for ip in pod_ips)
+    endpoint_list = " ".join(shlex.quote(ep) for ep in _CACHE_RESET_ENDPOINTS)
+    reset_url_tmpl = f'"http://$ip:{int(inference_port)}$ep"'
     inner = (
         f"for ip in {ip_list}; do "
         f"for ep in {endpoint_list}; do "
         f'echo "== $ip$ep =="; '
-        f"curl -sk --max-time {timeout_seconds} "
+        f"curl -sk --max-time {int(timeout_seconds)} "
         f'-w "\\n%{{http_code}}\\n" -X POST {reset_url_tmpl} 2>&1; '
         f"done; "
         f"done"
     )
-    curl_cmd = f"'{inner}'"
+    curl_cmd = shlex.quote(inner)
 
-    override_args = _build_overrides(plan_config)
+    override_args = build_overrides(plan_config)
     curl_image = "quay.io/fedora/fedora"
-    pod_name = f"reset-caches-{_rand_suffix()}"
+    pod_name = f"reset-caches-{rand_suffix()}"
 
     kubectl_args = (
         [
@@ -977,7 +994,7 @@ def reset_caches_pods(
             namespace,
             f"--image={curl_image}",
         ]
-        + _ephemeral_label_args()
+        + ephemeral_label_args()
         + override_args
         + ["--command", "--", "sh", "-c", curl_cmd]
     )
@@ -8,12 +8,13 @@ step_08, and step_10.
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from llmdbenchmark.utilities.podstate import PodState
+from llmdbenchmark.utilities.podstate import PodState, shared_watcher
 from llmdbenchmark.utilities.podstate import CRASH_STATES as _CRASH_STATES
 
 if TYPE_CHECKING:
@@ -303,101 +304,87 @@ def wait_for_pods_by_label(
     return errors
 
 
-def wait_for_pod(
+def pod_watch_api_client(context: ExecutionContext):
+    """Kubernetes API client for pod watches, or None to use ``kubectl``.
+
+    ``LLMDBENCH_POD_WATCH_API=false`` forces the ``kubectl`` fallback; so do
+    dry runs, a missing ``kubernetes`` package, and a failed connection.
+    """
+    if context.dry_run:
+        return None
+    if os.environ.get("LLMDBENCH_POD_WATCH_API", "true").lower() in (
+        "0",
+        "false",
+        "no",
+    ):
+        return None
+    try:
+        from llmdbenchmark.utilities.cluster import kube_connect
+
+        return kube_connect(
+            kubeconfig=context.kubeconfig,
+            kube_context=context.context_name,
+            cluster_url=context.cluster_url,
+            token=context.cluster_token,
+        )
+    except Exception:  # pylint: disable=broad-exception-caught
+        context.logger.log_debug(
+            "Kubernetes API unavailable for pod watch; using kubectl"
+        )
+        return None
+
+
+def wait_for_pods(
     cmd,
-    pod_name: str,
+    pod_names: list[str],
     namespace: str,
     timeout: int,
     context: ExecutionContext,
     poll_interval: int = 15,
-) -> str:
-    """Wait for a single pod to reach a terminal phase via polling.
+) -> dict[str, str]:
+    """Wait for several pods to reach a terminal phase, concurrently.
 
-    This is the per-pod polling fallback used by step_07 when pods
-    are tracked individually (e.g. when step_06 populated
-    ``context.deployed_pod_names``).
+    Every pod is resolved from one shared listing of ``namespace`` per tick
+    (see :class:`~llmdbenchmark.utilities.podstate.PodWatcher`), so the
+    cost of a tick does not grow with the number of pods and all pods share
+    one ``timeout``.
 
     Returns:
-        ``'Succeeded'``, ``'Failed'``, or an error description string.
+        Outcome per pod name: ``'Succeeded'``, ``'Failed'``, or an error
+        description string.
     """
-    start = time.time()
-
-    while True:
-        elapsed = time.time() - start
-        if elapsed > timeout:
-            return f"Timed out after {timeout}s"
-
-        result = cmd.kube(
-            "get",
-            "pod",
-            pod_name,
-            "--namespace",
-            namespace,
-            "-o",
-            "jsonpath={.status.phase}:{.status.containerStatuses[0].state}",
-            check=False,
+    if cmd.dry_run:
+        context.logger.log_info(
+            f"[DRY RUN] Would wait for {len(pod_names)} pod(s) in '{namespace}'"
         )
+        return {name: "Succeeded" for name in pod_names}
 
-        if result.dry_run:
-            return "Succeeded"  # Command logged, skip polling
-
-        if not result.success:
-            # Pod may not exist yet
-            time.sleep(poll_interval)
-            continue
+    watcher = shared_watcher(
+        cmd, namespace, connect=lambda: pod_watch_api_client(context)
+    )
+    return watcher.wait_for_pods(
+        pod_names, timeout, logger=context.logger, poll_interval=poll_interval
+    )
 
-        output = result.stdout.strip()
-        parts = output.split(":", 1)
-        phase = parts[0] if parts else ""
 
-        if phase == "Succeeded":
-            context.logger.log_info(
-                f"Pod '{pod_name}' completed successfully ({int(elapsed)}s)"
-            )
-            return "Succeeded"
-
-        if phase == "Failed":
-            exit_result = cmd.kube(
-                "get",
-                "pod",
-                pod_name,
-                "--namespace",
-                namespace,
-                "-o",
-                "jsonpath={.status.containerStatuses[0].state.terminated.exitCode}",
-                check=False,
-            )
-            exit_code = exit_result.stdout.strip() if exit_result.success else "?"
-            context.logger.log_error(
-                f"Pod '{pod_name}' failed (exit_code={exit_code}, {int(elapsed)}s)"
-            )
-            return "Failed"
+def wait_for_pod(
+    cmd,
+    pod_name: str,
+    namespace: str,
+    timeout: int,
+    context: ExecutionContext,
+    poll_interval: int = 15,
+) -> str:
+    """Wait for a single pod to reach a terminal phase via polling.
 
-        # Check for crash states via container status
-        container_result = cmd.kube(
-            "get",
-            "pod",
-            pod_name,
-            "--namespace",
-            namespace,
-            "-o",
-            "jsonpath={.status.containerStatuses[0].state.waiting.reason}",
-            check=False,
-        )
-        if container_result.success and container_result.stdout.strip():
-            reason = container_result.stdout.strip()
-            if reason in CRASH_STATES:
-                context.logger.log_error(
-                    f"Pod '{pod_name}' in terminal state: {reason}"
-                )
-                return f"Terminal state: {reason}"
+    Single-pod form of :func:`wait_for_pods`.
 
-        remaining = int(timeout - elapsed)
-        context.logger.log_info(
-            f"Pod '{pod_name}': {phase} ({int(elapsed)}s elapsed, "
-            f"{remaining}s remaining)"
-        )
-        time.sleep(poll_interval)
+    Returns:
+        ``'Succeeded'``, ``'Failed'``, or an error description string.
+    """
+    return wait_for_pods(cmd, [pod_name], namespace, timeout, context, poll_interval)[
+        pod_name
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -8,6 +8,9 @@ Public surface:
   cannot.
 * :func:`parse_pod_list` / :func:`observe_pods` -- the single parser for
   ``kubectl get pods -o json``.
+* :class:`PodWatcher` / :func:`shared_watcher` -- one listing per namespace
+  per tick, shared by every pod being waited on; :func:`release_watchers`
+  stops them at the end of a phase.
 * :class:`PodPolicy` / :class:`Remedy` -- the seam for reacting to unhealthy
   pods; :class:`RestartBudgetPolicy` is the first implementation.
 * :mod:`diagnostics` -- evidence capture and end-of-phase reporting.
@@ -41,6 +44,12 @@ from llmdbenchmark.utilities.podstate.state import (
     Termination,
     summarize_container_states,
 )
+from llmdbenchmark.utilities.podstate.watcher import (
+    PodWatcher,
+    pod_outcome,
+    release_watchers,
+    shared_watcher,
+)
 
 __all__ = [
     "CRASH_STATES",
@@ -53,6 +62,7 @@ __all__ = [
     "OwnerRef",
     "PodPolicy",
     "PodState",
+    "PodWatcher",
     "Remedy",
     "RestartBudget",
     "RestartBudgetPolicy",
@@ -64,6 +74,9 @@ __all__ = [
     "evidence_dir",
     "observe_pods",
     "parse_pod_list",
+    "pod_outcome",
+    "release_watchers",
     "render_restart_summary",
+    "shared_watcher",
     "summarize_container_states",
 ]
@@ -0,0 +1,261 @@
+"""One pod listing per namespace per tick, shared by every waiter.
+
+Waiting on pods one at a time costs several ``kubectl get pod`` forks per pod
+per tick and serializes their timeouts. :class:`PodWatcher` instead lists a
+namespace's pods once per tick -- through the Kubernetes API when a client is
+available, else one ``kubectl get pods -o json`` -- and hands the resulting
+:class:`PodState` objects to every pod being waited on.
+
+Watchers are shared through :func:`shared_watcher`, so stacks waiting in
+parallel on the same namespace also share its listing: a snapshot younger
+than the watcher's ``max_age`` is reused rather than fetched again.
+:func:`release_watchers` stops and forgets an executor's watchers once its
+steps are done.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from llmdbenchmark.utilities.podstate.observer import observe_pods
+from llmdbenchmark.utilities.podstate.state import CRASH_STATES, PodState
+
+try:
+    from kubernetes import client as k8s_client
+
+    _KUBE_AVAILABLE = True
+except ImportError:
+    _KUBE_AVAILABLE = False
+
+SUCCEEDED = "Succeeded"
+FAILED = "Failed"
+
+
+def pod_outcome(pod: PodState) -> str | None:
+    """Terminal outcome of a pod, or None while it may still finish.
+
+    Returns ``'Succeeded'`` or ``'Failed'`` from the pod phase, or
+    ``'Terminal state: <reason>'`` when a container is waiting on a crash
+    state.
+    """
+    if pod.phase in (SUCCEEDED, FAILED):
+        return pod.phase
+    for container in pod.containers:
+        if container.waiting_reason in CRASH_STATES:
+            return f"Terminal state: {container.waiting_reason}"
+    return None
+
+
+def _exit_code(pod: PodState) -> str:
+    """Exit code of the pod's first terminated container, '?' when unknown."""
+    for container in pod.containers:
+        if container.terminated and container.terminated.exit_code is not None:
+            return str(container.terminated.exit_code)
+    return "?"
+
+
+class PodWatcher:
+    """Lists one namespace's pods and resolves waits against the listing.
+
+    Args:
+        cmd: CommandExecutor used for the ``kubectl`` fallback.
+        namespace: Namespace to list.
+        label: Optional label selector narrowing the listing.
+        api_client: Kubernetes ``ApiClient`` (see
+            :func:`llmdbenchmark.utilities.cluster.kube_connect`); when None or
+            when an API call fails, listings go through ``kubectl``.
+        max_age: Seconds a snapshot is reused by concurrent callers.
+    """
+
+    def __init__(
+        self,
+        cmd,
+        namespace: str,
+        label: str | None = None,
+        api_client=None,
+        max_age: float = 2.0,
+    ):
+        self.cmd = cmd
+        self.namespace = namespace
+        self.label = label
+        self.api_client = api_client if _KUBE_AVAILABLE else None
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._snapshot: dict[str, PodState] | None = None
+        self._taken_at = float("-inf")
+
+    def _list_via_api(self) -> list[PodState] | None:
+        try:
+            pod_list = k8s_client.CoreV1Api(self.api_client).list_namespaced_pod(
+                self.namespace,
+                label_selector=self.label or "",
+                _request_timeout=30,
+            )
+            payload = self.api_client.sanitize_for_serialization(pod_list)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Fall back to kubectl for the rest of this watcher's life; an
+            # API that failed once (auth, proxy) rarely recovers mid-wait.
+            self.api_client = None
+            return None
+        return [
+            PodState.from_api(item, namespace=self.namespace)
+            for item in payload.get("items", []) or []
+        ]
+
+    def stop(self) -> None:
+        """Close the API client; later listings go through ``kubectl``."""
+        with self._lock:
+            api_client, self.api_client = self.api_client, None
+            self._snapshot = None
+            self._taken_at = float("-inf")
+        close = getattr(api_client, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+    def observe(self) -> dict[str, PodState] | None:
+        """Current pods by name, or None when the listing itself failed."""
+        with self._lock:
+            if time.monotonic() - self._taken_at < self.max_age:
+                return self._snapshot
+            pods = None
+            if self.api_client is not None:
+                pods = self._list_via_api()
+            if pods is None:
+                pods = observe_pods(self.cmd, self.namespace, label=self.label)
+            self._snapshot = None if pods is None else {p.name: p for p in pods}
+            self._taken_at = time.monotonic()
+            return self._snapshot
+
+    def wait_for_pods(
+        self,
+        pod_names: Iterable[str],
+        timeout: float,
+        logger=None,
+        poll_interval: float = 15.0,
+        on_done: Callable[[str, str], None] | None = None,
+    ) -> dict[str, str]:
+        """Wait until every pod reaches a terminal outcome, all at once.
+
+        A pod that is not listed yet is waited for, as it may not have been
+        created; a failed listing counts as "no news" for that tick. Every pod
+        shares one deadline, ``timeout`` seconds from now.
+
+        Args:
+            pod_names: Pods to wait for.
+            timeout: Seconds before unfinished pods time out.
+            logger: Receives per-pod completion lines and a progress line per
+                tick (``log_info``/``log_error``).
+            poll_interval: Seconds between listings.
+            on_done: Called with (pod name, outcome) as each pod finishes.
+
+        Returns:
+            dict[str, str]: Outcome per pod: ``'Succeeded'``, ``'Failed'``,
+                ``'Terminal state: <reason>'`` or ``'Timed out after <n>s'``.
+        """
+        pending = list(dict.fromkeys(pod_names))
+        outcomes: dict[str, str] = {}
+        start = time.time()
+
+        while pending:
+            elapsed = time.time() - start
+            if elapsed > timeout:
+                for name in pending:
+                    outcomes[name] = f"Timed out after {int(timeout)}s"
+                    if on_done:
+                        on_done(name, outcomes[name])
+                break
+
+            snapshot = self.observe() or {}
+            still_pending = []
+            for name in pending:
+                pod = snapshot.get(name)
+                outcome = pod_outcome(pod) if pod is not None else None
+                if outcome is None:
+                    still_pending.append(name)
+                    continue
+                outcomes[name] = outcome
+                if logger is not None:
+                    if outcome == SUCCEEDED:
+                        logger.log_info(
+                            f"Pod '{name}' completed successfully ({int(elapsed)}s)"
+                        )
+                    elif outcome == FAILED:
+                        logger.log_error(
+                            f"Pod '{name}' failed (exit_code={_exit_code(pod)}, "
+                            f"{int(elapsed)}s)"
+                        )
+                    else:
+                        reason = outcome.split(": ", 1)[1]
+                        logger.log_error(f"Pod '{name}' in terminal state: {reason}")
+                if on_done:
+                    on_done(name, outcome)
+            pending = still_pending
+            if not pending:
+                break
+
+            if logger is not None:
+                remaining = int(timeout - elapsed)
+                if len(pending) == 1:
+                    pod = snapshot.get(pending[0])
+                    phase = pod.phase if pod is not None else ""
+                    logger.log_info(
+                        f"Pod '{pending[0]}': {phase} ({int(elapsed)}s elapsed, "
+                        f"{remaining}s remaining)"
+                    )
+                else:
+                    counts: dict[str, int] = {}
+                    for name in pending:
+                        pod = snapshot.get(name)
+                        phase = pod.phase if pod is not None else "NotFound"
+                        counts[phase] = counts.get(phase, 0) + 1
+                    phases = ", ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+                    logger.log_info(
+                        f"Waiting for {len(pending)} pod(s): {phases} "
+                        f"({int(elapsed)}s elapsed, {remaining}s remaining)"
+                    )
+            time.sleep(poll_interval)
+
+        return outcomes
+
+
+_SHARED: dict[tuple, PodWatcher] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_watcher(
+    cmd,
+    namespace: str,
+    label: str | None = None,
+    api_client=None,
+    connect: Callable[[], object] | None = None,
+) -> PodWatcher:
+    """The process-wide watcher for (executor, namespace, label).
+
+    ``api_client``, or else ``connect()``, is only used when the watcher is
+    first created, so callers pass ``connect`` to avoid building a client that
+    an existing watcher would not use.
+    """
+    key = (id(cmd), namespace, label)
+    with _SHARED_LOCK:
+        watcher = _SHARED.get(key)
+        if watcher is None or watcher.cmd is not cmd:
+            if api_client is None and connect is not None:
+                api_client = connect()
+            watcher = PodWatcher(cmd, namespace, label=label, api_client=api_client)
+            _SHARED[key] = watcher
+        return watcher
+
+
+def release_watchers(cmd) -> None:
+    """Stop and forget every shared watcher created for executor *cmd*."""
+    with _SHARED_LOCK:
+        released = [
+            _SHARED.pop(key) for key, w in list(_SHARED.items()) if w.cmd is cmd
+        ]
+    for watcher in released:
+        watcher.stop()
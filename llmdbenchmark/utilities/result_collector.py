@@ -0,0 +1,299 @@
+"""Batched, concurrent result collection from the data-access pod.
+
+The fast-collect path used to run one ``kube exec ... tar cz`` per result
+directory, one after another; with ``-j 32`` that is 32 sequential exec
+sessions, each limited by the apiserver's per-stream throughput.  Here a
+treatment's result directories are fetched together:
+
+1. One ``exec`` lists every file under them (size and mtime) and reports
+   whether ``zstd`` is available in the pod.
+2. Files already present locally with the same size and mtime are skipped,
+   so a re-collection (or a retry after a dropped stream) only moves what is
+   missing.
+3. The rest is split by size into up to ``streams`` shards, each streamed by
+   its own ``exec -i ... tar -T -`` and extracted while it streams.
+
+A shard that fails is retried with whatever is still missing.  When the
+listing itself fails the directories are streamed whole in one ``tar``.
+"""
+
+from __future__ import annotations
+
+import shlex
+import subprocess
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Sequence
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd streams fall back to gzip
+    zstandard = None
+
+#: Printed by the listing script when the pod has a ``zstd`` binary.
+_ZSTD_MARKER = "#zstd"
+
+_LIST_SCRIPT = (
+    'cd "$1" && shift && '
+    f'{{ command -v zstd >/dev/null 2>&1 && echo "{_ZSTD_MARKER}"; '
+    'find "$@" -type f -exec stat -c "%s %Y %n" {} + ; }'
+)
+_TAR_SCRIPTS = {
+    "gzip": 'cd "$1" && tar czf - -T -',
+    "zstd": 'cd "$1" && tar cf - -T - | zstd -1 -q -c',
+}
+
+
+@dataclass
+class RemoteFile:
+    """A file under the results prefix on the PVC."""
+
+    path: str
+    size: int
+    mtime: int
+
+    def is_current(self, local_root: Path) -> bool:
+        """True when the local copy has the same size and mtime."""
+        try:
+            st = (local_root / self.path).stat()
+        except OSError:
+            return False
+        return st.st_size == self.size and int(st.st_mtime) == self.mtime
+
+
+@dataclass
+class CollectionStats:
+    """What one :func:`collect_result_dirs` call moved, and how long it took."""
+
+    dirs: list[str]
+    files: int = 0
+    skipped: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    streams: int = 0
+    compression: str = "gzip"
+    failed_dirs: set[str] = field(default_factory=set)
+    errors: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.dirs)} dir(s), {self.files} file(s) "
+            f"({self.bytes / 1e6:.1f} MB, {self.skipped} unchanged) in "
+            f"{self.seconds:.1f}s over {self.streams} {self.compression} "
+            f"stream(s)"
+        )
+
+
+def parse_listing(stdout: str) -> tuple[list[RemoteFile], bool]:
+    """Parse the listing script's output into files and the zstd flag."""
+    files: list[RemoteFile] = []
+    has_zstd = False
+    for line in stdout.splitlines():
+        if line == _ZSTD_MARKER:
+            has_zstd = True
+            continue
+        parts = line.split(" ", 2)
+        if len(parts) != 3:
+            continue
+        try:
+            files.append(RemoteFile(parts[2], int(parts[0]), int(parts[1])))
+        except ValueError:
+            continue
+    return files, has_zstd
+
+
+def shard_files(files: Sequence[RemoteFile], streams: int) -> list[list[RemoteFile]]:
+    """Split *files* into at most *streams* shards of similar total size.
+
+    Largest first onto the lightest shard; empty shards are dropped.
+    """
+    shards: list[list[RemoteFile]] = [[] for _ in range(max(1, streams))]
+    loads = [0] * len(shards)
+    for f in sorted(files, key=lambda f: (-f.size, f.path)):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(f)
+        loads[lightest] += f.size
+    return [s for s in shards if s]
+
+
+def stream_tar(
+    kube_argv: Sequence[str],
+    names: Sequence[str],
+    local_root: Path,
+    compression: str = "gzip",
+) -> tuple[int, str]:
+    """Run *kube_argv* (an ``exec -i ... tar -T -``), feeding *names* on stdin
+    and extracting its output under *local_root* as it streams.
+
+    Returns ``(exit_code, stderr)``.
+    """
+    try:
+        proc = subprocess.Popen(
+            list(kube_argv),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except OSError as exc:
+        return 1, str(exc)
+
+    # Feed the file list from a thread: tar starts writing before it has read
+    # all names, so writing them up front could deadlock on a full pipe.
+    def _feed(stdin: IO[bytes]) -> None:
+        try:
+            stdin.write("".join(f"{n}\n" for n in names).encode("utf-8"))
+            stdin.close()
+        except OSError:  # the stream died early; its exit code says why
+            pass
+
+    feeder = threading.Thread(target=_feed, args=(proc.stdin,), daemon=True)
+    feeder.start()
+    stderr_chunks: list[bytes] = []
+    drainer = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+    )
+    drainer.start()
+    try:
+        if compression == "zstd":
+            reader = zstandard.ZstdDecompressor().stream_reader(proc.stdout)
+            mode = "r|"
+        else:
+            reader, mode = proc.stdout, "r|gz"
+        with tarfile.open(fileobj=reader, mode=mode) as tar:
+            # ``filter="data"`` rejects absolute paths, ``..`` and devices.
+            tar.extractall(path=local_root, filter="data")
+        exit_code = proc.wait()
+        error = ""
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        proc.kill()
+        exit_code = proc.wait() or 1
+        error = f"{exc}\n"
+    feeder.join()
+    drainer.join()
+    for pipe in (proc.stdin, proc.stdout, proc.stderr):
+        try:
+            pipe.close()
+        except OSError:
+            pass
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    return exit_code, error + stderr
+
+
+def collect_result_dirs(  # pylint: disable=too-many-locals
+    cmd,
+    data_pod: str,
+    namespace: str,
+    remote_prefix: str,
+    dirs: Sequence[str],
+    local_root: Path,
+    streams: int = 4,
+    zstd: bool = False,
+    attempts: int = 5,
+    logger: Any = None,
+) -> CollectionStats:
+    """Copy ``<remote_prefix>/<dir>`` for every *dir* to ``<local_root>/<dir>``."""
+    start = time.monotonic()
+    stats = CollectionStats(dirs=list(dirs))
+    quoted = " ".join(shlex.quote(d) for d in dirs)
+    listing = cmd.kube(
+        "exec",
+        data_pod,
+        "--",
+        "sh",
+        "-c",
+        shlex.quote(_LIST_SCRIPT),
+        "sh",
+        shlex.quote(remote_prefix),
+        quoted,
+        namespace=namespace,
+        check=False,
+    )
+    files, has_zstd = parse_listing(listing.stdout if listing.success else "")
+
+    if zstd and zstandard is not None and has_zstd:
+        stats.compression = "zstd"
+    elif zstd and logger is not None:
+        missing = "the zstandard package" if zstandard is None else "zstd in the pod"
+        logger.log_warning(f"zstd collection needs {missing}; using gzip")
+
+    if files:
+        pending = [f for f in files if not f.is_current(local_root)]
+        stats.skipped = len(files) - len(pending)
+        # Parent dirs up front: concurrent extractions would race creating them.
+        for parent in {(local_root / f.path).parent for f in pending}:
+            parent.mkdir(parents=True, exist_ok=True)
+        shards = shard_files(pending, streams)
+    else:
+        # No listing (e.g. no ``stat`` in the image): stream the dirs whole.
+        if logger is not None:
+            logger.log_warning(
+                f"Could not list result files on {data_pod}; streaming "
+                f"{len(dirs)} dir(s) whole"
+            )
+        pending = []
+        shards = [[RemoteFile(d, 0, -1) for d in dirs]]
+    for d in dirs:
+        (local_root / d).mkdir(parents=True, exist_ok=True)
+    stats.streams = len(shards)
+
+    base_argv = [
+        cmd._kube_bin,
+        *cmd._kubeconfig_args(),
+        "--namespace",
+        namespace,
+        "exec",
+        "-i",
+        data_pod,
+        "--",
+        "sh",
+        "-c",
+        _TAR_SCRIPTS[stats.compression],
+        "sh",
+        remote_prefix,
+    ]
+
+    def _run_shard(shard: list[RemoteFile]) -> str | None:
+        todo = shard
+        error = ""
+        for attempt in range(1, attempts + 1):
+            exit_code, error = stream_tar(
+                base_argv, [f.path for f in todo], local_root, stats.compression
+            )
+            if files:
+                # Whatever did arrive intact is not fetched again.
+                todo = [f for f in todo if not f.is_current(local_root)]
+                if not todo:
+                    return None
+            elif exit_code == 0:
+                return None
+            if logger is not None:
+                logger.log_warning(
+                    f"Collection stream attempt {attempt}/{attempts} failed "
+                    f"({len(todo)} file(s) left, exit={exit_code}): {error[:300]}"
+                )
+            if attempt < attempts:
+                time.sleep(min(5 * attempt, 30))
+        for f in todo:
+            stats.failed_dirs.add(f.path.split("/", 1)[0])
+        return (
+            f"Failed to collect {len(todo)} file(s) after {attempts} "
+            f"attempt(s): {error[:200]}"
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, len(shards))) as pool:
+        for err in pool.map(_run_shard, shards):
+            if err:
+                stats.errors.append(err)
+
+    stats.files = (
+        len(pending)
+        if files
+        else sum(1 for d in dirs for p in (local_root / d).rglob("*") if p.is_file())
+    )
+    stats.bytes = sum(f.size for f in pending)
+    stats.seconds = time.monotonic() - start
+    return stats
@@ -0,0 +1,234 @@
+"""Background post-processing of run treatments.
+
+Step 07 normally runs each treatment end to end -- deploy, wait, collect,
+clean up -- and only then starts the next one, so the cluster sits idle while
+results are copied off the PVC, converted to benchmark reports and uploaded.
+With ``--pipeline-treatments`` the harness for treatment N+1 is deployed as
+soon as treatment N's pods are gone, and a single background worker does N's
+collection, analysis and upload meanwhile.
+
+The hand-off is a bounded FIFO queue drained by one worker, so treatments
+finish in the order they ran.  The pipeline fails closed: when the worker
+cannot accept a treatment within the submit timeout the treatment is marked
+failed ("collector fell behind") and the caller stops launching new ones,
+and :meth:`TreatmentPipeline.close` marks anything still unfinished at its
+deadline as failed and stops the worker before it starts another job, so the
+queued treatments are reported as not collected.  Harness results stay on
+the PVC either way.
+
+Every treatment's outcome is kept as a :class:`TreatmentStatus` and written
+in order to ``run/treatment-status.yaml`` (both modes), which the experiment
+summary reads back.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+TREATMENT_STATUS_FILE = "treatment-status.yaml"
+
+
+@dataclass
+class TreatmentStatus:
+    """Outcome of one run treatment.
+
+    ``status`` is ``pending`` (deployed, post-processing not finished),
+    ``succeeded``, ``failed`` or ``skipped`` (never launched because an
+    earlier treatment aborted the run).
+    """
+
+    index: int
+    treatment: str
+    experiment_id: str | None = None
+    status: str = "pending"
+    errors: list[str] = field(default_factory=list)
+    run_seconds: float = 0.0
+    collect_seconds: float = 0.0
+    stack: str | None = None
+
+    def fail(self, *errors: str) -> None:
+        self.status = "failed"
+        self.errors.extend(errors)
+
+    def to_dict(self) -> dict[str, Any]:
+        d: dict[str, Any] = {
+            "index": self.index,
+            "treatment": self.treatment,
+            "status": self.status,
+            "run_seconds": round(self.run_seconds, 1),
+            "collect_seconds": round(self.collect_seconds, 1),
+        }
+        if self.stack:
+            d["stack"] = self.stack
+        if self.experiment_id:
+            d["experiment_id"] = self.experiment_id
+        if self.errors:
+            d["errors"] = list(self.errors)
+        return d
+
+
+#: A post-processing job: returns the treatment's errors (empty on success).
+PostProcessJob = Callable[[], list[str]]
+
+
+class TreatmentPipeline:
+    """Run post-processing jobs on one worker thread behind a bounded queue.
+
+    *depth* is how many finished treatments may wait behind the one being
+    processed.  :meth:`submit` blocks up to *submit_timeout* seconds for a
+    free slot and returns False (with the status failed) if none frees up.
+    *on_done* is called on the worker thread after each job settles.
+    """
+
+    def __init__(
+        self,
+        depth: int = 1,
+        submit_timeout: float = 3600.0,
+        on_done: Callable[[TreatmentStatus], None] | None = None,
+        logger: Any = None,
+    ):
+        self.depth = max(1, depth)
+        self.submit_timeout = submit_timeout
+        self.on_done = on_done
+        self.logger = logger
+        self.statuses: list[TreatmentStatus] = []
+        self._queue: queue.Queue = queue.Queue(maxsize=self.depth)
+        self._lock = threading.Lock()
+        self._abandoned = False
+        self._failed = False
+        self._stop = threading.Event()
+        self._current: TreatmentStatus | None = None
+        self._worker = threading.Thread(
+            target=self._drain, name="treatment-pipeline", daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def failed(self) -> bool:
+        """True once any submitted treatment has failed."""
+        with self._lock:
+            return self._failed
+
+    def submit(self, status: TreatmentStatus, job: PostProcessJob) -> bool:
+        """Queue *job* for *status*; False if the collector fell behind."""
+        self.statuses.append(status)
+        try:
+            self._queue.put((status, job), timeout=self.submit_timeout)
+        except queue.Full:
+            self._settle(
+                status,
+                [
+                    f"collector fell behind: no free pipeline slot after "
+                    f"{self.submit_timeout:.0f}s (depth {self.depth})"
+                ],
+            )
+            return False
+        return True
+
+    def close(self, timeout: float | None = None) -> list[TreatmentStatus]:
+        """Wait up to *timeout* seconds for queued jobs, then stop the worker.
+
+        Anything not finished by then is marked failed: the job in progress
+        as unfinished, the ones still queued as not collected (the worker
+        stops before starting them).  Returns the statuses in submission
+        order.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        self._worker.join(remaining)
+        with self._lock:
+            self._abandoned = self._worker.is_alive()
+            if self._abandoned:
+                self._stop.set()
+            unfinished = [s for s in self.statuses if s.status == "pending"]
+            current = self._current
+        waited = f"within {timeout:.0f}s " if timeout is not None else ""
+        not_collected = []
+        for status in unfinished:
+            if status is current:
+                error = f"collection did not finish {waited}after the last run"
+            else:
+                error = f"not collected: pipeline stopped {waited}after the last run"
+                not_collected.append(status.treatment)
+            self._settle(status, [error], force=True)
+        if not_collected and self.logger is not None:
+            self.logger.log_warning(
+                f"Treatment(s) {', '.join(not_collected)} not collected; their "
+                "results are still on the PVC"
+            )
+        return list(self.statuses)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None or self._stop.is_set():
+                return
+            status, job = item
+            with self._lock:
+                self._current = status
+            start = time.monotonic()
+            try:
+                errors = list(job() or [])
+            except Exception as exc:  # a crashed job fails its treatment only
+                errors = [f"post-processing failed: {exc}"]
+            status.collect_seconds = time.monotonic() - start
+            self._settle(status, errors)
+
+    def _settle(
+        self, status: TreatmentStatus, errors: list[str], force: bool = False
+    ) -> None:
+        with self._lock:
+            # A job that outlives close() must not overwrite its timeout verdict.
+            if self._abandoned and not force:
+                return
+            if errors:
+                status.fail(*errors)
+                self._failed = True
+            else:
+                status.status = "succeeded"
+        if self.on_done is not None:
+            try:
+                self.on_done(status)
+            except Exception as exc:
+                if self.logger is not None:
+                    self.logger.log_warning(
+                        f"Treatment status callback failed for "
+                        f"'{status.treatment}': {exc}"
+                    )
+
+
+def write_treatment_statuses(statuses: list[TreatmentStatus], path: Path) -> Path:
+    """Write *statuses*, ordered by stack then treatment index, to *path*."""
+    ordered = sorted(statuses, key=lambda s: (s.stack or "", s.index))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(
+            {"treatments": [s.to_dict() for s in ordered]},
+            f,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+    return path
+
+
+def read_treatment_statuses(path: Path) -> list[dict[str, Any]]:
+    """Read back a ``treatment-status.yaml``; empty when absent or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        return []
+    treatments = data.get("treatments") if isinstance(data, dict) else None
+    return treatments if isinstance(treatments, list) else []
@@ -31,6 +31,7 @@ from llmdbenchmark.agent import (
     WorkloadIntent,
     WorkspaceVolume,
     discover_agent_analysis_input,
+    gate_margin,
     recommend,
     render_benchmark_job_manifest,
     render_run_command,
@@ -368,3 +369,13 @@ def test_write_agent_session_workspace_creates_expected_files_deterministically(
     )
     contents_second = {p.name: p.read_bytes() for p in second.iterdir()}
     assert contents_first == contents_second
+
+
+def test_gate_margin_normalizes_units():
+    tight = SloGate(metric=SloMetric.TIME_TO_FIRST_TOKEN, threshold=30, units="ms")
+    loose = SloGate(metric=SloMetric.TIME_TO_FIRST_TOKEN, threshold=0.09, units="s")
+    report = score_slo_goodput([EXAMPLE_REPORT], [tight, loose]).reports[0]
+    margins = [gate_margin(g) for g in report.gate_results]
+    assert round(margins[0], 3) == round(0.045246614259667695 / 0.030, 3)
+    assert round(margins[1], 3) == round(0.045246614259667695 / 0.09, 3)
+    assert [g.passed for g in report.gate_results] == [False, True]
@@ -0,0 +1,84 @@
+"""Tests for the format-sniffing JSON/YAML loader behind ``import_yaml``.
+
+Every harness converter and ``import_benchmark_report`` read their input
+through ``core.import_yaml``. It used to run everything through
+``yaml.safe_load``, which is the pure-Python parser and 10-50x slower than a
+JSON parser on the multi-hundred-MB JSON results some harnesses write. The
+loader now sends JSON content to a JSON parser and everything else to
+libyaml, and these tests pin that the answer does not depend on which
+parser ran.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+import yaml
+
+from llmdbenchmark.analysis.benchmark_report import core
+from llmdbenchmark.analysis.benchmark_report.core import import_yaml, load_yaml_str
+
+FIXTURE = Path(__file__).parent / "fixtures" / "guidellm_report_v2.json"
+
+SAMPLE = {
+    "version": "0.2",
+    "run": {"uid": "abc", "tags": ["a", "b"]},
+    "results": {"latency": [0.25, 1.5, 3], "ok": True, "missing": None},
+}
+
+
+def _write(path: Path, text: str) -> str:
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_json_file_matches_safe_load():
+    with open(FIXTURE, encoding="utf-8") as handle:
+        expected = json.load(handle)
+    assert import_yaml(str(FIXTURE)) == expected
+
+
+def test_yaml_file_matches_safe_load(tmp_path):
+    text = yaml.safe_dump(SAMPLE)
+    assert import_yaml(_write(tmp_path / "br.yaml", text)) == yaml.safe_load(text)
+
+
+def test_yaml_flow_mapping_is_not_mistaken_for_json(tmp_path):
+    """A YAML flow mapping starts with ``{`` but is not JSON."""
+    path = _write(tmp_path / "flow.yaml", "{version: '0.2', run: {uid: abc}}\n")
+    assert import_yaml(path) == {"version": "0.2", "run": {"uid": "abc"}}
+
+
+def test_json_nan_is_accepted(tmp_path):
+    """Python's json writes NaN/Infinity, which strict parsers reject."""
+    path = _write(tmp_path / "nan.json", '{"mean": NaN, "max": Infinity}')
+    data = import_yaml(path)
+    assert math.isnan(data["mean"])
+    assert data["max"] == math.inf
+
+
+def test_empty_file_is_none(tmp_path):
+    assert import_yaml(_write(tmp_path / "empty.yaml", "")) is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_mmap_path_matches_buffered_read(tmp_path, monkeypatch, use_orjson):
+    """Forcing every file over the mapping threshold must not change results,
+    with or without orjson installed."""
+    if use_orjson and core.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(core, "orjson", None)
+
+    json_path = _write(tmp_path / "br.json", json.dumps(SAMPLE))
+    yaml_path = _write(tmp_path / "br.yaml", yaml.safe_dump(SAMPLE))
+    assert import_yaml(json_path, mmap_threshold=0) == SAMPLE
+    assert import_yaml(yaml_path, mmap_threshold=0) == SAMPLE
+
+
+def test_load_yaml_str_handles_both_formats():
+    assert load_yaml_str(json.dumps(SAMPLE)) == SAMPLE
+    assert load_yaml_str(yaml.safe_dump(SAMPLE)) == SAMPLE
@@ -0,0 +1,229 @@
+"""Tests for the async metrics scraper (workload/harnesses/collect_metrics.py).
+
+The scraper replaces collect_metrics.sh's per-pod curl loop; its scrape
+segments must expand into the same ``raw/{pod}_{epoch}_metrics.log`` files the
+shell script wrote, so every analysis pass keeps reading them unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from llmdbenchmark.analysis.benchmark_report.scrape_store import (  # noqa: E402
+    load_scrape_store,
+    parse_scrape_file,
+)
+
+_HARNESS_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "workload"
+    / "harnesses"
+    / "collect_metrics.py"
+)
+_spec = importlib.util.spec_from_file_location("collect_metrics", _HARNESS_PATH)
+collector_mod = importlib.util.module_from_spec(_spec)
+sys.modules["collect_metrics"] = collector_mod
+_spec.loader.exec_module(collector_mod)
+
+_BODY = (
+    "# HELP vllm:num_requests_running Running requests\n"
+    "# TYPE vllm:num_requests_running gauge\n"
+    'vllm:num_requests_running{{model_name="m"}} {value}\n'
+)
+
+
+class _StaticDiscovery:
+    def __init__(self, targets):
+        self._targets = targets
+        self.invalidated = 0
+
+    async def targets(self):
+        return list(self._targets)
+
+    def invalidate(self):
+        self.invalidated += 1
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_get("/metrics", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+def _unused_port() -> int:
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _collect(tmp_path, targets, handler, ticks=1):
+    config = collector_mod.ScrapeConfig(metrics_dir=str(tmp_path), interval=1.0)
+    discovery = _StaticDiscovery(targets)
+
+    async def scenario():
+        runner, port = await _serve(handler)
+        for target in targets:
+            target.port = target.port or port
+            target.fallback_port = port if target.fallback_port else 0
+        collector = collector_mod.MetricsCollector(config, discovery=discovery)
+        try:
+            async with aiohttp.ClientSession() as session:
+                for tick in range(ticks):
+                    await collector.tick(session, tick)
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(scenario())
+    return discovery
+
+
+def test_segments_expand_to_legacy_raw_files(tmp_path: Path) -> None:
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        return web.Response(text=_BODY.format(value=len(requests)))
+
+    targets = [
+        collector_mod.ScrapeTarget(f"decode-{i}", "127.0.0.1", "prometheus_metrics", 0)
+        for i in range(3)
+    ]
+    _collect(tmp_path, targets, handler, ticks=2)
+
+    raw_dir = tmp_path / "raw"
+    assert list((raw_dir / "segments").glob("*.seg.gz"))
+    assert collector_mod.expand_segments(str(tmp_path)) == 6
+    assert not list((raw_dir / "segments").glob("*.seg.gz"))
+
+    # Ticks are stamped with their slot, one interval apart, not when they ran.
+    files = sorted(raw_dir.glob("decode-0_*_metrics.log"))
+    epochs = [int(f.name.split("_")[1]) for f in files]
+    assert epochs[1] - epochs[0] == 1
+    text = files[0].read_text()
+    lines = text.split("\n")
+    assert lines[0].startswith("# Timestamp: ") and lines[0].endswith("+0000")
+    assert lines[1:5] == [
+        "# Pod: decode-0",
+        "# PodIP: 127.0.0.1",
+        "# Source: prometheus_metrics",
+        "",
+    ]
+    assert text.endswith("\n\n")
+    headers, samples = parse_scrape_file(str(files[0]))
+    assert headers["pod"] == "decode-0"
+    assert samples[0][0] == "vllm:num_requests_running"
+
+    store = load_scrape_store(str(tmp_path), use_cache=False)
+    assert len(store.files) == 6
+
+    timings = json.loads((tmp_path / "processed" / "scrape_timings.json").read_text())
+    assert timings["ticks"] == 2
+    assert timings["pods"]["decode-2"]["latency_s"]["count"] == 2
+    assert timings["pods"]["decode-2"]["failures"] == 0
+
+
+def test_auth_rejection_and_port_fallback(tmp_path: Path) -> None:
+    async def handler(request):
+        if "Authorization" in request.headers:
+            return web.Response(status=403, text="Forbidden\n")
+        return web.Response(text=_BODY.format(value=1))
+
+    epp = collector_mod.ScrapeTarget(
+        "epp-0", "127.0.0.1", "epp_prometheus_metrics", 0, auth="Bearer t"
+    )
+    vllm = collector_mod.ScrapeTarget(
+        "decode-0", "127.0.0.1", "prometheus_metrics", _unused_port(), 1
+    )
+    discovery = _collect(tmp_path, [epp, vllm], handler)
+    collector_mod.expand_segments(str(tmp_path))
+
+    # Later ticks go straight to what worked: no auth, the fallback port.
+    assert epp.auth == ""
+    assert vllm.fallback_port != 0 and vllm.port != vllm.fallback_port
+    for pod in ("epp-0", "decode-0"):
+        (raw,) = (tmp_path / "raw").glob(f"{pod}_*_metrics.log")
+        assert "vllm:num_requests_running" in raw.read_text()
+    assert discovery.invalidated == 0
+
+
+def test_unreachable_pod_writes_warning_and_invalidates_discovery(
+    tmp_path: Path,
+) -> None:
+    async def handler(request):
+        return web.Response(text=_BODY.format(value=1))
+
+    gone = collector_mod.ScrapeTarget(
+        "decode-gone", "127.0.0.1", "prometheus_metrics", _unused_port()
+    )
+    discovery = _collect(tmp_path, [gone], handler)
+    collector_mod.expand_segments(str(tmp_path))
+
+    (raw,) = (tmp_path / "raw").glob("decode-gone_*_metrics.log")
+    assert (
+        "# Warning: Failed to collect metrics from pod decode-gone (127.0.0.1)"
+        in raw.read_text()
+    )
+    assert discovery.invalidated == 1
+    timings = json.loads((tmp_path / "processed" / "scrape_timings.json").read_text())
+    assert timings["pods"]["decode-gone"]["failures"] == 1
+
+
+def test_scheduler_does_not_drift_and_skips_overrun_slots() -> None:
+    now = [100.0]
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(round(seconds, 6))
+        now[0] += seconds
+
+    scheduler = collector_mod.TickScheduler(10, clock=lambda: now[0], sleep=fake_sleep)
+
+    async def scenario():
+        ticks = []
+        for work in (3.0, 4.5, 27.0, 1.0):
+            ticks.append(await scheduler.wait())
+            now[0] += work
+        return ticks
+
+    ticks = asyncio.run(scenario())
+
+    # Sleeps absorb the scrape time, so ticks start on their 10s slots; the
+    # 27s tick overran slot 3 entirely, so slot 4 starts at once, 7s late.
+    assert [t[0] for t in ticks] == [0, 1, 2, 4]
+    assert slept == [7.0, 5.5]
+    assert ticks[3] == (4, 7.0, 1)
+
+
+def test_torn_segment_tail_is_ignored(tmp_path: Path) -> None:
+    segments = tmp_path / "raw" / "segments"
+    writer = collector_mod.SegmentWriter(str(segments))
+    target = collector_mod.ScrapeTarget("decode-0", "10.0.0.1", "prometheus_metrics", 1)
+    for epoch in (1000, 1015):
+        meta = {
+            "file": f"decode-0_{epoch}_metrics.log",
+            "pod": "decode-0",
+            "latency_s": 0.01,
+            "ok": True,
+        }
+        payload = collector_mod.scrape_text(target, "ts", b"up 1\n")
+        writer.append([collector_mod._frame(meta, payload)])
+    (segment,) = segments.glob("*.seg.gz")
+    segment.write_bytes(segment.read_bytes()[:-7])
+
+    assert collector_mod.expand_segments(str(tmp_path)) == 1
+    assert (tmp_path / "raw" / "decode-0_1000_metrics.log").exists()
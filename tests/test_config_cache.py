@@ -0,0 +1,81 @@
+"""Tests for the per-context config.yaml cache (executor/config_cache.py)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import yaml
+
+from llmdbenchmark.executor.config_cache import ConfigCache
+from llmdbenchmark.executor.context import ExecutionContext
+from llmdbenchmark.executor.step import Phase, Step, StepResult
+from llmdbenchmark.executor.step_executor import StepExecutor
+
+
+def _write(path: Path, data: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    return path
+
+
+class TestConfigCache:
+    def test_parses_once_and_hands_out_copies(self, tmp_path: Path):
+        path = _write(tmp_path / "config.yaml", {"model": {"args": ["--a"]}})
+        cache = ConfigCache()
+
+        first = cache.load(path)
+        first["model"]["args"].append("--mutated")
+        second = cache.load(path)
+
+        assert second == {"model": {"args": ["--a"]}}
+        assert cache.load(path, copy=False) is cache.load(path, copy=False)
+        assert (cache.stats.parses, cache.stats.hits) == (1, 3)
+
+    def test_rewritten_file_is_reparsed(self, tmp_path: Path):
+        path = _write(tmp_path / "config.yaml", {"replicas": 1})
+        cache = ConfigCache()
+        assert cache.load(path) == {"replicas": 1}
+
+        _write(path, {"replicas": 12})
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert cache.load(path) == {"replicas": 12}
+        assert cache.stats.parses == 2
+
+
+class _ReadsConfig(Step):
+    def __init__(self, number: int):
+        super().__init__(number, f"reads_{number}", "reads config", Phase.RUN, True)
+
+    def execute(self, context, stack_path=None) -> StepResult:
+        cfg = self._load_stack_config(stack_path)
+        self._load_plan_config(context)
+        self._all_target_namespaces(context)
+        ok = cfg["namespace"]["name"] == "ns"
+        return StepResult(self.number, self.name, success=ok)
+
+
+class _Logger:
+    def __getattr__(self, name):
+        return lambda *a, **k: None
+
+
+def test_steps_share_the_context_cache(tmp_path: Path):
+    cfg = {"namespace": {"name": "ns"}}
+    stacks = [
+        _write(tmp_path / f"stack-{i}" / "config.yaml", cfg).parent for i in range(3)
+    ]
+    context = ExecutionContext(
+        plan_dir=tmp_path, workspace=tmp_path, rendered_stacks=stacks
+    )
+    context._cluster_resolved = True
+    executor = StepExecutor(
+        [_ReadsConfig(1), _ReadsConfig(2)], context, _Logger(), max_parallel_stacks=1
+    )
+
+    result = executor.execute()
+
+    assert not result.has_errors
+    assert context.config_cache.stats.parses == 3
+    assert context.config_cache.stats.hits > 10
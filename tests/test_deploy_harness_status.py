@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
@@ -417,6 +418,131 @@ def test_validate_failures_falls_back_for_non_otel_workload(
     assert result.success
 
 
+def test_sequential_run_writes_ordered_treatment_status(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    logger = _Logger()
+    context, stack_path = _base_context(tmp_path, logger)
+    context.treatment_stop_on_error = True
+    context.experiment_treatments = [
+        {"name": "t0", "overrides": {}},
+        {"name": "t1", "overrides": {}},
+    ]
+    _patch_run_helpers(monkeypatch)
+    monkeypatch.setattr(
+        deploy_harness, "wait_for_pods_by_label", lambda *_a, **_k: ["wait failed"]
+    )
+
+    DeployHarnessStep().execute(context, stack_path)
+
+    runs = yaml.safe_load((context.run_dir() / "treatment-status.yaml").read_text())
+    assert [(r["treatment"], r["status"]) for r in runs["treatments"]] == [
+        ("t0", "failed"),
+        ("t1", "skipped"),
+    ]
+    assert runs["treatments"][0]["errors"] == ["wait failed"]
+
+
+def _pipelined_context(tmp_path: Path, logger: _Logger, names: list[str]):
+    context, stack_path = _base_context(tmp_path, logger)
+    context.harness_pipeline = True
+    context.experiment_treatments = [{"name": n, "overrides": {}} for n in names]
+    return context, stack_path
+
+
+def test_pipelined_collection_overlaps_next_run(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    """Treatment t0 is collected while t1's harness runs; results stay ordered."""
+    import threading
+
+    logger = _Logger()
+    context, stack_path = _pipelined_context(tmp_path, logger, ["t0", "t1"])
+    context.analyze_locally = True
+    t1_running = threading.Event()
+    events: list[str] = []
+
+    def _wait(*_a, **_k):
+        events.append("wait")
+        if events.count("wait") == 2:
+            t1_running.set()
+        return []
+
+    def _collect(_cmd, experiment_id, *_a, **_k):
+        if "-t0-" in experiment_id:
+            # Only returns promptly if t1 was deployed in the meantime.
+            assert t1_running.wait(5)
+        (context.run_results_dir() / f"{experiment_id}_1").mkdir(parents=True)
+        events.append(f"collect {experiment_id.split('-')[2]}")
+        return []
+
+    monkeypatch.setattr(deploy_harness, "wait_for_pods_by_label", _wait)
+    monkeypatch.setattr(
+        DeployHarnessStep,
+        "_collect_treatment_results_discovery",
+        staticmethod(_collect),
+    )
+    monkeypatch.setattr(deploy_harness, "delete_pods_by_names", lambda *_a, **_k: None)
+    analyzed: list[str] = []
+    monkeypatch.setattr(
+        deploy_harness,
+        "run_analysis",
+        lambda _harness, result_dir, _ctx: analyzed.append(result_dir.name),
+    )
+
+    result = DeployHarnessStep().execute(context, stack_path)
+
+    assert result.success
+    assert events == ["wait", "wait", "collect t0", "collect t1"]
+    assert [eid.split("-")[2] for eid in context.experiment_ids] == ["t0", "t1"]
+    assert context.analyzed_result_dirs == set(analyzed) and len(analyzed) == 2
+    assert [s.status for s in context.treatment_statuses] == ["succeeded"] * 2
+
+
+def test_pipelined_run_fails_closed_when_collector_falls_behind(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    logger = _Logger()
+    context, stack_path = _pipelined_context(tmp_path, logger, ["t0", "t1", "t2", "t3"])
+    # Also the submit timeout: one slot behind a 1.5s collection.
+    context.harness_wait_timeout = 1
+    _patch_run_helpers(monkeypatch)
+    monkeypatch.setattr(
+        DeployHarnessStep,
+        "_collect_treatment_results_discovery",
+        lambda *_a, **_k: time.sleep(1.5) or [],
+    )
+
+    result = DeployHarnessStep().execute(context, stack_path)
+
+    assert not result.success
+    assert any("collector fell behind" in e for e in result.errors)
+    runs = yaml.safe_load((context.run_dir() / "treatment-status.yaml").read_text())
+    assert [r["status"] for r in runs["treatments"]] == [
+        "succeeded",
+        "failed",
+        "failed",
+        "skipped",
+    ]
+    assert "did not finish within 1s" in runs["treatments"][1]["errors"][0]
+
+
+def test_pipeline_disabled_when_treatments_are_retried(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    logger = _Logger()
+    context, stack_path = _pipelined_context(tmp_path, logger, ["t0"])
+    context.treatment_max_attempts = 2
+    _patch_run_helpers(monkeypatch)
+    monkeypatch.setattr(
+        deploy_harness,
+        "TreatmentPipeline",
+        lambda *_a, **_k: (_ for _ in ()).throw(AssertionError("pipelined")),
+    )
+
+    assert DeployHarnessStep().execute(context, stack_path).success
+
+
 def test_debug_harness_uses_generic_name_and_mounts_all_profiles(
     tmp_path: Path,
 ) -> None:
@@ -765,6 +765,16 @@ class TestExperimentSummary:
         assert len(d["treatments"]) == 2
         assert isinstance(d["total_duration_seconds"], float)
 
+    def test_run_statuses_in_order(self, summary: ExperimentSummary):
+        runs = [
+            {"index": 1, "treatment": "conc8", "status": "succeeded"},
+            {"index": 2, "treatment": "conc16", "status": "failed"},
+        ]
+        summary.record_failure("t1", "run", "Error", 1, 2, run_statuses=runs)
+        d = summary.to_dict()["treatments"][0]
+        assert d["run_treatments"] == "1/2"
+        assert d["run_treatment_status"] == runs
+
     def test_write_yaml(self, summary: ExperimentSummary, tmp_path: Path):
         summary.record_success("t1", 6, 6, "/tmp/ws1", 100.0)
         summary.record_failure("t2", "standup", "Error", 0, 6)
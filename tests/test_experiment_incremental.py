@@ -0,0 +1,229 @@
+"""Tests for incremental setup-treatment standup (experiment/incremental.py)."""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+# The experiment loop imports the search module, whose pydantic report schema
+# must load before the planner stub below (see test_experiment_search.py).
+import llmdbenchmark.experiment.search  # noqa: F401
+
+# Stub planner so we can import llmdbenchmark.cli (see
+# test_smoketest_inference.py for the same pattern + rationale).
+if "planner" not in sys.modules:
+    planner_stub = types.ModuleType("planner")
+    capacity_stub = types.ModuleType("planner.capacity_planner")
+    capacity_stub.__getattr__ = lambda name: lambda *a, **kw: None  # type: ignore
+    sys.modules["planner"] = planner_stub
+    sys.modules["planner.capacity_planner"] = capacity_stub
+
+from llmdbenchmark import cli  # noqa: E402
+from llmdbenchmark.experiment.incremental import (  # noqa: E402
+    decide_standup,
+    plan_incremental_standups,
+    write_incremental_report,
+)
+from llmdbenchmark.experiment.parser import SetupTreatment  # noqa: E402
+
+BASE_FILES = {
+    "02_pvc_model-pvc.yaml": "kind: PersistentVolumeClaim\n",
+    "04_download_job.yaml": "kind: Job\n",
+    "05_namespace_sa_rbac_secret.yaml": "kind: Namespace\n",
+    "10_helmfile-main.yaml": "releases: []\n",
+    "12_router-values.yaml": "plugins: default\n",
+    "13_ms-values.yaml": "decode:\n  replicas: 2\n",
+    "18_podmonitor.yaml": "",
+}
+BASE_CONFIG = {
+    "namespace": {"name": "bench"},
+    "release": "llmdbench",
+    "modelservice": {"enabled": True},
+    "decode": {"replicas": 2},
+}
+
+
+def _plan(root: Path, files: dict | None = None, cfg: dict | None = None) -> Path:
+    stack = root / "plan" / "stack-a"
+    stack.mkdir(parents=True)
+    for name, content in {**BASE_FILES, **(files or {})}.items():
+        if content is not None:
+            (stack / name).write_text(content)
+    (stack / "config.yaml").write_text(yaml.safe_dump({**BASE_CONFIG, **(cfg or {})}))
+    return root / "plan"
+
+
+class TestDecideStandup:
+    """Changed plan files map to the standup steps that apply them."""
+
+    def test_first_treatment_is_full(self, tmp_path: Path):
+        decision = decide_standup("t1", _plan(tmp_path / "t1"))
+        assert decision.mode == "full"
+        assert decision.reason == "nothing deployed"
+
+    def test_ms_values_change_reruns_modelservice_only(self, tmp_path: Path):
+        before = _plan(tmp_path / "t1")
+        after = _plan(
+            tmp_path / "t2",
+            {"13_ms-values.yaml": "decode:\n  replicas: 4\n"},
+            {"decode": {"replicas": 4}},
+        )
+        decision = decide_standup("t2", after, "t1", before)
+
+        assert decision.incremental
+        assert decision.steps == [0, 7, 9, 10, 11]
+        (diff,) = decision.diffs
+        assert diff.changed == ["13_ms-values.yaml"]
+        assert diff.config_keys == ["decode"]
+        assert "04_download_job.yaml" in diff.unchanged
+
+    def test_identical_plan_only_reruns_checks(self, tmp_path: Path):
+        before = _plan(tmp_path / "t1")
+        after = _plan(tmp_path / "t2")
+        decision = decide_standup("t2", after, "t1", before)
+
+        assert decision.incremental
+        assert decision.step_spec == "0,10,11"
+        assert decision.reason.startswith("plan unchanged")
+
+    def test_newly_rendered_resource_is_applied(self, tmp_path: Path):
+        before = _plan(tmp_path / "t1")
+        after = _plan(tmp_path / "t2", {"18_podmonitor.yaml": "kind: PodMonitor\n"})
+        decision = decide_standup("t2", after, "t1", before)
+
+        assert decision.incremental
+        assert decision.diffs[0].added == ["18_podmonitor.yaml"]
+        assert 9 in decision.steps
+
+    @pytest.mark.parametrize(
+        ("files", "cfg", "reason"),
+        [
+            ({"18_podmonitor.yaml": ""}, None, "resources removed"),
+            ({"13_ms-values.yaml": None}, None, "resources removed"),
+            (None, {"namespace": {"name": "other"}}, "namespace changed"),
+            (None, {"kustomize": {"enabled": True}}, "kustomize standup"),
+            ({"99_new-thing.yaml": "kind: X\n"}, None, "no standup step known"),
+            (None, {"harness": {"name": "guidellm"}}, "only config.yaml changed"),
+        ],
+    )
+    def test_falls_back_to_full_cycle(self, tmp_path: Path, files, cfg, reason):
+        monitor = {"18_podmonitor.yaml": "kind: PodMonitor\n"}
+        before = _plan(tmp_path / "t1", monitor)
+        after = _plan(tmp_path / "t2", {**monitor, **(files or {})}, cfg)
+        decision = decide_standup("t2", after, "t1", before)
+
+        assert decision.mode == "full"
+        assert reason in decision.reason
+
+
+class TestPlanSequence:
+    """Decisions chain over a treatment sequence and serialize to the report."""
+
+    def test_render_failure_breaks_the_chain(self, tmp_path: Path):
+        decisions = plan_incremental_standups(
+            [
+                ("t1", _plan(tmp_path / "t1")),
+                ("t2", None),
+                ("t3", _plan(tmp_path / "t3")),
+                ("t4", _plan(tmp_path / "t4", {"12_router-values.yaml": "kv\n"})),
+            ]
+        )
+        assert [d.mode for d in decisions] == ["full", "full", "full", "incremental"]
+        assert decisions[3].previous == "t3"
+        assert decisions[3].steps == [0, 7, 8, 10, 11]
+
+        report = tmp_path / "incremental-plan.yaml"
+        write_incremental_report(decisions, report)
+        document = yaml.safe_load(report.read_text())
+        assert document["incremental"] == 1
+        assert document["decisions"][3]["stacks"][0]["changed"] == [
+            "12_router-values.yaml"
+        ]
+
+
+class TestExperimentLoop:
+    """``experiment --incremental`` keeps the stack up between treatments."""
+
+    @pytest.fixture
+    def calls(self, tmp_path: Path, monkeypatch) -> list[tuple]:
+        treatments = {
+            "tp2": {},
+            "tp4": {"13_ms-values.yaml": "decode:\n  replicas: 4\n"},
+            "other-ns": {},
+        }
+        configs = {"other-ns": {"namespace": {"name": "elsewhere"}}}
+        calls: list[tuple] = []
+
+        def render(args, logger, setup_overrides=None):
+            name = setup_overrides["name"]
+            _plan(Path(cli.config.workspace), treatments[name], configs.get(name))
+            return SimpleNamespace(rendered_paths=[], name=name)
+
+        def standup(args, logger, rendered, step_spec=None):
+            calls.append(("standup", rendered.name, step_spec))
+            return None, None
+
+        def phase(kind):
+            def run(args, logger, rendered, **_):
+                calls.append((kind, rendered.name))
+                return None, None
+
+            return run
+
+        monkeypatch.setattr(cli, "_render_plans_for_experiment", render)
+        monkeypatch.setattr(cli, "_do_standup", standup)
+        monkeypatch.setattr(cli, "_do_smoketest", phase("smoketest"))
+        monkeypatch.setattr(cli, "_do_run", phase("run"))
+        monkeypatch.setattr(cli, "_do_teardown", phase("teardown"))
+        monkeypatch.setattr(
+            "llmdbenchmark.experiment.parser.parse_experiment",
+            lambda path: SimpleNamespace(
+                name="sweep",
+                harness=None,
+                profile=None,
+                dataset_url=None,
+                setup_treatments=[
+                    SetupTreatment(name=n, overrides={"name": n}) for n in treatments
+                ],
+                has_setup_phase=True,
+                run_treatments_count=1,
+                total_matrix=3,
+                experiment_file=tmp_path / "sweep.yaml",
+                search=None,
+            ),
+        )
+        monkeypatch.setattr(cli.config, "workspace", tmp_path)
+        monkeypatch.setattr(cli.config, "plan_dir", tmp_path / "plan")
+
+        args = SimpleNamespace(
+            experiments=str(tmp_path / "sweep.yaml"), incremental=True
+        )
+        cli._execute_experiment(args, MagicMock())
+        return calls
+
+    def test_standups_reuse_the_previous_stack(self, calls, tmp_path: Path):
+        assert calls == [
+            ("standup", "tp2", None),
+            ("smoketest", "tp2"),
+            ("run", "tp2"),
+            ("standup", "tp4", "0,7,9,10,11"),
+            ("smoketest", "tp4"),
+            ("run", "tp4"),
+            ("teardown", "tp4"),
+            ("standup", "other-ns", None),
+            ("smoketest", "other-ns"),
+            ("run", "other-ns"),
+            ("teardown", "other-ns"),
+        ]
+        report = yaml.safe_load((tmp_path / "incremental-plan.yaml").read_text())
+        assert [d["mode"] for d in report["decisions"]] == [
+            "full",
+            "incremental",
+            "full",
+        ]
@@ -0,0 +1,172 @@
+"""Tests for cost-aware setup-treatment ordering (experiment/ordering.py)."""
+
+from __future__ import annotations
+
+import itertools
+import random
+import sys
+import types
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# Stub planner so we can import llmdbenchmark.cli (see
+# test_smoketest_inference.py for the same pattern + rationale).
+if "planner" not in sys.modules:
+    planner_stub = types.ModuleType("planner")
+    capacity_stub = types.ModuleType("planner.capacity_planner")
+    capacity_stub.__getattr__ = lambda name: lambda *a, **kw: None  # type: ignore
+    sys.modules["planner"] = planner_stub
+    sys.modules["planner.capacity_planner"] = capacity_stub
+
+from llmdbenchmark import cli  # noqa: E402
+from llmdbenchmark.experiment.ordering import (  # noqa: E402
+    cost_matrix,
+    flatten_overrides,
+    order_setup_treatments,
+    path_weight,
+    reconfiguration_cost,
+    tour_cost,
+)
+from llmdbenchmark.experiment.parser import (  # noqa: E402
+    SetupTreatment,
+    dotted_to_nested,
+)
+
+
+def _treatment(name: str, **flat) -> SetupTreatment:
+    flat = {k.replace("__", "."): v for k, v in flat.items()}
+    return SetupTreatment(name=name, overrides=dotted_to_nested(flat))
+
+
+def _sweep(models, tps, replicas) -> list[SetupTreatment]:
+    """Full factorial sweep with the model varying fastest (worst file order)."""
+    axes = [("replicas", replicas), ("tp", tps), ("model", models)]
+    treatments = []
+    for combo in itertools.product(*(values for _, values in axes)):
+        point = dict(zip((name for name, _ in axes), combo))
+        treatments.append(
+            _treatment(
+                f"{point['model']}-tp{point['tp']}-r{point['replicas']}",
+                model__name=point["model"],
+                decode__parallelism__tensor=point["tp"],
+                decode__replicas=point["replicas"],
+            )
+        )
+    return treatments
+
+
+class TestCostModel:
+    """Per-path weights: model > accelerator/TP > replicas > vLLM flags."""
+
+    def test_weight_ranking(self):
+        model = path_weight("model.name")
+        tp = path_weight("decode.parallelism.tensor")
+        replicas = path_weight("prefill.replicas")
+        flags = path_weight("vllmCommon.flags.enablePrefixCaching")
+        assert model > tp > replicas > flags > 0
+
+    def test_flatten_round_trips_dotted_overrides(self):
+        flat = {"decode.replicas": 2, "decode.parallelism.tensor": 4, "x": [1]}
+        assert flatten_overrides(dotted_to_nested(flat)) == flat
+
+    def test_unset_path_counts_as_changed(self):
+        a = {"decode.replicas": 2}
+        b = {"decode.replicas": 2, "model.name": "m"}
+        assert reconfiguration_cost(a, a) == 0
+        assert reconfiguration_cost(a, b) == path_weight("model.name")
+
+    def test_custom_weights_and_default(self):
+        a, b = {"router.plugins": "x"}, {"router.plugins": "y"}
+        assert reconfiguration_cost(a, b, [("router.*", 7.0)]) == 7.0
+        assert reconfiguration_cost(a, b, [], default=1.5) == 1.5
+
+
+class TestOrdering:
+    """Reordering is deterministic, never worse, and groups costly changes."""
+
+    def test_model_changes_happen_once(self):
+        treatments = _sweep(["llama", "qwen"], [2, 4], [1, 2, 4])
+        result = order_setup_treatments(treatments)
+
+        models = [t.overrides["model"]["name"] for t in result.treatments]
+        switches = sum(a != b for a, b in zip(models, models[1:]))
+        assert switches == 1
+        assert result.reordered and result.cost < result.original_cost
+        assert result.savings_pct == pytest.approx(
+            100 * (result.original_cost - result.cost) / result.original_cost
+        )
+        assert sorted(t.name for t in result.treatments) == sorted(
+            t.name for t in treatments
+        )
+
+    def test_deterministic(self):
+        treatments = _sweep(["a", "b", "c"], [1, 2, 8], [1, 3])
+        first = [t.name for t in order_setup_treatments(treatments).treatments]
+        for _ in range(3):
+            again = order_setup_treatments(list(treatments))
+            assert [t.name for t in again.treatments] == first
+
+    def test_file_order_kept_when_already_cheapest(self):
+        # Already a Gray-code walk: one axis changes per step, model once.
+        walk = [("a", 2, 1), ("a", 2, 2), ("a", 4, 2), ("a", 4, 1)]
+        walk += [("b", tp, r) for _, tp, r in reversed(walk)]
+        treatments = [
+            _treatment(
+                f"{m}-tp{tp}-r{r}",
+                model__name=m,
+                decode__parallelism__tensor=tp,
+                decode__replicas=r,
+            )
+            for m, tp, r in walk
+        ]
+        result = order_setup_treatments(treatments)
+
+        assert not result.reordered
+        assert result.treatments == treatments
+        assert result.savings == 0
+
+    def test_matches_brute_force_on_small_sets(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            treatments = [
+                _treatment(
+                    f"t{i}",
+                    model__name=rng.choice("ab"),
+                    decode__parallelism__tensor=rng.choice([1, 2, 4]),
+                    decode__replicas=rng.choice([1, 2]),
+                    vllmCommon__flags__x=rng.choice([True, False]),
+                )
+                for i in range(6)
+            ]
+            matrix = cost_matrix(treatments)
+            optimum = min(
+                tour_cost(order, matrix)
+                for order in itertools.permutations(range(len(treatments)))
+            )
+            result = order_setup_treatments(treatments)
+            assert result.cost <= result.original_cost
+            # Heuristic, but within one cheap step of the optimum here.
+            assert result.cost - optimum <= path_weight("decode.replicas")
+
+    @pytest.mark.parametrize("count", [0, 1, 2])
+    def test_trivial_sets(self, count):
+        treatments = [_treatment(f"t{i}", model__name=f"m{i}") for i in range(count)]
+        result = order_setup_treatments(treatments)
+        assert result.treatments == treatments
+        assert not result.reordered
+
+
+class TestExperimentWiring:
+    """``experiment --order-treatments`` reorders the plan before it runs."""
+
+    def test_cli_reorders_plan(self):
+        treatments = _sweep(["llama", "qwen"], [2, 4], [1, 2])
+        plan = SimpleNamespace(setup_treatments=list(treatments))
+        logger = MagicMock()
+        cli._order_setup_treatments(plan, logger)
+
+        expected = order_setup_treatments(treatments).treatments
+        assert [t.name for t in plan.setup_treatments] == [t.name for t in expected]
+        assert "% saved" in logger.log_info.call_args_list[0].args[0]
@@ -0,0 +1,280 @@
+"""Tests for adaptive saturation search (experiment/search.py)."""
+
+from __future__ import annotations
+
+import math
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+# The search module (and the pydantic report schema behind it) is imported
+# before the planner stub below: the stub's catch-all ``__getattr__`` confuses
+# ``inspect`` when pydantic reads field docstrings from a module's source.
+from llmdbenchmark.experiment.parser import parse_experiment
+from llmdbenchmark.experiment.search import (
+    SaturationSearch,
+    SearchPoint,
+    SearchSpec,
+    score_point,
+    write_point_experiment,
+)
+from llmdbenchmark.experiment.summary import ExperimentSummary
+
+# Stub planner so we can import llmdbenchmark.cli (see
+# test_smoketest_inference.py for the same pattern + rationale).
+if "planner" not in sys.modules:
+    planner_stub = types.ModuleType("planner")
+    capacity_stub = types.ModuleType("planner.capacity_planner")
+    capacity_stub.__getattr__ = lambda name: lambda *a, **kw: None  # type: ignore
+    sys.modules["planner"] = planner_stub
+    sys.modules["planner.capacity_planner"] = capacity_stub
+
+from llmdbenchmark import cli  # noqa: E402
+
+EXAMPLE_REPORT = (
+    Path(__file__).resolve().parent.parent
+    / "llmdbenchmark"
+    / "analysis"
+    / "benchmark_report"
+    / "br_v0_2_example.yaml"
+)
+
+SEARCH = {
+    "knob": "max-concurrency",
+    "range": [4, 256],
+    "name": "conc",
+    "slo": {
+        "percentile": "p95",
+        "gates": [{"metric": "time_to_first_token", "threshold": 500, "units": "ms"}],
+    },
+}
+
+
+def _ttft(level: float) -> float:
+    """Synthetic p95 TTFT in seconds; crosses 0.5s at level 50*ln(5) ~ 80.5."""
+    return 0.1 * math.exp(level / 50)
+
+
+def _spec(**overrides) -> SearchSpec:
+    return SearchSpec.from_dict({**SEARCH, **overrides})
+
+
+def _simulate(search: SaturationSearch, ttft=_ttft) -> list[float]:
+    while (level := search.next_level()) is not None:
+        margin = ttft(level) / 0.5
+        search.record(
+            SearchPoint(
+                level=level,
+                name=search.treatment_name(level),
+                verdict="pass" if margin <= 1 else "fail",
+                margin=margin,
+            )
+        )
+    return [p.level for p in search.points]
+
+
+def _report(path: Path, ttft_p95: float) -> Path:
+    data = yaml.safe_load(EXAMPLE_REPORT.read_text())
+    data["results"]["request_performance"]["aggregate"]["latency"][
+        "time_to_first_token"
+    ]["p95"] = ttft_p95
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data, sort_keys=False))
+    return path
+
+
+class TestSearchSpec:
+    def test_parses_defaults(self):
+        spec = _spec()
+        assert (spec.low, spec.high, spec.strategy) == (4, 256, "fit")
+        assert spec.gates[0].threshold == 500
+        assert spec.integer and spec.max_points == 8
+
+    @pytest.mark.parametrize(
+        ("override", "message"),
+        [
+            ({"knob": None}, "search.knob"),
+            ({"range": [10, 5]}, "search.range"),
+            ({"range": [1]}, "search.range"),
+            ({"slo": {"gates": []}}, "search.slo.gates"),
+            ({"slo": {"gates": [{"metric": "ttft", "threshold": 1}]}}, "search.slo"),
+            ({"strategy": "golden"}, "search.strategy"),
+            ({"max_points": 1}, "search.max_points"),
+        ],
+    )
+    def test_rejects_invalid(self, override, message):
+        with pytest.raises(ValueError, match=message):
+            _spec(**override)
+
+    def test_parse_experiment_reads_search(self, tmp_path: Path):
+        path = tmp_path / "exp.yaml"
+        path.write_text(yaml.safe_dump({"search": SEARCH}))
+        plan = parse_experiment(path)
+        assert plan.search.knob == "max-concurrency"
+        assert plan.run_treatments_count == 0
+
+        path.write_text(
+            yaml.safe_dump({"search": SEARCH, "treatments": [{"name": "a"}]})
+        )
+        with pytest.raises(ValueError, match="not both"):
+            parse_experiment(path)
+
+
+class TestSaturationSearch:
+    """The search brackets the knee in far fewer points than a grid."""
+
+    @pytest.mark.parametrize("strategy", ["bisect", "fit"])
+    def test_finds_knee_within_tolerance(self, strategy):
+        search = SaturationSearch(_spec(strategy=strategy, max_points=12))
+        levels = _simulate(search)
+
+        assert levels[:2] == [4, 256]
+        assert search.reason == "converged"
+        knee = 50 * math.log(5)
+        assert search.best.level <= knee
+        assert knee - search.best.level <= 0.05 * 256
+        assert len(levels) < 12
+
+    def test_fit_needs_fewer_points_than_bisect(self):
+        for ttft in (_ttft, lambda level: 0.1 + 0.4 * (level / 90) ** 3):
+            bisect = SaturationSearch(_spec(strategy="bisect", max_points=20))
+            fit = SaturationSearch(_spec(strategy="fit", max_points=20))
+            assert len(_simulate(fit, ttft)) < len(_simulate(bisect, ttft))
+            assert fit.best.level >= bisect.best.level
+
+    def test_integer_levels_converge_to_adjacent_values(self):
+        search = SaturationSearch(_spec(tolerance=0.001, max_points=20))
+        levels = _simulate(search)
+        assert all(isinstance(level, int) for level in levels)
+        assert search.best.level == 80
+        assert 81 in levels
+
+    def test_continuous_levels_and_names(self):
+        search = SaturationSearch(
+            _spec(range=[0.02, 0.2], integer=False, name="rate", tolerance=0.02)
+        )
+        _simulate(search, ttft=lambda rate: 0.1 * math.exp(rate / 0.05))
+        assert search.best.level == pytest.approx(0.05 * math.log(5), rel=0.03)
+        assert search.treatment_name(0.08) == "rate0p08"
+
+    def test_stops_at_range_ends(self):
+        always_ok = SaturationSearch(_spec())
+        assert _simulate(always_ok, ttft=lambda _: 0.1) == [4, 256]
+        assert always_ok.reason == "SLO met at the highest load"
+
+        never_ok = SaturationSearch(_spec())
+        assert _simulate(never_ok, ttft=lambda _: 1.0) == [4]
+        assert never_ok.reason == "SLO missed at the lowest load"
+        assert never_ok.best is None
+
+    def test_errors_count_as_failures_and_indeterminate_stops(self):
+        search = SaturationSearch(_spec(strategy="bisect"))
+        search.record(SearchPoint(level=4, name="conc4", verdict="pass", margin=0.2))
+        search.record(SearchPoint(level=256, name="conc256", verdict="error"))
+        assert search.next_level() == 130
+
+        search.record(SearchPoint(level=130, name="conc130", verdict="indeterminate"))
+        assert search.next_level() is None
+        assert search.reason == "could not judge conc130 against the SLO"
+
+    def test_budget_is_respected(self):
+        search = SaturationSearch(_spec(max_points=3, tolerance=0.0001))
+        assert len(_simulate(search)) == 3
+        assert search.reason == "point budget exhausted"
+
+
+class TestScoring:
+    def test_score_point_uses_slo_gates(self, tmp_path: Path):
+        spec = _spec()
+        ok = score_point(spec, 8, "conc8", [_report(tmp_path / "a.yaml", 0.25)])
+        assert ok.verdict == "pass"
+        assert ok.margin == pytest.approx(0.5)
+        assert ok.output_token_rate == pytest.approx(2262.448)
+
+        slow = _report(tmp_path / "b.yaml", 0.75)
+        both = score_point(spec, 8, "conc8", [tmp_path / "a.yaml", slow])
+        assert both.verdict == "fail"
+        assert both.margin == pytest.approx(1.5)
+
+        assert score_point(spec, 8, "conc8", []).verdict == "indeterminate"
+
+    def test_point_experiment_keeps_run_controls(self, tmp_path: Path):
+        source = tmp_path / "exp.yaml"
+        source.write_text(
+            yaml.safe_dump(
+                {
+                    "experiment": {"name": "sweep"},
+                    "reset_caches": True,
+                    "constants": {"num-prompts": 200},
+                    "search": SEARCH,
+                }
+            )
+        )
+        path = write_point_experiment(
+            source, _spec(), 24, "conc24", tmp_path / "search" / "conc24.yaml"
+        )
+        assert yaml.safe_load(path.read_text()) == {
+            "reset_caches": True,
+            "constants": {"num-prompts": 200},
+            "treatments": [{"name": "conc24", "max-concurrency": 24}],
+        }
+
+
+class TestExperimentLoop:
+    """The orchestrator runs one level per point and records every point."""
+
+    def test_search_runs_and_summarizes(self, tmp_path: Path, monkeypatch):
+        experiment_file = tmp_path / "exp.yaml"
+        experiment_file.write_text(yaml.safe_dump({"search": SEARCH}))
+        plan = parse_experiment(experiment_file)
+        ran = []
+
+        def fake_run(args, logger, rendered, experiment_file_override=None):
+            point = yaml.safe_load(Path(experiment_file_override).read_text())
+            (treatment,) = point["treatments"]
+            level = treatment["max-concurrency"]
+            ran.append(level)
+            if level == 256:
+                raise cli.PhaseError("harness pod OOMKilled")
+            results = Path(cli.config.workspace) / "results" / treatment["name"]
+            _report(results / "benchmark_report_v0.2,_stage_0.yaml", _ttft(level))
+            return None, None
+
+        monkeypatch.setattr(cli, "_do_run", fake_run)
+        monkeypatch.setattr(cli.config, "workspace", tmp_path)
+        monkeypatch.setattr(cli.config, "dry_run", False)
+
+        search = SaturationSearch(plan.search)
+        cli._run_saturation_search(None, MagicMock(), None, plan, search)
+
+        assert ran[:2] == [4, 256]
+        assert search.points[1].error == "harness pod OOMKilled"
+        assert 70 <= search.best.level <= 80
+        assert (tmp_path / "search" / f"{search.best.name}.yaml").exists()
+
+        summary = ExperimentSummary("sweep", 1, plan.search.max_points)
+        summary.record_success(
+            "default", len(search.points), 8, search=search.to_dict()
+        )
+        recorded = summary.to_dict()["treatments"][0]["search"]
+        assert recorded["max_passing_level"] == search.best.level
+        assert [p["level"] for p in recorded["points"]] == ran
+        assert recorded["points"][0]["verdict"] == "pass"
+
+    def test_unjudgeable_search_fails_the_run(self, tmp_path: Path, monkeypatch):
+        experiment_file = tmp_path / "exp.yaml"
+        experiment_file.write_text(yaml.safe_dump({"search": SEARCH}))
+        plan = parse_experiment(experiment_file)
+
+        monkeypatch.setattr(cli, "_do_run", lambda *a, **kw: (None, None))
+        monkeypatch.setattr(cli.config, "workspace", tmp_path)
+        monkeypatch.setattr(cli.config, "dry_run", False)
+
+        search = SaturationSearch(plan.search)
+        with pytest.raises(cli.PhaseError, match="could not judge any load level"):
+            cli._run_saturation_search(None, MagicMock(), None, plan, search)
+        assert search.points[0].error == "no benchmark_report_v0.2 files were produced"
@@ -0,0 +1,97 @@
+"""Tests for the analysis explorer's bulk benchmark-report loader.
+
+``docs/analysis/explorer.py`` imports the benchmark report package under its
+top-level name, as the notebook does, so each check runs in a subprocess
+from that directory rather than importing a second copy of the schemas here.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+import yaml
+
+pytest.importorskip("pandas")
+
+ANALYSIS_DIR = Path(__file__).resolve().parent.parent / "docs" / "analysis"
+EXAMPLE = ANALYSIS_DIR / "benchmark_report" / "br_v0_1_example.yaml"
+
+
+@pytest.fixture()
+def report_dir(tmp_path: Path) -> Path:
+    report = yaml.safe_load(EXAMPLE.read_text(encoding="utf-8"))
+    report["scenario"]["load"]["metadata"] = {"stage": 0}
+    report["scenario"]["load"]["args"]["load"] = {"stages": [{"rate": 5}]}
+    for i in range(6):
+        report["metrics"]["throughput"]["output_tokens_per_sec"] = 100.0 * (i + 1)
+        (tmp_path / f"run{i}").mkdir()
+        (tmp_path / f"run{i}" / "benchmark_report,_x.yaml").write_text(
+            yaml.safe_dump(report), encoding="utf-8"
+        )
+    return tmp_path
+
+
+def _run(script: str, *args: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script), *args],
+        cwd=ANALYSIS_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_bulk_load_matches_row_by_row(report_dir: Path) -> None:
+    _run(
+        """
+        import sys
+        import pandas as pd
+        import explorer as xp
+
+        files = sorted(xp.get_benchmark_report_files(sys.argv[1]))
+        runs = xp.make_benchmark_runs_df()
+        for br in files:
+            xp.add_benchmark_report_to_df(runs, br)
+        for workers in (1, 2):
+            bulk = xp.load_benchmark_reports_df(files, max_workers=workers)
+            pd.testing.assert_frame_equal(runs, bulk, check_dtype=False)
+
+        extended = xp.load_benchmark_reports_df(files[:2], runs, max_workers=1)
+        assert len(extended) == len(files) + 2 and len(runs) == len(files)
+        """,
+        str(report_dir),
+    )
+
+
+def test_cache_parses_only_new_or_changed_files(report_dir: Path) -> None:
+    cache = report_dir / "rows.pkl"
+    changed = report_dir / "run0" / "benchmark_report,_x.yaml"
+    script = """
+        import sys
+        import explorer as xp
+
+        parsed = []
+        row = xp._benchmark_report_row
+        xp._benchmark_report_row = lambda path: parsed.append(path) or row(path)
+        files = sorted(xp.get_benchmark_report_files(sys.argv[1]))
+        df = xp.load_benchmark_reports_df(files, max_workers=1, cache_file=sys.argv[2])
+        print(len(parsed), len(df), df["Output_Token_Throughput"].sum())
+    """
+    assert _run(script, str(report_dir), str(cache)).split() == ["6", "6", "2100.0"]
+    assert _run(script, str(report_dir), str(cache)).split() == ["0", "6", "2100.0"]
+
+    text = changed.read_text(encoding="utf-8")
+    changed.write_text(text.replace("100.0", "700.0"), encoding="utf-8")
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _run(script, str(report_dir), str(cache)).split() == ["1", "6", "2700.0"]
+
+    cache.write_bytes(b"not a pickle")
+    assert _run(script, str(report_dir), str(cache)).split()[0] == "6"
@@ -27,14 +27,17 @@ import json
 from pathlib import Path
 
 import pytest
+import yaml
 
-from llmdbenchmark.analysis.benchmark_report import guidellm_native
+from llmdbenchmark.analysis.benchmark_report import guidellm_native, native_to_br0_2
 from llmdbenchmark.analysis.benchmark_report.base import Units
 from llmdbenchmark.analysis.benchmark_report.native_to_br0_1 import (
     import_guidellm as import_guidellm_v01,
+    iter_guidellm as iter_guidellm_v01,
 )
 from llmdbenchmark.analysis.benchmark_report.native_to_br0_2 import (
     import_guidellm as import_guidellm_v02,
+    iter_guidellm as iter_guidellm_v02,
 )
 from llmdbenchmark.analysis.benchmark_report.native_to_br0_2_1 import (
     import_guidellm as import_guidellm_v021,
@@ -329,3 +332,116 @@ def test_rate_and_concurrency_per_strategy_kind(strategy, expected):
     read a single run-wide ``rate`` list for all of them."""
     results = {"config": {"strategy": strategy}}
     assert guidellm_native.rate_and_concurrency({}, results) == expected
+
+
+# ---------------------------------------------------------------------------
+# Single-pass streaming import of every benchmark
+# ---------------------------------------------------------------------------
+
+
+def _without_uid(report) -> dict:
+    """Report contents minus the per-report random UID."""
+    dumped = report.model_dump(mode="json")
+    dumped["run"].pop("uid", None)
+    return dumped
+
+
+def _write_sweep(path: Path, native: dict, count: int) -> Path:
+    """Write a report holding ``count`` copies of the fixture's first stage."""
+    sweep = dict(native, benchmarks=[native["benchmarks"][0]] * count)
+    path.write_text(json.dumps(sweep, indent=2), encoding="utf-8")
+    return path
+
+
+def test_iter_guidellm_matches_indexed_import():
+    """Streaming must produce exactly what converting each index does."""
+    streamed = list(iter_guidellm_v02(str(FIXTURE)))
+    assert len(streamed) == 2
+    for index, report in enumerate(streamed):
+        expected = import_guidellm_v02(str(FIXTURE), index)
+        assert _without_uid(report) == _without_uid(expected)
+
+
+def test_import_all_never_parses_whole_file(monkeypatch):
+    """The old path parsed the full file once to count benchmarks and once
+    more per benchmark. No full-document parse may remain."""
+
+    def _no_full_parse(_path):
+        raise AssertionError("whole results file parsed")
+
+    monkeypatch.setattr(guidellm_native, "import_yaml", _no_full_parse)
+    monkeypatch.setattr(native_to_br0_2, "import_yaml", _no_full_parse)
+
+    reports = native_to_br0_2.import_guidellm_all(str(FIXTURE))
+    assert [r.scenario.load.standardized.stage for r in reports] == [0, 1]
+
+
+@pytest.mark.parametrize("count", [1, 4, 16])
+def test_stream_reads_file_once(tmp_path, monkeypatch, native, count):
+    """Linear scaling: however many benchmarks the sweep holds, the reader
+    consumes each character of the file exactly once and yields each
+    benchmark exactly once. A tiny read size forces every value across
+    many buffer refills."""
+    sweep = _write_sweep(tmp_path / "sweep.json", native, count)
+    monkeypatch.setattr(guidellm_native, "_STREAM_CHUNK_CHARS", 97)
+
+    consumed = 0
+    original_fill = guidellm_native._JsonStream._fill
+
+    def _counting_fill(stream):
+        nonlocal consumed
+        before = len(stream._buf) - stream._pos
+        filled = original_fill(stream)
+        if filled:
+            consumed += len(stream._buf) - before
+        return filled
+
+    monkeypatch.setattr(guidellm_native._JsonStream, "_fill", _counting_fill)
+
+    entries = list(guidellm_native.iter_benchmarks(str(sweep)))
+    assert [index for _, index, _ in entries] == list(range(count))
+    assert all(results == native["benchmarks"][0] for _, _, results in entries)
+    assert consumed == len(sweep.read_text(encoding="utf-8"))
+
+
+def test_stream_holds_benchmarks_until_config_is_read(tmp_path, native):
+    """A report that writes ``benchmarks`` ahead of ``config`` still converts:
+    the run-wide config is needed for every benchmark."""
+    reordered = {"benchmarks": native["benchmarks"], "config": native["config"]}
+    path = tmp_path / "reordered.json"
+    path.write_text(json.dumps(reordered), encoding="utf-8")
+
+    reports = list(iter_guidellm_v02(str(path)))
+    assert [r.scenario.load.standardized.rate_qps for r in reports] == [
+        b["config"]["strategy"]["rate"] for b in native["benchmarks"]
+    ]
+    assert reports[0].scenario.load.native.config == native["config"]
+
+
+def test_stream_falls_back_to_yaml(tmp_path, native):
+    """YAML results cannot be streamed, but must still convert."""
+    path = tmp_path / "results.yaml"
+    path.write_text(yaml.safe_dump(native), encoding="utf-8")
+
+    reports = list(iter_guidellm_v02(str(path)))
+    assert len(reports) == len(native["benchmarks"])
+    assert _without_uid(reports[1]) == _without_uid(
+        import_guidellm_v02(str(FIXTURE), 1)
+    )
+
+
+def test_stream_rejects_truncated_json(tmp_path, native):
+    path = tmp_path / "truncated.json"
+    text = json.dumps(native)
+    path.write_text(text[: len(text) // 2], encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        list(guidellm_native.iter_benchmarks(str(path)))
+
+
+def test_v0_1_iter_guidellm_matches_indexed_import():
+    streamed = list(iter_guidellm_v01(str(FIXTURE)))
+    assert [r.scenario.load.metadata["stage"] for r in streamed] == [0, 1]
+    assert streamed[1].metrics.time.duration == (
+        import_guidellm_v01(str(FIXTURE), 1).metrics.time.duration
+    )
@@ -0,0 +1,100 @@
+"""Tests for per-stack buffered logging when stacks run in parallel."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from llmdbenchmark.executor.context import ExecutionContext
+from llmdbenchmark.executor.step import Phase, Step, StepResult
+from llmdbenchmark.executor.step_executor import StepExecutor
+from llmdbenchmark.logging.logger import get_logger
+
+
+def _stdout_log(log_dir: Path, name: str) -> list[str]:
+    (path,) = log_dir.glob(f"{name}-*-stdout.log")
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+class _Chatty(Step):
+    """Logs a few lines per stack, sleeping between them so stacks overlap."""
+
+    def __init__(self, logger):
+        super().__init__(1, "chatty", "logs a lot", Phase.SMOKETEST, True)
+        self.logger = logger
+
+    def execute(self, context, stack_path=None) -> StepResult:
+        for i in range(4):
+            self.logger.log_info(f"{stack_path.name} line {i}")
+            time.sleep(0.05)
+        return StepResult(self.number, self.name, success=True)
+
+
+def test_parallel_stacks_log_in_contiguous_blocks(tmp_path: Path, capsys):
+    logger = get_logger(tmp_path, log_name="parallel")
+    stacks = []
+    for name in ("alpha", "beta", "gamma"):
+        (tmp_path / name).mkdir()
+        stacks.append(tmp_path / name)
+    context = ExecutionContext(
+        plan_dir=tmp_path,
+        workspace=tmp_path,
+        rendered_stacks=stacks,
+        current_phase=Phase.SMOKETEST,
+    )
+    context._cluster_resolved = True
+
+    started = time.monotonic()
+    result = StepExecutor(
+        [_Chatty(logger)], context, logger, max_parallel_stacks=3
+    ).execute()
+    elapsed = time.monotonic() - started
+
+    assert not result.has_errors
+    assert elapsed < 2 * 4 * 0.05  # the stacks really overlapped
+    console = capsys.readouterr().out.splitlines()
+    lines = [line for line in console if " line " in line]
+    owners = [line.rsplit(" line ", 1)[0].split()[-1] for line in lines]
+    # Each stack's lines form one uninterrupted run on the terminal.
+    runs = [o for i, o in enumerate(owners) if i == 0 or owners[i - 1] != o]
+    assert sorted(runs) == ["alpha", "beta", "gamma"]
+    file_lines = [
+        line for line in _stdout_log(tmp_path, "parallel") if " line " in line
+    ]
+    assert sorted(file_lines) == sorted(lines)
+    assert all(r.duration > 0 for r in result.stack_results)
+    summary = [line for line in _stdout_log(tmp_path, "parallel") if "wall" in line]
+    assert "3 stack(s) finished in" in summary[0]
+
+
+def test_buffered_block_still_writes_log_files_immediately(tmp_path: Path, capsys):
+    logger = get_logger(tmp_path, log_name="buffered")
+    with logger.buffered():
+        logger.log_info("stack progress")
+        logger.log_warning("stack warning")
+        logger.log_plain("banner")
+
+        assert any(
+            "stack progress" in line for line in _stdout_log(tmp_path, "buffered")
+        )
+        (errors,) = tmp_path.glob("buffered-*-stderr.log")
+        assert "stack warning" in errors.read_text(encoding="utf-8")
+        assert capsys.readouterr().out == ""
+
+    console = capsys.readouterr()
+    assert "stack progress" in console.out and "banner" in console.out
+    assert "stack warning" in console.err
+    assert _stdout_log(tmp_path, "buffered").count("banner") == 1
+
+
+def test_indent_is_per_thread(tmp_path: Path):
+    logger = get_logger(tmp_path, log_name="indent")
+    logger.set_indent(1)
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(logger._indent_level))
+    thread.start()
+    thread.join()
+
+    assert seen == [0]
+    assert logger._indent_level == 1
@@ -0,0 +1,105 @@
+"""Tests for the vectorized Pareto-front and SLO masks.
+
+``benchmark_report.pareto`` replaces the analysis explorer's nested
+``iterrows`` loops and flags fronts in the cross-treatment CSV. A row stays on
+the front unless another row is strictly better in every objective, and a NaN
+objective neither dominates nor is dominated; the brute-force reference below
+pins that definition.
+"""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from llmdbenchmark.analysis.benchmark_report.pareto import pareto_mask, slo_mask
+
+
+def _reference_front(costs: np.ndarray) -> np.ndarray:
+    """O(n^2) definition: kept unless some row is strictly lower everywhere."""
+    with np.errstate(invalid="ignore"):
+        better = (costs[None, :, :] < costs[:, None, :]).all(axis=2)
+    return ~better.any(axis=1)
+
+
+def _random_costs(seed: int, rows: int, objectives: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    # Few distinct values so ties in one objective are common.
+    costs = rng.integers(0, 12, size=(rows, objectives)).astype(float)
+    costs[rng.random(rows) < 0.05, 0] = np.nan
+    return costs
+
+
+@pytest.mark.parametrize("objectives", [1, 2, 3, 4])
+@pytest.mark.parametrize("seed", range(5))
+def test_mask_matches_brute_force(objectives: int, seed: int) -> None:
+    costs = _random_costs(seed, 300, objectives)
+    assert np.array_equal(pareto_mask(costs), _reference_front(costs))
+
+
+def test_nd_sweep_spans_several_blocks(monkeypatch) -> None:
+    from llmdbenchmark.analysis.benchmark_report import pareto
+
+    monkeypatch.setattr(pareto, "_SWEEP_BLOCK_ELEMENTS", 64)
+    costs = np.random.default_rng(7).random((500, 3))
+    assert np.array_equal(pareto_mask(costs), _reference_front(costs))
+
+
+def test_maximize_flips_direction() -> None:
+    # (throughput, latency): higher throughput and lower latency are better.
+    values = np.array([[10.0, 1.0], [19.0, 2.0], [5.0, 3.0], [20.0, 1.5]])
+    assert pareto_mask(values, [True, False]).tolist() == [True, False, False, True]
+
+
+def test_ties_and_nan_rows_stay_on_front() -> None:
+    values = np.array([[1.0, 1.0], [1.0, 2.0], [np.nan, 9.0], [2.0, 2.0]])
+    assert pareto_mask(values).tolist() == [True, True, True, False]
+
+
+def test_direction_count_must_match() -> None:
+    with pytest.raises(ValueError):
+        pareto_mask(np.zeros((3, 2)), [True])
+
+
+def test_slo_mask_is_inclusive_and_fails_nan() -> None:
+    values = np.array([[0.5, 100.0], [0.2, 50.0], [np.nan, 200.0], [0.1, 100.0]])
+    meets = slo_mask(values, [0.5, 100.0], [False, True])
+    assert meets.tolist() == [True, False, False, True]
+    with pytest.raises(ValueError):
+        slo_mask(values, [0.5])
+
+
+# ---------------------------------------------------------------------------
+# Callers
+# ---------------------------------------------------------------------------
+
+
+def test_cross_treatment_csv_flags_front(tmp_path: Path) -> None:
+    from llmdbenchmark.analysis.cross_treatment import generate_cross_treatment_summary
+
+    for name, tps, ttft in (("a", 100, 0.5), ("b", 200, 0.9), ("c", 90, 0.6)):
+        (tmp_path / name).mkdir()
+        aggregate = {
+            "throughput": {"output_token_rate": {"mean": tps}},
+            "latency": {"time_to_first_token": {"p99": ttft}},
+        }
+        (tmp_path / name / "benchmark_report_v0.2,_x.yaml").write_text(
+            yaml.safe_dump(
+                {"results": {"request_performance": {"aggregate": aggregate}}}
+            )
+        )
+    out = tmp_path / "out"
+    assert generate_cross_treatment_summary(tmp_path, out) == 3
+
+    with open(out / "treatment_comparison.csv", encoding="utf-8") as f:
+        rows = {row["treatment"]: row for row in csv.DictReader(f)}
+    assert {t: r["pareto_output_tps_vs_ttft_p99"] for t, r in rows.items()} == {
+        "a": "True",
+        "b": "True",
+        "c": "False",
+    }
+    assert rows["a"]["pareto_output_tps_vs_tpot_p99"] == ""
@@ -0,0 +1,146 @@
+"""Tests for incremental, parallel plot rendering (benchmark_report/plot_jobs.py).
+
+Analysis plots are :class:`PlotJob` objects -- a module-level render function
+plus the data it draws -- run by :func:`run_plot_jobs`, which skips jobs whose
+PNG exists with the input digest recorded in ``.plot-digests.json``.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from llmdbenchmark.analysis.benchmark_report.plot_jobs import (
+    MANIFEST_NAME,
+    PlotJob,
+    run_plot_jobs,
+)
+
+
+def _write(output: str, values: list = (), when: datetime | None = None) -> None:
+    Path(output).write_text(json.dumps(values), encoding="utf-8")
+
+
+def _fail(output: str) -> None:
+    raise ValueError("no data")
+
+
+def _jobs(out: Path, series: list[tuple[str, list]]) -> list[PlotJob]:
+    return [PlotJob(str(out / f"{k}.png"), _write, {"values": v}) for k, v in series]
+
+
+def _mtimes(out: Path) -> dict[str, int]:
+    return {p.name: p.stat().st_mtime_ns for p in out.glob("*.png")}
+
+
+def test_rerun_redraws_only_changed_or_missing_plots(tmp_path: Path):
+    series = [("ttft", [1, 2]), ("tpot", [3.5, float("nan")]), ("e2e", [5])]
+    first = run_plot_jobs(_jobs(tmp_path, series), workers=1)
+    assert (first.drawn, first.skipped, first.failed) == (3, 0, {})
+    before = _mtimes(tmp_path)
+
+    again = run_plot_jobs(_jobs(tmp_path, series), workers=1)
+    assert (again.drawn, again.skipped) == (0, 3)
+    assert _mtimes(tmp_path) == before
+
+    (tmp_path / "e2e.png").unlink()
+    series[0] = ("ttft", [1, 2, 9])
+    changed = run_plot_jobs(_jobs(tmp_path, series), workers=1)
+    assert (changed.drawn, changed.skipped, changed.plotted) == (2, 1, 3)
+    assert json.loads((tmp_path / "ttft.png").read_text()) == [1, 2, 9]
+    assert _mtimes(tmp_path)["tpot.png"] == before["tpot.png"]
+
+
+def test_failed_job_is_reported_and_retried(tmp_path: Path):
+    jobs = [
+        PlotJob(str(tmp_path / "bad.png"), _fail),
+        PlotJob(str(tmp_path / "ok.png"), _write, {"values": [1]}),
+    ]
+    result = run_plot_jobs(jobs, workers=1)
+    assert result.drawn == 1
+    assert result.failed == {str(tmp_path / "bad.png"): "no data"}
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert list(manifest) == ["ok.png"]
+    assert run_plot_jobs(jobs, workers=1).failed  # not skipped next time
+
+
+def test_digest_covers_nested_data_and_datetimes(tmp_path: Path):
+    when = datetime(2026, 7, 14, tzinfo=timezone.utc)
+    job = PlotJob(str(tmp_path / "a.png"), _write, {"values": [("pod", [1.0])]})
+    same = PlotJob(str(tmp_path / "a.png"), _write, {"values": [["pod", [1.0]]]})
+    dated = PlotJob(str(tmp_path / "a.png"), _write, {"values": [1.0], "when": when})
+    assert job.digest() == same.digest()
+    assert dated.digest() != job.digest()
+    with pytest.raises(TypeError):
+        PlotJob(str(tmp_path / "a.png"), _write, {"values": object()}).digest()
+
+
+def test_pool_matches_serial(tmp_path: Path):
+    series = [(f"plot{i}", list(range(i))) for i in range(6)]
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "pool").mkdir()
+
+    run_plot_jobs(_jobs(tmp_path / "serial", series), workers=1)
+    result = run_plot_jobs(_jobs(tmp_path / "pool", series), workers=3)
+
+    assert result.drawn == 6
+    for name in _mtimes(tmp_path / "serial"):
+        assert (tmp_path / "pool" / name).read_bytes() == (
+            tmp_path / "serial" / name
+        ).read_bytes()
+    assert (tmp_path / "pool" / MANIFEST_NAME).read_bytes() == (
+        tmp_path / "serial" / MANIFEST_NAME
+    ).read_bytes()
+
+
+def test_per_request_plots_skip_unchanged_inputs(tmp_path: Path):
+    pytest.importorskip("matplotlib")
+    from llmdbenchmark.analysis.per_request_plots import generate_per_request_plots
+
+    requests = [
+        {
+            "start_time": 100.0 + i,
+            "end_time": 101.0 + i,
+            "info": {
+                "output_token_times": [100.2 + i, 100.3 + i, 100.5 + i],
+                "input_tokens": 10 * (i + 1),
+                "output_tokens": 3,
+            },
+        }
+        for i in range(5)
+    ]
+    pr_file = tmp_path / "per_request_lifecycle_metrics.json"
+    pr_file.write_text(json.dumps(requests), encoding="utf-8")
+    out = tmp_path / "analysis" / "distributions"
+
+    assert generate_per_request_plots(tmp_path) == 7
+    before = _mtimes(out)
+    assert generate_per_request_plots(tmp_path) == 7
+    assert _mtimes(out) == before
+
+    requests[0]["info"]["input_tokens"] = 999
+    pr_file.write_text(json.dumps(requests), encoding="utf-8")
+    assert generate_per_request_plots(tmp_path) == 7
+    redrawn = {name for name, mtime in _mtimes(out).items() if mtime != before[name]}
+    assert redrawn == {"scatter_ttft_vs_input.png"}
+
+
+def test_without_manifest_always_draws_and_records_nothing(tmp_path: Path):
+    jobs = _jobs(tmp_path, [("ttft", [1])])
+    run_plot_jobs(jobs, workers=1, manifest=False)
+    again = run_plot_jobs(jobs, workers=1, manifest=False)
+    assert (again.drawn, again.skipped) == (1, 0)
+    assert not (tmp_path / MANIFEST_NAME).exists()
+
+
+def test_one_off_visualize_plot_raises_on_failure(tmp_path: Path):
+    from llmdbenchmark.analysis import visualize_metrics
+
+    visualize_metrics._submit(PlotJob(str(tmp_path / "ok.png"), _write), None)
+    with pytest.raises(RuntimeError, match="no data"):
+        visualize_metrics._submit(PlotJob(str(tmp_path / "bad.png"), _fail), None)
+    assert not (tmp_path / MANIFEST_NAME).exists()
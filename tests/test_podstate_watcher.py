@@ -0,0 +1,175 @@
+"""Tests for the shared pod watcher (llmdbenchmark.utilities.podstate.watcher).
+
+Waiting on many harness pods must cost one namespace listing per tick, not
+several ``kubectl get pod`` calls per pod, and must keep the outcome strings
+step 08 has always reported.
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from llmdbenchmark.utilities import kube_helpers
+from llmdbenchmark.utilities.podstate import (
+    PodWatcher,
+    release_watchers,
+    shared_watcher,
+)
+
+
+class _Logger:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def log_info(self, msg: str, *_: Any, **__: Any) -> None:
+        self.lines.append(msg)
+
+    log_error = log_warning = log_debug = log_info
+
+
+class _Result:
+    def __init__(self, *, success: bool = True, stdout: str = "") -> None:
+        self.success = success
+        self.stdout = stdout
+        self.dry_run = False
+
+
+class _Command:
+    """Serves a scripted sequence of pod listings, one per ``get pods``."""
+
+    dry_run = False
+
+    def __init__(self, listings: list[list[dict] | None]) -> None:
+        self.listings = listings
+        self.calls: list[tuple[str, ...]] = []
+
+    def kube(self, *args: str, **_: Any) -> _Result:
+        self.calls.append(args)
+        assert args[:2] == ("get", "pods"), f"unexpected kubectl call: {args}"
+        index = min(len(self.calls), len(self.listings)) - 1
+        items = self.listings[index]
+        if items is None:
+            return _Result(success=False)
+        return _Result(stdout=json.dumps({"items": items}))
+
+
+def _pod(name: str, phase: str = "Running", waiting: str = "", exit_code=None):
+    state: dict = {}
+    if waiting:
+        state["waiting"] = {"reason": waiting}
+    if exit_code is not None:
+        state["terminated"] = {"reason": "Error", "exitCode": exit_code}
+    return {
+        "metadata": {"name": name, "uid": f"uid-{name}"},
+        "status": {
+            "phase": phase,
+            "containerStatuses": [{"name": "harness", "state": state}],
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch) -> None:
+    monkeypatch.setattr("llmdbenchmark.utilities.podstate.watcher.time.sleep", _noop)
+
+
+def _noop(*_: Any) -> None:
+    pass
+
+
+def test_many_pods_resolve_from_one_listing_per_tick() -> None:
+    names = [f"harness-{i}" for i in range(20)]
+    cmd = _Command(
+        [
+            None,  # apiserver hiccup: nobody is resolved, nobody fails
+            [_pod(n) for n in names[:10]],
+            [_pod(n, "Succeeded") for n in names[:19]]
+            + [_pod(names[19], "Failed", exit_code=3)],
+        ]
+    )
+    logger = _Logger()
+    watcher = PodWatcher(cmd, "bench", max_age=0)
+
+    outcomes = watcher.wait_for_pods(names, timeout=60, logger=logger)
+
+    assert len(cmd.calls) == 3
+    assert all(outcomes[n] == "Succeeded" for n in names[:19])
+    assert outcomes["harness-19"] == "Failed"
+    assert "Pod 'harness-19' failed (exit_code=3, 0s)" in logger.lines
+    assert any("Running=10" in line and "NotFound=10" in line for line in logger.lines)
+
+
+def test_crash_state_and_timeout_outcomes() -> None:
+    cmd = _Command([[_pod("a", waiting="ImagePullBackOff"), _pod("b")]])
+    watcher = PodWatcher(cmd, "bench", max_age=0)
+
+    outcomes = watcher.wait_for_pods(["a"], timeout=60)
+    assert outcomes == {"a": "Terminal state: ImagePullBackOff"}
+
+    outcomes = watcher.wait_for_pods(["b"], timeout=0)
+    assert outcomes == {"b": "Timed out after 0s"}
+
+
+def test_concurrent_callers_reuse_a_fresh_snapshot() -> None:
+    cmd = _Command([[_pod("a", "Succeeded"), _pod("b", "Succeeded")]])
+    watcher = shared_watcher(cmd, "bench")
+    assert shared_watcher(cmd, "bench") is watcher
+
+    assert watcher.wait_for_pods(["a"], timeout=60) == {"a": "Succeeded"}
+    assert watcher.wait_for_pods(["b"], timeout=60) == {"b": "Succeeded"}
+    assert len(cmd.calls) == 1
+
+
+def test_shared_watcher_connects_once_and_is_released() -> None:
+    class _Api:
+        closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+    cmd = _Command([[_pod("a", "Succeeded")]])
+    connects: list[_Api] = []
+
+    def connect() -> _Api:
+        connects.append(_Api())
+        return connects[-1]
+
+    watcher = shared_watcher(cmd, "bench-release", connect=connect)
+    assert shared_watcher(cmd, "bench-release", connect=connect) is watcher
+    assert len(connects) == 1
+
+    release_watchers(cmd)
+    assert connects[0].closed and watcher.api_client is None
+    assert shared_watcher(cmd, "bench-release") is not watcher
+    release_watchers(cmd)
+
+
+def test_api_failure_falls_back_to_kubectl() -> None:
+    class _BrokenApi:
+        def call_api(self, *_: Any, **__: Any):
+            raise RuntimeError("connection refused")
+
+    cmd = _Command([[_pod("a", "Succeeded")]])
+    watcher = PodWatcher(cmd, "bench", api_client=_BrokenApi(), max_age=0)
+
+    assert watcher.wait_for_pods(["a"], timeout=60) == {"a": "Succeeded"}
+    assert watcher.api_client is None
+    assert len(cmd.calls) == 1
+
+
+def test_wait_for_pod_keeps_single_pod_contract(monkeypatch) -> None:
+    monkeypatch.setenv("LLMDBENCH_POD_WATCH_API", "false")
+    cmd = _Command([[_pod("solo", "Running")], [_pod("solo", "Succeeded")]])
+    logger = _Logger()
+    context = SimpleNamespace(dry_run=False, logger=logger)
+
+    result = kube_helpers.wait_for_pod(
+        cmd, "solo", "bench-wait", 60, context, poll_interval=0
+    )
+
+    assert result == "Succeeded"
+    assert any(line.startswith("Pod 'solo': Running (") for line in logger.lines)
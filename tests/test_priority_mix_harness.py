@@ -191,3 +191,131 @@ def test_priority_mix_reports_streaming_ttft_and_tpot() -> None:
     assert summary["ttft_ms"]["avg"] > 0
     assert summary["tpot_ms"]["avg"] > 0
     assert summary["output_tokens"] == 3
+
+
+def test_lazy_schedule_matches_weighted_schedule() -> None:
+    classes = [
+        priority_mix.TrafficClass(name="critical", weight=0.2),
+        priority_mix.TrafficClass(name="batch", weight=0.8),
+    ]
+    lazy = priority_mix.iter_weighted_schedule(classes)
+    eager = priority_mix.weighted_schedule(classes, 50)
+
+    assert [next(lazy).name for _ in range(50)] == [tc.name for tc in eager]
+    assert sum(tc.name == "critical" for tc in eager) == 10
+
+
+def test_arrival_processes_hit_the_target_rate() -> None:
+    constant = priority_mix.arrival_offsets("constant", 200)
+    assert [next(constant) for _ in range(3)] == [0.0, 0.005, 0.01]
+
+    poisson = priority_mix.arrival_offsets("poisson", 200, seed=7)
+    offsets = [next(poisson) for _ in range(20001)]
+    assert offsets == sorted(offsets)
+    assert abs(20000 / offsets[-1] - 200) < 10
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    delay = 0.3
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        _ = self.rfile.read(length)
+        time.sleep(self.delay)
+        body = json.dumps({"id": "ok", "choices": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        return
+
+
+def test_open_loop_drops_requests_over_max_in_flight() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        profile = {
+            "endpoint_url": f"http://127.0.0.1:{server.server_port}",
+            "model": "test-model",
+            "load": {
+                "rate_per_second": 100,
+                "max_in_flight": 2,
+                "total_requests": 6,
+                "late_threshold_ms": 50,
+            },
+            "trafficClasses": [
+                {"name": "critical", "weight": 1, "objective": "app-critical"},
+            ],
+        }
+        output = priority_mix.run(profile, priority_mix.logging.getLogger("test"))
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
+
+    # Arrivals never wait on completions: the four that found two requests
+    # outstanding are dropped instead of being sent late.
+    assert output["load"]["engine"] == "asyncio"
+    assert output["load"]["dispatched"] == 2
+    assert output["load"]["dropped"] == 4
+    critical = output["summary"]["traffic_classes"]["critical"]
+    assert (critical["requests"], critical["dropped"], critical["late"]) == (2, 4, 0)
+
+
+def test_default_max_in_flight_drops_nothing_with_slow_responses() -> None:
+    # Responses outlast a second, so ceil(rate) slots would not be enough.
+    class Handler(_SlowHandler):
+        delay = 1.5
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        profile = {
+            "endpoint_url": f"http://127.0.0.1:{server.server_port}",
+            "model": "test-model",
+            "load": {"rate_per_second": 4, "total_requests": 6},
+            "trafficClasses": [
+                {"name": "critical", "weight": 1, "objective": "app-critical"},
+            ],
+        }
+        output = priority_mix.run(profile, priority_mix.logging.getLogger("test"))
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
+
+    assert priority_mix.LoadSettings.from_profile(profile).max_in_flight == 240
+    assert (output["load"]["dispatched"], output["load"]["dropped"]) == (6, 0)
+
+
+def test_open_loop_records_requests_that_raise(monkeypatch) -> None:
+    async def explode(*_: Any, **__: Any):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(priority_mix, "send_request_async", explode)
+    profile = {"model": "test-model"}
+    settings = priority_mix.LoadSettings(
+        rate_per_second=1000, total_requests=3, max_in_flight=3
+    )
+    classes = [priority_mix.TrafficClass(name="critical", weight=1)]
+
+    results, dispatch_times, dropped = priority_mix.asyncio.run(
+        priority_mix.run_open_loop(profile, settings, classes, "http://127.0.0.1:9")
+    )
+
+    assert len(dispatch_times) == 3 and not dropped
+    assert [(r.traffic_class, r.latency_ms) for r in results] == [
+        ("critical", None)
+    ] * 3
+    assert all(r.error == "RuntimeError('boom')" for r in results)
+
+
+def test_self_test_reaches_target_rate() -> None:
+    stats = priority_mix.self_test(rate_per_second=1000, duration_seconds=1)
+
+    assert stats["dispatched"] == 1000
+    assert stats["errors"] == 0 and stats["dropped"] == 0
+    assert stats["achieved_rate"] > 900
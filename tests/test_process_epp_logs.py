@@ -0,0 +1,269 @@
+"""Tests for the streaming EPP log analyzer (workload/harnesses/process_epp_logs.py).
+
+Includes an oracle check: the pre-streaming aggregation (every entry parsed
+into a list, then one pass per metric) is reproduced here on top of the
+module's list-based helpers and asserted to produce the same summary and
+time series as the streaming analyzer.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_HARNESS_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "workload"
+    / "harnesses"
+    / "process_epp_logs.py"
+)
+_spec = importlib.util.spec_from_file_location("process_epp_logs", _HARNESS_PATH)
+epp = importlib.util.module_from_spec(_spec)
+sys.modules["process_epp_logs"] = epp
+_spec.loader.exec_module(epp)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic logs
+# ---------------------------------------------------------------------------
+
+
+def _line(pod: str, record: dict) -> str:
+    return f"[pod/{pod}/epp] " + json.dumps(record, separators=(",", ":"))
+
+
+def _pod_log(pod: str, requests: int) -> list[str]:
+    start = datetime(2026, 7, 1, 12, 0, 0)
+    lines = [
+        _line(
+            pod,
+            {
+                "ts": "2026-07-01T11:59:59.000000001Z",
+                "level": "info",
+                "msg": "Creating new SaturationDetector",
+                "queueDepthThreshold": 5,
+                "kvCacheUtilThreshold": 0.8,
+                "metricsStalenessThreshold": "200ms",
+            },
+        ),
+        f"[pod/{pod}/epp] plain-text startup banner",
+    ]
+    for i in range(requests):
+        rid = f"{pod}-{i}"
+        t = start + timedelta(milliseconds=37 * i)
+
+        def ts(us: int) -> str:
+            return (t + timedelta(microseconds=us)).isoformat() + "123Z"
+
+        def add(us: int, msg: str, level: str = "debug", **fields) -> None:
+            lines.append(
+                _line(pod, {"ts": ts(us), "level": level, "msg": msg, **fields})
+            )
+
+        add(0, "Received request", **{"x-request-id": rid})
+        add(10, "LLM request assembled", **{"x-request-id": rid})
+        for j, plugin in enumerate(["decode-filter", "prefix-filter"]):
+            add(
+                20 + 30 * j,
+                "Running filter plugin",
+                plugin=plugin,
+                **{"x-request-id": rid},
+            )
+            add(
+                31 + 30 * j + i % 7,
+                "Completed running filter plugin successfully",
+                plugin=plugin,
+                **{"x-request-id": rid},
+            )
+        add(100, "Running scorer plugin", plugin="kv-scorer", **{"x-request-id": rid})
+        add(
+            120 + i % 13,
+            "Completed running scorer plugin successfully",
+            plugin="kv-scorer",
+            **{"x-request-id": rid},
+        )
+        add(
+            125,
+            "Calculated score",
+            endpoint={"name": f"vllm-{i % 2}", "namespace": "bench"},
+            score=(i % 10) / 10,
+            **{"x-request-id": rid},
+        )
+        targets = [
+            {
+                "Endpoint": {"Address": f"10.0.0.{k}", "Port": "8000"},
+                "Score": k / (i + 3),
+            }
+            for k in (1, 2, 3)
+        ]
+        add(
+            200,
+            "Candidate pods for picking",
+            **{"x-request-id": rid, "endpoints-weighted-score": targets},
+        )
+        if i % 5:
+            add(
+                250 + 3 * (i % 17),
+                "Completed running picker plugin successfully",
+                result={"TargetEndpoints": [targets[i % 3]]},
+                **{"x-request-id": rid},
+            )
+        add(900, "Request handled", endpoint="10.0.0.9:8000", **{"x-request-id": rid})
+        if i % 4 == 0:
+            add(950, "Failed to fetch metrics", level="error", **{"x-request-id": rid})
+        if i % 3:
+            add(5000, "Exiting HandleResponseBodyComplete", **{"x-request-id": rid})
+    lines.append(f'[pod/{pod}/epp] {{"ts":"2026-07-01T13:00:00Z","msg":"cut')
+    lines.append("")
+    return lines
+
+
+def _write_log(path: Path, pods: list[str], requests: int = 40) -> Path:
+    lines = [line for pod in pods for line in _pod_log(pod, requests)]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Oracle: the pre-streaming aggregation
+# ---------------------------------------------------------------------------
+
+
+def _legacy_outputs(log_path: Path) -> tuple[dict, dict]:
+    entries = epp.parse_log_file(str(log_path))
+    traces = epp.correlate_requests(entries)
+    scoring_data = epp.extract_scoring_data(entries)
+    total_lines = sum(1 for _ in open(log_path))
+
+    dispatch = []
+    for trace in traces.values():
+        if trace.assembled_time and trace.picker_complete_time:
+            dt = (trace.picker_complete_time - trace.assembled_time).total_seconds()
+            if dt >= 0:
+                dispatch.append((trace.assembled_time, dt, trace.request_id))
+
+    filter_latencies = defaultdict(list)
+    scorer_latencies = defaultdict(list)
+    request_dist = defaultdict(lambda: {"count": 0})
+    for trace in traces.values():
+        for timings, latencies in (
+            (trace.filter_plugin_timings, filter_latencies),
+            (trace.scorer_plugin_timings, scorer_latencies),
+        ):
+            for plugin, (start, end) in timings.items():
+                if start and end and (end - start).total_seconds() >= 0:
+                    latencies[plugin].append((end - start).total_seconds())
+        if trace.picked_endpoint:
+            request_dist[trace.picked_endpoint]["count"] += 1
+
+    summary = {
+        "_metadata": {
+            "source_file": log_path.name,
+            "total_log_lines": total_lines,
+            "parsed_entries": len(entries),
+            "total_requests": len(traces),
+            "parse_errors": total_lines - len(entries),
+        },
+        "saturation_config": epp.extract_saturation_config(entries),
+        "dispatch_latency": epp.compute_stats([d[1] for d in dispatch], "seconds"),
+        "plugin_latencies": {
+            "filter": {
+                p: epp.compute_stats(v, "seconds") for p, v in filter_latencies.items()
+            },
+            "scorer": {
+                p: epp.compute_stats(v, "seconds") for p, v in scorer_latencies.items()
+            },
+        },
+        "request_distribution": dict(request_dist),
+        "endpoint_scores": {
+            addr: epp.compute_stats([s.score for s in snaps], "score")
+            for addr, snaps in scoring_data.items()
+        },
+        "error_counts": epp.count_errors(entries),
+    }
+    dispatch.sort(key=lambda point: point[0])
+    ts_data = {
+        "scoring_timeseries": {
+            addr: {
+                "timestamps": [s.timestamp.isoformat() for s in snaps],
+                "scores": [s.score for s in snaps],
+                "request_ids": [s.request_id for s in snaps],
+            }
+            for addr, snaps in scoring_data.items()
+        },
+        "dispatch_latency_timeseries": {
+            "timestamps": [p[0].isoformat() for p in dispatch],
+            "latencies_seconds": [p[1] for p in dispatch],
+            "request_ids": [p[2] for p in dispatch],
+        },
+    }
+    return summary, ts_data
+
+
+def _dump(document: dict) -> str:
+    return json.dumps(document, indent=2, default=str)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_streaming_matches_list_based_aggregation(tmp_path: Path) -> None:
+    log_path = _write_log(tmp_path / "epp_pods.log", ["epp-a", "epp-b"])
+
+    summary, ts_data = epp.analyze_log_file(str(log_path)).outputs()
+    expected_summary, expected_ts = _legacy_outputs(log_path)
+
+    assert _dump(summary) == _dump(expected_summary)
+    assert _dump(ts_data) == _dump(expected_ts)
+    assert summary["_metadata"]["parse_errors"] == 6
+
+
+def test_irrelevant_lines_are_not_decoded(tmp_path: Path, monkeypatch) -> None:
+    log_path = _write_log(tmp_path / "epp_pods.log", ["epp-a"], requests=10)
+    decoded = []
+    loads = json.loads
+
+    def counting_loads(text, *args, **kwargs):
+        decoded.append(text)
+        return loads(text, *args, **kwargs)
+
+    monkeypatch.setattr(epp.json, "loads", counting_loads)
+    analyzer = epp.analyze_log_file(str(log_path))
+
+    assert not any('"msg":"Received request"' in text for text in decoded)
+    assert analyzer.outputs()[0]["_metadata"]["total_requests"] == 10
+
+
+def test_traces_close_on_terminal_message(tmp_path: Path) -> None:
+    analyzer = epp.EppLogAnalyzer()
+    for line in _pod_log("epp-a", requests=6):
+        analyzer.feed_line(line)
+
+    # Requests 1, 2, 4 and 5 logged their terminal message; 0 and 3 did not.
+    assert sorted(analyzer._open) == ["epp-a-0", "epp-a-3"]
+    assert len(analyzer.dispatch) == 3
+    analyzer.close()
+    assert not analyzer._open
+    assert len(analyzer.request_ids) == 6
+
+
+def test_parallel_files_match_combined_log(tmp_path: Path) -> None:
+    pods = ["epp-a", "epp-b", "epp-c"]
+    combined = _write_log(tmp_path / "epp_pods.log", pods)
+    per_pod = [str(_write_log(tmp_path / f"{pod}.log", [pod])) for pod in pods]
+
+    summary, ts_data = epp.analyze_log_file(str(combined)).outputs()
+    merged_summary, merged_ts = epp.analyze_log_files(per_pod, workers=2).outputs()
+
+    sources = merged_summary["_metadata"]["source_file"]
+    assert sources == "epp-a.log, epp-b.log, epp-c.log"
+    summary.pop("_metadata")
+    merged_summary.pop("_metadata")
+    assert _dump(merged_summary) == _dump(summary)
+    assert _dump(merged_ts) == _dump(ts_data)
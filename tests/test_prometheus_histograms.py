@@ -0,0 +1,238 @@
+"""Tests for server-side latency percentiles reconstructed from raw scrapes.
+
+vLLM's latency histograms arrive as cumulative ``_bucket{le=...}`` counters in
+every raw scrape. ``histograms.histogram_series`` keeps their labels, groups
+buckets per pod and label set, and differences consecutive scrapes; the
+percentiles follow Prometheus ``histogram_quantile`` interpolation and land in
+``results.observability`` without a Prometheus server.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from llmdbenchmark.analysis.benchmark_report.histograms import (
+    histogram_quantiles,
+    histogram_series,
+    interval_quantiles,
+    summarize_histograms,
+)
+from llmdbenchmark.analysis.benchmark_report.metrics_processor import (
+    add_metrics_to_benchmark_report,
+)
+from llmdbenchmark.analysis.benchmark_report.scrape_store import (
+    load_scrape_store,
+    parse_labels,
+    parse_scrape_file,
+)
+
+TTFT = "vllm:time_to_first_token_seconds"
+BOUNDS = ("0.1", "0.5", "1.0", "+Inf")
+
+
+def _histogram_lines(labels: str, cumulative: list[int], total: float) -> list[str]:
+    sep = "," if labels else ""
+    lines = [
+        f'{TTFT}_bucket{{{labels}{sep}le="{le}"}} {count}'
+        for le, count in zip(BOUNDS, cumulative)
+    ]
+    braces = f"{{{labels}}}" if labels else ""
+    lines.append(f"{TTFT}_sum{braces} {total}")
+    lines.append(f"{TTFT}_count{braces} {cumulative[-1]}")
+    return lines
+
+
+def _write_scrape(raw_dir: Path, pod: str, second: int, lines: list[str]) -> None:
+    (raw_dir / f"{pod}_{1_700_000_000 + second}_metrics.log").write_text(
+        f"# Timestamp: 2026-07-14T00:00:{second:02d}Z\n"
+        f"# Pod: {pod}\n# Namespace: bench\n"
+        f"# TYPE {TTFT} histogram\n" + "\n".join(lines) + "\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture()
+def metrics_dir(tmp_path: Path) -> Path:
+    """Two decode pods, the first with two engines, scraped every 10s."""
+    raw_dir = tmp_path / "metrics" / "raw"
+    raw_dir.mkdir(parents=True)
+    scrapes = {
+        "decode-a": [
+            (
+                'engine="0",model_name="m"',
+                [[0, 0, 0, 0], [2, 6, 10, 10], [4, 12, 20, 20]],
+            ),
+            (
+                'engine="1",model_name="m"',
+                [[0, 0, 0, 0], [0, 0, 5, 5], [0, 0, 10, 10]],
+            ),
+        ],
+        "decode-b": [("", [[1, 1, 1, 1], [1, 3, 3, 5], [1, 3, 3, 5]])],
+    }
+    for pod, series in scrapes.items():
+        for step in range(3):
+            lines = []
+            for labels, counts in series:
+                lines += _histogram_lines(labels, counts[step], 0.4 * counts[step][-1])
+            _write_scrape(raw_dir, pod, step * 10, lines)
+    return tmp_path / "metrics"
+
+
+# ---------------------------------------------------------------------------
+# Exposition parsing
+# ---------------------------------------------------------------------------
+
+
+def test_parse_labels_unescapes_values() -> None:
+    labels = parse_labels(r'model_name="a\"b",path="c:\\d",msg="x\ny", le="+Inf"')
+    assert labels == {
+        "model_name": 'a"b',
+        "path": "c:\\d",
+        "msg": "x\ny",
+        "le": "+Inf",
+    }
+
+
+def test_scrape_parser_keeps_labels_with_braces(tmp_path: Path) -> None:
+    path = tmp_path / "pod_1_metrics.log"
+    path.write_text('vllm:info{config="{a: 1}",le="0.5"} 3 1700000000\n')
+    _, samples = parse_scrape_file(str(path))
+    assert samples == [("vllm:info", 'config="{a: 1}",le="0.5"', 3.0)]
+
+
+# ---------------------------------------------------------------------------
+# Quantile interpolation
+# ---------------------------------------------------------------------------
+
+
+def test_quantiles_interpolate_within_bucket() -> None:
+    bounds = np.array([0.1, 0.5, 1.0, np.inf])
+    # 2 observations <= 0.1, 4 in (0.1, 0.5], 4 in (0.5, 1.0].
+    p50, p90, p10 = histogram_quantiles(bounds, [2, 6, 10, 10], (0.5, 0.9, 0.1))
+    assert p50 == pytest.approx(0.1 + 0.4 * (5 - 2) / 4)
+    assert p90 == pytest.approx(0.5 + 0.5 * (9 - 6) / 4)
+    assert p10 == pytest.approx(0.1 * 1 / 2)
+
+
+def test_quantile_in_inf_bucket_reports_highest_finite_bound() -> None:
+    bounds = np.array([0.1, 0.5, np.inf])
+    assert histogram_quantiles(bounds, [1, 2, 10], (0.99,))[0] == 0.5
+
+
+def test_quantiles_are_nan_for_empty_intervals_and_vectorized() -> None:
+    bounds = np.array([0.1, 1.0, np.inf])
+    result = histogram_quantiles(bounds, np.array([[0, 0, 0], [4, 4, 4]]), (0.5,))
+    assert result.shape == (2, 1)
+    assert np.isnan(result[0, 0])
+    assert result[1, 0] == pytest.approx(0.05)
+
+
+# ---------------------------------------------------------------------------
+# Series grouping and interval deltas
+# ---------------------------------------------------------------------------
+
+
+def test_series_grouped_per_pod_and_label_set(metrics_dir: Path) -> None:
+    series = histogram_series(load_scrape_store(str(metrics_dir)), TTFT)
+
+    assert [(s.pod, s.labels) for s in series] == [
+        ("decode-a", {"engine": "0", "model_name": "m"}),
+        ("decode-a", {"engine": "1", "model_name": "m"}),
+        ("decode-b", {}),
+    ]
+    engine0 = series[0]
+    assert engine0.bounds.tolist() == [0.1, 0.5, 1.0, np.inf]
+    assert engine0.buckets[:, -1].tolist() == [0, 10, 20]
+    assert engine0.sums.tolist() == pytest.approx([0.0, 4.0, 8.0])
+
+    ends, per_interval = interval_quantiles(engine0, (0.5,))
+    assert (ends[1:] - ends[:-1]).tolist() == [10.0]
+    assert per_interval[:, 0] == pytest.approx([0.4, 0.4])
+
+
+def test_counter_reset_counts_new_values(tmp_path: Path) -> None:
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    for step, counts in enumerate(([5, 5, 10, 10], [1, 2, 2, 2])):
+        _write_scrape(raw_dir, "decode-a", step, _histogram_lines("", counts, 1.0))
+
+    (hist,) = histogram_series(load_scrape_store(str(tmp_path)), TTFT)
+    _, counts, sums = hist.intervals()
+    assert counts.tolist() == [[1, 2, 2, 2]]
+    assert sums.tolist() == [1.0]
+
+
+def test_series_without_inf_bucket_is_dropped(tmp_path: Path) -> None:
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    for step in range(2):
+        _write_scrape(raw_dir, "decode-a", step, [f'{TTFT}_bucket{{le="0.1"}} {step}'])
+    assert histogram_series(load_scrape_store(str(tmp_path)), TTFT) == []
+
+
+def test_summary_pools_observations_over_window(metrics_dir: Path) -> None:
+    series = histogram_series(load_scrape_store(str(metrics_dir)), TTFT)
+
+    pooled = summarize_histograms(series)
+    assert pooled["count"] == 20 + 10 + 4
+    assert pooled["mean"] == pytest.approx(0.4)
+
+    # Only the interval ending at :20 lies in the window.
+    window = (
+        datetime(2026, 7, 14, 0, 0, 15, tzinfo=timezone.utc),
+        datetime(2026, 7, 14, 0, 0, 30, tzinfo=timezone.utc),
+    )
+    assert summarize_histograms(series, window)["count"] == 10 + 5 + 0
+
+
+def test_summary_rejects_mismatched_buckets(metrics_dir: Path) -> None:
+    series = histogram_series(load_scrape_store(str(metrics_dir)), TTFT)
+    series[1].bounds = series[1].bounds[1:]
+    with pytest.raises(ValueError):
+        summarize_histograms(series)
+
+
+# ---------------------------------------------------------------------------
+# Benchmark report
+# ---------------------------------------------------------------------------
+
+
+def test_report_carries_server_side_percentiles(metrics_dir: Path) -> None:
+    from llmdbenchmark.analysis.benchmark_report.schema_v0_2 import Observability
+
+    (metrics_dir / "processed").mkdir()
+    (metrics_dir / "processed" / "metrics_summary.json").write_text(
+        json.dumps({"decode-a": {"metrics": {}}}), encoding="utf-8"
+    )
+    report = add_metrics_to_benchmark_report({"version": "0.2"}, str(metrics_dir))
+    obs = report["results"]["observability"]
+
+    entry = obs["vllm_time_to_first_token_seconds"]
+    assert entry["scope"] == "run"
+    assert [c["pod"] for c in entry["components"]] == [
+        "decode-a",
+        "decode-a",
+        "decode-b",
+    ]
+    assert entry["components"][0]["labels"] == {"engine": "0", "model_name": "m"}
+    assert entry["components"][0]["role"] == "decode"
+    stats = entry["components"][0]["statistics"]
+    assert stats["units"] == "seconds"
+    assert stats["count"] == 20
+    assert stats["p50"] == pytest.approx(0.1 + 0.4 * (10 - 4) / 8)
+    assert set(entry["aggregated"]) >= {"p50", "p90", "p99", "mean", "units"}
+    assert report["version"] == "0.2"
+    Observability(**obs)
+
+
+def test_report_server_percentiles_disabled_by_env(
+    metrics_dir: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("LLMDBENCH_METRICS_SERVER_HISTOGRAMS", "false")
+    report = add_metrics_to_benchmark_report({}, str(metrics_dir))
+    assert "vllm_time_to_first_token_seconds" not in report["results"]["observability"]
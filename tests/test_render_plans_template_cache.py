@@ -0,0 +1,124 @@
+"""Tests for compiled-template reuse and parallel stack rendering in RenderPlans.
+
+Plan templates load through ``PlanTemplateLoader``, which imports the shared
+``_macros.j2`` into each template instead of pasting it in, so each template
+is compiled once per ``RenderPlans`` however many stacks render. Stacks can be
+rendered in worker processes; the plan directories must not change.
+"""
+
+from __future__ import annotations
+
+import filecmp
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from jinja2 import TemplateSyntaxError
+
+from llmdbenchmark.parser.render_plans import RenderPlans, render_stack_files
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def template_dir(tmp_path: Path) -> Path:
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "_macros.j2").write_text(
+        "{% set greeting = 'hello' %}\n"
+        "{% macro label() -%}\n"
+        "{{ greeting }}-{{ model.name }}\n"
+        "{%- endmacro %}\n",
+        encoding="utf-8",
+    )
+    (templates / "01_a.yaml.j2").write_text(
+        "name: {{ label() }}\nns: {{ namespace.name }}\n", encoding="utf-8"
+    )
+    (templates / "02_b.yaml.j2").write_text("b: {{ label() }}\n", encoding="utf-8")
+    return templates
+
+
+def _templates() -> list[dict]:
+    return [
+        {"filename": "01_a.yaml", "template": "01_a.yaml.j2"},
+        {"filename": "02_b.yaml", "template": "02_b.yaml.j2"},
+    ]
+
+
+def test_macros_are_imported_with_render_context(
+    template_dir: Path, tmp_path: Path
+) -> None:
+    env = RenderPlans.build_environment(template_dir)
+    render = render_stack_files(
+        env,
+        _templates(),
+        {"model": {"name": "m1"}, "namespace": {"name": "ns1"}},
+        tmp_path / "out",
+    )
+
+    assert [error for _, error, _ in render.outcomes] == [None, None]
+    assert (tmp_path / "out" / "01_a.yaml").read_text() == "name: hello-m1\nns: ns1\n"
+    assert (tmp_path / "out" / "02_b.yaml").read_text() == "b: hello-m1\n"
+
+
+def test_templates_compile_once_across_stacks(
+    template_dir: Path, tmp_path: Path, monkeypatch
+) -> None:
+    env = RenderPlans.build_environment(template_dir)
+    compiled: list[str] = []
+    compile_source = env.compile
+
+    def counting_compile(source, name=None, filename=None, *args, **kwargs):
+        compiled.append(name)
+        return compile_source(source, name, filename, *args, **kwargs)
+
+    monkeypatch.setattr(env, "compile", counting_compile)
+    for i in range(5):
+        values = {"model": {"name": f"m{i}"}, "namespace": {"name": "ns"}}
+        render_stack_files(env, _templates(), values, tmp_path / f"stack-{i}")
+
+    assert sorted(compiled) == ["01_a.yaml.j2", "02_b.yaml.j2", "_macros.j2"]
+    assert (tmp_path / "stack-4" / "02_b.yaml").read_text() == "b: hello-m4\n"
+
+
+def test_template_errors_keep_file_line_numbers(template_dir: Path) -> None:
+    (template_dir / "03_broken.yaml.j2").write_text(
+        "ok: 1\nbroken: {{ oops( }}\n", encoding="utf-8"
+    )
+    env = RenderPlans.build_environment(template_dir)
+
+    with pytest.raises(TemplateSyntaxError) as excinfo:
+        env.get_template("03_broken.yaml.j2")
+    assert excinfo.value.lineno == 2
+
+
+def _same_tree(left: Path, right: Path) -> bool:
+    cmp = filecmp.dircmp(left, right)
+    if cmp.left_only or cmp.right_only:
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(left, right, cmp.common_files, shallow=False)
+    return (
+        not mismatch
+        and not errors
+        and all(_same_tree(left / d, right / d) for d in cmp.common_dirs)
+    )
+
+
+def test_parallel_render_matches_serial(tmp_path: Path) -> None:
+    outputs = {}
+    for workers in (1, 2):
+        output_dir = tmp_path / f"workers-{workers}"
+        result = RenderPlans(
+            template_dir=PROJECT_ROOT / "config/templates/jinja",
+            defaults_file=PROJECT_ROOT / "config/templates/values/defaults.yaml",
+            scenarios_file=PROJECT_ROOT
+            / "config/scenarios/examples/multi-model-optimized-baseline.yaml",
+            output_dir=output_dir,
+            logger=MagicMock(),
+            render_workers=workers,
+        ).eval()
+        assert not result.has_errors, result.to_dict()
+        assert len(result.rendered_paths) == 2
+        outputs[workers] = output_dir
+
+    assert _same_tree(outputs[1], outputs[2])
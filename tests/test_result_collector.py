@@ -0,0 +1,155 @@
+"""Tests for batched result collection (utilities/result_collector.py).
+
+The "cluster" is a fake kube binary that drops everything up to ``--`` and
+runs the rest locally, so the listing and tar scripts run for real against
+a directory standing in for the PVC.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from llmdbenchmark.executor.command import CommandResult
+from llmdbenchmark.utilities.result_collector import (
+    RemoteFile,
+    collect_result_dirs,
+    parse_listing,
+    shard_files,
+)
+
+_FAKE_KUBE = """#!/bin/sh
+while [ "$1" != "--" ]; do shift; done
+shift
+exec "$@"
+"""
+
+
+class _Cmd:
+    """Just enough of CommandExecutor: ``kube()`` and the exec argv pieces."""
+
+    def __init__(self, kube_bin: Path):
+        self._kube_bin = str(kube_bin)
+
+    def _kubeconfig_args(self) -> list[str]:
+        return []
+
+    def kube(self, *args: str, namespace=None, check=True) -> CommandResult:
+        command = " ".join(args[list(args).index("--") + 1 :])
+        proc = subprocess.run(command, shell=True, capture_output=True, text=True)
+        return CommandResult(
+            command=command,
+            exit_code=proc.returncode,
+            stdout=proc.stdout,
+            stderr=proc.stderr,
+        )
+
+
+@pytest.fixture
+def pvc(tmp_path: Path) -> Path:
+    root = tmp_path / "pvc" / "requests"
+    for i in (1, 2, 3):
+        pod_dir = root / f"exp-abc_{i}"
+        (pod_dir / "analysis").mkdir(parents=True)
+        (pod_dir / "stdout.log").write_text(f"pod {i}\n" * (100 * i))
+        (pod_dir / "analysis" / "summary.json").write_text("{}")
+    (root / "other-exp_1").mkdir()
+    (root / "other-exp_1" / "stdout.log").write_text("not ours")
+    return root
+
+
+@pytest.fixture
+def cmd(tmp_path: Path) -> _Cmd:
+    kube = tmp_path / "kube"
+    kube.write_text(_FAKE_KUBE)
+    kube.chmod(0o755)
+    return _Cmd(kube)
+
+
+def _collect(cmd, pvc: Path, local: Path, **kw):
+    dirs = [f"exp-abc_{i}" for i in (1, 2, 3)]
+    return collect_result_dirs(cmd, "data-pod", "bench", str(pvc), dirs, local, **kw)
+
+
+class TestPlanning:
+    def test_parse_listing(self):
+        files, has_zstd = parse_listing(
+            "#zstd\n12 1700000000 exp_1/stdout.log\n3 1700000001 exp_1/a b.json\n"
+            "garbage\n"
+        )
+        assert has_zstd
+        assert files == [
+            RemoteFile("exp_1/stdout.log", 12, 1700000000),
+            RemoteFile("exp_1/a b.json", 3, 1700000001),
+        ]
+
+    def test_shards_balance_by_size(self):
+        files = [RemoteFile(f"f{i}", size, 0) for i, size in enumerate([9, 5, 4, 1])]
+        shards = shard_files(files, 2)
+        assert [sum(f.size for f in s) for s in shards] == [10, 9]
+        assert shard_files(files[:1], 4) == [[files[0]]]
+        assert shard_files([], 4) == []
+
+
+class TestCollectResultDirs:
+    def test_collects_all_dirs_concurrently(self, cmd, pvc: Path, tmp_path: Path):
+        local = tmp_path / "results"
+        stats = _collect(cmd, pvc, local, streams=2)
+
+        assert not stats.errors and not stats.failed_dirs
+        assert (stats.files, stats.skipped, stats.streams) == (6, 0, 2)
+        for i in (1, 2, 3):
+            copied = local / f"exp-abc_{i}" / "stdout.log"
+            original = pvc / f"exp-abc_{i}" / "stdout.log"
+            assert copied.read_text() == original.read_text()
+            assert int(copied.stat().st_mtime) == int(original.stat().st_mtime)
+        assert not (local / "other-exp_1").exists()
+        assert "6 file(s)" in stats.summary()
+
+    def test_skips_files_already_collected(self, cmd, pvc: Path, tmp_path: Path):
+        local = tmp_path / "results"
+        _collect(cmd, pvc, local)
+        stale = local / "exp-abc_2" / "stdout.log"
+        stale.write_text("truncated")
+
+        stats = _collect(cmd, pvc, local)
+        assert (stats.files, stats.skipped) == (1, 5)
+        assert stale.read_text() == (pvc / "exp-abc_2" / "stdout.log").read_text()
+
+        assert _collect(cmd, pvc, local).files == 0
+
+    def test_zstd_falls_back_to_gzip(self, cmd, pvc: Path, tmp_path: Path):
+        logger = type("L", (), {"warnings": []})()
+        logger.log_warning = logger.warnings.append
+        stats = _collect(cmd, pvc, tmp_path / "results", zstd=True, logger=logger)
+        if stats.compression == "gzip":
+            assert "using gzip" in logger.warnings[0]
+        assert stats.files == 6 and not stats.errors
+
+    def test_failed_stream_reports_dirs(self, cmd, pvc: Path, tmp_path: Path):
+        broken = tmp_path / "broken-kube"
+        broken.write_text("#!/bin/sh\necho 'stream dropped' >&2\nexit 1\n")
+        broken.chmod(0o755)
+        cmd._kube_bin = str(broken)
+
+        stats = _collect(cmd, pvc, tmp_path / "results", attempts=1)
+        assert stats.failed_dirs == {"exp-abc_1", "exp-abc_2", "exp-abc_3"}
+        assert "stream dropped" in stats.errors[0]
+
+    def test_unlistable_dirs_are_streamed_whole(self, pvc: Path, tmp_path: Path):
+        class _NoListing(_Cmd):
+            def kube(self, *args, **kw):
+                return CommandResult(command="ls", exit_code=1, stderr="no stat")
+
+        kube = tmp_path / "kube"
+        kube.write_text(_FAKE_KUBE)
+        kube.chmod(0o755)
+        local = tmp_path / "results"
+        stats = _collect(_NoListing(kube), pvc, local)
+
+        assert not stats.errors and stats.streams == 1
+        assert sorted(os.listdir(local)) == [f"exp-abc_{i}" for i in (1, 2, 3)]
+        assert stats.files == 6
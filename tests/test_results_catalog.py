@@ -0,0 +1,230 @@
+"""Tests for the results store's SQLite catalog.
+
+``ls``, ``pull`` and ``status`` answer from ``.result_store/catalog.db``: remote
+runs are recorded from a full listing, from the remote's
+``catalog_index.json``, or as they are pushed, and parsed workspace runs are
+reused until their files change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from llmdbenchmark.interface import results
+from llmdbenchmark.results_store.catalog import (
+    Catalog,
+    load_remote_index,
+    runs_from_listing,
+    write_remote_index,
+)
+from llmdbenchmark.results_store.client import FileClient
+from llmdbenchmark.results_store.workspace import WorkspaceManager
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.lines = []
+
+    def log_info(self, msg):
+        self.lines.append(msg)
+
+    log_error = log_warning = log_debug = log_info
+
+    def log_plain(self, msg, emoji=None):
+        self.lines.append(msg)
+
+
+def _write_run(store: Path, workspace: str, uid: str, model: str, tps: float) -> Path:
+    ws_dir = store / "workspaces" / workspace
+    (ws_dir / "plan" / "chat").mkdir(parents=True, exist_ok=True)
+    run_dir = ws_dir / "results" / f"{uid}_0"
+    run_dir.mkdir(parents=True)
+    report = {
+        "run": {"uid": uid, "time": {"start": "2026-07-01T00:00:00Z"}},
+        "scenario": {
+            "stack": [
+                {
+                    "standardized": {
+                        "model": {"name": model},
+                        "accelerator": {"model": "H100", "count": 8},
+                    }
+                }
+            ]
+        },
+        "results": {
+            "request_performance": {
+                "aggregate": {"throughput": {"output_token_rate": {"mean": tps}}}
+            }
+        },
+    }
+    (run_dir / "benchmark_report_v0.2.yaml").write_text(yaml.safe_dump(report))
+    return run_dir
+
+
+@pytest.fixture()
+def store(tmp_path: Path, monkeypatch) -> Path:
+    state_dir = str(tmp_path / "xfer")
+    monkeypatch.setenv("LLMDBENCH_RESULTS_TRANSFER_STATE_DIR", state_dir)
+    root = tmp_path / "store"
+    root.mkdir()
+    monkeypatch.chdir(root)
+    results.execute(argparse.Namespace(results_command="init"), RecordingLogger())
+    results.execute(
+        argparse.Namespace(
+            results_command="remote",
+            remote_action="add",
+            name="local",
+            uri=f"file://{tmp_path / 'remote'}",
+        ),
+        RecordingLogger(),
+    )
+    return root
+
+
+def _ls(logger=None, **kwargs) -> RecordingLogger:
+    logger = logger or RecordingLogger()
+    args = {"model": None, "hardware": None, **kwargs}
+    results.execute(
+        argparse.Namespace(results_command="ls", remote="local", **args), logger
+    )
+    return logger
+
+
+def _push(run_dir: Path) -> None:
+    results.execute(
+        argparse.Namespace(
+            results_command="push", remote="local", path=str(run_dir), group="g"
+        ),
+        RecordingLogger(),
+    )
+
+
+def test_ls_answers_from_catalog_after_first_listing(store: Path) -> None:
+    _push(_write_run(store, "ws", "aaaa1111", "llama-8b", 100.0))
+    _ls()
+    _push(_write_run(store, "ws", "bbbb2222", "qwen-7b", 50.0))
+
+    # The listing and the push since are both in the catalog.
+    with patch.object(FileClient, "ls", side_effect=AssertionError("listed")):
+        output = "\n".join(_ls().lines)
+        filtered = "\n".join(_ls(model="llama-*").lines)
+    assert "aaaa1111" in output and "bbbb2222" in output
+    assert "aaaa1111" in filtered and "bbbb2222" not in filtered
+
+    remote = f"file://{store.parent / 'remote'}"
+    (run,) = Catalog.for_store(store).find_remote_runs(remote, run_uid="bbbb")
+    assert run["metrics"] == {"output_tps": 50.0}
+    assert run["start"] == "2026-07-01T00:00:00Z"
+    assert run["hardware"] == "H100-x8"
+    assert run["relative_name"].startswith("g/chat/qwen-7b/H100-x8/bbbb2222/")
+
+
+def test_remote_index_is_kept_by_push_and_read_by_ls(store: Path) -> None:
+    remote = f"file://{store.parent / 'remote'}"
+    _push(_write_run(store, "ws", "aaaa1111", "llama-8b", 100.0))
+    assert load_remote_index(FileClient(), remote) is None
+
+    _ls(write_index=True)
+    _push(_write_run(store, "ws", "bbbb2222", "qwen-7b", 50.0))
+    indexed = load_remote_index(FileClient(), remote)
+    assert [r["run_uid"] for r in indexed] == ["aaaa1111", "bbbb2222"]
+
+    # A fresh store has no catalog rows; the metrics come from the index.
+    (store / ".result_store" / "catalog.db").unlink()
+    assert "bbbb2222" in "\n".join(_ls().lines)
+    (run,) = Catalog.for_store(store).find_remote_runs(remote, run_uid="bbbb")
+    assert run["metrics"] == {"output_tps": 50.0}
+
+
+def test_listing_restores_runs_lost_from_index(store: Path) -> None:
+    remote = f"file://{store.parent / 'remote'}"
+    _push(_write_run(store, "ws", "aaaa1111", "llama-8b", 100.0))
+    _ls(write_index=True)
+    _push(_write_run(store, "ws", "bbbb2222", "qwen-7b", 50.0))
+
+    # Concurrent pushes can drop an entry: rewrite the index without aaaa1111.
+    indexed = load_remote_index(FileClient(), remote)
+    write_remote_index(FileClient(), remote, indexed[1:])
+    (store / ".result_store" / "catalog.db").unlink()
+
+    output = "\n".join(_ls().lines)
+    assert "aaaa1111" in output and "bbbb2222" in output
+    repaired = load_remote_index(FileClient(), remote)
+    assert [r["run_uid"] for r in repaired] == ["aaaa1111", "bbbb2222"]
+    assert repaired[1]["metrics"] == {"output_tps": 50.0}
+
+
+def test_refresh_rewrites_existing_index(store: Path) -> None:
+    remote = f"file://{store.parent / 'remote'}"
+    _push(_write_run(store, "ws", "aaaa1111", "llama-8b", 100.0))
+    _ls(refresh=True)
+    assert load_remote_index(FileClient(), remote) is None
+
+    _ls(write_index=True)
+    with patch("llmdbenchmark.results_store.catalog.write_remote_index") as write_index:
+        _ls()
+        write_index.assert_not_called()  # fresh catalog rows
+        _ls(refresh=True)
+    write_index.assert_called_once()
+
+
+def test_pull_refreshes_stale_catalog_for_unknown_run(store: Path) -> None:
+    _ls(refresh=True)  # Catalog now records an empty remote.
+    run_dir = _write_run(store, "ws", "cccc3333", "llama-8b", 1.0)
+    FileClient().push(
+        f"file://{store.parent / 'remote'}/g/chat/llama-8b/H100-x8/cccc3333",
+        str(run_dir),
+    )
+    logger = RecordingLogger()
+    results.execute(
+        argparse.Namespace(
+            results_command="pull", remote=["local"], run_uid="cccc", dest=None
+        ),
+        logger,
+    )
+    pulled = store / "workspaces" / "local_g_cccc3333" / "results" / "cccc3333"
+    assert (pulled / "benchmark_report_v0.2.yaml").exists()
+
+
+def test_status_reuses_parsed_runs_until_files_change(store: Path) -> None:
+    run_dir = _write_run(store, "ws", "dddd4444", "llama-8b", 1.0)
+    manager = WorkspaceManager()
+    calls = []
+    parse = manager._parse_report
+
+    def counting_parse(path):
+        calls.append(path)
+        return parse(path)
+
+    manager._parse_report = counting_parse
+    assert manager.parse_report(run_dir)["run_uid"] == "dddd4444"
+    assert manager.parse_report(run_dir)["metrics"] == {"output_tps": 1.0}
+    assert len(calls) == 1
+
+    report = run_dir / "benchmark_report_v0.2.yaml"
+    report.write_text(report.read_text().replace("dddd4444", "eeee5555"))
+    os.utime(report, ns=(0, report.stat().st_mtime_ns + 10**9))
+    assert manager.parse_report(run_dir)["run_uid"] == "eeee5555"
+    assert len(calls) == 2
+
+
+def test_listing_strips_bucket_prefix_and_skips_odd_names() -> None:
+    runs, ignored = runs_from_listing(
+        [
+            "pub/g/chat/org/model/H100-x8/uid1/benchmark_report_v0.2.yaml",
+            "pub/g/chat/uid2/report_v0.2.yaml",
+            "pub/g/chat/org/model/H100-x8/uid1/trace.json",
+        ],
+        "gs://bucket/pub",
+    )
+    assert [(r["run_uid"], r["model"], r["group"]) for r in runs] == [
+        ("uid1", "org/model", "g")
+    ]
+    assert runs[0]["relative_name"].startswith("g/chat/org/model/")
+    assert ignored == ["pub/g/chat/uid2/report_v0.2.yaml"]
@@ -0,0 +1,170 @@
+"""Tests for the results store transfer engine and the file:// client.
+
+Push and pull share ``client.transfer.TransferEngine``: a bounded thread pool
+that skips files whose size and checksum match the other side and records
+completed files in a manifest so an interrupted transfer resumes.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from llmdbenchmark.interface import results
+from llmdbenchmark.results_store.client import FileClient, get_storage_client
+from llmdbenchmark.results_store.client import local as local_client
+from llmdbenchmark.results_store.client.gcs_proxy import GCSProxyClient
+from llmdbenchmark.results_store.client.transfer import (
+    RemoteObject,
+    default_manifest_path,
+    file_checksums,
+    is_unchanged,
+)
+
+
+@pytest.fixture(autouse=True)
+def _state_dir(tmp_path: Path, monkeypatch) -> None:
+    state_dir = str(tmp_path / "state")
+    monkeypatch.setenv("LLMDBENCH_RESULTS_TRANSFER_STATE_DIR", state_dir)
+
+
+@pytest.fixture()
+def run_dir(tmp_path: Path) -> Path:
+    run = tmp_path / "run"
+    (run / "traces").mkdir(parents=True)
+    for i in range(20):
+        (run / "traces" / f"request_{i}.json").write_text(f'{{"id": {i}}}')
+    (run / "benchmark_report_v0.2.yaml").write_text("version: '0.2'\n")
+    return run
+
+
+class DummyLogger:
+    def __init__(self):
+        self.lines = []
+
+    def log_info(self, msg):
+        self.lines.append(msg)
+
+    log_error = log_warning = log_debug = log_info
+
+    def log_plain(self, msg, emoji=None):
+        self.lines.append(msg)
+
+
+def test_checksums_use_gcs_encoding(tmp_path: Path) -> None:
+    path = tmp_path / "f"
+    path.write_bytes(b"123456789")
+    checksums = file_checksums(path)
+    assert checksums["crc32c"] == "4waSgw=="  # CRC32C 0xE3069283
+    assert checksums["md5"] == "JfnnlDI7RTiF9RgfG2JNCw=="
+
+    assert is_unchanged(path, RemoteObject("f", 9, crc32c="4waSgw=="))
+    assert is_unchanged(path, RemoteObject("f", 9, md5="JfnnlDI7RTiF9RgfG2JNCw=="))
+    assert not is_unchanged(path, RemoteObject("f", 9, crc32c="AAAAAA=="))
+    assert not is_unchanged(path, RemoteObject("f", 8, crc32c="4waSgw=="))
+    assert not is_unchanged(path, RemoteObject("f", 9))
+
+
+def test_file_client_round_trip_skips_unchanged(run_dir: Path, tmp_path: Path) -> None:
+    uri = f"file://{tmp_path / 'remote'}/default/run"
+    client = get_storage_client(uri)
+    assert isinstance(client, FileClient)
+    assert not client.exists(uri)
+
+    assert client.push(uri, str(run_dir)) == 21
+    assert client.exists(uri)
+    assert "traces/request_3.json" in client.ls(uri)
+
+    (run_dir / "traces" / "request_3.json").write_text('{"id": 33}')
+    assert client.push(uri, str(run_dir)) == 1
+    assert client.last_transfer.skipped == 20
+
+    dest = tmp_path / "pulled"
+    assert client.pull(uri, str(dest)) == 21
+    assert (dest / "traces" / "request_3.json").read_text() == '{"id": 33}'
+    assert client.pull(uri, str(dest)) == 0
+    assert not list(dest.rglob("*.part"))
+
+
+def test_interrupted_push_resumes_from_manifest(
+    run_dir: Path, tmp_path: Path, monkeypatch
+) -> None:
+    uri = f"file://{tmp_path / 'remote'}"
+    copied = []
+    real_copy = local_client._copy
+
+    def flaky_copy(source: Path, target: Path) -> None:
+        if source.name == "request_7.json":
+            raise OSError("connection reset")
+        copied.append(source.name)
+        real_copy(source, target)
+
+    monkeypatch.setattr(local_client, "_copy", flaky_copy)
+    client = FileClient()
+    with pytest.raises(RuntimeError, match="1 of 21 transfers failed"):
+        client.push(uri, str(run_dir))
+    manifest = default_manifest_path("push", uri, str(run_dir))
+    assert manifest.exists()
+    assert len(copied) == 20
+
+    # Resuming trusts the manifest: completed files are neither copied nor
+    # re-hashed against the remote.
+    monkeypatch.setattr(local_client, "_remote_object", MagicMock())
+    monkeypatch.setattr(local_client, "_copy", real_copy)
+    assert client.push(uri, str(run_dir)) == 1
+    assert client.last_transfer.skipped == 20
+    assert not manifest.exists()
+
+
+def test_proxy_pull_follows_page_tokens(tmp_path: Path) -> None:
+    pages = {
+        None: {
+            "items": [{"name": "p/run/a.txt", "size": "5", "md5Hash": "ignored"}],
+            "nextPageToken": "t1",
+        },
+        "t1": {"items": [{"name": "p/run/b.txt", "size": "3"}]},
+    }
+
+    def get(url, params=None, timeout=None, stream=False):
+        response = MagicMock()
+        if params.get("alt") == "media":
+            response.__enter__.return_value = response
+            response.iter_content.return_value = [url.rsplit("%2F", 1)[1].encode()]
+        else:
+            response.json.return_value = pages[params.get("pageToken")]
+        return response
+
+    client = GCSProxyClient()
+    client.session = MagicMock(get=get)
+    assert client.pull("gs://bucket/p/run", str(tmp_path)) == 2
+    assert (tmp_path / "a.txt").read_text() == "a.txt"
+    assert client.ls("gs://bucket/p") == ["p/run/a.txt", "p/run/b.txt"]
+
+
+def test_push_command_reports_throughput(
+    run_dir: Path, tmp_path: Path, monkeypatch
+) -> None:
+    remote = tmp_path / "remote"
+    monkeypatch.chdir(tmp_path)
+    results.execute(argparse.Namespace(results_command="init"), DummyLogger())
+    results.execute(
+        argparse.Namespace(
+            results_command="remote",
+            remote_action="add",
+            name="local",
+            uri=f"file://{remote}",
+        ),
+        DummyLogger(),
+    )
+    logger = DummyLogger()
+    results.execute(
+        argparse.Namespace(
+            results_command="push", remote="local", path=str(run_dir), group="g"
+        ),
+        logger,
+    )
+    assert any("21 transferred, 0 unchanged" in line for line in logger.lines)
+    assert len(list(remote.rglob("*.json"))) == 20
@@ -503,3 +503,77 @@ def test_failed_conversion_does_not_leak_the_results_dir(tmp_path, monkeypatch)
         analysis.run_analysis("inference-perf", results_dir, None)
 
     assert "LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR" not in os.environ
+
+
+def test_explicit_run_context_outranks_the_environment(tmp_path, monkeypatch) -> None:
+    """Two treatments converted in one process each keep their own identity.
+
+    The converters take the run identity from the context they are handed, so
+    nothing process-wide (envars, memoised metadata) decides it.
+    """
+    from llmdbenchmark.analysis.benchmark_report.run_context import RunContext
+
+    first_id = "inference-perf-conc32-1786024743-aaaaaa"
+    second_id = "inference-perf-conc64-1786024744-bbbbbb"
+    first = _setup_run(tmp_path / "a", monkeypatch, experiment_id=first_id)
+    second = _setup_run(tmp_path / "b", monkeypatch, experiment_id=second_id)
+    monkeypatch.setenv("LLMDBENCH_RUN_EXPERIMENT_ID", "stale-1786000000-zzzzzz")
+
+    reports = [
+        import_inference_perf(
+            results_file, RunContext.from_results_dir(Path(results_file).parent)
+        )
+        for results_file in (first, second, first)
+    ]
+
+    assert [r.run.description for r in reports] == [first_id, second_id, first_id]
+    assert reports[0].scenario.load.standardized.tool_version == "test-version"
+
+
+def test_parallel_analysis_matches_serial(tmp_path, monkeypatch) -> None:
+    """run_analysis_many writes the same reports as analysing one by one.
+
+    run.uid is a fresh UUID per conversion by design, so it is the only line
+    allowed to differ.
+    """
+    from llmdbenchmark.analysis import run_analysis, run_analysis_many
+
+    def _reports(results_dir: Path) -> dict[str, str]:
+        return {
+            path.name: "\n".join(
+                line
+                for line in path.read_text(encoding="utf-8").splitlines()
+                if not line.lstrip().startswith("uid:")
+            )
+            for path in sorted(results_dir.glob("benchmark_report*.yaml"))
+        }
+
+    dirs = {}
+    for mode in ("serial", "parallel"):
+        for index in range(3):
+            experiment_id = f"inference-perf-conc{index}-178602474{index}-aaaaa{index}"
+            results_dir = tmp_path / mode / f"{experiment_id}_1"
+            _setup_run(results_dir, monkeypatch, experiment_id=experiment_id)
+            dirs.setdefault(mode, []).append(results_dir)
+    for envar in ("LLMDBENCH_MAGIC_ENVAR", "LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR"):
+        monkeypatch.delenv(envar, raising=False)
+    monkeypatch.setenv("LLMDBENCH_DESCRIPTION_TEXT", "SCENARIO WIDE")
+
+    for results_dir in dirs["serial"]:
+        assert run_analysis("inference-perf", results_dir, None) is None
+    outcomes = run_analysis_many("inference-perf", dirs["parallel"], workers=3)
+
+    assert list(outcomes) == dirs["parallel"]
+    assert all(err is None for err in outcomes.values())
+    for serial, parallel in zip(dirs["serial"], dirs["parallel"]):
+        serial_reports = _reports(serial)
+        assert len(serial_reports) == 2
+        # Paths embedded in the reports name the mode's directory.
+        assert {
+            name: text.replace(str(serial), "<dir>")
+            for name, text in serial_reports.items()
+        } == {
+            name: text.replace(str(parallel), "<dir>")
+            for name, text in _reports(parallel).items()
+        }
+    assert os.environ["LLMDBENCH_DESCRIPTION_TEXT"] == "SCENARIO WIDE"
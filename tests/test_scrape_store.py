@@ -0,0 +1,167 @@
+"""Tests for the shared columnar cache of raw Prometheus scrapes.
+
+process_metrics.py, visualize_metrics.py, the embedded benchmark-report time
+series and the cross-treatment cache plots all read ``metrics/raw/*.log``.
+They now share one parse through ``scrape_store.load_scrape_store``, persisted
+as ``metrics/scrape_store.npz`` and revalidated against file size and mtime.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from llmdbenchmark.analysis import cross_treatment, visualize_metrics
+from llmdbenchmark.analysis.benchmark_report import scrape_store
+from llmdbenchmark.analysis.benchmark_report.scrape_store import (
+    CACHE_FILE_NAME,
+    load_scrape_store,
+    parse_scrape_file,
+)
+
+
+def _write_scrape(raw_dir: Path, pod: str, epoch: int, lines: list[str]) -> Path:
+    path = raw_dir / f"{pod}_{epoch}_metrics.log"
+    minute, second = divmod(epoch - 1_700_000_000, 60)
+    path.write_text(
+        f"# Timestamp: 2026-07-14T00:{minute:02d}:{second:02d}Z\n"
+        f"# Pod: {pod}\n# Namespace: bench\n"
+        "# HELP vllm:kv_cache_usage_perc KV cache usage.\n" + "\n".join(lines) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture()
+def metrics_dir(tmp_path: Path) -> Path:
+    raw_dir = tmp_path / "metrics" / "raw"
+    raw_dir.mkdir(parents=True)
+    for pod in ("decode-a", "decode-b"):
+        for step in range(3):
+            _write_scrape(
+                raw_dir,
+                pod,
+                1_700_000_000 + step,
+                [
+                    f'vllm:kv_cache_usage_perc{{engine="0"}} {0.1 * step}',
+                    f'vllm:kv_cache_usage_perc{{engine="1"}} {0.2 * step}',
+                    f"vllm:prefix_cache_queries_total {100 * step} 1700000000",
+                    f"vllm:prefix_cache_hits_total {50 * step}",
+                    'vllm:e2e_request_latency_seconds_bucket{le="+Inf"} 7',
+                    "vllm:not_a_number NaN",
+                ],
+            )
+    (raw_dir / "collection_debug.log").write_text("kubectl failed\n")
+    return tmp_path / "metrics"
+
+
+def test_parse_keeps_labels_and_skips_non_samples(metrics_dir):
+    headers, samples = parse_scrape_file(
+        str(metrics_dir / "raw" / "decode-a_1700000001_metrics.log")
+    )
+    assert headers == {
+        "timestamp": "2026-07-14T00:00:01Z",
+        "pod": "decode-a",
+        "namespace": "bench",
+    }
+    assert samples[0] == ("vllm:kv_cache_usage_perc", 'engine="0"', 0.1)
+    assert ("vllm:prefix_cache_queries_total", "", 100.0) in samples
+    assert ("vllm:e2e_request_latency_seconds_bucket", 'le="+Inf"', 7.0) in samples
+    assert all(name != "vllm:not_a_number" for name, _, _ in samples)
+
+
+def test_time_series_matches_legacy_parser(metrics_dir, monkeypatch):
+    """visualize_metrics keeps its line parser as a fallback; both must agree."""
+    cached = visualize_metrics.collect_time_series_data(str(metrics_dir))
+    monkeypatch.setattr(visualize_metrics, "load_scrape_store", None)
+    legacy = visualize_metrics.collect_time_series_data(str(metrics_dir))
+
+    assert cached == legacy
+    assert [v for _, v in cached["decode-b"]["vllm:prefix_cache_hits_total"]] == [
+        0.0,
+        50.0,
+        100.0,
+    ]
+
+
+def test_time_series_metric_filter(metrics_dir):
+    series = load_scrape_store(str(metrics_dir)).time_series(
+        ["vllm:prefix_cache_hits_total", "vllm:unknown"]
+    )
+    assert set(series) == {"decode-a", "decode-b"}
+    assert set(series["decode-a"]) == {"vllm:prefix_cache_hits_total"}
+
+
+def test_cache_is_reused_without_reparsing(metrics_dir, monkeypatch):
+    first = load_scrape_store(str(metrics_dir))
+    assert (metrics_dir / CACHE_FILE_NAME).is_file()
+
+    def _fail(_path):
+        raise AssertionError("unchanged scrape re-parsed")
+
+    monkeypatch.setattr(scrape_store, "parse_scrape_file", _fail)
+    second = load_scrape_store(str(metrics_dir))
+    assert second.time_series() == first.time_series()
+
+
+def test_cache_from_older_parser_is_rebuilt(metrics_dir, monkeypatch):
+    load_scrape_store(str(metrics_dir))
+    monkeypatch.setattr(scrape_store, "_CACHE_VERSION", scrape_store._CACHE_VERSION + 1)
+
+    parsed: list[str] = []
+    original = scrape_store.parse_scrape_file
+
+    def _spy(path):
+        parsed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(scrape_store, "parse_scrape_file", _spy)
+    load_scrape_store(str(metrics_dir))
+    assert len(parsed) == len(list((metrics_dir / "raw").iterdir()))
+
+
+def test_changed_added_and_removed_files_invalidate(metrics_dir, monkeypatch):
+    load_scrape_store(str(metrics_dir))
+    raw_dir = metrics_dir / "raw"
+
+    changed = _write_scrape(raw_dir, "decode-a", 1_700_000_000, ["vllm:new 5"])
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _write_scrape(raw_dir, "decode-c", 1_700_000_009, ["vllm:new 9"])
+    (raw_dir / "decode-b_1700000002_metrics.log").unlink()
+
+    parsed: list[str] = []
+    original = scrape_store.parse_scrape_file
+
+    def _spy(path):
+        parsed.append(os.path.basename(path))
+        return original(path)
+
+    monkeypatch.setattr(scrape_store, "parse_scrape_file", _spy)
+    series = load_scrape_store(str(metrics_dir)).time_series()
+
+    assert sorted(parsed) == [
+        "decode-a_1700000000_metrics.log",
+        "decode-c_1700000009_metrics.log",
+    ]
+    assert series["decode-a"]["vllm:new"][0][1] == 5.0
+    assert series["decode-c"]["vllm:new"][0][1] == 9.0
+    assert len(series["decode-b"]["vllm:prefix_cache_hits_total"]) == 2
+
+
+def test_unwritable_cache_still_loads(metrics_dir, monkeypatch):
+    monkeypatch.setattr(scrape_store, "_write_cache", lambda *_args: None)
+    store = load_scrape_store(str(metrics_dir))
+    assert len(store.file_indices("*_metrics.log")) == 6
+    assert not (metrics_dir / CACHE_FILE_NAME).exists()
+
+
+def test_cross_treatment_snapshots(metrics_dir):
+    samples = dict(cross_treatment._cache_snapshots(metrics_dir))
+    # Two scrapes share each epoch; the later pod in name order wins here.
+    values = samples[1_700_000_002.0]
+    assert values["vllm:kv_cache_usage_perc"] == pytest.approx(0.3)
+    assert values["vllm:prefix_cache_queries_total"] == 200.0
+    assert values["vllm:prefix_cache_hits_total"] == 100.0
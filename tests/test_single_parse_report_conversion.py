@@ -0,0 +1,127 @@
+"""Tests for single-parse, all-versions report conversion in run_analysis.
+
+run_analysis used to hand every result file to the converters once per report
+version, each parsing the native file again. It now parses once and builds
+every version from the shared data, and the reports are written with libyaml's
+emitter. These tests pin that the written reports are exactly what converting
+each version on its own, and emitting with the pure-Python dumper, produces.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from llmdbenchmark.analysis import run_analysis
+from llmdbenchmark.analysis.benchmark_report import (
+    import_benchmark_report,
+    native_to_br0_1,
+    native_to_br0_2,
+    native_to_br0_2_1,
+)
+from llmdbenchmark.analysis.benchmark_report.core import import_yaml
+from llmdbenchmark.analysis.benchmark_report.run_context import RunContext
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# harness -> (fixture, file name run_analysis picks up, converter name)
+CASES = {
+    "inference-perf": (
+        "inference_perf_lifecycle.yaml",
+        "stage_0_lifecycle_metrics.json",
+        "import_inference_perf",
+    ),
+    "guidellm": ("guidellm_report_v2.json", "results.json", "import_guidellm"),
+}
+
+
+def _without_uid(text: str) -> str:
+    """run.uid is a fresh UUID per conversion, so it is the one line that differs."""
+    return "\n".join(
+        line for line in text.splitlines() if not line.lstrip().startswith("uid:")
+    )
+
+
+def _stage(tmp_path: Path, harness: str, monkeypatch) -> Path:
+    fixture, name, _ = CASES[harness]
+    results_dir = tmp_path / f"{harness}-conc8-1786024743-abcdef_1"
+    results_dir.mkdir()
+    native = import_yaml(str(FIXTURES / fixture))
+    (results_dir / name).write_text(json.dumps(native), encoding="utf-8")
+    (results_dir / "run_metadata.yaml").write_text(
+        yaml.safe_dump({"experiment_id": results_dir.name[:-2]}), encoding="utf-8"
+    )
+    for envar in ("LLMDBENCH_MAGIC_ENVAR", "LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR"):
+        monkeypatch.delenv(envar, raising=False)
+    return results_dir / name
+
+
+@pytest.mark.parametrize("harness", sorted(CASES))
+def test_reports_match_per_version_conversion(harness, tmp_path, monkeypatch):
+    results_file = _stage(tmp_path, harness, monkeypatch)
+    results_dir = results_file.parent
+    converter = CASES[harness][2]
+    run_context = RunContext.from_results_dir(results_dir)
+
+    expected = {}
+    for prefix, module in (
+        ("benchmark_report", native_to_br0_1),
+        ("benchmark_report_v0.2", native_to_br0_2),
+    ):
+        report = getattr(module, converter)(str(results_file), run_context=run_context)
+        expected[f"{prefix},_{results_file.name}.yaml"] = yaml.dump(
+            report.dump(), indent=2, Dumper=yaml.Dumper
+        )
+
+    assert run_analysis(harness, results_dir, None) is None
+
+    for name, text in expected.items():
+        written = (results_dir / name).read_text(encoding="utf-8")
+        assert _without_uid(written) == _without_uid(text)
+
+
+@pytest.mark.parametrize("harness", sorted(CASES))
+def test_converters_leave_shared_native_data_untouched(harness, tmp_path, monkeypatch):
+    results_file = str(_stage(tmp_path, harness, monkeypatch))
+    converter = CASES[harness][2]
+    native = import_yaml(results_file)
+    pristine = copy.deepcopy(native)
+
+    for module in (native_to_br0_1, native_to_br0_2):
+        getattr(module, converter)(results_file, native=native)
+
+    assert native == pristine
+
+
+def test_v0_2_1_builds_on_an_existing_v0_2_report(tmp_path, monkeypatch):
+    results_file = str(_stage(tmp_path, "inference-perf", monkeypatch))
+    native = import_yaml(results_file)
+    run_context = RunContext.from_results_dir(Path(results_file).parent)
+
+    report_v0_2 = native_to_br0_2.import_inference_perf(
+        results_file, run_context, native
+    )
+    derived = native_to_br0_2_1.import_inference_perf(
+        results_file, run_context, native, report_v0_2=report_v0_2
+    ).dump()
+    standalone = native_to_br0_2_1.import_inference_perf(
+        results_file, run_context
+    ).dump()
+
+    assert derived["version"] == "0.2.1"
+    assert derived["run"].pop("uid") == report_v0_2.run.uid
+    standalone["run"].pop("uid")
+    assert derived == standalone
+
+
+@pytest.mark.parametrize("version", ["0_1", "0_2", "0_2_1"])
+def test_libyaml_emitter_matches_pure_python(version):
+    example = Path(native_to_br0_2.__file__).parent / f"br_v{version}_example.yaml"
+
+    report = import_benchmark_report(str(example))
+
+    assert report.get_yaml_str() == yaml.dump(report.dump(), indent=2)
@@ -0,0 +1,190 @@
+"""Tests for the smoketest probe agent (smoketests/probe_agent.py).
+
+The "cluster" is a fake ``cmd.kube`` that records calls and runs the probe
+script of ``exec`` / ``run --attach`` locally under ``sh -c``, against a
+stub HTTP server -- so the script and its JSON output are exercised for real.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from llmdbenchmark.executor.command import CommandResult
+from llmdbenchmark.smoketests import probe_agent
+from llmdbenchmark.smoketests.base import BaseSmoketest
+from llmdbenchmark.smoketests.probe_agent import (
+    ProbeAgent,
+    ProbeAgentPool,
+    ProbeRequest,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/health":
+            self._reply(200, b"")
+        else:
+            self._reply(200, json.dumps({"data": [{"id": "qwen"}]}).encode())
+
+    def do_POST(self) -> None:  # noqa: N802
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if payload.get("model") != "qwen":
+            self._reply(404, b"no such model")
+            return
+        self._reply(200, json.dumps({"choices": [{"text": " Washington"}]}).encode())
+
+    def log_message(self, *_: Any) -> None:
+        return
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    thread.join(timeout=5)
+
+
+class _Kube:
+    """Fake kube: ``run`` / ``wait`` / ``delete`` succeed, scripts run locally."""
+
+    def __init__(self, ready: bool = True):
+        self.ready = ready
+        self.dry_run = False
+        self.calls: list[tuple] = []
+
+    def kube(self, *args: str, namespace=None, check=True, force=False):
+        self.calls.append(args)
+        if args[0] == "wait" and not self.ready:
+            return CommandResult(command="wait", exit_code=1, stderr="timed out")
+        if "sh" in args:
+            script = args[-1]
+            proc = subprocess.run(
+                f"sh -c {script}", shell=True, capture_output=True, text=True
+            )
+            return CommandResult(
+                command="sh", exit_code=proc.returncode, stdout=proc.stdout
+            )
+        return CommandResult(command=args[0], exit_code=0)
+
+    def verbs(self) -> list[str]:
+        return [c[0] for c in self.calls]
+
+
+class TestProbeAgent:
+    def test_batch_runs_in_one_reused_pod(self, server: str):
+        kube = _Kube()
+        agent = ProbeAgent(kube, "model")
+
+        results = agent.run(
+            [
+                ProbeRequest(f"{server}/v1/models"),
+                ProbeRequest(f"{server}/v1/completions", "POST", {"model": "qwen"}),
+                ProbeRequest(f"{server}/v1/completions", "POST", {"model": "x's"}),
+                ProbeRequest("http://127.0.0.1:1/v1/models", timeout=2),
+            ]
+        )
+        assert agent.get(f"{server}/health").status == 200
+
+        assert [r.status for r in results] == [200, 200, 404, 0]
+        assert json.loads(results[0].body)["data"][0]["id"] == "qwen"
+        assert "Washington" in results[1].body
+        assert results[2].body == "no such model"
+        assert results[3].error and not results[3].ok
+        assert all(r.latency_ms >= 0 for r in results)
+        # One pod for the phase: created once, then only execs.
+        assert kube.verbs() == ["run", "wait", "exec", "exec"]
+
+        agent.close()
+        assert kube.verbs()[-1] == "delete"
+
+    def test_falls_back_to_one_shot_pods(self, server: str):
+        kube = _Kube(ready=False)
+        agent = ProbeAgent(kube, "model")
+
+        assert agent.get(f"{server}/v1/models").ok
+        assert agent.get(f"{server}/v1/models").ok
+        runs = [c for c in kube.calls if c[0] == "run"]
+        assert len(runs) == 3 and all("--rm" in c for c in runs[1:])
+
+    def test_request_values_are_quoted_for_both_shells(self, server: str, tmp_path):
+        marker = tmp_path / "pwn"
+        agent = ProbeAgent(_Kube(), "model")
+
+        result = agent.get(f"{server}/v1/models?x=';touch${{IFS}}{marker};'")
+
+        assert result.status == 200
+        assert not marker.exists()
+
+    def test_dead_agent_is_replaced_and_batch_retried(self, server: str):
+        kube = _Kube()
+        agent = ProbeAgent(kube, "model")
+        agent.start()
+        first_pod = agent.pod_name
+        real_kube = kube.kube
+
+        def exec_fails_once(*args, **kwargs):
+            if args[0] == "exec" and kube.verbs().count("exec") == 0:
+                kube.calls.append(args)
+                return CommandResult(
+                    command="exec", exit_code=1, stderr="pod not found"
+                )
+            return real_kube(*args, **kwargs)
+
+        kube.kube = exec_fails_once
+        assert agent.get(f"{server}/health").ok
+        assert kube.verbs() == ["run", "wait", "exec", "delete", "run", "wait", "exec"]
+        assert agent.pod_name != first_pod
+
+    def test_agent_near_end_of_lifetime_is_replaced(self, server: str, monkeypatch):
+        kube = _Kube()
+        agent = ProbeAgent(kube, "model")
+        agent.start()
+        monkeypatch.setattr(
+            probe_agent.time,
+            "monotonic",
+            lambda: agent._started_at + probe_agent.AGENT_LIFETIME_SECONDS,
+        )
+
+        assert agent.get(f"{server}/health").ok
+        assert kube.verbs() == ["run", "wait", "delete", "run", "wait", "exec"]
+
+    def test_pool_shares_one_agent_per_namespace(self):
+        pool = ProbeAgentPool()
+        kube = _Kube()
+        first = pool.agent(kube, "model")
+        assert pool.agent(kube, "model") is first
+        assert pool.agent(kube, "harness") is not first
+
+        first.start()
+        pool.close_all()
+        assert kube.verbs() == ["run", "wait", "delete"]
+
+
+def test_curl_post_through_agent_keeps_error_shapes(server: str):
+    agent = ProbeAgent(_Kube(), "model")
+    url = f"{server}/v1/completions"
+
+    body, err = BaseSmoketest._curl_post(
+        None, "model", url, {"model": "qwen"}, None, agent=agent
+    )
+    assert err is None and "Washington" in body
+
+    body, err = BaseSmoketest._curl_post(
+        None, "model", url, {"model": "other"}, None, agent=agent
+    )
+    assert "HTTP 404" in err and "no such model" in err
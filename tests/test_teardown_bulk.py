@@ -0,0 +1,290 @@
+"""Tests for the bulk teardown engine (teardown/bulk.py) and step 03 on top of it.
+
+The cluster is a dict of namespaced objects behind a fake ``cmd.kube`` that
+understands just the ``get -o json`` and ``delete`` forms the engine issues.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from llmdbenchmark.executor.command import CommandResult
+from llmdbenchmark.teardown.bulk import (
+    DeletionPlan,
+    ResourceRef,
+    delete_batches,
+    list_namespace,
+    wait_for_deletion,
+)
+from llmdbenchmark.teardown.steps.step_03_delete_resources import (
+    DeleteResourcesStep,
+)
+
+_API = {
+    "deployment": "apps/v1",
+    "statefulset": "apps/v1",
+    "service": "v1",
+    "configmap": "v1",
+    "pod": "v1",
+    "httproute": "gateway.networking.k8s.io/v1",
+}
+#: Kinds this fake cluster does not serve.
+_UNSERVED = {"va", "hpa", "servicemonitor", "podmonitor"}
+
+
+def _obj(kind: str, name: str, namespace: str, **extra: Any) -> dict:
+    item = {
+        "apiVersion": _API[kind],
+        "kind": kind.capitalize(),
+        "metadata": {"name": name, "namespace": namespace},
+    }
+    item.update(extra)
+    return item
+
+
+class _Cluster:
+    """Fake kube: ``get`` lists served kinds, ``delete`` removes by name.
+
+    Objects with finalizers in *sticky* survive deletion.
+    """
+
+    def __init__(self, objects: list[dict], sticky: set[str] = frozenset()):
+        self.objects = objects
+        self.sticky = sticky
+        self.calls: list[tuple] = []
+        self._lock = threading.Lock()
+
+    def kube(self, *args: str, namespace=None, check=True, force=False):
+        with self._lock:
+            self.calls.append(args)
+            if args[0] == "get":
+                ns = args[args.index("--namespace") + 1]
+                return self._get(args[1].split(","), ns)
+            if args[0] == "delete" and "--namespace" in args:
+                return self._delete(args)
+        return CommandResult(command=" ".join(args), exit_code=0)
+
+    def _get(self, kinds: list[str], ns: str) -> CommandResult:
+        for kind in kinds:
+            if kind in _UNSERVED:
+                return CommandResult(
+                    command="get",
+                    exit_code=1,
+                    stderr=f'the server doesn\'t have a resource type "{kind}"',
+                )
+        wanted = {k.split(".")[0] for k in kinds}
+        items = [
+            o
+            for o in self.objects
+            if o["metadata"]["namespace"] == ns and o["kind"].lower() in wanted
+        ]
+        return CommandResult(
+            command="get", exit_code=0, stdout=json.dumps({"items": items})
+        )
+
+    def _delete(self, args: tuple) -> CommandResult:
+        ns = args[args.index("--namespace") + 1]
+        positional = [a for a in args[1:] if not a.startswith("-") and a != ns]
+        kind = positional[0].split(".")[0]
+        names = set(positional[1:])
+        self.objects = [
+            o
+            for o in self.objects
+            if not (
+                o["metadata"]["namespace"] == ns
+                and o["kind"].lower() == kind
+                and o["metadata"]["name"] in names
+                and not self.sticky & set(o["metadata"].get("finalizers", []))
+            )
+        ]
+        return CommandResult(command="delete", exit_code=0)
+
+    def gets(self) -> list[tuple]:
+        return [c for c in self.calls if c[0] == "get"]
+
+    def deletes(self) -> list[tuple]:
+        return [c for c in self.calls if c[0] == "delete" and "--namespace" in c]
+
+
+class _Logger:
+    def __init__(self):
+        self.messages: list[str] = []
+
+    def log_info(self, msg: str, **_: Any) -> None:
+        self.messages.append(msg)
+
+    def log_warning(self, msg: str, **_: Any) -> None:
+        self.messages.append(f"WARN: {msg}")
+
+    def log_error(self, msg: str, **_: Any) -> None:
+        self.messages.append(f"ERR: {msg}")
+
+
+@dataclass
+class _Context:
+    cmd: _Cluster
+    rendered_stacks: list[Path]
+    namespace: str = "model"
+    harness_namespace: str = "harness"
+    deep_clean: bool = False
+    is_openshift: bool = False
+    dry_run: bool = False
+    deployed_methods: list[str] = field(default_factory=lambda: ["modelservice"])
+    teardown_parallelism: int = 4
+    teardown_wait_timeout: int = 0
+    logger: _Logger = field(default_factory=_Logger)
+
+    def require_cmd(self) -> _Cluster:
+        return self.cmd
+
+
+def _stack(tmp_path: Path) -> Path:
+    stack = tmp_path / "stack"
+    stack.mkdir()
+    (stack / "config.yaml").write_text(
+        yaml.safe_dump(
+            {
+                "namespace": {"name": "model"},
+                "harness": {"namespace": "harness"},
+                "huggingface": {"secretName": "hf-token"},
+            }
+        )
+    )
+    return stack
+
+
+def _cluster() -> _Cluster:
+    serving = {
+        "spec": {
+            "template": {"metadata": {"labels": {"llm-d.ai/inferenceServing": "true"}}}
+        }
+    }
+    return _Cluster(
+        [
+            _obj("deployment", "qwen-decode", "model", **serving),
+            _obj("deployment", "qwen-router-epp", "model"),
+            _obj("deployment", "unrelated-app", "model"),
+            _obj("service", "qwen-router-epp", "model"),
+            _obj("httproute", "llm-route", "model"),
+            _obj("configmap", "kube-root-ca.crt", "model"),
+            _obj("pod", "lmbenchmark-0", "harness"),
+            _obj("configmap", "kube-root-ca.crt", "harness"),
+        ]
+    )
+
+
+class TestEngine:
+    def test_listing_drops_unsupported_kinds(self):
+        cluster = _cluster()
+        listing = list_namespace(cluster, "model", ["deployment", "va", "hpa"])
+
+        assert listing.unsupported == ["va", "hpa"]
+        assert not listing.error
+        assert len(listing.items) == 3
+        assert len(cluster.gets()) == 3
+
+    def test_plan_batches_by_namespace_and_type(self):
+        plan = DeletionPlan()
+        for i in range(5):
+            plan.add(ResourceRef("model", "deployment", "apps", f"d{i}"))
+        plan.add(ResourceRef("harness", "pod", "", "p0"))
+        plan.add(ResourceRef("harness", "pod", "", "p0"))
+
+        batches = plan.batches(batch_size=2)
+        assert [(b.namespace, b.type_name, len(b.names)) for b in batches] == [
+            ("model", "deployment.apps", 2),
+            ("model", "deployment.apps", 2),
+            ("model", "deployment.apps", 1),
+            ("harness", "pod", 1),
+        ]
+        assert "--force" in batches[-1].args()
+        assert "--force" not in batches[0].args()
+        assert plan.describe()[0] == 'Namespace "model": 5 resource(s)'
+
+    def test_controllers_are_deleted_before_pods(self):
+        cluster = _Cluster([])
+        plan = DeletionPlan()
+        plan.add(ResourceRef("harness", "pod", "", "p0"))
+        plan.add(ResourceRef("model", "service", "", "s0"))
+        plan.add(ResourceRef("model", "statefulset", "apps", "ss0"))
+        plan.add(ResourceRef("model", "deployment", "apps", "d0"))
+
+        assert delete_batches(cluster, plan.batches(), parallelism=4) == []
+        kinds = [c[-2] for c in cluster.deletes()]
+        assert set(kinds[:2]) == {"statefulset.apps", "deployment.apps"}
+        assert set(kinds[2:]) == {"pod", "service"}
+
+    def test_watcher_reports_stuck_finalizers(self):
+        held = {"name": "p0", "namespace": "ns", "finalizers": ["fma/keep"]}
+        cluster = _Cluster([_obj("pod", "p0", "ns", metadata=held)])
+        gone = ResourceRef("ns", "pod", "", "p1")
+        stuck_ref = ResourceRef("ns", "pod", "", "p0")
+
+        stuck = wait_for_deletion(cluster, [gone, stuck_ref], timeout=0)
+        assert stuck == {stuck_ref: ["fma/keep"]}
+        assert wait_for_deletion(cluster, [gone], timeout=0) == {}
+
+
+class TestDeleteResourcesStep:
+    def test_normal_mode_one_listing_per_namespace(self, tmp_path: Path):
+        cluster = _cluster()
+        ctx = _Context(cmd=cluster, rendered_stacks=[_stack(tmp_path)])
+
+        result = DeleteResourcesStep().execute(ctx)
+
+        assert result.success, result.errors
+        assert [c[3] for c in cluster.gets()[:2]] == ["model", "harness"]
+        remaining = {
+            (o["metadata"]["namespace"], o["metadata"]["name"]) for o in cluster.objects
+        }
+        # System configmaps and unmatched workloads survive; the serving
+        # deployment is caught by its pod template label.
+        assert remaining == {
+            ("model", "unrelated-app"),
+            ("model", "kube-root-ca.crt"),
+            ("harness", "kube-root-ca.crt"),
+        }
+        model_deploys = [
+            c for c in cluster.deletes() if "deployment.apps" in c and "model" in c
+        ]
+        assert len(model_deploys) == 1
+        assert {"qwen-decode", "qwen-router-epp"} <= set(model_deploys[0])
+        assert all("--wait=false" in c for c in cluster.deletes())
+
+    def test_deep_mode_deletes_everything_listed(self, tmp_path: Path):
+        cluster = _cluster()
+        ctx = _Context(cmd=cluster, rendered_stacks=[_stack(tmp_path)], deep_clean=True)
+
+        assert DeleteResourcesStep().execute(ctx).success
+        assert cluster.objects == []
+
+    def test_dry_run_prints_plan_and_skips_watcher(self, tmp_path: Path):
+        cluster = _cluster()
+        ctx = _Context(cmd=cluster, rendered_stacks=[_stack(tmp_path)], dry_run=True)
+
+        DeleteResourcesStep().execute(ctx)
+
+        assert "Would delete 5 resource(s) in 2 namespace(s):" in ctx.logger.messages
+        assert any("qwen-decode" in m for m in ctx.logger.messages)
+        # Listing only; the watcher never polls in a dry run.
+        assert len(cluster.gets()) == 2
+
+    def test_stuck_resources_are_reported(self, tmp_path: Path):
+        cluster = _cluster()
+        cluster.objects[0]["metadata"]["finalizers"] = ["example.com/hold"]
+        cluster.sticky = {"example.com/hold"}
+        ctx = _Context(cmd=cluster, rendered_stacks=[_stack(tmp_path)])
+
+        assert DeleteResourcesStep().execute(ctx).success
+        warnings = [m for m in ctx.logger.messages if m.startswith("WARN")]
+        assert "1/5 resource(s) still present" in warnings[0]
+        assert (
+            "deployment.apps/qwen-decode (finalizers: example.com/hold)"
+            in (warnings[1])
+        )
@@ -68,6 +68,7 @@ class _StubContext:
     rendered_stacks: list[Path] = field(default_factory=list)
     stack_filter: list[str] | None = None
     deep_clean: bool = False
+    dry_run: bool = False
     is_openshift: bool = True
     platform_type: str = "openshift"
     logger: _StubLogger = field(default_factory=_StubLogger)
@@ -322,7 +323,7 @@ class TestWvaTeardownPolicy:
 
 
 # ---------------------------------------------------------------------------
-# _uninstall_releases: handling of releases stuck in a transitional state
+# _uninstall_all: handling of releases stuck in a transitional state
 # ---------------------------------------------------------------------------
 
 
@@ -367,8 +368,8 @@ class TestUninstallReleasesWedged:
         )
         errors: list = []
 
-        step._uninstall_releases(
-            cmd, ctx, "ns1", release="", model_labels=["mymodel"], errors=errors
+        step._uninstall_all(
+            cmd, ctx, ["ns1"], release="", model_labels=["mymodel"], errors=errors
         )
 
         # list enumerates every status so transitional releases are visible
@@ -404,8 +405,8 @@ class TestUninstallReleasesWedged:
         )
         errors: list = []
 
-        step._uninstall_releases(
-            cmd, ctx, "ns1", release="", model_labels=["mymodel"], errors=errors
+        step._uninstall_all(
+            cmd, ctx, ["ns1"], release="", model_labels=["mymodel"], errors=errors
         )
 
         assert _secret_delete_calls(cmd) == []
@@ -425,10 +426,10 @@ class TestUninstallReleasesWedged:
         )
         errors: list = []
 
-        step._uninstall_releases(
+        step._uninstall_all(
             cmd,
             ctx,
-            "ns1",
+            ["ns1"],
             release="myrelease",
             model_labels=["mymodel"],
             errors=errors,
@@ -0,0 +1,112 @@
+"""Tests for background treatment post-processing (utilities/treatment_pipeline.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from llmdbenchmark.utilities.treatment_pipeline import (
+    TreatmentPipeline,
+    TreatmentStatus,
+    read_treatment_statuses,
+    write_treatment_statuses,
+)
+
+
+def _status(index: int) -> TreatmentStatus:
+    return TreatmentStatus(
+        index=index, treatment=f"t{index}", experiment_id=f"e{index}"
+    )
+
+
+class TestTreatmentPipeline:
+    """One worker, bounded queue, FIFO completion, fail closed."""
+
+    def test_jobs_finish_in_submission_order(self):
+        done: list[str] = []
+        pipeline = TreatmentPipeline(
+            depth=3, on_done=lambda s: done.append(s.treatment)
+        )
+        for i in range(1, 5):
+            assert pipeline.submit(
+                _status(i), lambda i=i: time.sleep(0.01 * (5 - i)) or []
+            )
+        statuses = pipeline.close(timeout=5)
+
+        assert done == ["t1", "t2", "t3", "t4"]
+        assert [s.status for s in statuses] == ["succeeded"] * 4
+        assert all(s.collect_seconds > 0 for s in statuses)
+
+    def test_job_errors_and_crashes_fail_only_their_treatment(self):
+        def crash():
+            raise RuntimeError("oc cp exploded")
+
+        pipeline = TreatmentPipeline()
+        pipeline.submit(_status(1), lambda: ["copy failed"])
+        pipeline.submit(_status(2), crash)
+        pipeline.submit(_status(3), lambda: [])
+        first, second, third = pipeline.close(timeout=5)
+
+        assert first.errors == ["copy failed"]
+        assert second.errors == ["post-processing failed: oc cp exploded"]
+        assert third.status == "succeeded"
+        assert pipeline.failed
+
+    def test_submit_fails_closed_when_collector_falls_behind(self):
+        release = threading.Event()
+        pipeline = TreatmentPipeline(depth=1, submit_timeout=0.05)
+        pipeline.submit(_status(1), lambda: release.wait(5) and [])
+        # Wait until the worker has taken job 1, then fill the single slot.
+        while pipeline._queue.qsize():
+            time.sleep(0.005)
+        assert pipeline.submit(_status(2), lambda: [])
+
+        late = _status(3)
+        assert not pipeline.submit(late, lambda: [])
+        assert late.status == "failed"
+        assert "collector fell behind" in late.errors[0]
+
+        release.set()
+        statuses = pipeline.close(timeout=5)
+        assert [s.status for s in statuses] == ["succeeded", "succeeded", "failed"]
+
+    def test_close_deadline_fails_unfinished_jobs(self):
+        release = threading.Event()
+        ran: list[str] = []
+        pipeline = TreatmentPipeline(depth=2)
+        pipeline.submit(_status(1), lambda: release.wait(5) and [])
+        while pipeline._queue.qsize():
+            time.sleep(0.005)
+        pipeline.submit(_status(2), lambda: ran.append("t2") or [])
+        first, second = pipeline.close(timeout=0.05)
+
+        assert first.status == second.status == "failed"
+        assert "did not finish within 0s" in first.errors[0]
+        assert second.errors[0].startswith("not collected")
+        # The abandoned job finishing later does not overturn the verdict,
+        # and the worker stops instead of starting the queued one.
+        release.set()
+        pipeline._worker.join(5)
+        assert not pipeline._worker.is_alive()
+        assert first.status == "failed" and ran == []
+
+
+class TestStatusFile:
+    def test_round_trip_orders_by_stack_then_index(self, tmp_path: Path):
+        statuses = [
+            TreatmentStatus(index=2, treatment="b", stack="s1", status="failed"),
+            TreatmentStatus(index=1, treatment="a", stack="s1", status="succeeded"),
+            TreatmentStatus(index=1, treatment="a", stack="s0", status="skipped"),
+        ]
+        statuses[0].errors.append("wait failed")
+        path = write_treatment_statuses(statuses, tmp_path / "run" / "status.yaml")
+
+        runs = read_treatment_statuses(path)
+        assert [(r["stack"], r["index"]) for r in runs] == [
+            ("s0", 1),
+            ("s1", 1),
+            ("s1", 2),
+        ]
+        assert runs[2]["errors"] == ["wait failed"]
+        assert read_treatment_statuses(tmp_path / "missing.yaml") == []
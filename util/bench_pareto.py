@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the Pareto-front and SLO masks on synthetic result tables.
+
+Times ``benchmark_report.pareto.pareto_mask`` for two and three objectives and
+``slo_mask`` on tables of 1k, 10k and 100k rows shaped like the analysis
+explorer's throughput/latency columns. For tables up to ``--baseline-max-rows``
+it also times the nested ``iterrows`` loop the explorer used before, and checks
+that both select the same rows.
+
+Run modes:
+
+  python util/bench_pareto.py                        # 1k, 10k and 100k rows
+  python util/bench_pareto.py --rows 1000000         # custom sizes
+  python util/bench_pareto.py --baseline-max-rows 0  # skip the legacy loop
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llmdbenchmark.analysis.benchmark_report.pareto import (  # noqa: E402
+    pareto_mask,
+    slo_mask,
+)
+
+
+def _synthetic_runs(rows: int) -> np.ndarray:
+    """(throughput, TTFT, ITL) rows with the usual latency/throughput trade-off."""
+    rng = np.random.default_rng(0)
+    load = rng.uniform(0.05, 1.0, rows)
+    throughput = 5000 * load * rng.uniform(0.7, 1.0, rows)
+    ttft = 0.05 / (1.02 - load) * rng.uniform(0.8, 1.5, rows)
+    itl = 0.01 + 0.04 * load * rng.uniform(0.8, 1.2, rows)
+    return np.column_stack((throughput, ttft, itl))
+
+
+def _legacy_front(values: np.ndarray) -> np.ndarray:
+    """The explorer's former nested-iterrows Pareto loop, for comparison."""
+    import pandas as pd
+
+    df = pd.DataFrame(values[:, :2], columns=["thpt", "ttft"])
+    pareto_set = set(df.index.tolist())
+    for ii, rowa in df.iterrows():
+        is_pareto_front = df.index.isin(pareto_set)
+        for jj, rowb in df[is_pareto_front].iterrows():
+            if ii == jj:
+                continue
+            if rowa["thpt"] > rowb["thpt"] and rowa["ttft"] < rowb["ttft"]:
+                pareto_set.remove(jj)
+    return df.index.isin(pareto_set)
+
+
+def _time(func, repeat: int) -> tuple[float, object]:
+    """Best wall time of ``repeat`` calls, in seconds, and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--baseline-max-rows", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>9}{'front 2d s':>12}{'front 3d s':>12}"
+        f"{'slo s':>10}{'legacy s':>11}{'front':>7}"
+    )
+    for rows in args.rows:
+        values = _synthetic_runs(rows)
+        two_d, mask = _time(
+            lambda: pareto_mask(values[:, :2], [True, False]), args.repeat
+        )
+        three_d, _ = _time(lambda: pareto_mask(values, [True, False, False]), 1)
+        slo, _ = _time(
+            lambda: slo_mask(values, [1000.0, 0.5, 0.04], [True, False, False]),
+            args.repeat,
+        )
+        legacy = "-"
+        if rows <= args.baseline_max_rows:
+            seconds, expected = _time(lambda: _legacy_front(values), 1)
+            if not np.array_equal(mask, expected):
+                print(f"{rows:>9} MISMATCH against the legacy loop")
+                return 1
+            legacy = f"{seconds:.3f}"
+        print(
+            f"{rows:>9}{two_d:>12.4f}{three_d:>12.4f}"
+            f"{slo:>10.4f}{legacy:>11}{int(mask.sum()):>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
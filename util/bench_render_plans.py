@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark plan rendering time against the number of stacks.
+
+Builds synthetic scenarios of 1, 5, 10 and 20 stacks by cycling the stacks of
+``--scenario`` (renamed so each is distinct), renders each one with
+``RenderPlans`` in-process and with ``--workers`` render processes, and checks
+both produce byte-identical plan directories. No cluster is contacted: the
+version and cluster-resource resolvers are left out.
+
+Run modes:
+
+  python util/bench_render_plans.py                     # 1, 5, 10, 20 stacks
+  python util/bench_render_plans.py --stacks 40 --workers 8
+  python util/bench_render_plans.py --scenario config/scenarios/guides/pd-disaggregation.yaml
+"""
+
+from __future__ import annotations
+
+import argparse
+import filecmp
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from llmdbenchmark.parser.render_plans import RenderPlans  # noqa: E402
+
+
+class _QuietLogger:
+    """Swallows RenderPlans' per-file log lines so they do not skew timings."""
+
+    def __getattr__(self, _name):
+        return lambda *args, **kwargs: None
+
+
+def _scenario(source: Path, stacks: int, dest: Path) -> Path:
+    """Write a copy of ``source`` with ``stacks`` stacks cycled from its own."""
+    data = yaml.safe_load(source.read_text(encoding="utf-8"))
+    base = data["scenario"]
+    data["scenario"] = [
+        {**base[i % len(base)], "name": f"{base[i % len(base)]['name']}-{i}"}
+        for i in range(stacks)
+    ]
+    path = dest / f"{source.stem}-{stacks}.yaml"
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+    return path
+
+
+def _render(scenario: Path, output_dir: Path, workers: int) -> float:
+    """Wall time of one full ``RenderPlans.eval()``, in seconds."""
+    start = time.perf_counter()
+    result = RenderPlans(
+        template_dir=ROOT / "config/templates/jinja",
+        defaults_file=ROOT / "config/templates/values/defaults.yaml",
+        scenarios_file=scenario,
+        output_dir=output_dir,
+        logger=_QuietLogger(),
+        render_workers=workers,
+    ).eval()
+    elapsed = time.perf_counter() - start
+    if result.global_errors:
+        raise RuntimeError(f"render failed: {result.global_errors}")
+    return elapsed
+
+
+def _same_tree(left: Path, right: Path) -> bool:
+    """True when two plan directories hold the same files with the same bytes."""
+    cmp = filecmp.dircmp(left, right)
+    if cmp.left_only or cmp.right_only or cmp.funny_files:
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(left, right, cmp.common_files, shallow=False)
+    if mismatch or errors:
+        return False
+    return all(_same_tree(left / d, right / d) for d in cmp.common_dirs)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stacks", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--workers", type=int, default=min(8, os.cpu_count() or 1))
+    parser.add_argument(
+        "--scenario",
+        type=Path,
+        default=ROOT / "config/scenarios/examples/multi-model-optimized-baseline.yaml",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    print(
+        f"{'stacks':>7}{'serial s':>11}{'per stack':>11}"
+        f"{f'{args.workers} workers s':>15}{'speedup':>9}{'identical':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        for stacks in args.stacks:
+            scenario = _scenario(args.scenario, stacks, tmp_path)
+            serial_dir = tmp_path / f"serial-{stacks}"
+            parallel_dir = tmp_path / f"parallel-{stacks}"
+            serial = _render(scenario, serial_dir, 1)
+            parallel = _render(scenario, parallel_dir, args.workers)
+            identical = _same_tree(serial_dir, parallel_dir)
+            print(
+                f"{stacks:>7}{serial:>11.2f}{serial / stacks:>11.3f}"
+                f"{parallel:>15.2f}{serial / parallel:>8.1f}x{str(identical):>11}"
+            )
+            if not identical:
+                print("parallel render differs from serial render", file=sys.stderr)
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
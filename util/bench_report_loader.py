@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the benchmark report loader on synthetic results files.
+
+Generates harness-shaped results files of increasing size (a JSON document
+with per-request sample arrays, like inference-perf, vllm-benchmark, aiperf
+and GuideLLM write, and a YAML benchmark report) and times
+``benchmark_report.core.import_yaml`` against the plain ``yaml.safe_load``
+it replaced.
+
+Run modes:
+
+  python util/bench_report_loader.py                  # 1 and 5 MB inputs
+  python util/bench_report_loader.py --sizes-mb 50    # custom sizes
+  python util/bench_report_loader.py --repeat 5       # best of 5 runs
+
+Pure-Python ``yaml.safe_load`` takes several seconds per MB, so large sizes
+take minutes to time on the baseline side alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llmdbenchmark.analysis.benchmark_report import core  # noqa: E402
+
+
+def _synthetic_results(target_bytes: int) -> dict:
+    """Build a results document of roughly ``target_bytes`` as JSON."""
+    rng = random.Random(0)
+    requests = []
+    # One sample serializes to roughly 200 bytes of JSON.
+    for i in range(max(1, target_bytes // 200)):
+        requests.append(
+            {
+                "request_id": f"req-{i:08d}",
+                "start_time": 1_700_000_000 + i * 0.01,
+                "ttft_ms": rng.uniform(10, 500),
+                "itl_ms": [rng.uniform(5, 40) for _ in range(4)],
+                "input_tokens": rng.randint(100, 4000),
+                "output_tokens": rng.randint(10, 1000),
+                "success": True,
+            }
+        )
+    return {
+        "metadata": {"version": 2},
+        "config": {"rate": [1, 2]},
+        "requests": requests,
+    }
+
+
+def _time(func, repeat: int) -> float:
+    """Best wall time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _safe_load(path: Path) -> None:
+    with open(path, "r", encoding="UTF-8") as handle:
+        yaml.safe_load(handle)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 5])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(
+        f"orjson: {'yes' if core.orjson is not None else 'no'}, "
+        f"libyaml: {'yes' if core.YamlLoader is not yaml.SafeLoader else 'no'}"
+    )
+    print(
+        f"{'file':<14}{'size MB':>9}{'safe_load s':>13}"
+        f"{'import_yaml s':>15}{'speedup':>9}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in args.sizes_mb:
+            data = _synthetic_results(int(size_mb * 1024 * 1024))
+            files = {
+                "results.json": json.dumps(data),
+                "report.yaml": yaml.safe_dump(data, sort_keys=False),
+            }
+            for name, text in files.items():
+                path = Path(tmp) / name
+                path.write_text(text, encoding="utf-8")
+                baseline = _time(lambda: _safe_load(path), args.repeat)
+                loader = _time(lambda: core.import_yaml(str(path)), args.repeat)
+                print(
+                    f"{name:<14}{path.stat().st_size / 1e6:>9.1f}"
+                    f"{baseline:>13.3f}{loader:>15.3f}{baseline / loader:>8.1f}x"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+
+# Copyright 2025 The llm-d Authors.
+# Licensed under the Apache License, Version 2.0 (the "License");
+
+"""
+Async Prometheus scraper for llm-d-benchmark
+Replaces the per-pod curl loop of collect_metrics.sh when aiohttp is available
+
+Every ``interval`` seconds all vLLM and EPP pods are scraped concurrently over
+one keep-alive connection pool. Ticks are scheduled against a monotonic clock
+(tick k starts at t0 + k * interval), so the scrape time does not push later
+ticks back; a tick that overruns skips the slots it missed instead of bursting.
+Discovered pods are cached and re-listed on a slower cadence, or at once when
+a pod stops answering.
+
+Each tick is appended to ``metrics/raw/segments/*.seg.gz`` as one gzip member
+holding the scrapes in the legacy raw-file layout (``# Timestamp:`` header,
+blank line, metrics body). ``expand`` turns the segments back into the
+``raw/{pod}_{epoch}_metrics.log`` files every analysis pass reads, and writes
+per-scrape latencies to ``processed/scrape_timings.json``.
+
+Usage:
+  collect_metrics.py run [--duration SECONDS]
+  collect_metrics.py expand [--keep-segments]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import signal
+import statistics
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+SEGMENT_DIR = "segments"
+SEGMENT_SUFFIX = ".seg.gz"
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+TIMINGS_FILE = "scrape_timings.json"
+VLLM_SOURCE = "prometheus_metrics"
+EPP_SOURCE = "epp_prometheus_metrics"
+DEFAULT_EPP_SECRET = (
+    "inference-gateway-sa-metrics-reader-secret"  # pragma: allowlist secret
+)
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ScrapeConfig:
+    """Scraper settings, read from the same variables as collect_metrics.sh."""
+
+    metrics_dir: str
+    namespace: str = "default"
+    interval: float = 15.0
+    discovery_interval: float = 60.0
+    metrics_port: int = 8000
+    inference_port: int = 8000
+    metrics_path: str = "/metrics"
+    timeout: float = 30.0
+    epp_port: int = 9090
+    epp_secret: str = ""
+    kubectl: str = "kubectl"
+    pod_pattern: str = "decode"
+
+    @classmethod
+    def from_env(cls, metrics_dir=None):
+        env = os.environ
+        results_dir = env.get("LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR", ".")
+        inference_port = env.get("LLMDBENCH_VLLM_COMMON_INFERENCE_PORT") or "8000"
+        interval = float(env.get("METRICS_COLLECTION_INTERVAL") or 15)
+        return cls(
+            metrics_dir=metrics_dir or os.path.join(results_dir, "metrics"),
+            namespace=env.get("LLMDBENCH_VLLM_COMMON_NAMESPACE") or "default",
+            interval=interval,
+            discovery_interval=float(
+                env.get("METRICS_DISCOVERY_INTERVAL") or max(60.0, 4 * interval)
+            ),
+            metrics_port=int(
+                env.get("LLMDBENCH_VLLM_COMMON_METRICS_PORT") or inference_port
+            ),
+            inference_port=int(inference_port),
+            metrics_path=(
+                env.get("LLMDBENCH_VLLM_MONITORING_METRICS_PATH") or "/metrics"
+            ),
+            timeout=float(env.get("METRICS_CURL_TIMEOUT") or 30),
+            epp_port=int(env.get("LLMDBENCH_EPP_METRICS_PORT") or 9090),
+            epp_secret=env.get("LLMDBENCH_EPP_METRICS_SECRET", DEFAULT_EPP_SECRET),
+            kubectl=env.get("KUBECTL_CMD") or "kubectl",
+            pod_pattern=env.get("LLMDBENCH_METRICS_POD_PATTERN") or "decode",
+        )
+
+
+@dataclass
+class ScrapeTarget:
+    """One pod endpoint; ``port`` sticks to the fallback once that answers."""
+
+    name: str
+    ip: str
+    source: str
+    port: int
+    fallback_port: int = 0
+    auth: str = ""
+
+    @property
+    def key(self):
+        return (self.source, self.name, self.ip)
+
+
+# ---------------------------------------------------------------------------
+# Pod discovery
+# ---------------------------------------------------------------------------
+
+
+async def _kubectl(config, *args):
+    """Run kubectl and return its stdout, or "" when it fails."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            config.kubectl,
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+    except OSError:
+        return ""
+    return stdout.decode() if proc.returncode == 0 else ""
+
+
+def _running_pods(listing, name_filter=None):
+    """(name, podIP) of the Running pods in a ``get pods -o json`` listing."""
+    try:
+        items = json.loads(listing).get("items", []) if listing else []
+    except json.JSONDecodeError:
+        return []
+    pods = []
+    for item in items:
+        name = item.get("metadata", {}).get("name", "")
+        status = item.get("status", {})
+        if status.get("phase") != "Running" or not status.get("podIP"):
+            continue
+        if name_filter and name_filter not in name.lower():
+            continue
+        pods.append((name, status["podIP"]))
+    return pods
+
+
+class PodDiscovery:
+    """Cached vLLM/EPP pod discovery with the label fallbacks of the shell script.
+
+    ``targets()`` answers from the cache; once the cache is older than
+    ``discovery_interval`` (or ``invalidate()`` was called) a refresh starts in
+    the background and the next tick picks it up. Only the very first call
+    waits for kubectl.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self._targets = {}
+        self._listed_at = None
+        self._refresh = None
+        self._epp_auth = None
+        self.refreshes = 0
+
+    def invalidate(self):
+        self._listed_at = None
+
+    async def targets(self):
+        stale = (
+            self._listed_at is None
+            or not self._targets
+            or time.monotonic() - self._listed_at >= self.config.discovery_interval
+        )
+        if stale and (self._refresh is None or self._refresh.done()):
+            self._refresh = asyncio.ensure_future(self._list())
+        if self.refreshes == 0:
+            await self._refresh
+        return list(self._targets.values())
+
+    async def _list(self):
+        config = self.config
+        vllm = await self._pods(
+            ["-l", "llm-d.ai/inferenceServing=true"],
+            ["-l", "stood-up-via=standalone"],
+            name_filter=config.pod_pattern.lower(),
+        )
+        epp = await self._pods(["-l", "inferencepool"], name_filter="epp")
+        auth = await self._epp_auth_header() if epp else ""
+
+        targets = {}
+        for name, ip in vllm:
+            target = ScrapeTarget(
+                name, ip, VLLM_SOURCE, config.metrics_port, config.inference_port
+            )
+            targets[target.key] = self._targets.get(target.key, target)
+        for name, ip in epp:
+            target = ScrapeTarget(name, ip, EPP_SOURCE, config.epp_port, auth=auth)
+            targets[target.key] = self._targets.get(target.key, target)
+        self._targets = targets
+        self._listed_at = time.monotonic()
+        self.refreshes += 1
+
+    async def _pods(self, *selectors, name_filter):
+        """First non-empty Running listing among the selectors, then by name."""
+        base = ["--namespace", self.config.namespace, "get", "pods"]
+        for selector in selectors:
+            listing = await _kubectl(
+                self.config,
+                *base,
+                *selector,
+                "--field-selector=status.phase=Running",
+                "-o",
+                "json",
+            )
+            pods = _running_pods(listing)
+            if pods:
+                return pods
+        return _running_pods(
+            await _kubectl(self.config, *base, "-o", "json"), name_filter
+        )
+
+    async def _epp_auth_header(self):
+        if self._epp_auth is None:
+            token = await _kubectl(
+                self.config,
+                "get",
+                "secret",
+                self.config.epp_secret,
+                "--namespace",
+                self.config.namespace,
+                "-o",
+                "jsonpath={.data.token}",
+            )
+            try:
+                token = base64.b64decode(token.strip()).decode() if token else ""
+            except ValueError:
+                token = ""
+            self._epp_auth = f"Bearer {token}" if token else ""
+        return self._epp_auth
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+
+class TickScheduler:
+    """Fixed-rate ticks on a monotonic clock.
+
+    Tick k is due at ``start + k * interval``. ``wait()`` sleeps until the next
+    due tick and returns ``(tick, lag, skipped)``: how late the tick started and
+    how many slots were dropped because the previous tick overran them.
+    """
+
+    def __init__(self, interval, clock=time.monotonic, sleep=asyncio.sleep):
+        self.interval = interval
+        self._clock = clock
+        self._sleep = sleep
+        self._start = None
+        self._next = 0
+
+    async def wait(self):
+        now = self._clock()
+        if self._start is None:
+            self._start = now
+        due = self._start + self._next * self.interval
+        skipped = 0
+        if now - due >= self.interval:
+            skipped = int((now - due) // self.interval)
+            self._next += skipped
+            due += skipped * self.interval
+        if due > now:
+            await self._sleep(due - now)
+        tick = self._next
+        self._next += 1
+        return tick, max(0.0, self._clock() - due), skipped
+
+
+# ---------------------------------------------------------------------------
+# Segments
+# ---------------------------------------------------------------------------
+
+
+def scrape_text(target, iso_timestamp, body):
+    """The legacy raw-file bytes collect_metrics.sh writes for one scrape."""
+    header = (
+        f"# Timestamp: {iso_timestamp}\n"
+        f"# Pod: {target.name}\n"
+        f"# PodIP: {target.ip}\n"
+        f"# Source: {target.source}\n"
+        "\n"
+    )
+    if not body:
+        body = (
+            f"# Warning: Failed to collect metrics from pod {target.name} "
+            f"({target.ip})\n"
+        ).encode()
+    return header.encode() + body + b"\n"
+
+
+def _frame(meta, payload=b""):
+    meta = dict(meta, size=len(payload))
+    return json.dumps(meta, separators=(",", ":")).encode() + b"\n" + payload
+
+
+class SegmentWriter:
+    """Appends one gzip member per tick, rotating at ``max_bytes``."""
+
+    def __init__(self, directory, max_bytes=SEGMENT_MAX_BYTES, level=1):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.level = level
+        os.makedirs(directory, exist_ok=True)
+        existing = [n for n in os.listdir(directory) if n.endswith(SEGMENT_SUFFIX)]
+        self._index = len(existing)
+        self._path = None
+
+    def _segment(self):
+        if self._path is None or os.path.getsize(self._path) >= self.max_bytes:
+            self._index += 1
+            self._path = os.path.join(
+                self.directory, f"scrapes-{self._index:05d}{SEGMENT_SUFFIX}"
+            )
+        return self._path
+
+    def append(self, frames):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        member = compressor.compress(b"".join(frames)) + compressor.flush()
+        with open(self._segment(), "ab") as f:
+            f.write(member)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _members(path):
+    """Decompressed gzip members of a segment; a torn last member is dropped."""
+    with open(path, "rb") as f:
+        data = f.read()
+    while data:
+        decompressor = zlib.decompressobj(31)
+        try:
+            chunk = decompressor.decompress(data)
+        except zlib.error:
+            return
+        if not decompressor.eof:
+            return
+        yield chunk
+        data = decompressor.unused_data
+
+
+def read_segment(path):
+    """Yield ``(meta, payload)`` for every complete record in a segment."""
+    for member in _members(path):
+        pos = 0
+        while pos < len(member):
+            end = member.index(b"\n", pos)
+            meta = json.loads(member[pos:end])
+            start = end + 1
+            pos = start + meta["size"]
+            yield meta, member[start:pos]
+
+
+def segment_paths(metrics_dir):
+    directory = os.path.join(metrics_dir, "raw", SEGMENT_DIR)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(SEGMENT_SUFFIX)
+    )
+
+
+def _latency_stats(values):
+    ordered = sorted(values)
+    return {
+        "mean": statistics.mean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+        "count": len(ordered),
+        "unit": "s",
+    }
+
+
+def expand_segments(metrics_dir, keep_segments=False):
+    """Write the legacy raw files and the scrape timing summary from segments.
+
+    Returns the number of raw files written. Existing raw files are left as
+    they are, so expanding twice is harmless.
+    """
+    raw_dir = os.path.join(metrics_dir, "raw")
+    processed_dir = os.path.join(metrics_dir, "processed")
+    paths = segment_paths(metrics_dir)
+    if not paths:
+        return 0
+
+    written = 0
+    latencies = {}
+    failures = {}
+    ticks = []
+    for path in paths:
+        for meta, payload in read_segment(path):
+            if "tick" in meta:
+                ticks.append(meta)
+                continue
+            pod = meta["pod"]
+            latencies.setdefault(pod, []).append(meta["latency_s"])
+            failures[pod] = failures.get(pod, 0) + (0 if meta["ok"] else 1)
+            raw_path = os.path.join(raw_dir, meta["file"])
+            if not os.path.exists(raw_path):
+                with open(raw_path, "wb") as f:
+                    f.write(payload)
+                written += 1
+
+    os.makedirs(processed_dir, exist_ok=True)
+    summary = {
+        "interval_s": ticks[0]["interval_s"] if ticks else None,
+        "ticks": len(ticks),
+        "skipped_ticks": sum(t["skipped"] for t in ticks),
+        "tick_lag_s": _latency_stats([t["lag_s"] for t in ticks]) if ticks else None,
+        "tick_duration_s": (
+            _latency_stats([t["duration_s"] for t in ticks]) if ticks else None
+        ),
+        "pods": {
+            pod: {"failures": failures[pod], "latency_s": _latency_stats(values)}
+            for pod, values in sorted(latencies.items())
+        },
+    }
+    with open(os.path.join(processed_dir, TIMINGS_FILE), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    if not keep_segments:
+        for path in paths:
+            os.remove(path)
+    return written
+
+
+# ---------------------------------------------------------------------------
+# Scraping
+# ---------------------------------------------------------------------------
+
+
+class MetricsCollector:
+    """Scrapes every discovered pod once per tick and appends the results."""
+
+    def __init__(self, config, discovery=None, connector_limit=64):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required to run the async scraper")
+        self.config = config
+        self.discovery = discovery or PodDiscovery(config)
+        self.connector_limit = connector_limit
+        self.writer = SegmentWriter(
+            os.path.join(config.metrics_dir, "raw", SEGMENT_DIR)
+        )
+        self.ticks = 0
+        self._wall_start = None
+        self._stop = asyncio.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    async def _get(self, session, target, port, auth):
+        """(status, body) of one GET, or (None, b"") when the pod is unreachable."""
+        url = f"http://{target.ip}:{port}{self.config.metrics_path}"
+        headers = {"Authorization": auth} if auth else None
+        try:
+            async with session.get(url, headers=headers) as response:
+                return response.status, await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+            return None, b""
+
+    async def _scrape(self, session, target):
+        """(status, body) of one pod's scrape, with the shell script's fallbacks."""
+        status, body = await self._get(session, target, target.port, target.auth)
+        if target.auth and status in (401, 403):
+            status, body = await self._get(session, target, target.port, "")
+            if body:
+                target.auth = ""
+        if not body and target.fallback_port and target.fallback_port != target.port:
+            status, body = await self._get(
+                session, target, target.fallback_port, target.auth
+            )
+            if body:
+                target.port, target.fallback_port = target.fallback_port, target.port
+        return status, body
+
+    async def _timed_scrape(self, session, target, epoch, iso_timestamp):
+        started = time.monotonic()
+        status, body = await self._scrape(session, target)
+        meta = {
+            "file": f"{target.name}_{epoch}_metrics.log",
+            "pod": target.name,
+            "source": target.source,
+            "latency_s": round(time.monotonic() - started, 6),
+            "ok": status == 200 and bool(body),
+        }
+        return meta, scrape_text(target, iso_timestamp, body)
+
+    async def tick(self, session, tick=0, lag=0.0, skipped=0):
+        """One scrape round: every target concurrently, then one segment append.
+
+        Scrapes are stamped with the tick's slot on the wall clock rather than
+        the moment the tick got to run, so the time series stays evenly spaced.
+        """
+        started = time.monotonic()
+        if self._wall_start is None:
+            self._wall_start = time.time() - lag - tick * self.config.interval
+        now = self._wall_start + tick * self.config.interval
+        epoch = int(now)
+        iso_timestamp = datetime.fromtimestamp(now, timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S%z"
+        )
+        targets = await self.discovery.targets()
+        results = await asyncio.gather(
+            *(
+                self._timed_scrape(session, target, epoch, iso_timestamp)
+                for target in targets
+            )
+        )
+        if any(not meta["ok"] for meta, _ in results):
+            self.discovery.invalidate()
+
+        frames = [
+            _frame(
+                {
+                    "tick": tick,
+                    "epoch": epoch,
+                    "interval_s": self.config.interval,
+                    "lag_s": round(lag, 6),
+                    "skipped": skipped,
+                    "pods": len(targets),
+                    "duration_s": round(time.monotonic() - started, 6),
+                }
+            )
+        ]
+        frames.extend(_frame(meta, payload) for meta, payload in results)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.writer.append, frames
+        )
+        self.ticks += 1
+        failed = sum(1 for meta, _ in results if not meta["ok"])
+        print(
+            f"Collected metrics at {iso_timestamp}: {len(targets)} pods"
+            + (f", {failed} failed" if failed else "")
+            + (f", {skipped} ticks skipped" if skipped else ""),
+            flush=True,
+        )
+
+    async def run(self, duration=0.0):
+        """Tick until ``stop()`` (or SIGTERM) or until ``duration`` seconds pass."""
+        connector = aiohttp.TCPConnector(
+            limit=self.connector_limit,
+            keepalive_timeout=2 * self.config.interval + 5,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout, sock_connect=5)
+        scheduler = TickScheduler(self.config.interval)
+        started = time.monotonic()
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            while not self._stop.is_set():
+                waiter = asyncio.ensure_future(scheduler.wait())
+                stopper = asyncio.ensure_future(self._stop.wait())
+                await asyncio.wait(
+                    {waiter, stopper}, return_when=asyncio.FIRST_COMPLETED
+                )
+                stopper.cancel()
+                if self._stop.is_set():
+                    waiter.cancel()
+                    break
+                await self.tick(session, *waiter.result())
+                if duration and time.monotonic() - started >= duration:
+                    print(
+                        f"Collection duration reached ({duration:g} seconds)",
+                        flush=True,
+                    )
+                    break
+        print(f"Collected {self.ticks} snapshots", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=["run", "expand"])
+    parser.add_argument(
+        "--metrics-dir",
+        default=os.environ.get("METRICS_DIR"),
+        help="default: $LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR/metrics",
+    )
+    parser.add_argument("--duration", type=float, default=0.0)
+    parser.add_argument("--keep-segments", action="store_true")
+    args = parser.parse_args()
+
+    config = ScrapeConfig.from_env(args.metrics_dir)
+    if args.command == "expand":
+        written = expand_segments(config.metrics_dir, args.keep_segments)
+        print(f"Expanded {written} raw metrics files from scrape segments")
+        return 0
+
+    collector = MetricsCollector(config)
+    loop = asyncio.new_event_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, collector.stop)
+    print(
+        f"Starting async metrics scraper (interval: {config.interval:g}s, "
+        f"discovery every {config.discovery_interval:g}s)",
+        flush=True,
+    )
+    try:
+        loop.run_until_complete(collector.run(args.duration))
+    finally:
+        loop.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
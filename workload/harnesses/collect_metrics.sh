@@ -19,6 +19,8 @@ METRICS_CURL_TIMEOUT="${METRICS_CURL_TIMEOUT:-30}"  # max-time for curl in secon
 EPP_METRICS_PORT="${LLMDBENCH_EPP_METRICS_PORT:-9090}"  # EPP Prometheus metrics port
 EPP_METRICS_SECRET="${LLMDBENCH_EPP_METRICS_SECRET:-inference-gateway-sa-metrics-reader-secret}"  # pragma: allowlist secret
 _EPP_AUTH_HEADER=""  # cached bearer token header for EPP scrapes
+METRICS_SCRAPER="${LLMDBENCH_METRICS_SCRAPER:-auto}"  # auto | python | shell
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Function to initialize metrics directory
 init_metrics_dir() {
@@ -497,6 +499,16 @@ collect_metrics_snapshot() {
 # Collection lifecycle
 # ---------------------------------------------------------------------------
 
+# Whether Prometheus scraping runs in the async collector (collect_metrics.py)
+# instead of the curl loop above. "auto" uses it when aiohttp is importable.
+_use_python_scraper() {
+    case "$METRICS_SCRAPER" in
+        shell) return 1 ;;
+        python) return 0 ;;
+    esac
+    [[ -f "${SCRIPT_DIR}/collect_metrics.py" ]] && python3 -c "import aiohttp" 2>/dev/null
+}
+
 # Start continuous collection in background
 start_continuous_collection() {
     local duration="${1:-0}"  # 0 means run until stopped
@@ -506,6 +518,17 @@ start_continuous_collection() {
     echo "Starting continuous metrics collection (interval: ${COLLECTION_INTERVAL}s)"
     echo $$ > "$METRICS_DIR/collector.pid"
 
+    # The async scraper keeps its own drift-free schedule; this loop then only
+    # tracks replica status and startup times.
+    local scraper_pid=""
+    if _use_python_scraper; then
+        python3 "${SCRIPT_DIR}/collect_metrics.py" run \
+            --metrics-dir "$METRICS_DIR" --duration "$duration" &
+        scraper_pid=$!
+        echo "$scraper_pid" > "$METRICS_DIR/scraper.pid"
+        echo "Prometheus scraping delegated to collect_metrics.py (PID: $scraper_pid)"
+    fi
+
     local start_time=$(date +%s)
     local iterations=0
 
@@ -514,8 +537,16 @@ start_continuous_collection() {
         collect_replica_status
         collect_pod_startup_times
 
-        # Collect Prometheus metrics from all pods
-        collect_metrics_snapshot
+        # Collect Prometheus metrics from all pods, unless the async scraper
+        # does; fall back to curl if it has died.
+        if [[ -n "$scraper_pid" ]] && ! kill -0 "$scraper_pid" 2>/dev/null; then
+            echo "Warning: async metrics scraper exited, falling back to curl" >&2
+            scraper_pid=""
+            rm -f "$METRICS_DIR/scraper.pid"
+        fi
+        if [[ -z "$scraper_pid" ]]; then
+            collect_metrics_snapshot
+        fi
         iterations=$((iterations + 1))
 
         # Check if we should stop (duration exceeded)
@@ -537,6 +568,20 @@ start_continuous_collection() {
 
 # Stop continuous collection
 stop_continuous_collection() {
+    # Let the async scraper finish its current tick so its last segment is whole
+    if [[ -f "$METRICS_DIR/scraper.pid" ]]; then
+        local scraper_pid=$(cat "$METRICS_DIR/scraper.pid")
+        if kill -0 "$scraper_pid" 2>/dev/null; then
+            echo "Stopping async metrics scraper (PID: $scraper_pid)"
+            kill "$scraper_pid"
+            local waited=0
+            while kill -0 "$scraper_pid" 2>/dev/null && [[ $waited -lt 60 ]]; do
+                sleep 0.5
+                waited=$((waited + 1))
+            done
+        fi
+        rm -f "$METRICS_DIR/scraper.pid"
+    fi
     if [[ -f "$METRICS_DIR/collector.pid" ]]; then
         local pid=$(cat "$METRICS_DIR/collector.pid")
         if kill -0 "$pid" 2>/dev/null; then
@@ -550,7 +595,10 @@ stop_continuous_collection() {
 # Parse and aggregate collected logs
 process_collected_metrics() {
     echo "Processing collected logs..."
-    SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+    # Scrape segments from the async scraper become the per-pod raw files
+    if compgen -G "$METRICS_DIR/raw/segments/*.seg.gz" > /dev/null; then
+        python3 "${SCRIPT_DIR}/collect_metrics.py" expand --metrics-dir "$METRICS_DIR"
+    fi
     METRICS_DIR="$METRICS_DIR" python3 "${SCRIPT_DIR}/process_metrics.py"
 }
 
@@ -5,24 +5,53 @@
 This harness sends OpenAI-compatible requests with different
 ``x-llm-d-inference-objective`` values so EPP priority bands can be tested with
 mixed traffic classes.
+
+Load is open-loop: request start times come from the arrival process
+(``load.arrival``: ``constant`` or ``poisson``) and never wait for earlier
+requests to finish.  The default engine runs every request on one asyncio
+event loop over a shared keep-alive connection pool.  A request that arrives
+while ``max_in_flight`` requests are outstanding is dropped, and one that
+starts more than ``late_threshold_ms`` after its scheduled time is counted as
+late; both are reported per traffic class.  Unset, ``max_in_flight`` is
+``rate_per_second * request_timeout_seconds`` -- the most requests that can be
+outstanding before the oldest times out -- so only a profile that caps it
+explicitly drops traffic.  Without ``aiohttp`` (or with
+``load.engine: threads``) a thread pool is used instead; it queues requests
+beyond ``max_in_flight`` rather than dropping them.
+
+``priority_mix.py --self-test --rate 1000`` drives a local stub server and
+reports the achieved request rate against the target.
 """
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import functools
+import itertools
 import json
 import logging
 import math
 import os
 from pathlib import Path
+import random
+import sys
 import time
-from typing import Any
+from typing import Any, Iterator
 
 import requests
 import yaml
 
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:  # the threaded engine needs only requests
+    aiohttp = None
+    web = None
+
 
 OBJECTIVE_HEADER = "x-llm-d-inference-objective"
 FAIRNESS_HEADER = "x-llm-d-inference-fairness-id"
@@ -41,11 +70,59 @@ class TrafficClass:
 class RequestResult:
     traffic_class: str
     status_code: int
-    latency_ms: float
+    latency_ms: float | None
     ttft_ms: float | None = None
     tpot_ms: float | None = None
     output_tokens: int = 0
     error: str | None = None
+    start_delay_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class LoadSettings:
+    """The ``load`` section of a profile."""
+
+    rate_per_second: float = 1.0
+    total_requests: int = 30
+    max_in_flight: int = 1
+    timeout_seconds: float = 60.0
+    arrival: str = "constant"
+    seed: int | None = None
+    late_threshold_ms: float = 10.0
+    engine: str = "asyncio"
+
+    @classmethod
+    def from_profile(cls, profile: dict[str, Any]) -> LoadSettings:
+        load = profile.get("load") or {}
+        duration_seconds = float(load.get("duration_seconds", 30))
+        rate_per_second = float(load.get("rate_per_second", 1))
+        arrival = str(load.get("arrival", "constant")).lower()
+        if arrival not in ARRIVAL_PROCESSES:
+            raise ValueError(
+                f"load.arrival must be one of {', '.join(ARRIVAL_PROCESSES)}"
+            )
+        engine = str(load.get("engine", "asyncio")).lower()
+        if engine not in {"asyncio", "threads"}:
+            raise ValueError("load.engine must be asyncio or threads")
+        seed = load.get("seed")
+        timeout_seconds = float(load.get("request_timeout_seconds", 60))
+        return cls(
+            rate_per_second=rate_per_second,
+            total_requests=int(
+                load.get("total_requests", max(1, duration_seconds * rate_per_second))
+            ),
+            max_in_flight=int(
+                load.get(
+                    "max_in_flight",
+                    max(1, math.ceil(rate_per_second * timeout_seconds)),
+                )
+            ),
+            timeout_seconds=timeout_seconds,
+            arrival=arrival,
+            seed=None if seed is None else int(seed),
+            late_threshold_ms=float(load.get("late_threshold_ms", 10)),
+            engine=engine,
+        )
 
 
 def setup_logger(results_dir: Path) -> logging.Logger:
@@ -115,19 +192,48 @@ def traffic_classes(profile: dict[str, Any]) -> list[TrafficClass]:
     return parsed
 
 
-def weighted_schedule(
-    classes: list[TrafficClass], total_requests: int
-) -> list[TrafficClass]:
+def iter_weighted_schedule(classes: list[TrafficClass]) -> Iterator[TrafficClass]:
+    """Smooth weighted round-robin over *classes*, generated lazily."""
     total_weight = sum(item.weight for item in classes)
     current = [0.0 for _ in classes]
-    schedule: list[TrafficClass] = []
-    for _ in range(total_requests):
+    while True:
         for index, item in enumerate(classes):
             current[index] += item.weight
         selected_index = max(range(len(classes)), key=lambda index: current[index])
         current[selected_index] -= total_weight
-        schedule.append(classes[selected_index])
-    return schedule
+        yield classes[selected_index]
+
+
+def weighted_schedule(
+    classes: list[TrafficClass], total_requests: int
+) -> list[TrafficClass]:
+    return list(itertools.islice(iter_weighted_schedule(classes), total_requests))
+
+
+ARRIVAL_PROCESSES = ("constant", "poisson")
+
+
+def arrival_offsets(
+    process: str, rate_per_second: float, seed: int | None = None
+) -> Iterator[float]:
+    """Scheduled start times, in seconds from the start of the run.
+
+    ``constant`` spaces requests exactly ``1/rate`` apart; ``poisson`` draws
+    exponential gaps with mean ``1/rate``.  A rate of zero or less sends
+    everything at once.
+    """
+    if rate_per_second <= 0:
+        yield from itertools.repeat(0.0)
+        return
+    if process == "constant":
+        for index in itertools.count():
+            yield index / rate_per_second
+        return
+    rng = random.Random(seed)
+    offset = 0.0
+    while True:
+        yield offset
+        offset += rng.expovariate(rate_per_second)
 
 
 def build_payload(
@@ -225,46 +331,112 @@ def send_request(
         return RequestResult(traffic_class.name, 0, latency_ms, error=str(exc))
 
 
+class _TokenTimer:
+    """Token arrival times of one streaming (SSE) response."""
+
+    def __init__(self, start: float):
+        self.start = start
+        self.first: float | None = None
+        self.last: float | None = None
+        self.output_tokens = 0
+
+    def feed(self, raw_line: str | bytes | None) -> bool:
+        """Account for one SSE line; True once the stream reports ``[DONE]``."""
+        if not raw_line:
+            return False
+        if isinstance(raw_line, bytes):
+            raw_line = raw_line.decode("utf-8", errors="replace")
+        line = str(raw_line).strip()
+        if not line.startswith("data:"):
+            return False
+        data = line.removeprefix("data:").strip()
+        if data == "[DONE]":
+            return True
+        if streaming_chunk_has_content(data):
+            now = time.perf_counter()
+            self.first = self.first or now
+            self.last = now
+            self.output_tokens += 1
+        return False
+
+    def result(
+        self,
+        traffic_class: str,
+        status_code: int,
+        error: str | None = None,
+        start_delay_ms: float = 0.0,
+    ) -> RequestResult:
+        latency_ms = (time.perf_counter() - self.start) * 1000
+        ttft_ms = ((self.first - self.start) * 1000) if self.first else None
+        tpot_ms = None
+        if self.first and self.last and self.output_tokens > 1:
+            tpot_ms = ((self.last - self.first) * 1000) / (self.output_tokens - 1)
+        return RequestResult(
+            traffic_class=traffic_class,
+            status_code=status_code,
+            latency_ms=latency_ms,
+            ttft_ms=ttft_ms,
+            tpot_ms=tpot_ms,
+            output_tokens=self.output_tokens,
+            error=error,
+            start_delay_ms=start_delay_ms,
+        )
+
+
 def read_streaming_response(
     response: requests.Response,
     traffic_class: str,
     start: float,
 ) -> RequestResult:
-    first_token_time: float | None = None
-    last_token_time: float | None = None
-    output_tokens = 0
+    timer = _TokenTimer(start)
     error: str | None = None
     try:
         for raw_line in response.iter_lines(decode_unicode=True):
-            if not raw_line:
-                continue
-            line = str(raw_line)
-            if not line.startswith("data:"):
-                continue
-            data = line.removeprefix("data:").strip()
-            if data == "[DONE]":
+            if timer.feed(raw_line):
                 break
-            if streaming_chunk_has_content(data):
-                now = time.perf_counter()
-                first_token_time = first_token_time or now
-                last_token_time = now
-                output_tokens += 1
     except requests.RequestException as exc:
         error = str(exc)
-    latency_ms = (time.perf_counter() - start) * 1000
-    ttft_ms = ((first_token_time - start) * 1000) if first_token_time else None
-    tpot_ms = None
-    if first_token_time and last_token_time and output_tokens > 1:
-        tpot_ms = ((last_token_time - first_token_time) * 1000) / (output_tokens - 1)
-    return RequestResult(
-        traffic_class=traffic_class,
-        status_code=response.status_code,
-        latency_ms=latency_ms,
-        ttft_ms=ttft_ms,
-        tpot_ms=tpot_ms,
-        output_tokens=output_tokens,
-        error=error,
-    )
+    return timer.result(traffic_class, response.status_code, error)
+
+
+async def send_request_async(
+    session: Any,
+    url: str,
+    payload: dict[str, Any],
+    traffic_class: TrafficClass,
+    start_delay_ms: float = 0.0,
+) -> RequestResult:
+    """:func:`send_request` on a shared ``aiohttp`` session."""
+    headers = {"Content-Type": "application/json", **traffic_class.headers}
+    timer = _TokenTimer(time.perf_counter())
+    status_code = 0
+    try:
+        async with session.post(url, headers=headers, json=payload) as response:
+            status_code = response.status
+            if payload.get("stream"):
+                async for raw_line in response.content:
+                    if timer.feed(raw_line):
+                        break
+            else:
+                await response.read()
+        return timer.result(
+            traffic_class.name, status_code, start_delay_ms=start_delay_ms
+        )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        error = str(exc) or type(exc).__name__
+        result = timer.result(
+            traffic_class.name, status_code, error, start_delay_ms=start_delay_ms
+        )
+        if result.output_tokens == 0:
+            # Nothing arrived: keep TTFT/TPOT out of the error's numbers.
+            return RequestResult(
+                traffic_class.name,
+                status_code,
+                result.latency_ms,
+                error=error,
+                start_delay_ms=start_delay_ms,
+            )
+        return result
 
 
 def streaming_chunk_has_content(data: str) -> bool:
@@ -294,8 +466,12 @@ def percentile(values: list[float], percentile_value: float) -> float:
 
 
 def summarize(
-    results: list[RequestResult], classes: list[TrafficClass]
+    results: list[RequestResult],
+    classes: list[TrafficClass],
+    dropped: dict[str, int] | None = None,
+    late_threshold_ms: float | None = None,
 ) -> dict[str, Any]:
+    dropped = dropped or {}
     by_class: dict[str, list[RequestResult]] = {item.name: [] for item in classes}
     for result in results:
         by_class.setdefault(result.traffic_class, []).append(result)
@@ -346,10 +522,16 @@ def summarize(
                 "p99": percentile(tpots, 0.99),
             },
             "output_tokens": sum(result.output_tokens for result in class_results),
+            "dropped": dropped.get(item.name, 0),
         }
+        if late_threshold_ms is not None:
+            class_summaries[item.name]["late"] = sum(
+                1 for r in class_results if r.start_delay_ms > late_threshold_ms
+            )
 
     return {
         "total_requests": len(results),
+        "dropped": sum(dropped.values()),
         "successes": sum(1 for result in results if 200 <= result.status_code < 300),
         "errors": sum(
             1 for result in results if result.error or result.status_code >= 400
@@ -358,51 +540,240 @@ def summarize(
     }
 
 
-def run(profile: dict[str, Any], logger: logging.Logger) -> dict[str, Any]:
-    load = profile.get("load") or {}
-    duration_seconds = float(load.get("duration_seconds", 30))
-    rate_per_second = float(load.get("rate_per_second", 1))
-    max_in_flight = int(load.get("max_in_flight", max(1, math.ceil(rate_per_second))))
-    timeout_seconds = float(load.get("request_timeout_seconds", 60))
-    total_requests = int(
-        load.get("total_requests", max(1, duration_seconds * rate_per_second))
-    )
+def _load_stats(
+    settings: LoadSettings,
+    engine: str,
+    results: list[RequestResult],
+    dispatch_times: list[float],
+    dropped: dict[str, int],
+) -> dict[str, Any]:
+    """How closely the run followed its arrival process."""
+    delays = [r.start_delay_ms for r in results]
+    span = dispatch_times[-1] - dispatch_times[0] if len(dispatch_times) > 1 else 0.0
+    return {
+        "engine": engine,
+        "arrival": settings.arrival,
+        "target_rate": settings.rate_per_second,
+        "achieved_rate": (len(dispatch_times) - 1) / span if span > 0 else 0.0,
+        "dispatched": len(dispatch_times),
+        "dropped": sum(dropped.values()),
+        "late": sum(1 for d in delays if d > settings.late_threshold_ms),
+        "late_threshold_ms": settings.late_threshold_ms,
+        "start_delay_ms": {
+            "p50": percentile(delays, 0.50),
+            "p99": percentile(delays, 0.99),
+            "max": max(delays, default=0.0),
+        },
+    }
 
-    classes = traffic_classes(profile)
-    schedule = weighted_schedule(classes, total_requests)
-    url = request_url(profile)
 
-    logger.info(
-        "running priority-mix workload url=%s total_requests=%d", url, total_requests
-    )
-    logger.info("traffic classes: %s", ", ".join(item.name for item in classes))
+async def run_open_loop(
+    profile: dict[str, Any],
+    settings: LoadSettings,
+    classes: list[TrafficClass],
+    url: str,
+) -> tuple[list[RequestResult], list[float], dict[str, int]]:
+    """Issue the schedule on one event loop; never wait on completions."""
+    loop = asyncio.get_running_loop()
+    connector = aiohttp.TCPConnector(limit=settings.max_in_flight, limit_per_host=0)
+    timeout = aiohttp.ClientTimeout(total=settings.timeout_seconds)
+    results: list[RequestResult] = []
+    dispatch_times: list[float] = []
+    dropped: dict[str, int] = {}
+    in_flight: set[asyncio.Task] = set()
+
+    def _done(class_name: str, start_delay_ms: float, task: asyncio.Task) -> None:
+        in_flight.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is None:
+            results.append(task.result())
+        else:
+            # An unexpected failure still counts against its class.
+            results.append(
+                RequestResult(
+                    class_name, 0, None, error=repr(exc), start_delay_ms=start_delay_ms
+                )
+            )
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        start = loop.time()
+        arrivals = arrival_offsets(
+            settings.arrival, settings.rate_per_second, settings.seed
+        )
+        schedule = iter_weighted_schedule(classes)
+        for index in range(settings.total_requests):
+            due = start + next(arrivals)
+            traffic_class = next(schedule)
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= settings.max_in_flight:
+                dropped[traffic_class.name] = dropped.get(traffic_class.name, 0) + 1
+                continue
+            now = loop.time()
+            dispatch_times.append(now)
+            start_delay_ms = max(0.0, now - due) * 1000
+            task = loop.create_task(
+                send_request_async(
+                    session,
+                    url,
+                    build_payload(profile, traffic_class, index),
+                    traffic_class,
+                    start_delay_ms=start_delay_ms,
+                )
+            )
+            in_flight.add(task)
+            task.add_done_callback(
+                functools.partial(_done, traffic_class.name, start_delay_ms)
+            )
+        if in_flight:
+            await asyncio.wait(set(in_flight))
+    return results, dispatch_times, dropped
+
 
+def run_threaded(
+    profile: dict[str, Any],
+    settings: LoadSettings,
+    classes: list[TrafficClass],
+    url: str,
+) -> tuple[list[RequestResult], list[float], dict[str, int]]:
+    """Fallback engine: pace on this thread, send from a thread pool."""
+    arrivals = arrival_offsets(
+        settings.arrival, settings.rate_per_second, settings.seed
+    )
+    schedule = iter_weighted_schedule(classes)
     results: list[RequestResult] = []
-    interval = 1 / rate_per_second if rate_per_second > 0 else 0
-    next_send = time.perf_counter()
-    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+    dispatch_times: list[float] = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=settings.max_in_flight) as executor:
         futures = []
-        for index in range(total_requests):
-            delay = next_send - time.perf_counter()
+        for index in range(settings.total_requests):
+            due = start + next(arrivals)
+            traffic_class = next(schedule)
+            delay = due - time.perf_counter()
             if delay > 0:
                 time.sleep(delay)
-            traffic_class = schedule[index]
             payload = build_payload(profile, traffic_class, index)
+            dispatch_times.append(time.perf_counter())
             futures.append(
                 executor.submit(
-                    send_request, url, payload, traffic_class, timeout_seconds
+                    send_request,
+                    url,
+                    payload,
+                    traffic_class,
+                    settings.timeout_seconds,
                 )
             )
-            next_send += interval
         for future in as_completed(futures):
             results.append(future.result())
+    return results, dispatch_times, {}
+
+
+def run(profile: dict[str, Any], logger: logging.Logger) -> dict[str, Any]:
+    settings = LoadSettings.from_profile(profile)
+    classes = traffic_classes(profile)
+    url = request_url(profile)
+    engine = settings.engine
+    if engine == "asyncio" and aiohttp is None:
+        logger.warning("aiohttp is not installed; using the threaded engine")
+        engine = "threads"
+
+    logger.info(
+        "running priority-mix workload url=%s total_requests=%d rate=%.1f/s "
+        "arrival=%s engine=%s",
+        url,
+        settings.total_requests,
+        settings.rate_per_second,
+        settings.arrival,
+        engine,
+    )
+    logger.info("traffic classes: %s", ", ".join(item.name for item in classes))
 
+    if engine == "asyncio":
+        results, dispatch_times, dropped = asyncio.run(
+            run_open_loop(profile, settings, classes, url)
+        )
+    else:
+        results, dispatch_times, dropped = run_threaded(profile, settings, classes, url)
+
+    load_stats = _load_stats(settings, engine, results, dispatch_times, dropped)
+    logger.info(
+        "achieved %.1f/s of %.1f/s target: %d dispatched, %d dropped, %d late",
+        load_stats["achieved_rate"],
+        settings.rate_per_second,
+        load_stats["dispatched"],
+        load_stats["dropped"],
+        load_stats["late"],
+    )
     return {
-        "summary": summarize(results, classes),
+        "summary": summarize(results, classes, dropped, settings.late_threshold_ms),
+        "load": load_stats,
         "requests": [result.__dict__ for result in results],
     }
 
 
+async def _serve_stub(handler_delay: float) -> tuple[Any, str]:
+    """Start a minimal OpenAI-style endpoint on localhost."""
+
+    async def _complete(_request: Any) -> Any:
+        if handler_delay:
+            await asyncio.sleep(handler_delay)
+        return web.json_response({"id": "stub", "choices": []})
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", _complete)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def self_test(
+    rate_per_second: float = 1000.0,
+    duration_seconds: float = 5.0,
+    arrival: str = "constant",
+    handler_delay: float = 0.0,
+) -> dict[str, Any]:
+    """Drive a local stub server open-loop and return the load statistics."""
+    if aiohttp is None:
+        raise RuntimeError("the self-test needs aiohttp")
+    profile: dict[str, Any] = {
+        "model": "self-test",
+        "load": {
+            "rate_per_second": rate_per_second,
+            "duration_seconds": duration_seconds,
+            "max_in_flight": max(64, math.ceil(rate_per_second)),
+            "arrival": arrival,
+            "seed": 0,
+        },
+        "trafficClasses": [
+            {"name": "critical", "weight": 1, "objective": "app-critical"},
+            {"name": "batch", "weight": 3, "objective": "app-batch"},
+        ],
+    }
+    settings = LoadSettings.from_profile(profile)
+    classes = traffic_classes(profile)
+
+    async def _run() -> dict[str, Any]:
+        runner, endpoint = await _serve_stub(handler_delay)
+        try:
+            profile["endpoint_url"] = endpoint
+            results, dispatch_times, dropped = await run_open_loop(
+                profile, settings, classes, request_url(profile)
+            )
+        finally:
+            await runner.cleanup()
+        stats = _load_stats(settings, "asyncio", results, dispatch_times, dropped)
+        stats["errors"] = sum(1 for r in results if r.error or r.status_code >= 400)
+        return stats
+
+    return asyncio.run(_run())
+
+
 def write_run_metadata(
     results_dir: Path, start: datetime, stop: datetime, rc: int
 ) -> None:
@@ -430,7 +801,23 @@ def write_run_metadata(
         yaml.safe_dump(metadata, metadata_file, sort_keys=False)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--self-test",
+        action="store_true",
+        help="Drive a local stub server and compare achieved and target rate.",
+    )
+    parser.add_argument("--rate", type=float, default=1000.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--arrival", choices=ARRIVAL_PROCESSES, default="constant")
+    args = parser.parse_args(argv)
+    if args.self_test:
+        stats = self_test(args.rate, args.duration, args.arrival)
+        print(json.dumps(stats, indent=2, sort_keys=True))
+        on_target = stats["achieved_rate"] >= 0.95 * args.rate
+        return 0 if on_target and not stats["dropped"] and not stats["errors"] else 1
+
     results_dir = Path(os.environ["LLMDBENCH_RUN_EXPERIMENT_RESULTS_DIR"])
     workspace_dir = Path(os.environ.get("LLMDBENCH_RUN_WORKSPACE_DIR", "/workspace"))
     workload_name = os.environ.get(
@@ -460,4 +847,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main(sys.argv[1:]))
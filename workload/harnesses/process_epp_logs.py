@@ -5,10 +5,17 @@ EPP (Endpoint Picker Plugin) log parser and visualization for llm-d-benchmark.
 Parses structured JSON logs from EPP pods, extracts scheduling metrics,
 and optionally generates visualization plots.
 
+Logs are analyzed in a single streaming pass (see EppLogAnalyzer): lines
+whose "msg" is irrelevant are skipped before JSON decoding, and each
+request's trace is folded into the aggregates once its terminal message is
+seen, so memory does not grow with log size. Several log files are analyzed
+in parallel worker processes.
+
 Usage:
     python3 process_epp_logs.py <results_dir>                    # parse only
     python3 process_epp_logs.py <results_dir> --visualize        # parse + generate plots
     python3 process_epp_logs.py <results_dir> -o <output_dir>    # custom output location
+    python3 process_epp_logs.py <results_dir> --log a.log --log b.log --workers 4
 """
 
 import argparse
@@ -18,6 +25,7 @@ import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
@@ -99,7 +107,10 @@ def parse_timestamp(ts_str: str) -> Optional[datetime]:
 
 
 def parse_log_file(log_path: str) -> List[EppLogEntry]:
-    """Parse an EPP pod log file into structured entries."""
+    """Parse an EPP pod log file into structured entries.
+
+    Keeps every entry in memory; the CLI streams with analyze_log_file.
+    """
     entries = []
     parse_errors = 0
 
@@ -331,112 +342,380 @@ def compute_stats(values: List[float], unit: str = "") -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def aggregate_and_output(
-    entries: List[EppLogEntry], output_dir: str, log_path: str
-) -> dict:
-    """Aggregate all extracted data and write JSON output files."""
-    os.makedirs(output_dir, exist_ok=True)
+# ---------------------------------------------------------------------------
+# Streaming analysis
+# ---------------------------------------------------------------------------
 
-    sat_config = extract_saturation_config(entries)
-    traces = correlate_requests(entries)
-    scoring_data = extract_scoring_data(entries)
-    errors = count_errors(entries)
+# Messages that feed the summary or time series. Any other line is only
+# decoded when it is an error (for error_counts).
+SATURATION_MSG = "Creating new SaturationDetector"
+TERMINAL_MSG = "Exiting HandleResponseBodyComplete"
+RELEVANT_MSGS = frozenset(
+    {
+        SATURATION_MSG,
+        "LLM request assembled",
+        "Running filter plugin",
+        "Completed running filter plugin successfully",
+        "Running scorer plugin",
+        "Completed running scorer plugin successfully",
+        "Completed running picker plugin successfully",
+        "Request handled",
+        TERMINAL_MSG,
+        "Calculated score",
+        "Candidate pods for picking",
+    }
+)
+
+# Cheap field extraction from compact zap JSON, used before (and usually
+# instead of) json.loads.
+_MSG_RE = re.compile(r'"msg":"((?:[^"\\]|\\.)*)"')
+_REQUEST_ID_RE = re.compile(r'"x-request-id":"((?:[^"\\]|\\.)*)"')
+_ERROR_LEVEL = '"level":"error"'
+
+
+def _unescape(value: str) -> str:
+    """Decode a JSON string body captured by one of the field regexes."""
+    return json.loads(f'"{value}"') if "\\" in value else value
+
+
+class EppLogAnalyzer:
+    """Single-pass accumulator for EPP log lines.
+
+    Feed lines with :meth:`feed_line` (or decoded entries with
+    :meth:`feed_entry`), call :meth:`close`, then :meth:`outputs`. A request's
+    trace is folded into the aggregates as soon as its terminal message is
+    seen; traces still open at :meth:`close` are folded then. Lines for a
+    request after its terminal message are ignored.
+
+    Per-request results are keyed by ``(file_index, first-seen order)`` and
+    re-sorted on output, so the summary and time series match the order in
+    which the list-based functions above would have produced them.
+    Analyzers for different files (one request is scheduled by one EPP pod)
+    combine with :meth:`merge`.
+    """
+
+    def __init__(self, file_index: int = 0):
+        self.file_index = file_index
+        self.source_files: List[str] = []
+        self.total_lines = 0
+        self.parsed_entries = 0
+        self.saturation_config: Optional[Dict[str, Any]] = None
+        self.error_counts: Dict[str, int] = {}
+        self.request_ids: Dict[str, Tuple[int, int]] = {}
+        self._open: Dict[str, RequestTrace] = {}
+        # (order key, latency seconds, assembled time, request id)
+        self.dispatch: List[Tuple[Tuple[int, int], float, datetime, str]] = []
+        # plugin -> [(order key, latency seconds)], and the plugin's first
+        # (order key, position in trace) for dict ordering
+        self.filter_latencies: Dict[str, List[Tuple[Tuple[int, int], float]]] = {}
+        self.scorer_latencies: Dict[str, List[Tuple[Tuple[int, int], float]]] = {}
+        self.plugin_order: Dict[Tuple[str, str], Tuple[Tuple[int, int], int]] = {}
+        # endpoint -> [count, first order key]
+        self.picks: Dict[str, List[Any]] = {}
+        # endpoint key -> [(timestamp, request id, score)]
+        self.scoring: Dict[str, List[Tuple[datetime, str, float]]] = {}
+
+    # -- input -------------------------------------------------------------
+
+    def feed_line(self, line: str) -> None:
+        """Consume one raw ``kubectl logs --prefix`` line."""
+        self.total_lines += 1
+        m = PREFIX_RE.match(line)
+        if not m:
+            return
+        remainder = line[m.end() :].rstrip("\n")
+        if not remainder.startswith("{"):
+            return
+
+        msg_match = _MSG_RE.search(remainder)
+        rid_matches = _REQUEST_ID_RE.findall(remainder)
+        decode = (
+            msg_match is None
+            or len(rid_matches) > 1
+            or (not rid_matches and '"x-request-id"' in remainder)
+            or _ERROR_LEVEL in remainder
+            or _unescape(msg_match.group(1)) in RELEVANT_MSGS
+        )
+        if not decode:
+            # Counted as parsed without decoding; a line that is cut off
+            # (no closing brace) is what fails to decode in practice.
+            if remainder.rstrip().endswith("}"):
+                self.parsed_entries += 1
+                if rid_matches and rid_matches[0]:
+                    self._trace_for(_unescape(rid_matches[0]))
+            return
 
-    # Count JSON vs non-JSON lines for metadata
-    total_lines = 0
-    parsed_entries = len(entries)
-    try:
-        with open(log_path, "r") as f:
-            total_lines = sum(1 for _ in f)
-    except OSError:
-        pass
+        try:
+            data = json.loads(remainder)
+        except json.JSONDecodeError:
+            return
+        self.parsed_entries += 1
+        self.feed_entry(
+            EppLogEntry(
+                pod_name=m.group(1),
+                container=m.group(2),
+                timestamp=parse_timestamp(data.get("ts", "")),
+                level=data.get("level", ""),
+                msg=data.get("msg", ""),
+                raw=data,
+            )
+        )
+
+    def feed_entry(self, entry: EppLogEntry) -> None:
+        """Consume one decoded entry (see correlate_requests for the rules)."""
+        msg = entry.msg
+        raw = entry.raw
+        ts = entry.timestamp
+
+        if entry.level == "error":
+            self.error_counts[msg] = self.error_counts.get(msg, 0) + 1
+        if msg == SATURATION_MSG and self.saturation_config is None:
+            self.saturation_config = {
+                "queueDepthThreshold": raw.get("queueDepthThreshold"),
+                "kvCacheUtilThreshold": raw.get("kvCacheUtilThreshold"),
+                "metricsStalenessThreshold": raw.get("metricsStalenessThreshold"),
+            }
+        if ts and msg in ("Calculated score", "Candidate pods for picking"):
+            self._add_scores(entry)
+
+        rid = raw.get("x-request-id")
+        if not rid:
+            return
+        trace = self._trace_for(rid)
+        if trace is None:
+            return
+
+        if msg == "LLM request assembled":
+            trace.assembled_time = ts
+        elif msg in ("Running filter plugin", "Running scorer plugin"):
+            timings = (
+                trace.filter_plugin_timings
+                if msg == "Running filter plugin"
+                else trace.scorer_plugin_timings
+            )
+            plugin = raw.get("plugin", "")
+            if plugin and plugin not in timings:
+                timings[plugin] = (ts, None)
+        elif msg in (
+            "Completed running filter plugin successfully",
+            "Completed running scorer plugin successfully",
+        ):
+            timings = (
+                trace.filter_plugin_timings
+                if msg.startswith("Completed running filter")
+                else trace.scorer_plugin_timings
+            )
+            plugin = raw.get("plugin", "")
+            if plugin and plugin in timings:
+                start, _ = timings[plugin]
+                timings[plugin] = (start, ts)
+        elif msg == "Completed running picker plugin successfully":
+            trace.picker_complete_time = ts
+            targets = raw.get("result", {}).get("TargetEndpoints", [])
+            if targets:
+                ep = targets[0].get("Endpoint", {})
+                trace.picked_endpoint = ep.get("Address", "")
+                if ep.get("Port"):
+                    trace.picked_endpoint = f"{trace.picked_endpoint}:{ep['Port']}"
+                trace.picked_endpoint_score = targets[0].get("Score")
+        elif msg == "Request handled":
+            trace.handled_time = ts
+            if not trace.picked_endpoint:
+                trace.picked_endpoint = raw.get("endpoint", "")
+        elif msg == TERMINAL_MSG:
+            trace.response_complete_time = ts
+            self._finish(self._open.pop(rid))
+
+    def _trace_for(self, rid: str) -> Optional[RequestTrace]:
+        """The open trace for a request, opening it on first sight.
 
-    # --- Dispatch latency ---
-    dispatch_latencies = []
-    for trace in traces.values():
+        Returns None once the request's trace has been closed.
+        """
+        trace = self._open.get(rid)
+        if trace is None and rid not in self.request_ids:
+            self.request_ids[rid] = (self.file_index, len(self.request_ids))
+            trace = self._open[rid] = RequestTrace(request_id=rid)
+        return trace
+
+    def _add_scores(self, entry: EppLogEntry) -> None:
+        rid = entry.raw.get("x-request-id", "")
+        if entry.msg == "Calculated score":
+            ep_info = entry.raw.get("endpoint", {})
+            score = entry.raw.get("score")
+            if score is not None and isinstance(ep_info, dict):
+                name = ep_info.get("name", "")
+                ns = ep_info.get("namespace", "")
+                key = f"{ns}/{name}" if ns else name
+                self.scoring.setdefault(key, []).append((entry.timestamp, rid, score))
+            return
+        for scored in entry.raw.get("endpoints-weighted-score", []):
+            ep = scored.get("Endpoint", {})
+            addr = ep.get("Address", "")
+            port = ep.get("Port", "")
+            full_addr = f"{addr}:{port}" if port else addr
+            score = scored.get("Score")
+            if score is not None:
+                self.scoring.setdefault(full_addr, []).append(
+                    (entry.timestamp, rid, score)
+                )
+
+    def _finish(self, trace: RequestTrace) -> None:
+        """Fold a completed trace into the aggregates."""
+        key = self.request_ids[trace.request_id]
         if trace.assembled_time and trace.picker_complete_time:
             dt = (trace.picker_complete_time - trace.assembled_time).total_seconds()
             if dt >= 0:
-                dispatch_latencies.append(dt)
-
-    # --- Plugin latencies ---
-    filter_latencies: Dict[str, List[float]] = defaultdict(list)
-    scorer_latencies: Dict[str, List[float]] = defaultdict(list)
-    for trace in traces.values():
-        for plugin, (start, end) in trace.filter_plugin_timings.items():
-            if start and end:
-                dt = (end - start).total_seconds()
-                if dt >= 0:
-                    filter_latencies[plugin].append(dt)
-        for plugin, (start, end) in trace.scorer_plugin_timings.items():
-            if start and end:
-                dt = (end - start).total_seconds()
-                if dt >= 0:
-                    scorer_latencies[plugin].append(dt)
-
-    # --- Request distribution ---
-    request_dist: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0})
-    for trace in traces.values():
+                self.dispatch.append((key, dt, trace.assembled_time, trace.request_id))
+        for kind, timings, latencies in (
+            ("filter", trace.filter_plugin_timings, self.filter_latencies),
+            ("scorer", trace.scorer_plugin_timings, self.scorer_latencies),
+        ):
+            for position, (plugin, (start, end)) in enumerate(timings.items()):
+                if start and end:
+                    dt = (end - start).total_seconds()
+                    if dt >= 0:
+                        latencies.setdefault(plugin, []).append((key, dt))
+                        first = self.plugin_order.get((kind, plugin))
+                        if first is None or (key, position) < first:
+                            self.plugin_order[(kind, plugin)] = (key, position)
         if trace.picked_endpoint:
-            request_dist[trace.picked_endpoint]["count"] += 1
-
-    # --- Endpoint scores ---
-    endpoint_scores: Dict[str, Dict[str, Any]] = {}
-    for addr, snapshots in scoring_data.items():
-        endpoint_scores[addr] = compute_stats([s.score for s in snapshots], "score")
-
-    # --- Build summary ---
-    summary = {
-        "_metadata": {
-            "source_file": os.path.basename(log_path),
-            "total_log_lines": total_lines,
-            "parsed_entries": parsed_entries,
-            "total_requests": len(traces),
-            "parse_errors": total_lines - parsed_entries,
-        },
-        "saturation_config": sat_config,
-        "dispatch_latency": compute_stats(dispatch_latencies, "seconds"),
-        "plugin_latencies": {
-            "filter": {
-                p: compute_stats(v, "seconds") for p, v in filter_latencies.items()
+            pick = self.picks.setdefault(trace.picked_endpoint, [0, key])
+            pick[0] += 1
+            pick[1] = min(pick[1], key)
+
+    def close(self) -> "EppLogAnalyzer":
+        """Fold every trace that never saw its terminal message."""
+        for trace in self._open.values():
+            self._finish(trace)
+        self._open.clear()
+        return self
+
+    def merge(self, other: "EppLogAnalyzer") -> "EppLogAnalyzer":
+        """Add a closed analyzer for a later file into this one."""
+        self.source_files.extend(other.source_files)
+        self.total_lines += other.total_lines
+        self.parsed_entries += other.parsed_entries
+        if self.saturation_config is None:
+            self.saturation_config = other.saturation_config
+        for msg, count in other.error_counts.items():
+            self.error_counts[msg] = self.error_counts.get(msg, 0) + count
+        for rid, key in other.request_ids.items():
+            self.request_ids.setdefault(rid, key)
+        self.dispatch.extend(other.dispatch)
+        for mine, theirs in (
+            (self.filter_latencies, other.filter_latencies),
+            (self.scorer_latencies, other.scorer_latencies),
+        ):
+            for plugin, values in theirs.items():
+                mine.setdefault(plugin, []).extend(values)
+        for plugin_key, order in other.plugin_order.items():
+            self.plugin_order[plugin_key] = min(
+                self.plugin_order.get(plugin_key, order), order
+            )
+        for endpoint, (count, key) in other.picks.items():
+            pick = self.picks.setdefault(endpoint, [0, key])
+            pick[0] += count
+            pick[1] = min(pick[1], key)
+        for addr, snapshots in other.scoring.items():
+            self.scoring.setdefault(addr, []).extend(snapshots)
+        return self
+
+    # -- output ------------------------------------------------------------
+
+    def _plugin_stats(self, kind: str, latencies: Dict[str, list]) -> Dict[str, Any]:
+        plugins = sorted(latencies, key=lambda p: self.plugin_order[(kind, p)])
+        return {
+            p: compute_stats([dt for _, dt in sorted(latencies[p])], "seconds")
+            for p in plugins
+        }
+
+    def outputs(self) -> Tuple[dict, dict]:
+        """Build the ``epp_metrics_summary`` and ``epp_timeseries`` documents."""
+        dispatch = sorted(self.dispatch, key=lambda point: point[0])
+        summary = {
+            "_metadata": {
+                "source_file": ", ".join(self.source_files),
+                "total_log_lines": self.total_lines,
+                "parsed_entries": self.parsed_entries,
+                "total_requests": len(self.request_ids),
+                "parse_errors": self.total_lines - self.parsed_entries,
             },
-            "scorer": {
-                p: compute_stats(v, "seconds") for p, v in scorer_latencies.items()
+            "saturation_config": self.saturation_config or {},
+            "dispatch_latency": compute_stats([p[1] for p in dispatch], "seconds"),
+            "plugin_latencies": {
+                "filter": self._plugin_stats("filter", self.filter_latencies),
+                "scorer": self._plugin_stats("scorer", self.scorer_latencies),
             },
-        },
-        "request_distribution": dict(request_dist),
-        "endpoint_scores": endpoint_scores,
-        "error_counts": errors,
-    }
-
-    # --- Build timeseries ---
-    ts_data: Dict[str, Any] = {
-        "scoring_timeseries": {},
-        "dispatch_latency_timeseries": {},
-    }
+            "request_distribution": {
+                endpoint: {"count": count}
+                for endpoint, (count, _) in sorted(
+                    self.picks.items(), key=lambda item: item[1][1]
+                )
+            },
+            "endpoint_scores": {
+                addr: compute_stats([s[2] for s in snapshots], "score")
+                for addr, snapshots in self.scoring.items()
+            },
+            "error_counts": dict(self.error_counts),
+        }
 
-    for addr, snapshots in scoring_data.items():
-        ts_data["scoring_timeseries"][addr] = {
-            "timestamps": [s.timestamp.isoformat() for s in snapshots],
-            "scores": [s.score for s in snapshots],
-            "request_ids": [s.request_id for s in snapshots],
+        latency_points = sorted(dispatch, key=lambda point: point[2])
+        ts_data = {
+            "scoring_timeseries": {
+                addr: {
+                    "timestamps": [s[0].isoformat() for s in snapshots],
+                    "scores": [s[2] for s in snapshots],
+                    "request_ids": [s[1] for s in snapshots],
+                }
+                for addr, snapshots in self.scoring.items()
+            },
+            "dispatch_latency_timeseries": {
+                "timestamps": [p[2].isoformat() for p in latency_points],
+                "latencies_seconds": [p[1] for p in latency_points],
+                "request_ids": [p[3] for p in latency_points],
+            },
         }
+        return summary, ts_data
 
-    # Dispatch latency timeseries (sorted by time)
-    latency_points = []
-    for trace in traces.values():
-        if trace.assembled_time and trace.picker_complete_time:
-            dt = (trace.picker_complete_time - trace.assembled_time).total_seconds()
-            if dt >= 0:
-                latency_points.append((trace.assembled_time, dt, trace.request_id))
-    latency_points.sort(key=lambda x: x[0])
-    ts_data["dispatch_latency_timeseries"] = {
-        "timestamps": [p[0].isoformat() for p in latency_points],
-        "latencies_seconds": [p[1] for p in latency_points],
-        "request_ids": [p[2] for p in latency_points],
-    }
 
-    # --- Write output files ---
+def analyze_log_file(log_path: str, file_index: int = 0) -> EppLogAnalyzer:
+    """Stream one EPP log file through a fresh analyzer (worker entry point)."""
+    analyzer = EppLogAnalyzer(file_index)
+    analyzer.source_files.append(os.path.basename(log_path))
+    with open(log_path, "r") as f:
+        for line in f:
+            analyzer.feed_line(line)
+    return analyzer.close()
+
+
+def analyze_log_files(log_paths: List[str], workers: int = 1) -> EppLogAnalyzer:
+    """Analyze EPP log files, in parallel worker processes when asked.
+
+    Results are merged in ``log_paths`` order, whatever order workers finish.
+    """
+    if workers > 1 and len(log_paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(log_paths))) as pool:
+            analyzers = list(
+                pool.map(analyze_log_file, log_paths, range(len(log_paths)))
+            )
+    else:
+        analyzers = [analyze_log_file(p, i) for i, p in enumerate(log_paths)]
+    merged = analyzers[0]
+    for analyzer in analyzers[1:]:
+        merged.merge(analyzer)
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Aggregation and output
+# ---------------------------------------------------------------------------
+
+
+def write_outputs(analyzer: EppLogAnalyzer, output_dir: str) -> dict:
+    """Write the summary and time-series JSON files for a closed analyzer."""
+    os.makedirs(output_dir, exist_ok=True)
+    summary, ts_data = analyzer.outputs()
+
     summary_path = os.path.join(output_dir, "epp_metrics_summary.json")
     with open(summary_path, "w") as f:
         json.dump(summary, f, indent=2, default=str)
@@ -450,6 +729,23 @@ def aggregate_and_output(
     return summary
 
 
+def aggregate_and_output(
+    entries: List[EppLogEntry], output_dir: str, log_path: str
+) -> dict:
+    """Aggregate already-parsed entries and write JSON output files."""
+    analyzer = EppLogAnalyzer()
+    analyzer.source_files.append(os.path.basename(log_path))
+    analyzer.parsed_entries = len(entries)
+    try:
+        with open(log_path, "r") as f:
+            analyzer.total_lines = sum(1 for _ in f)
+    except OSError:
+        pass
+    for entry in entries:
+        analyzer.feed_entry(entry)
+    return write_outputs(analyzer.close(), output_dir)
+
+
 # ---------------------------------------------------------------------------
 # Visualization
 # ---------------------------------------------------------------------------
@@ -618,38 +914,55 @@ def main():
         default=None,
         help="Custom output directory (default: <results_dir>/epp_metrics)",
     )
+    parser.add_argument(
+        "--log",
+        action="append",
+        default=None,
+        help="EPP log file to analyze (repeatable; default: logs/epp_pods.log)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes when analyzing several log files",
+    )
     args = parser.parse_args()
 
     results_dir = args.results_dir
-    log_path = os.path.join(results_dir, "logs", "epp_pods.log")
-
-    if not os.path.isfile(log_path):
-        # Also check if the log is directly in results_dir (standalone usage)
-        alt_path = os.path.join(results_dir, "epp_pods.log")
-        if os.path.isfile(alt_path):
-            log_path = alt_path
-        else:
-            print(f"EPP log file not found: {log_path}")
-            print("No EPP logs to process.")
-            sys.exit(0)
-
-    if os.path.getsize(log_path) == 0:
-        print(f"EPP log file is empty: {log_path}")
+    if args.log:
+        log_paths = [p for p in args.log if os.path.isfile(p)]
+        for missing in sorted(set(args.log) - set(log_paths)):
+            print(f"EPP log file not found: {missing}")
+    else:
+        log_path = os.path.join(results_dir, "logs", "epp_pods.log")
+        if not os.path.isfile(log_path):
+            # Also check if the log is directly in results_dir (standalone usage)
+            alt_path = os.path.join(results_dir, "epp_pods.log")
+            if os.path.isfile(alt_path):
+                log_path = alt_path
+            else:
+                print(f"EPP log file not found: {log_path}")
+        log_paths = [log_path] if os.path.isfile(log_path) else []
+
+    for path in [p for p in log_paths if os.path.getsize(p) == 0]:
+        print(f"EPP log file is empty: {path}")
+        log_paths.remove(path)
+    if not log_paths:
         print("No EPP logs to process.")
         sys.exit(0)
 
     output_dir = args.output_dir or os.path.join(results_dir, "metrics")
 
-    print(f"Parsing EPP logs from {log_path} ...")
-    entries = parse_log_file(log_path)
-    print(f"  Parsed {len(entries)} structured log entries")
+    print(f"Parsing EPP logs from {', '.join(log_paths)} ...")
+    analyzer = analyze_log_files(log_paths, workers=args.workers)
+    print(f"  Parsed {analyzer.parsed_entries} structured log entries")
 
-    if not entries:
+    if not analyzer.parsed_entries:
         print("  No structured entries found. Nothing to aggregate.")
         sys.exit(0)
 
     print("Aggregating metrics ...")
-    aggregate_and_output(entries, output_dir, log_path)
+    write_outputs(analyzer, output_dir)
 
     if args.visualize:
         print("Generating visualizations ...")
@@ -15,6 +15,19 @@ import glob
 from collections import defaultdict
 import statistics
 
+# The shared scrape cache ships in the benchmark_report package (a top-level
+# package in the harness image, nested under llmdbenchmark in a checkout).
+# Without it, the raw files are parsed here instead.
+try:
+    from benchmark_report.scrape_store import load_scrape_store
+except ImportError:
+    try:
+        from llmdbenchmark.analysis.benchmark_report.scrape_store import (
+            load_scrape_store,
+        )
+    except ImportError:
+        load_scrape_store = None
+
 metrics_dir = os.environ.get("METRICS_DIR", "metrics")
 raw_dir = os.path.join(metrics_dir, "raw")
 processed_dir = os.path.join(metrics_dir, "processed")
@@ -243,16 +256,48 @@ def parse_prometheus_metrics(file_path):
             if match:
                 base_name = match.group(1).split("{")[0]
                 value = float(match.group(2))
+                base_name, divisor = _converted_name(base_name)
+                metrics[base_name].append(value / divisor)
 
-                # Apply byte-unit conversions
-                if base_name in _BYTE_CONVERSIONS:
-                    divisor, old_suffix, new_suffix = _BYTE_CONVERSIONS[base_name]
-                    value = value / divisor
-                    base_name = base_name.replace(old_suffix, new_suffix)
+    return timestamp, pod_name, namespace, dict(metrics)
 
-                metrics[base_name].append(value)
 
-    return timestamp, pod_name, namespace, dict(metrics)
+def _converted_name(base_name):
+    """Apply byte-unit conversions: (reported name, divisor for values)."""
+    if base_name in _BYTE_CONVERSIONS:
+        divisor, old_suffix, new_suffix = _BYTE_CONVERSIONS[base_name]
+        return base_name.replace(old_suffix, new_suffix), divisor
+    return base_name, 1
+
+
+def _parsed_scrapes(all_files):
+    """Yield (file_path, timestamp, pod_name, namespace, metrics) per scrape.
+
+    Reads through the shared scrape cache when it is importable, so the other
+    analysis passes over the same run reuse this parse.
+    """
+    if load_scrape_store is None:
+        for file_path in all_files:
+            yield (file_path, *parse_prometheus_metrics(file_path))
+        return
+
+    store = load_scrape_store(metrics_dir)
+    converted = [_converted_name(str(name)) for name in store.metric_names]
+    for index in store.file_indices("*_metrics.log"):
+        rows = store.file_rows(index)
+        metric_ids = store.row_metric[rows].tolist()
+        values = store.values[rows].tolist()
+        metrics = defaultdict(list)
+        for metric_id, value in zip(metric_ids, values):
+            name, divisor = converted[metric_id]
+            metrics[name].append(value / divisor)
+        yield (
+            os.path.join(raw_dir, str(store.files[index])),
+            str(store.file_timestamp[index]) or None,
+            str(store.file_pod[index]) or None,
+            str(store.file_namespace[index]) or None,
+            dict(metrics),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -295,9 +340,9 @@ def aggregate_metrics():
 
     print(f"Processing {len(all_files)} files...")
 
-    for file_path in all_files:
-        timestamp, pod_name, namespace, metrics = parse_prometheus_metrics(file_path)
-
+    for file_path, timestamp, pod_name, namespace, metrics in _parsed_scrapes(
+        all_files
+    ):
         if pod_name:
             if pod_name not in pod_metadata:
                 pod_metadata[pod_name] = {"namespace": namespace, "files": []}